@@ -0,0 +1,75 @@
+"""Benchmark OrcaCamera streaming on a simulated camera.
+
+Run with ``python benchmarks/bench_camera_stream.py``. Frames are streamed
+at the frame rate of the camera for several binning and subarray settings of
+the Orca Flash 4, reporting the delivered frame rate and the dropped frames,
+and as fast as the simulated camera fills its buffer, to measure the cost of
+locking the frames and copying them into the ring buffer. The sensor reads 2048 rows in 10 ms: binning does not shorten
+the readout, a subarray reads fewer rows.
+"""
+import time
+
+from copylot.hardware.cameras.orca.camera import OrcaCamera
+from copylot.hardware.simulated.dcam import simulated_dcam_backend
+from tracking import Metric
+
+FULL_CHIP_READOUT = 0.01
+FULL_CHIP_ROWS = 2048
+
+# frame shape and number of sensor rows read
+SETTINGS = {
+    'full_frame': ((2048, 2048), 2048),
+    'binning_2x2': ((1024, 1024), 2048),
+    'binning_4x4': ((512, 512), 2048),
+    'subarray_2048x256': ((256, 2048), 256),
+}
+
+
+def stream(shape, rows, exposure_time, nb_frames, realtime):
+    """Frame rate of a stream and number of dropped frames"""
+    camera = OrcaCamera(
+        backend=simulated_dcam_backend(
+            shape=shape,
+            exposure_time=exposure_time,
+            readout_time=FULL_CHIP_READOUT * rows / FULL_CHIP_ROWS,
+            realtime=realtime,
+        )
+    )
+    start = time.perf_counter()
+    for _ in camera.stream(nb_frames):
+        pass
+    return nb_frames / (time.perf_counter() - start), camera.dropped_frames
+
+
+def track(exposure_time=0.001, duration=1.0, nb_max_rate_frames=200):
+    """Frame rates and dropped frames of every setting"""
+    metrics = {}
+    for name, (shape, rows) in SETTINGS.items():
+        frame_period = max(exposure_time, FULL_CHIP_READOUT * rows / FULL_CHIP_ROWS)
+        frame_rate, dropped_frames = stream(
+            shape, rows, exposure_time, round(duration / frame_period), True
+        )
+        max_rate, _ = stream(shape, rows, exposure_time, nb_max_rate_frames, False)
+        metrics[f"camera.{name}.frame_rate"] = Metric(frame_rate, 'frames/s')
+        metrics[f"camera.{name}.dropped_frames"] = Metric(
+            dropped_frames, 'frames', higher_is_better=False
+        )
+        metrics[f"camera.{name}.max_rate"] = Metric(max_rate, 'frames/s')
+    return metrics
+
+
+def main(exposure_time=0.001):
+    print(f"exposure of {exposure_time * 1e3:.0f} ms")
+    metrics = track(exposure_time)
+    for name in SETTINGS:
+        frame_rate = metrics[f"camera.{name}.frame_rate"].value
+        dropped_frames = metrics[f"camera.{name}.dropped_frames"].value
+        max_rate = metrics[f"camera.{name}.max_rate"].value
+        print(
+            f"{name}: {frame_rate:.0f} frames/s, {dropped_frames} dropped, "
+            f"at most {max_rate:.0f} frames/s"
+        )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,78 @@
+"""Benchmark the latency of parameter changes made in the GUI.
+
+Run with ``python benchmarks/bench_gui_parameters.py``. When a parameter is
+edited in live mode, the live control dock restarts its worker, which opens
+a new NIDaq with the parameters and outputs the voltages of the selected
+view. The worker is timed on a simulated DAQ, without the Qt event loop and
+the 50 ms polling of ``LiveControlDockWidget.launch_nidaq`` while the
+previous worker shuts down. For time-lapses, a changed parameter also means
+new stack waveforms, which are timed separately.
+"""
+import time
+
+from copylot.hardware.daqs.ni.legacy_daxi_nidaq import NIDaq
+from copylot.hardware.simulated.daq import SimulatedDAQ
+from tracking import Metric
+
+# parameters of the parameters dock that NIDaq accepts as is
+PARAMETERS = {
+    'exposure': 0.02,
+    'nb_timepoints': 1,
+    'scan_step': 0.4,
+    'scan_range': 100,
+    'vertical_pixels': 2048,
+    'num_samples': 2000,
+}
+
+
+def live_worker(daq, parameters, view):
+    """Same as ``LiveControlDockWidget.timelapse_worker_method``"""
+    with NIDaq(**parameters, backend=daq) as daq_card:
+        daq_card.select_view(view)
+
+
+def time_live_restart(nb_changes):
+    """Mean time from a parameter change to the new voltages in live mode"""
+    daq = SimulatedDAQ()
+    start = time.perf_counter()
+    for i in range(nb_changes):
+        parameters = dict(PARAMETERS, exposure=PARAMETERS['exposure'] + i * 1e-3)
+        live_worker(daq, parameters, view=1 + i % 2)
+    return (time.perf_counter() - start) / nb_changes
+
+
+def time_waveform_update(nb_changes, nb_channels=2):
+    """Mean time to generate the stack waveforms of both views after a change"""
+    daq_card = NIDaq(**PARAMETERS, backend=SimulatedDAQ())
+    start = time.perf_counter()
+    for i in range(nb_changes):
+        # a new exposure misses the waveform cache
+        daq_card.exposure = PARAMETERS['exposure'] + i * 1e-3
+        for view in ('view1', 'view2'):
+            daq_card._get_ao_data(view)
+            for channel in range(nb_channels):
+                daq_card._get_do_data(nb_channels, False, current_ch=channel)
+    return (time.perf_counter() - start) / nb_changes
+
+
+def track(nb_changes=50):
+    """Latency of a parameter change in live mode and for time-lapses"""
+    live_restart = time_live_restart(nb_changes)
+    waveform_update = time_waveform_update(nb_changes)
+    return {
+        "gui.live_restart.latency": Metric(
+            live_restart, 's', higher_is_better=False, resolution=1e-3
+        ),
+        "gui.waveform_update.latency": Metric(
+            waveform_update, 's', higher_is_better=False, resolution=1e-3
+        ),
+    }
+
+
+def main(nb_changes=50):
+    for name, metric in track(nb_changes).items():
+        print(f"{name}: {metric.value * 1e3:.2f} ms")
+
+
+if __name__ == '__main__':
+    main()
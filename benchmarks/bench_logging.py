@@ -0,0 +1,83 @@
+"""Benchmark the cost of a log call on the acquisition thread.
+
+Run with ``python benchmarks/bench_logging.py``. A debug call with lazy
+arguments, as on the per-frame and per-command paths of the drivers, is timed
+without a debug log, with a debug log written on the calling thread, and
+with the queued outputs of ``enable_logging``. The queued handlers only pay
+for creating the record, formatting and writing happen on the listener
+thread.
+"""
+import os
+import tempfile
+import time
+
+from copylot import enable_logging, logger
+from tracking import Metric
+
+# mean time of a queued debug call, including the record creation
+QUEUED_LOG_CALL_BUDGET = 50e-6
+
+CONFIGURATIONS = {
+    'no debug log': None,
+    'text, direct': dict(output='text', queued=False),
+    'text, queued': dict(output='text'),
+    'jsonl, queued': dict(output='jsonl'),
+    'binary, queued': dict(output='binary'),
+    'jsonl, queued, rate limited': dict(output='jsonl', rate_limit=100),
+}
+
+
+def time_log_call(nb_calls, **settings):
+    """Mean time of a debug call with the debug log enabled with settings"""
+    level = logger.level
+    handler = None
+    with tempfile.TemporaryDirectory() as directory:
+        if settings:
+            handler = enable_logging(os.path.join(directory, 'log'), **settings)
+        try:
+            start = time.perf_counter()
+            for index in range(nb_calls):
+                logger.debug("frame %d: %s", index, (2048, 2048))
+            duration = (time.perf_counter() - start) / nb_calls
+        finally:
+            if handler is not None:
+                logger.removeHandler(handler)
+                handler.close()
+            logger.setLevel(level)
+    return duration
+
+
+def track(nb_calls=20000):
+    """Mean time of a debug call with every configuration"""
+    return {
+        f"logging.{name.replace(', ', '.').replace(' ', '_')}.call_time": Metric(
+            time_log_call(nb_calls, **(settings or {})),
+            's',
+            higher_is_better=False,
+            resolution=1e-6,
+        )
+        for name, settings in CONFIGURATIONS.items()
+    }
+
+
+def main(nb_calls=20000):
+    print(f"{nb_calls} debug calls")
+    for name, settings in CONFIGURATIONS.items():
+        duration = time_log_call(nb_calls, **(settings or {}))
+        over_budget = (
+            settings
+            and settings.get('queued', True)
+            and duration > QUEUED_LOG_CALL_BUDGET
+        )
+        print(
+            f"{name}: {duration * 1e6:.2f} us"
+            + (
+                f", over the {QUEUED_LOG_CALL_BUDGET * 1e6:.0f} us budget"
+                if over_budget
+                else ""
+            )
+        )
+
+
+if __name__ == '__main__':
+    main()
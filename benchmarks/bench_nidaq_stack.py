@@ -0,0 +1,117 @@
+"""Benchmark the dead time of NIDaq stack acquisitions on a simulated DAQ.
+
+Run with ``python benchmarks/bench_nidaq_stack.py``. The event-driven stack
+completion is compared to the former loop that polled the camera trigger
+count every 5 ms and then slept for ``exposure + 0.1`` s after every stack,
+and to the hardware-timed playback of the whole time-lapse.
+
+``track()`` measures the stack rate and the dead time between stacks of
+every scan option and view, see ``run_benchmarks.py``.
+"""
+import time
+
+import nidaqmx
+
+from copylot.hardware.daqs.ni.legacy_daxi_nidaq import NIDaq
+from copylot.hardware.simulated.daq import SimulatedDAQ
+from tracking import Metric
+
+# set_initial_states only supports a single view for the O1 and galvo scans
+SCAN_OPTIONS = {'Stage': (1, 2, 3), 'O1': (1, 2), 'Galvo': (1, 2)}
+
+
+class PollingNIDaq(NIDaq):
+    """NIDaq with the former polling stack completion"""
+
+    def _set_up_stack_counter(self):
+        task_ctr_loop = self._backend.Task("counter0")
+        ctr_loop = task_ctr_loop.ci_channels.add_ci_count_edges_chan(
+            self.ch_ctr1, edge=nidaqmx.constants.Edge.RISING
+        )
+        ctr_loop.ci_count_edges_term = self.PFI0
+        return task_ctr_loop, None
+
+    def _wait_for_stack(self, task_ctr, stack_done):
+        task_ctr.start()
+        counts = 0
+        while counts < self.nb_slices + 1:
+            counts = task_ctr.read()
+            time.sleep(0.005)
+        task_ctr.stop()
+        time.sleep(self.exposure + 0.1)
+
+
+class PlaybackNIDaq(NIDaq):
+    """NIDaq streaming all the time points without restarting tasks"""
+
+    def acquire_stacks(self, channels, view, scan_option='Stage', interleave=True):
+        self.acquire_stacks_hardware_timed(channels, view, interleave)
+
+
+def time_per_stack(
+    daq_class,
+    exposure,
+    nb_slices,
+    nb_timepoints,
+    channels=('488', '561'),
+    view=3,
+    scan_option='Stage',
+):
+    daq = daq_class(
+        exposure=exposure,
+        nb_timepoints=nb_timepoints,
+        scan_step=1,
+        scan_range=nb_slices,
+        backend=SimulatedDAQ(frame_period=exposure),
+    )
+    start = time.perf_counter()
+    daq.acquire_stacks(
+        list(channels), view=view, scan_option=scan_option, interleave=False
+    )
+    duration = time.perf_counter() - start
+    daq.close()
+    nb_stacks = nb_timepoints * len(NIDaq._get_views(view)) * len(channels)
+    return duration / nb_stacks
+
+
+def track(exposure=0.01, nb_slices=20, nb_timepoints=3):
+    """Stack rate and dead time between stacks of every scan option and view"""
+    ideal = (nb_slices + 1) * exposure
+    metrics = {}
+    for scan_option, views in SCAN_OPTIONS.items():
+        for view in views:
+            duration = time_per_stack(
+                NIDaq,
+                exposure,
+                nb_slices,
+                nb_timepoints,
+                channels=('488',),
+                view=view,
+                scan_option=scan_option,
+            )
+            name = f"nidaq.{scan_option.lower()}.view{view}"
+            metrics[f"{name}.stack_rate"] = Metric(1 / duration, 'stacks/s')
+            metrics[f"{name}.dead_time"] = Metric(
+                duration - ideal, 's', higher_is_better=False, resolution=0.002
+            )
+    return metrics
+
+
+def main(exposure=0.01, nb_slices=20, nb_timepoints=3):
+    # the camera triggers nb_slices + 1 frames, the outputs of the last one take an exposure
+    ideal = (nb_slices + 1) * exposure
+    print(f"{nb_slices} slices of {exposure * 1e3:.0f} ms, ideal {ideal * 1e3:.0f} ms")
+    for name, daq_class in (
+        ("polling", PollingNIDaq),
+        ("done event", NIDaq),
+        ("playback", PlaybackNIDaq),
+    ):
+        duration = time_per_stack(daq_class, exposure, nb_slices, nb_timepoints)
+        print(
+            f"{name}: {duration * 1e3:.1f} ms per stack, "
+            f"dead time {(duration - ideal) * 1e3:.1f} ms"
+        )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,83 @@
+"""Benchmark the round trips of optoMDC commands on a simulated MR-E-2 board.
+
+Run with ``python benchmarks/bench_optomdc_commands.py``. The mirror runs on
+the backend of ``configs/simulated.yaml``. The per-command latencies are the
+round trip statistics the connection records, the upload and start of a
+trajectory is timed end to end.
+"""
+import pathlib
+import time
+
+import numpy as np
+
+from copylot.hardware.mirrors.optotune.mirror import OptoMirror
+from copylot.microscope_config.microscope_config import MicroscopeConfig
+from tracking import Metric
+
+CONFIG_PATH = (
+    pathlib.Path(__file__).parents[1]
+    / 'copylot'
+    / 'microscope_config'
+    / 'configs'
+    / 'simulated.yaml'
+)
+
+
+def command_latencies(mirror, nb_repeats):
+    """Mean round trip time of the commands moving and reading the mirror"""
+    latency = mirror.mirror.Connection.latency
+    latency.reset()
+    for i in range(nb_repeats):
+        mirror.channel_x.StaticInput.SetXY(i / nb_repeats)
+        mirror.channel_x.StaticInput.GetXY()
+        mirror.positions
+        mirror.mirror.set_many(
+            [
+                (mirror.channel_x.StaticInput.xy, i / nb_repeats),
+                (mirror.channel_y.StaticInput.xy, -i / nb_repeats),
+            ]
+        )
+    return {name: stats['mean'] for name, stats in latency.summary().items()}
+
+
+def time_trajectory_upload(mirror, nb_samples, nb_repeats):
+    """Time to upload and start a circular trajectory"""
+    phase = np.linspace(0, 2 * np.pi, nb_samples, endpoint=False)
+    trajectory = 0.5 * np.stack([np.cos(phase), np.sin(phase)], axis=1)
+    durations = []
+    for _ in range(nb_repeats):
+        start = time.perf_counter()
+        mirror.upload_trajectory(trajectory, sample_rate=1000)
+        mirror.start_trajectory()
+        durations.append(time.perf_counter() - start)
+        mirror.stop_trajectory()
+    return min(durations)
+
+
+def track(nb_repeats=50, nb_samples=1000):
+    """Mean latency per command and duration of a trajectory upload"""
+    config = MicroscopeConfig.read_config(CONFIG_PATH)
+    mirror = OptoMirror(com_port='SIM', backend=config.backend('mirror'))
+    metrics = {
+        f"optomdc.{name}.latency": Metric(
+            latency, 's', higher_is_better=False, resolution=1e-4
+        )
+        for name, latency in command_latencies(mirror, nb_repeats).items()
+    }
+    metrics["optomdc.upload_trajectory.duration"] = Metric(
+        time_trajectory_upload(mirror, nb_samples, 3),
+        's',
+        higher_is_better=False,
+        resolution=1e-3,
+    )
+    return metrics
+
+
+def main(nb_repeats=50, nb_samples=1000):
+    metrics = track(nb_repeats, nb_samples)
+    for name, metric in metrics.items():
+        print(f"{name}: {metric.value * 1e3:.2f} ms")
+
+
+if __name__ == '__main__':
+    main()
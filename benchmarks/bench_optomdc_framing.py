@@ -0,0 +1,108 @@
+"""Benchmark the optoMDC frame codec.
+
+Run with ``python benchmarks/bench_optomdc_framing.py``. The shared codec of
+``optoKummenberg.tools.framing`` is compared to the former byte by byte
+implementation, on set multiple values frames of the mirror channels, and
+encoding a whole batch into one ``FrameBuffer`` is compared to concatenating
+the frames encoded one at a time.
+"""
+import struct
+import timeit
+
+from copylot.hardware.mirrors.optotune.optoMDC.optoKummenberg.tools import framing
+from copylot.hardware.mirrors.optotune.optoMDC.optoKummenberg.tools.definitions import (
+    CommandID,
+)
+
+REGISTER_IDS = [0x5000, 0x5001, 0x6000, 0x6001]
+VALUES = [0.125, -0.25, 0.0078125, -0.5]
+
+
+def legacy_encode(command_id, register_ids, values):
+    b_message = struct.pack(">BBBB", 0x7E, 0x00, command_id, 2 + 6 * len(register_ids))
+    b_message += struct.pack(">H", len(register_ids))
+    for x in register_ids:
+        b_message += struct.pack(">H", x)
+    for v in values:
+        b_message += struct.pack(">f", v)
+    b_message += struct.pack(">H", 0x00) + struct.pack(">B", 0x7E)
+    b_message = b_message.replace(b'}', b'}]')
+    return b'~' + b_message[1:-1].replace(b'~', b'}^') + b'~'
+
+
+def legacy_decode(data):
+    result = []
+    i = 1
+    while i < len(data) - 1:
+        if data[i] == framing.ESCAPE_BYTE:
+            result.append(data[i + 1] ^ framing.ESCAPE_MASK)
+            i += 2
+        else:
+            result.append(data[i])
+            i += 1
+    return bytes(result)
+
+
+def encode_batch(frames, nb_frames):
+    frames.clear()
+    for _ in range(nb_frames):
+        frames.append_set_multiple(REGISTER_IDS, VALUES)
+    return frames.view()
+
+
+def time_us(statement, nb_repeats):
+    return min(timeit.repeat(statement, number=nb_repeats, repeat=5)) / nb_repeats * 1e6
+
+
+def main(nb_repeats=20000, nb_frames=100):
+    message = framing.encode(CommandID.SET_MULTIPLE, REGISTER_IDS, VALUES)
+    # values with bytes to escape
+    escaped = legacy_encode(
+        CommandID.SET_MULTIPLE, REGISTER_IDS, [struct.unpack('>f', b'~}~}')[0]] * 4
+    )
+    assert legacy_encode(CommandID.SET_MULTIPLE, REGISTER_IDS, VALUES) == message
+    assert legacy_decode(escaped) == framing.decode(escaped)
+
+    rows = [
+        (
+            "encode, legacy",
+            lambda: legacy_encode(CommandID.SET_MULTIPLE, REGISTER_IDS, VALUES),
+        ),
+        (
+            "encode, framing",
+            lambda: framing.encode(CommandID.SET_MULTIPLE, REGISTER_IDS, VALUES),
+        ),
+        ("decode, legacy", lambda: legacy_decode(message)),
+        ("decode, framing", lambda: framing.decode(message)),
+        ("decode escaped, legacy", lambda: legacy_decode(escaped)),
+        ("decode escaped, framing", lambda: framing.decode(escaped)),
+    ]
+    for name, statement in rows:
+        print(f"{name}: {time_us(statement, nb_repeats):.2f} us")
+
+    batch = nb_repeats // nb_frames
+    concatenated = time_us(
+        lambda: b''.join(
+            framing.encode(CommandID.SET_MULTIPLE, REGISTER_IDS, VALUES)
+            for _ in range(nb_frames)
+        ),
+        batch,
+    )
+    print(f"{nb_frames} frames, encode and join: {concatenated:.1f} us")
+    frames = framing.FrameBuffer()
+    buffered = time_us(lambda: encode_batch(frames, nb_frames), batch)
+    print(f"{nb_frames} frames, FrameBuffer.append_set_multiple: {buffered:.1f} us")
+
+    trajectory = [VALUES] * nb_frames
+
+    def extend():
+        frames.clear()
+        frames.extend_set_multiple(REGISTER_IDS, trajectory)
+
+    print(
+        f"{nb_frames} frames, FrameBuffer.extend_set_multiple: {time_us(extend, batch):.1f} us"
+    )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,91 @@
+"""Benchmark synchronized acquisition from several simulated Orca cameras.
+
+Run with ``python benchmarks/bench_synchronized.py``. Every camera streams
+2x2 binned 1024x1024 frames on its own capture thread, the cameras start
+together like cameras on the same external trigger, and the frames are
+paired by frame index. The frame rate summed over the cameras should grow
+linearly with the number of cameras, until the capture threads run out of
+cores or memory bandwidth, which shows up as skipped frames. At 400 frames/s
+the readout of the simulated cameras is shortened like a subarray readout.
+"""
+import os
+import time
+
+from bench_camera_stream import StreamingOrcaCamera
+from copylot.hardware.cameras.synchronized import SynchronizedAcquisition
+from copylot.hardware.simulated.dcam import simulated_dcam_backend
+from tracking import Metric
+
+# 2x2 binned frames of the Orca Flash 4
+SHAPE = (1024, 1024)
+NB_CAMERAS = (1, 2, 4)
+# readout time of the full chip and of a quarter of the rows
+READOUT_TIMES = {'100fps': 0.01, '400fps': 0.0025}
+# the streams run until the acquisition is stopped
+MAX_FRAMES = 10**6
+
+
+def acquire_sets(nb_cameras, nb_sets, readout_time):
+    """Frame sets per second, mean skew and frames skipped of ``nb_cameras``"""
+    cameras = {
+        f"orca{index}": StreamingOrcaCamera(
+            camera_index=index,
+            backend=simulated_dcam_backend(
+                shape=SHAPE, exposure_time=0.001, readout_time=readout_time
+            ),
+        ).stream(MAX_FRAMES, copy=False)
+        for index in range(nb_cameras)
+    }
+    acquisition = SynchronizedAcquisition(cameras, nb_buffers=16)
+    acquisition.start()
+    acquisition.read_next_set(timeout=5)
+    start = time.perf_counter()
+    for _ in acquisition.frame_sets(nb_sets, timeout=5):
+        pass
+    set_rate = nb_sets / (time.perf_counter() - start)
+    acquisition.stop()
+
+    report = acquisition.skew_report()
+    skipped_frames = sum(report.unmatched_frames.values()) + sum(
+        report.dropped_frames.values()
+    )
+    return set_rate, report.mean_skew, skipped_frames
+
+
+def track(duration=0.5):
+    """Frame rate summed over the cameras, skew and skipped frames"""
+    metrics = {}
+    for rate, readout_time in READOUT_TIMES.items():
+        for nb_cameras in NB_CAMERAS:
+            name = f"sync.{nb_cameras}_cameras_{rate}"
+            set_rate, skew, skipped_frames = acquire_sets(
+                nb_cameras, round(duration / readout_time), readout_time
+            )
+            metrics[f"{name}.frame_rate"] = Metric(
+                set_rate * nb_cameras, 'frames/s', resolution=5.0 * nb_cameras
+            )
+            metrics[f"{name}.skew"] = Metric(
+                skew, 's', higher_is_better=False, resolution=readout_time
+            )
+            metrics[f"{name}.skipped_frames"] = Metric(
+                skipped_frames, 'frames', higher_is_better=False
+            )
+    return metrics
+
+
+def main(duration=0.5):
+    print(f"{os.cpu_count()} cores, {SHAPE[0]}x{SHAPE[1]} frames")
+    metrics = track(duration)
+    for rate in READOUT_TIMES:
+        for nb_cameras in NB_CAMERAS:
+            name = f"sync.{nb_cameras}_cameras_{rate}"
+            print(
+                f"{nb_cameras} cameras at {rate}: "
+                f"{metrics[f'{name}.frame_rate'].value:.0f} frames/s, "
+                f"skew {metrics[f'{name}.skew'].value * 1e3:.2f} ms, "
+                f"{metrics[f'{name}.skipped_frames'].value} frames skipped"
+            )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,40 @@
+"""Benchmark the latency of VortranLaser queries on a simulated laser.
+
+Run with ``python benchmarks/bench_vortran_queries.py``. Reading the power
+and the status with one round trip per query is compared to a single
+pipelined ``query_many``. The simulated link adds the 16 ms default latency
+timer of FTDI USB-serial adapters in each direction.
+"""
+import time
+from unittest import mock
+
+from copylot.hardware.lasers.vortran.vortran import VortranLaser
+from copylot.hardware.simulated.vortran import SimulatedVortranLaser
+
+QUERIES = ['?LP', '?FC', '?FD']
+
+
+def time_queries(laser, batched, nb_repeats):
+    start = time.perf_counter()
+    for _ in range(nb_repeats):
+        if batched:
+            laser.query_many(QUERIES)
+        else:
+            for query in QUERIES:
+                laser.query_many([query])
+    return (time.perf_counter() - start) / nb_repeats
+
+
+def main(link_latency=0.016, nb_repeats=20):
+    device = SimulatedVortranLaser(echo=False, link_latency=link_latency)
+    with mock.patch('serial.Serial', return_value=device):
+        laser = VortranLaser(port='SIM')
+    print(f"{', '.join(QUERIES)} with a link latency of {link_latency * 1e3:.0f} ms")
+    for name, batched in (("one round trip per query", False), ("query_many", True)):
+        duration = time_queries(laser, batched, nb_repeats)
+        print(f"{name}: {duration * 1e3:.1f} ms")
+    laser.disconnect()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,127 @@
+"""Benchmark the NIDaq waveform generation against the former list-based path.
+
+Run with ``python benchmarks/bench_waveforms.py``. A full acquisition calls
+the waveform getters for every time point, view and channel, which is
+simulated by calling them ``nb_calls`` times with the same parameters.
+"""
+import timeit
+
+import numpy as np
+
+from copylot.hardware.daqs.ni import waveforms
+from copylot.hardware.daqs.ni.legacy_daxi_nidaq import NIDaq
+
+
+def list_ao_data(daq, view):
+    """List-based stage scan AO data, as generated before the waveforms module"""
+    stripe_min = -daq.stripe_reduction_range + daq.stripe_reduction_offset
+    stripe_max = daq.stripe_reduction_range + daq.stripe_reduction_offset
+    nb_on_sample = round((daq.exposure - daq.readout_time) * daq.sampling_rate)
+    nb_off_sample = round(daq.readout_time * daq.sampling_rate)
+    data_ao3 = list(np.linspace(stripe_min, stripe_max, nb_on_sample))
+    data_ao3.extend([stripe_min] * nb_off_sample)
+    data_ao4 = [daq.light_sheet_angle] * daq.num_samples
+    data_ao7 = [daq.laser_power_percent / 100 * daq.MAX_LASER_ANALOG] * daq.num_samples
+    if view == "view1":
+        offset = daq._offset_distance_to_voltage(daq.offset_view1)
+        data_ao1 = [daq.view1_galvo1] * daq.num_samples
+        data_ao2 = [daq.view1_galvo2] * daq.num_samples
+        data_ao6 = [daq.o3_view1 / daq.CONVERT_RATIO_PIFOC_O3] * daq.num_samples
+    else:
+        offset = daq._offset_distance_to_voltage(daq.offset_view2)
+        data_ao1 = [daq.view2_galvo1] * daq.num_samples
+        data_ao2 = [daq.view2_galvo2] * daq.num_samples
+        data_ao6 = [daq.o3_view2 / daq.CONVERT_RATIO_PIFOC_O3] * daq.num_samples
+    min_range = -daq.scan_step / 2 / daq.CONVERT_RATIO_SCAN_GALVO
+    max_range = daq.scan_step / 2 / daq.CONVERT_RATIO_SCAN_GALVO
+    data_ao0_on = list(
+        np.linspace(max_range + offset, min_range + offset, daq.num_samples)
+    )
+    data_ao0_off = list(
+        np.linspace(data_ao0_on[nb_on_sample], max_range + offset, nb_off_sample)
+    )
+    data_ao0 = data_ao0_on[:nb_on_sample] + data_ao0_off
+    data_ao5 = [daq.o1_pifoc / daq.CONVERT_RATIO_PIFOC_O1] * daq.num_samples
+    return [
+        data_ao0,
+        data_ao1,
+        data_ao2,
+        data_ao3,
+        data_ao4,
+        data_ao5,
+        data_ao6,
+        data_ao7,
+    ]
+
+
+def list_do_data(daq, nb_channels, interleave=False, current_ch=0):
+    """List-based DO data, as generated before the waveforms module"""
+    nb_on_sample = round((daq.exposure - daq.readout_time) * daq.sampling_rate)
+    data_on = [True] * nb_on_sample + [False] * (daq.num_samples - nb_on_sample)
+    data_off = [False] * daq.num_samples
+    if nb_channels == 1:
+        return data_on
+    data = []
+    if interleave:
+        for i in range(nb_channels):
+            data.append(data_off * i + data_on + data_off * (nb_channels - i - 1))
+    else:
+        for ch in range(nb_channels):
+            data.append(data_on if ch == current_ch else data_off)
+    return data
+
+
+def list_stack_data(daq, views, nb_channels, interleave):
+    for view in views:
+        list_ao_data(daq, view)
+        for ch in range(nb_channels):
+            list_do_data(daq, nb_channels, interleave, current_ch=ch)
+
+
+def array_stack_data(daq, views, nb_channels, interleave, cached=True):
+    if not cached:
+        waveforms.stage_scan_ao_waveforms.cache_clear()
+        waveforms.stripe_reduction_waveform.cache_clear()
+        waveforms.exposure_do_waveforms.cache_clear()
+    for view in views:
+        daq._get_ao_data(view)
+        for ch in range(nb_channels):
+            daq._get_do_data(nb_channels, interleave, current_ch=ch)
+
+
+def main(num_samples=20000, nb_channels=4, nb_calls=100):
+    daq = NIDaq(
+        exposure=0.1,
+        nb_timepoints=1,
+        scan_step=1,
+        scan_range=100,
+        num_samples=num_samples,
+    )
+    views = ['view1', 'view2']
+
+    # both paths generate the same waveforms
+    for view in views:
+        np.testing.assert_allclose(daq._get_ao_data(view), list_ao_data(daq, view))
+    for interleave in (True, False):
+        np.testing.assert_array_equal(
+            daq._get_do_data(nb_channels, interleave, current_ch=1),
+            list_do_data(daq, nb_channels, interleave, current_ch=1),
+        )
+
+    print(f"{num_samples} samples, {nb_channels} channels, {nb_calls} stacks per run")
+    for interleave in (True, False):
+        args = (daq, views, nb_channels, interleave)
+        t_list = timeit.timeit(lambda: list_stack_data(*args), number=nb_calls)
+        t_uncached = timeit.timeit(
+            lambda: array_stack_data(*args, cached=False), number=nb_calls
+        )
+        t_array = timeit.timeit(lambda: array_stack_data(*args), number=nb_calls)
+        print(
+            f"interleave={interleave}: lists {t_list * 1e3:.1f} ms, "
+            f"arrays without cache {t_uncached * 1e3:.1f} ms, "
+            f"arrays {t_array * 1e3:.1f} ms (x{t_list / t_array:.0f})"
+        )
+
+
+if __name__ == '__main__':
+    main()
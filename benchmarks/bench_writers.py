@@ -0,0 +1,79 @@
+"""Benchmark the throughput of the stream writers.
+
+Run with ``python benchmarks/bench_writers.py``. Frames of 2x2 binned Orca
+Flash 4 images, a noisy background with a few bright spots so that
+compression behaves as on sample images, are written to a temporary
+directory by every writer. The throughput is measured from the first write
+to the end of ``close``, the time ``write`` waited for a free slot is the
+backpressure the writer puts on acquisition.
+"""
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+from copylot.io.writers import TiffWriter, ZarrWriter
+from tracking import Metric
+
+WRITERS = {
+    'zarr': lambda path, nb_frames: ZarrWriter(str(path / 'frames.zarr')),
+    'tiff': lambda path, nb_frames: TiffWriter(str(path / 'frames.tif')),
+    'ome_tiff': lambda path, nb_frames: TiffWriter(
+        str(path / 'frames.ome.tif'), nb_frames=nb_frames
+    ),
+}
+
+
+def sample_frames(shape, nb_frames=8, seed=0):
+    """Frames to cycle through, generating noise for every frame is slower than writing it"""
+    rng = np.random.default_rng(seed)
+    frames = rng.poisson(100, size=(nb_frames, *shape)).astype(np.uint16)
+    for frame in frames:
+        y, x = rng.integers(0, shape[0], 20), rng.integers(0, shape[1], 20)
+        frame[y, x] = 4000
+    return frames
+
+
+def write(writer, frames, nb_frames):
+    """Frames written per second and time spent waiting for the writer"""
+    start = time.perf_counter()
+    with writer:
+        for index in range(nb_frames):
+            writer.write(frames[index % len(frames)])
+    return nb_frames / (time.perf_counter() - start), writer.blocked_time
+
+
+def track(shape=(1024, 1024), nb_frames=100):
+    """Throughput and backpressure of every writer"""
+    frames = sample_frames(shape)
+    metrics = {}
+    for name, create_writer in WRITERS.items():
+        with tempfile.TemporaryDirectory() as directory:
+            writer = create_writer(Path(directory), nb_frames)
+            frame_rate, blocked_time = write(writer, frames, nb_frames)
+        metrics[f"writer.{name}.frame_rate"] = Metric(frame_rate, 'frames/s')
+        metrics[f"writer.{name}.throughput"] = Metric(
+            frame_rate * frames[0].nbytes / 1e6, 'MB/s'
+        )
+        metrics[f"writer.{name}.blocked_time"] = Metric(
+            blocked_time, 's', higher_is_better=False, resolution=0.05
+        )
+    return metrics
+
+
+def main(shape=(1024, 1024), nb_frames=100):
+    print(f"{nb_frames} frames of {shape[0]}x{shape[1]} pixels")
+    metrics = track(shape, nb_frames)
+    for name in WRITERS:
+        frame_rate = metrics[f"writer.{name}.frame_rate"].value
+        throughput = metrics[f"writer.{name}.throughput"].value
+        blocked_time = metrics[f"writer.{name}.blocked_time"].value
+        print(
+            f"{name}: {frame_rate:.0f} frames/s, {throughput:.0f} MB/s, "
+            f"write blocked for {blocked_time * 1e3:.0f} ms"
+        )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,89 @@
+"""Run the tracked benchmarks and report the metrics that regressed.
+
+Run with ``python benchmarks/run_benchmarks.py``, or ``make benchmark``.
+Every device runs on its simulated backend. The metrics are appended to
+``benchmarks/results/<machine>.jsonl`` with the current commit, and compared
+to the latest earlier run, or to the latest run of ``--baseline <commit>``.
+The script exits with status 1 if a metric got worse by more than
+``--threshold``, so it can gate a change in CI on a dedicated machine.
+
+    python benchmarks/run_benchmarks.py --only camera writer
+    python benchmarks/run_benchmarks.py --baseline 3754c01 --no-save
+"""
+import argparse
+import importlib
+import sys
+
+import tracking
+
+# module of every tracked benchmark, by the prefix of its metrics
+BENCHMARKS = {
+    'nidaq': 'bench_nidaq_stack',
+    'camera': 'bench_camera_stream',
+    'writer': 'bench_writers',
+    'optomdc': 'bench_optomdc_commands',
+    'gui': 'bench_gui_parameters',
+    'logging': 'bench_logging',
+    'sync': 'bench_synchronized',
+}
+
+
+def run(names):
+    metrics = {}
+    for name in names:
+        print(f"running {BENCHMARKS[name]}...", flush=True)
+        metrics.update(importlib.import_module(BENCHMARKS[name]).track())
+    return metrics
+
+
+def report(metrics, baseline):
+    previous = baseline['metrics'] if baseline else {}
+    for name, metric in metrics.items():
+        line = f"{name}: {metric.value:.6g} {metric.unit}"
+        if name in previous and previous[name]['value']:
+            change = metric.value / previous[name]['value'] - 1
+            line += f" ({change:+.1%})"
+        print(line)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        '--only', nargs='+', choices=BENCHMARKS, default=list(BENCHMARKS)
+    )
+    parser.add_argument('--results', default=tracking.default_results_path())
+    parser.add_argument('--baseline', help="commit to compare to")
+    parser.add_argument(
+        '--threshold',
+        type=float,
+        default=0.2,
+        help="relative change of a metric reported as a regression",
+    )
+    parser.add_argument('--no-save', action='store_true', help="do not record this run")
+    args = parser.parse_args(argv)
+
+    runs = tracking.load_runs(args.results)
+    baseline = tracking.find_run(runs, args.baseline)
+    if args.baseline and baseline is None:
+        parser.error(f"no run of {args.baseline} in {args.results}")
+
+    metrics = run(args.only)
+    report(metrics, baseline)
+    if not args.no_save:
+        tracking.append_run(args.results, metrics, tracking.git_commit())
+
+    if baseline is None:
+        print("no earlier run to compare to")
+        return 0
+    regressions = tracking.compare(baseline, metrics, args.threshold)
+    for regression in regressions:
+        print(
+            f"REGRESSION {regression.name}: {regression.baseline:.6g} -> "
+            f"{regression.value:.6g} {regression.unit} ({regression.change:+.1%})"
+        )
+    print(f"{len(regressions)} regressions compared to {baseline['commit']}")
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
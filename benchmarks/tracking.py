@@ -0,0 +1,126 @@
+"""Record the metrics of the tracked benchmarks and compare them between runs.
+
+The benchmarks that are tracked over time define ``track()``, which returns
+their metrics by name. ``run_benchmarks.py`` appends the metrics of every run
+to a JSON-lines file per machine, with the commit they were measured at, and
+reports the metrics that regressed compared to an earlier run.
+"""
+import json
+import platform
+import subprocess
+import time
+from pathlib import Path
+from typing import Dict, List, NamedTuple, Optional
+
+
+class Metric(NamedTuple):
+    """
+    Value of a benchmark metric.
+
+    ``resolution`` is the smallest change of the value that is not noise,
+    e.g. the jitter of the sleeps of a simulated device, in the unit of the
+    value. Changes below it are never reported as regressions.
+    """
+
+    value: float
+    unit: str
+    higher_is_better: bool = True
+    resolution: float = 0.0
+
+
+class Regression(NamedTuple):
+    name: str
+    baseline: float
+    value: float
+    unit: str
+
+    @property
+    def change(self) -> float:
+        """Relative change of the value compared to the baseline"""
+        if self.baseline == 0:
+            return float('inf')
+        return (self.value - self.baseline) / abs(self.baseline)
+
+
+def git_commit() -> Optional[str]:
+    """Commit of the working tree, None outside of a git repository"""
+    try:
+        return subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'],
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=Path(__file__).parent,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def default_results_path() -> Path:
+    """Results of this machine, timings of different machines do not compare"""
+    return Path(__file__).parent / 'results' / f"{platform.node() or 'unknown'}.jsonl"
+
+
+def load_runs(path: Path) -> List[dict]:
+    """Runs recorded in a results file, oldest first"""
+    if not Path(path).exists():
+        return []
+    with open(path) as stream:
+        return [json.loads(line) for line in stream if line.strip()]
+
+
+def append_run(path: Path, metrics: Dict[str, Metric], commit: str = None) -> dict:
+    """Append the metrics of a run to a results file and return the run"""
+    run = {
+        'commit': commit,
+        'date': time.strftime('%Y-%m-%dT%H:%M:%S%z'),
+        'python': platform.python_version(),
+        'metrics': {name: metric._asdict() for name, metric in metrics.items()},
+    }
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, 'a') as stream:
+        stream.write(json.dumps(run) + '\n')
+    return run
+
+
+def find_run(runs: List[dict], commit: str = None) -> Optional[dict]:
+    """Latest run, or latest run of a commit"""
+    for run in reversed(runs):
+        if commit is None or (run['commit'] or '').startswith(commit):
+            return run
+    return None
+
+
+def compare(
+    baseline: dict, metrics: Dict[str, Metric], threshold: float = 0.2
+) -> List[Regression]:
+    """
+    Metrics that got worse than in a baseline run.
+
+    Parameters
+    ----------
+    baseline : dict
+        Run loaded from a results file.
+    metrics : Dict[str, Metric]
+    threshold : float
+        Relative change of a metric that is reported, e.g. 0.2 for 20%.
+
+    Returns
+    -------
+    List[Regression]
+        Metrics that are not in the baseline run are skipped.
+    """
+    regressions = []
+    for name, metric in metrics.items():
+        previous = baseline['metrics'].get(name)
+        if previous is None:
+            continue
+        loss = previous['value'] - metric.value
+        if not metric.higher_is_better:
+            loss = -loss
+        if loss > metric.resolution and loss > threshold * abs(previous['value']):
+            regressions.append(
+                Regression(name, previous['value'], metric.value, metric.unit)
+            )
+    return regressions
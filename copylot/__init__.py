@@ -5,13 +5,23 @@ except ImportError:
 
 import logging
 
+from copylot._logging import (
+    BinaryFileHandler,
+    JsonLinesFormatter,
+    LazyQueueHandler,
+    RateLimitFilter,
+)
+
 
 def enable_logging(
     log_filepath: str = 'copylot_debug_log.txt',
-    level = logging.DEBUG,
-):
+    level=logging.DEBUG,
+    output: str = 'text',
+    queued: bool = True,
+    rate_limit: float = None,
+) -> logging.Handler:
     """
-    Enable debug logging to a text file
+    Enable debug logging to a file
 
     Parameters
     ----------
@@ -19,17 +29,47 @@ def enable_logging(
         Path to log file, by default 'copylot_debug_log.txt'
     level : int
         Logging level, by default logging.DEBUG
+    output : str
+        'text' for the format of the console, 'jsonl' for a JSON object
+        per line or 'binary' for the records of ``BinaryFileHandler``.
+    queued : bool
+        Format and write the records on a listener thread, so that logging
+        from an acquisition thread does not wait for the disk. A debug call
+        then costs a few microseconds.
+    rate_limit : float, optional
+        Maximum number of records per second of every module below the
+        warning level, e.g. to log from per-frame code paths.
+
+    Returns
+    -------
+    logging.Handler
+        Handler added to the ``copylot`` logger, remove it from the logger
+        and close it to stop logging to the file.
     """
-    # create file handler which logs debug messages
-    fh = logging.FileHandler(log_filepath)
-    fh.setLevel(level)
-    fh.setFormatter(formatter)
+    if output == 'binary':
+        handler = BinaryFileHandler(log_filepath)
+    elif output in ('text', 'jsonl'):
+        handler = logging.FileHandler(log_filepath)
+        handler.setFormatter(formatter if output == 'text' else JsonLinesFormatter())
+    else:
+        raise ValueError(f"Unknown log output {output!r}, use text, jsonl or binary.")
+    handler.setLevel(level)
+
+    if queued:
+        handler = LazyQueueHandler(handler)
+        handler.setLevel(level)
+    if rate_limit is not None:
+        handler.addFilter(RateLimitFilter(rate_limit))
 
-    logger.addHandler(fh)
+    logger.addHandler(handler)
+    if logger.getEffectiveLevel() > level:
+        logger.setLevel(level)
+    return handler
 
 
 logger = logging.getLogger('copylot')
-logger.setLevel(logging.DEBUG)
+# debug records are only created once a debug log is enabled
+logger.setLevel(logging.INFO)
 
 # create console handler with a higher log level
 ch = logging.StreamHandler()
@@ -0,0 +1,202 @@
+"""
+Handlers, formatters and filters of ``copylot.enable_logging``.
+
+With ``queued=True`` the acquisition threads only create the log record and
+put it in a queue, formatting and file I/O happen on the thread of a
+``QueueListener``. Log calls on hot paths pass their arguments lazily, e.g.
+``logger.debug("frame %d", index)``, so they cost little more than the
+record creation.
+"""
+import json
+import logging
+import queue
+import struct
+import threading
+import time
+from logging.handlers import QueueHandler, QueueListener
+from typing import Dict, Iterator
+
+# created time, level, then the lengths of the logger name, the location and
+# the message, followed by these strings encoded in UTF-8
+_BINARY_HEADER = struct.Struct('<dBHHI')
+
+
+class LazyQueueHandler(QueueHandler):
+    """
+    Queue the records for a handler that runs on a listener thread.
+
+    Unlike ``QueueHandler``, records are queued without formatting their
+    message, so the arguments of a log call are formatted on the listener
+    thread and must not be modified after the call.
+
+    Parameters
+    ----------
+    handler : logging.Handler
+        Handler that formats and writes the records on the listener thread.
+
+    """
+
+    def __init__(self, handler: logging.Handler):
+        super().__init__(queue.SimpleQueue())
+        self.listener = QueueListener(self.queue, handler, respect_handler_level=True)
+        self.listener.start()
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+    def close(self):
+        """Write the queued records, stop the listener and close its handler"""
+        if self.listener is not None:
+            self.listener.stop()
+            for handler in self.listener.handlers:
+                handler.close()
+            self.listener = None
+        super().close()
+
+
+class RateLimitFilter(logging.Filter):
+    """
+    Limit the number of records of every subsystem, i.e. of every module
+    logging to the ``copylot`` logger, e.g. when a driver logs every frame.
+
+    Each subsystem may log ``burst`` records at once, then ``rate`` records
+    per second. Warnings and errors always pass. The next record of a
+    subsystem that passes reports how many records were dropped before it.
+
+    Parameters
+    ----------
+    rate : float
+        Records per second and subsystem.
+    burst : int, optional
+        Records a subsystem may log at once, defaults to ``rate``.
+    clock : Callable[[], float]
+
+    """
+
+    def __init__(self, rate: float, burst: int = None, clock=time.monotonic):
+        super().__init__()
+        if rate <= 0:
+            raise ValueError("The rate limit must be positive.")
+        self.rate = rate
+        self.burst = max(1, round(rate)) if burst is None else burst
+        self.clock = clock
+        # tokens, time of the last update and dropped records, by subsystem
+        self._buckets: Dict[tuple, list] = {}
+        self._lock = threading.Lock()
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno >= logging.WARNING:
+            return True
+        key = (record.name, record.module)
+        now = self.clock()
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                bucket = self._buckets[key] = [self.burst, now, 0]
+            tokens = min(self.burst, bucket[0] + (now - bucket[1]) * self.rate)
+            bucket[1] = now
+            if tokens < 1:
+                bucket[0] = tokens
+                bucket[2] += 1
+                return False
+            bucket[0] = tokens - 1
+            suppressed, bucket[2] = bucket[2], 0
+        if suppressed:
+            record.suppressed = suppressed
+            record.msg = f"{record.msg} ({suppressed} records suppressed)"
+        return True
+
+
+class JsonLinesFormatter(logging.Formatter):
+    """Format a record as a single line JSON object"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            'time': record.created,
+            'level': record.levelname,
+            'logger': record.name,
+            'module': record.module,
+            'function': record.funcName,
+            'thread': record.threadName,
+            'message': record.getMessage(),
+        }
+        if getattr(record, 'suppressed', 0):
+            entry['suppressed'] = record.suppressed
+        if record.exc_info:
+            entry['exception'] = self.formatException(record.exc_info)
+        return json.dumps(entry, default=str)
+
+
+class BinaryFileHandler(logging.Handler):
+    """
+    Append records to a file in a compact binary format, see
+    ``read_binary_log``. It skips formatting a text line per record.
+
+    Parameters
+    ----------
+    filename : str
+
+    """
+
+    def __init__(self, filename: str):
+        super().__init__()
+        self.baseFilename = filename
+        self._file = open(filename, 'ab')
+
+    def emit(self, record: logging.LogRecord):
+        try:
+            message = record.getMessage()
+            if record.exc_info:
+                message += '\n' + logging.Formatter().formatException(record.exc_info)
+            name = record.name.encode()
+            location = f"{record.module}.{record.funcName}".encode()
+            text = message.encode()
+            data = _BINARY_HEADER.pack(
+                record.created, record.levelno, len(name), len(location), len(text)
+            )
+            with self.lock:
+                self._file.write(data + name + location + text)
+        except Exception:
+            self.handleError(record)
+
+    def flush(self):
+        with self.lock:
+            if not self._file.closed:
+                self._file.flush()
+
+    def close(self):
+        with self.lock:
+            self._file.close()
+        super().close()
+
+
+def read_binary_log(path: str) -> Iterator[dict]:
+    """
+    Read a log written by ``BinaryFileHandler``.
+
+    Parameters
+    ----------
+    path : str
+
+    Yields
+    ------
+    dict
+        'time', 'level', 'logger', 'location' and 'message' of every record.
+    """
+    with open(path, 'rb') as stream:
+        data = stream.read()
+    offset = 0
+    while offset < len(data):
+        created, levelno, *lengths = _BINARY_HEADER.unpack_from(data, offset)
+        offset += _BINARY_HEADER.size
+        strings = []
+        for length in lengths:
+            strings.append(data[offset : offset + length].decode())
+            offset += length
+        yield dict(
+            time=created,
+            level=logging.getLevelName(levelno),
+            logger=strings[0],
+            location=strings[1],
+            message=strings[2],
+        )
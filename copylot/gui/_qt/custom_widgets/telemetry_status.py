@@ -0,0 +1,21 @@
+from qtpy.QtCore import QTimer
+from qtpy.QtWidgets import QLabel
+
+from copylot.hardware import telemetry
+
+
+class TelemetryStatusWidget(QLabel):
+    """Status bar label with the frame rate, jitter and drops of every device,
+    refreshed every ``interval`` milliseconds from the telemetry registry"""
+
+    def __init__(self, parent, interval: int = 1000):
+        super().__init__(parent)
+        self.parent = parent
+
+        self.timer = QTimer(self)
+        self.timer.timeout.connect(self.update_status)
+        self.timer.start(interval)
+
+    def update_status(self):
+        # reading the telemetry does not wait for the acquisition threads
+        self.setText(telemetry.status_text())
@@ -5,6 +5,7 @@ import time
 from copylot import logger
 from copylot.gui._qt.job_runners.worker import Worker
 from copylot.hardware.daqs.ni.legacy_daxi_nidaq import NIDaq
+from copylot.hardware.daqs.ni.task_pool import TaskPool
 
 
 class LiveControlDockWidget(QWidget):
@@ -20,6 +21,10 @@ class LiveControlDockWidget(QWidget):
 
         self.state_tracker = False  # tracks if live mode is on
         self.wait_shutdown = False
+        # committed DAQ tasks reused by every launch, also by timelapse mode,
+        # closed when the application quits as the docks get no close event
+        self.task_pool = TaskPool()
+        QApplication.instance().aboutToQuit.connect(self.task_pool.close)
 
         self.layout = QVBoxLayout()
         self.layout.setAlignment(Qt.AlignTop)
@@ -55,7 +60,7 @@ class LiveControlDockWidget(QWidget):
         view = self.combobox_view
         parameters = self.parent.parameters_widget.parameters
 
-        daq_card = NIDaq(self, **parameters)
+        daq_card = NIDaq(self, task_pool=self.task_pool, **parameters)
         daq_card.select_view(view)
 
     def launch_nidaq(self):
@@ -74,7 +79,10 @@ class LiveControlDockWidget(QWidget):
             daq_card_worker = Worker(self.timelapse_worker_method)
 
             logger.info(
-                f"called with: {self.parent.parameters_widget.parameters} view {self.combobox_view}, and channel {self.combobox_channel}"
+                "called with: %s view %s, and channel %s",
+                self.parent.parameters_widget.parameters,
+                self.combobox_view,
+                self.combobox_channel,
             )
 
             # connect
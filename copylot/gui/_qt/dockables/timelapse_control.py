@@ -72,7 +72,10 @@ class TimelapseControlDockWidget(QWidget):
         )
         parameters = self.parent.parameters_widget.parameters
 
-        daq_card = NIDaq(self, **parameters)
+        # the tasks committed in live mode are reused
+        daq_card = NIDaq(
+            self, task_pool=self.parent.live_widget.task_pool, **parameters
+        )
         daq_card.acquire_stacks(channels=channel, view=view)
 
     def launch_nidaq(self):
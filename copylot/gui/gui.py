@@ -14,6 +14,7 @@ from qtpy.QtWidgets import (
 )
 
 from copylot.gui._qt.custom_widgets.dock_placeholder import DockPlaceholder
+from copylot.gui._qt.custom_widgets.telemetry_status import TelemetryStatusWidget
 from copylot import __version__, logger
 
 
@@ -129,6 +130,9 @@ class MainWindow(QMainWindow):
         # create status bar that is updated from live and timelapse control classes
         self.status_bar = QStatusBar()
         self.setStatusBar(self.status_bar)
+        # live frame rates and drops of the devices, next to the messages
+        self.telemetry_status = TelemetryStatusWidget(self)
+        self.status_bar.addPermanentWidget(self.telemetry_status)
 
         # Menu bar
         self.setupMenubar()
@@ -1,6 +1,5 @@
 from copylot.gui.viewer.viewer import Viewer
 from copylot.hardware.cameras.flir.flir_camera import FlirCamera
-import numpy as np
 
 # create camera object
 cam = FlirCamera()
@@ -9,36 +8,32 @@ cam.open()
 
 
 # 2 ways to stream in viewer
-# FIRST OPTION: cycle one by one
+# FIRST OPTION: continuous stream, show the newest frame at up to 30 fps
 
-# function to take and stack an image
-def snap_mono(c: FlirCamera):
-    snap = c.snap()
-    return np.stack((snap, snap, snap), axis=2)
+# start the acquisition once, frames are grabbed in the background
+cam.start_stream()
 
+# create vispy canvas with initial image, mono frames are shown with a colormap
+init_im, _ = cam.read_latest(timeout=1)
+view1 = Viewer(init_im, auto_contrast=True, binning='auto')
 
-# create initial blank (placeholder) image
-init_im = snap_mono(cam)
+# frames are copied on a worker thread and rendered by the vispy event loop
+view1.start_live(cam, max_fps=30)
 
-# create vispy canvas with initial image
-view1 = Viewer(init_im)
-
-for i in range(5):
-    im = snap_mono(cam)
-    view1.update(im)
-    view1.process()  # introduces a delay between snapping the images
-
-# run the vispy event loop
+# run the vispy event loop until the window is closed
 view1.run()
 
+view1.stop_live()
+cam.stop_stream()
+print(f"streamed {cam.frame_count} frames")
+
 # SECOND OPTION: get all images and then cycle them through the viewer
 # create vispy canvas with initial image
 view2 = Viewer(init_im)
 
 ims = cam.snap(10)
 for i in range(10):
-    ima = np.stack((ims[i], ims[i], ims[i]), axis=2)
-    view2.update(ima)
+    view2.update(ims[i])
     view2.process()
 
 view2.run()
@@ -0,0 +1,160 @@
+"""
+Contrast and downsampling of the frames shown by the viewer.
+
+Contrast limits are estimated from a strided subsample of a frame, so a
+2048x2048 frame costs the percentiles of a few thousand pixels. Frames can
+be binned before the upload when the canvas shows fewer pixels than the
+frame has, a 2x or 4x binned frame keeps its dtype and is 4 or 16 times
+smaller to transfer.
+``apply_contrast`` is the CPU equivalent of the ``clim`` and ``gamma`` of
+the vispy image, for displays without a GPU and for tests.
+"""
+from typing import Tuple
+
+import numpy as np
+
+# binning factors of the display pyramid
+BINNING_LEVELS = (1, 2, 4)
+
+
+def auto_contrast(
+    frame: np.ndarray,
+    stride: int = 8,
+    percentiles: Tuple[float, float] = (0.1, 99.9),
+) -> Tuple[float, float]:
+    """
+    Contrast limits from the percentiles of a strided subsample.
+
+    Parameters
+    ----------
+    frame : np.ndarray
+    stride : int
+        Every ``stride``-th pixel of every ``stride``-th row is sampled.
+    percentiles : Tuple[float, float]
+        Percentiles of the lower and upper limits.
+
+    Returns
+    -------
+    Tuple[float, float]
+        Lower and upper limits, the upper one is above the lower one even
+        for uniform frames.
+    """
+    sample = frame[::stride, ::stride]
+    low, high = np.percentile(sample, percentiles)
+    if high <= low:
+        high = low + 1
+    return float(low), float(high)
+
+
+def apply_contrast(
+    frame: np.ndarray,
+    clim: Tuple[float, float],
+    gamma: float = 1.0,
+    out: np.ndarray = None,
+) -> np.ndarray:
+    """
+    Map a frame to 8 bits on the CPU, like the ``clim`` and ``gamma`` of a
+    vispy image do on the GPU.
+
+    Parameters
+    ----------
+    frame : np.ndarray
+    clim : Tuple[float, float]
+        Values mapped to 0 and 255.
+    gamma : float
+        Exponent applied to the values scaled to [0, 1].
+    out : np.ndarray, optional
+        uint8 destination buffer, a new array is allocated if None.
+
+    Returns
+    -------
+    np.ndarray
+    """
+    low, high = clim
+    scaled = (frame.astype(np.float32) - low) * (1 / (high - low))
+    np.clip(scaled, 0, 1, out=scaled)
+    if gamma != 1:
+        np.power(scaled, gamma, out=scaled)
+    scaled *= 255
+    if out is None:
+        out = np.empty(frame.shape, dtype=np.uint8)
+    np.rint(scaled, out=scaled)
+    out[...] = scaled
+    return out
+
+
+def bin_frame(
+    frame: np.ndarray,
+    factor: int,
+    out: np.ndarray = None,
+    accumulator: np.ndarray = None,
+) -> np.ndarray:
+    """
+    Mean of ``factor`` x ``factor`` blocks of pixels, in the dtype of the
+    frame.
+
+    Rows and columns that do not fill a block are dropped. The blocks are
+    summed in float32 and the means of integer frames are rounded, so a
+    binned uint16 frame stays uint16 and is ``factor**2`` times smaller to
+    upload.
+
+    Parameters
+    ----------
+    frame : np.ndarray
+    factor : int
+    out : np.ndarray, optional
+        Destination buffer of the dtype of the frame, a new array is
+        allocated if None.
+    accumulator : np.ndarray, optional
+        float32 buffer of the binned shape for the sums of integer frames, a
+        new array is allocated if None.
+
+    Returns
+    -------
+    np.ndarray
+        Binned frame, the frame itself for a factor of 1.
+    """
+    if factor == 1:
+        return frame
+    rows, columns = frame.shape[0] // factor, frame.shape[1] // factor
+    if out is None:
+        out = np.empty((rows, columns), dtype=frame.dtype)
+    if out.dtype == np.float32:
+        accumulator = out
+    elif accumulator is None:
+        accumulator = np.empty((rows, columns), dtype=np.float32)
+    # in-place sums of strided views, a reduction over a reshaped frame is
+    # several times slower
+    np.copyto(accumulator, frame[: rows * factor : factor, : columns * factor : factor])
+    for row in range(factor):
+        for column in range(factor):
+            if row or column:
+                accumulator += frame[
+                    row : rows * factor : factor, column : columns * factor : factor
+                ]
+    accumulator *= 1 / factor**2
+    if accumulator is not out:
+        if np.issubdtype(out.dtype, np.integer):
+            np.rint(accumulator, out=accumulator)
+        out[...] = accumulator
+    return out
+
+
+def display_binning(frame_pixels: float, screen_pixels: float) -> int:
+    """
+    Largest binning of ``BINNING_LEVELS`` that keeps at least a binned pixel
+    per screen pixel.
+
+    Parameters
+    ----------
+    frame_pixels : float
+        Number of frame pixels shown along the width of the canvas.
+    screen_pixels : float
+        Width of the canvas in screen pixels.
+
+    Returns
+    -------
+    int
+    """
+    ratio = frame_pixels / max(screen_pixels, 1)
+    return max(level for level in BINNING_LEVELS if level <= max(ratio, 1))
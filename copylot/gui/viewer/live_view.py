@@ -0,0 +1,156 @@
+import threading
+import time
+from typing import Optional, Tuple
+
+import numpy as np
+
+from copylot import logger
+from copylot.hardware.cameras.frame_buffer import FrameMetadata
+
+
+class LiveViewException(Exception):
+    pass
+
+
+class LiveView:
+    """
+    Latest-wins hand-off of camera frames from a worker thread to a display.
+
+    The worker thread copies the newest frame of ``source`` into one of three
+    preallocated buffers, at most ``max_fps`` times per second, and publishes
+    it as the ready frame. The display takes the ready frame whenever it
+    renders, e.g. from a vispy timer. Frames the display did not take in time
+    are overwritten instead of queued, so a slow display only lowers the
+    displayed frame rate and never stalls the acquisition, and a frame being
+    uploaded is never overwritten.
+
+    Parameters
+    ----------
+    source
+        Camera stream with a ``read_latest(out, timeout)`` method returning a
+        frame and its ``FrameMetadata``, e.g. ``FlirCamera`` after
+        ``start_stream()`` or a ``StreamingAcquisition``.
+    max_fps : float
+        Maximum number of frames per second copied for the display.
+    timeout : float
+        Maximum time to wait for a frame of the source in seconds.
+
+    """
+
+    def __init__(self, source, max_fps: float = 30.0, timeout: float = 1.0):
+        if max_fps <= 0:
+            raise ValueError("The live view needs a positive frame rate.")
+        self.source = source
+        self.max_fps = max_fps
+        self.timeout = timeout
+
+        # the buffers being filled, ready to be taken and displayed
+        self._buffers = None
+        self._metadata = [None] * 3
+        self._fill, self._ready, self._displayed = 0, 1, 2
+        self._has_new_frame = False
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._thread = None
+        self._error = None
+        self._last_index = None
+        self._published_frames = 0
+        self._displayed_frames = 0
+
+    @property
+    def is_running(self) -> bool:
+        """True while the worker thread is alive"""
+        return self._thread is not None and self._thread.is_alive()
+
+    @property
+    def published_frames(self) -> int:
+        """Number of frames copied for the display since start"""
+        return self._published_frames
+
+    @property
+    def displayed_frames(self) -> int:
+        """Number of frames taken by the display since start"""
+        return self._displayed_frames
+
+    def start(self):
+        """Start the worker thread"""
+        if self.is_running:
+            raise LiveViewException("Live view is already running.")
+
+        self._buffers = None
+        self._error = None
+        self._has_new_frame = False
+        self._last_index = None
+        self._published_frames = 0
+        self._displayed_frames = 0
+        self._stop_event.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="copylot-live-view", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self, timeout: float = None):
+        """Stop the worker thread and wait until it returns
+
+        Parameters
+        ----------
+        timeout : float
+            Maximum time to wait for the thread in seconds.
+        """
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+        if self._error is not None:
+            raise LiveViewException("Live view thread failed.") from self._error
+
+    def take(self) -> Tuple[Optional[np.ndarray], Optional[FrameMetadata]]:
+        """
+        Newest frame that was not displayed yet.
+
+        Returns
+        -------
+        Tuple[Optional[np.ndarray], Optional[FrameMetadata]]
+            (None, None) if no new frame arrived since the last call. The
+            frame stays valid until the next call that returns a frame.
+        """
+        with self._lock:
+            if not self._has_new_frame:
+                return None, None
+            self._ready, self._displayed = self._displayed, self._ready
+            self._has_new_frame = False
+            self._displayed_frames += 1
+            return self._buffers[self._displayed], self._metadata[self._displayed]
+
+    def _publish(self, metadata):
+        with self._lock:
+            self._metadata[self._fill] = metadata
+            self._fill, self._ready = self._ready, self._fill
+            self._has_new_frame = True
+            self._published_frames += 1
+
+    def _run(self):
+        period = 1 / self.max_fps
+        try:
+            while not self._stop_event.is_set():
+                start = time.perf_counter()
+                try:
+                    if self._buffers is None:
+                        frame, metadata = self.source.read_latest(timeout=self.timeout)
+                        self._buffers = np.empty((3, *frame.shape), dtype=frame.dtype)
+                        self._buffers[self._fill] = frame
+                    else:
+                        frame, metadata = self.source.read_latest(
+                            out=self._buffers[self._fill], timeout=self.timeout
+                        )
+                except TimeoutError:
+                    continue
+
+                # the source hands out its newest frame again until the next one
+                if metadata.frame_index != self._last_index:
+                    self._last_index = metadata.frame_index
+                    self._publish(metadata)
+                self._stop_event.wait(period - (time.perf_counter() - start))
+        except Exception as e:
+            logger.error("Live view stopped with error: %s", e)
+            self._error = e
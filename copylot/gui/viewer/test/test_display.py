@@ -0,0 +1,62 @@
+import numpy as np
+import pytest
+
+from copylot.gui.viewer.display import (
+    apply_contrast,
+    auto_contrast,
+    bin_frame,
+    display_binning,
+)
+
+
+def test_auto_contrast_from_subsample():
+    frame = np.tile(np.arange(1000, dtype=np.uint16), (64, 1))
+    low, high = auto_contrast(frame, stride=4, percentiles=(0, 100))
+
+    assert (low, high) == (0, 996)
+    assert auto_contrast(np.full((8, 8), 7, dtype=np.uint16)) == (7, 8)
+
+
+def test_apply_contrast_matches_clim_and_gamma():
+    frame = np.array([[100, 200, 300, 400]], dtype=np.uint16)
+    out = np.empty(frame.shape, dtype=np.uint8)
+
+    assert apply_contrast(frame, (200, 300), out=out) is out
+    np.testing.assert_array_equal(out, [[0, 0, 255, 255]])
+
+    frame = np.array([[0, 25, 100]], dtype=np.uint16)
+    np.testing.assert_array_equal(
+        apply_contrast(frame, (0, 100), gamma=0.5), [[0, 128, 255]]
+    )
+
+
+@pytest.mark.parametrize('factor', [2, 4])
+def test_bin_frame(factor):
+    frame = np.random.default_rng(0).integers(0, 4096, (18, 20), dtype=np.uint16)
+    out = np.empty((18 // factor, 20 // factor), dtype=np.float32)
+
+    binned = bin_frame(frame, factor, out=out)
+
+    assert binned is out
+    expected = frame[: 18 // factor * factor, : 20 // factor * factor]
+    expected = expected.reshape(18 // factor, factor, 20 // factor, factor)
+    np.testing.assert_allclose(binned, expected.mean(axis=(1, 3)), rtol=1e-6)
+    assert bin_frame(frame, 1) is frame
+
+
+def test_bin_frame_keeps_the_dtype():
+    frame = np.array([[1, 2, 10, 10], [3, 4, 10, 11]], dtype=np.uint16)
+
+    binned = bin_frame(frame, 2)
+
+    assert binned.dtype == np.uint16
+    assert binned.nbytes == frame.nbytes // 4
+    # means rounded to the nearest integer
+    np.testing.assert_array_equal(binned, [[2, 10]])
+
+
+def test_display_binning():
+    assert display_binning(2048, 1024) == 2
+    assert display_binning(4096, 1000) == 4
+    assert display_binning(10000, 1000) == 4
+    assert display_binning(512, 1024) == 1
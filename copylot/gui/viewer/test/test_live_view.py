@@ -0,0 +1,107 @@
+import time
+
+import numpy as np
+import pytest
+
+from copylot.gui.viewer.live_view import LiveView, LiveViewException
+from copylot.hardware.cameras.frame_buffer import FrameMetadata
+from copylot.hardware.cameras.streaming import StreamingAcquisition
+
+
+class FakeCamera:
+    '''Acquires 4x4 frames filled with their frame index every period'''
+
+    def __init__(self, period=0.001):
+        self.period = period
+        self.count = 0
+        self._buffer = np.zeros((4, 4), dtype=np.uint16)
+
+    def __call__(self):
+        time.sleep(self.period)
+        self._buffer[:] = self.count
+        metadata = FrameMetadata(frame_index=self.count)
+        self.count += 1
+        return self._buffer, metadata
+
+
+class StillSource:
+    '''Hands out the same frame forever'''
+
+    def read_latest(self, out=None, timeout=None):
+        frame = np.ones((4, 4), dtype=np.uint16)
+        if out is not None:
+            np.copyto(out, frame)
+            frame = out
+        return frame, FrameMetadata(frame_index=0)
+
+
+class FailingSource:
+    def read_latest(self, out=None, timeout=None):
+        raise RuntimeError("camera unplugged")
+
+
+def wait_until(predicate, timeout=2.0):
+    deadline = time.perf_counter() + timeout
+    while not predicate():
+        assert time.perf_counter() < deadline
+        time.sleep(0.001)
+
+
+def test_slow_display_does_not_stall_acquisition():
+    stream = StreamingAcquisition(FakeCamera(), nb_buffers=4)
+    stream.start()
+    live_view = LiveView(stream, max_fps=200)
+    live_view.start()
+
+    # the display takes a frame every 50 ms
+    frames = []
+    for _ in range(4):
+        time.sleep(0.05)
+        frame, metadata = live_view.take()
+        frames.append((frame.copy(), metadata))
+    live_view.stop()
+    stream.stop()
+
+    assert live_view.displayed_frames == 4
+    assert live_view.published_frames > live_view.displayed_frames
+    # the camera kept acquiring at its own rate while the display was waiting
+    assert stream.frame_count > 100
+    indices = [metadata.frame_index for _, metadata in frames]
+    assert indices == sorted(set(indices))
+    for frame, metadata in frames:
+        assert np.all(frame == metadata.frame_index)
+
+
+def test_take_returns_each_frame_once():
+    live_view = LiveView(StillSource(), max_fps=500)
+    live_view.start()
+    wait_until(lambda: live_view.published_frames > 0)
+    time.sleep(0.02)
+
+    frame, metadata = live_view.take()
+    assert metadata.frame_index == 0
+    assert np.all(frame == 1)
+    assert live_view.take() == (None, None)
+    live_view.stop()
+    assert live_view.published_frames == 1
+
+
+def test_frame_rate_is_capped():
+    stream = StreamingAcquisition(FakeCamera(), nb_buffers=4)
+    stream.start()
+    live_view = LiveView(stream, max_fps=20)
+    live_view.start()
+    time.sleep(0.3)
+    live_view.stop()
+    stream.stop()
+
+    assert 3 <= live_view.published_frames <= 8
+
+
+def test_source_error_is_raised_on_stop():
+    live_view = LiveView(FailingSource())
+    live_view.start()
+    wait_until(lambda: not live_view.is_running)
+
+    with pytest.raises(LiveViewException):
+        live_view.stop()
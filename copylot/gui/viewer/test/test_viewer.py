@@ -0,0 +1,49 @@
+import sys
+
+import numpy as np
+import pytest
+
+
+@pytest.fixture
+def viewer(mocker):
+    '''
+    Viewer module imported with a fake vispy
+    '''
+    vispy = mocker.MagicMock()
+    mocker.patch.dict(
+        sys.modules,
+        {
+            'vispy': vispy,
+            'vispy.visuals': vispy.visuals,
+            'vispy.visuals.transforms': vispy.visuals.transforms,
+        },
+    )
+    sys.modules.pop('copylot.gui.viewer.viewer', None)
+
+    from copylot.gui.viewer import viewer
+
+    return viewer
+
+
+def test_gpu_contrast_uploads_frames_in_their_dtype(viewer):
+    image = viewer.scene.visuals.Image
+    shown = viewer.Viewer(binning=2)
+
+    assert image.call_args.kwargs['texture_format'] == 'auto'
+
+    shown.update(np.ones((64, 64), dtype=np.uint16))
+    uploaded = image.return_value.set_data.call_args.args[0]
+    assert uploaded.dtype == np.uint16
+    assert uploaded.shape == (32, 32)
+
+
+def test_cpu_contrast_uploads_8_bit_frames(viewer):
+    image = viewer.scene.visuals.Image
+    shown = viewer.Viewer(clim=(0, 100), gpu_contrast=False)
+
+    assert image.call_args.kwargs['texture_format'] is None
+
+    shown.update(np.full((4, 4), 50, dtype=np.uint16))
+    uploaded = image.return_value.set_data.call_args.args[0]
+    assert uploaded.dtype == np.uint8
+    assert uploaded[0, 0] == 128
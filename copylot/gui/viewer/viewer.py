@@ -1,10 +1,61 @@
 import numpy as np
 from vispy import scene
 from vispy import app
+from vispy.visuals.transforms import STTransform
+
+from copylot.gui.viewer.display import (
+    BINNING_LEVELS,
+    apply_contrast,
+    auto_contrast,
+    bin_frame,
+    display_binning,
+)
+from copylot.gui.viewer.live_view import LiveView
 
 
 class Viewer:
-    def __init__(self, img_data=None):
+    """
+    Image viewer on a vispy canvas.
+
+    Single channel frames are uploaded in their own dtype to a texture of
+    that format and mapped to colors on the GPU with ``cmap``, ``clim`` and
+    ``gamma``, so mono camera frames are neither scaled nor converted to RGB
+    on the CPU. With ``gpu_contrast=False`` the contrast is applied on the
+    CPU and 8-bit frames are uploaded instead.
+
+    Parameters
+    ----------
+    img_data : np.ndarray, optional
+        Initial image.
+    cmap : str
+        Colormap of single channel images.
+    clim : Tuple[float, float], optional
+        Contrast limits, defaults to the range of an integer dtype, e.g.
+        (0, 65535) for uint16, or to the range of each float image.
+    gamma : float
+        Gamma correction of the contrast.
+    auto_contrast : bool
+        Set the contrast limits of every frame from a subsample of it.
+    binning : int or str
+        Binning of the uploaded frames, 1, 2 or 4, or 'auto' to bin them
+        while the canvas shows fewer pixels than the frame has.
+    gpu_contrast : bool
+        Apply the contrast on the GPU, else on the CPU.
+
+    """
+
+    def __init__(
+        self,
+        img_data=None,
+        cmap='grays',
+        clim=None,
+        gamma=1.0,
+        auto_contrast=False,
+        binning=1,
+        gpu_contrast=True,
+    ):
+        if binning != 'auto' and binning not in BINNING_LEVELS:
+            raise ValueError(f"Binning must be 'auto' or one of {BINNING_LEVELS}.")
         self.canvas = scene.SceneCanvas(keys='interactive')
         self.canvas.size = 1024, 1024
         self.canvas.title = 'coPylot viewer'
@@ -15,24 +66,51 @@ class Viewer:
 
         interpolation = 'nearest'
 
+        if clim is None:
+            clim = self._default_clim(img_data)
         self.image = scene.visuals.Image(
-            img_data,
+            None,
             interpolation=interpolation,
             parent=self.view.scene,
             method='subdivide',
+            cmap=cmap,
+            clim=clim if gpu_contrast else (0, 255),
+            gamma=gamma if gpu_contrast else 1.0,
+            # a texture in the format of the data, None scales it on the CPU
+            texture_format='auto' if gpu_contrast else None,
         )
 
+        # set parameters for contrast
+        self.img_data = img_data
+        self._contrast_limits = clim
+        self._gamma = gamma
+        self.auto_contrast = auto_contrast
+        self.gpu_contrast = gpu_contrast
+        self.binning = binning
+        self.update_freq = 0
+        self._live_view = None
+        self._render_timer = None
+        # binning of the uploaded frame and the buffers reused for uploads
+        self._shown_binning = 1
+        self._binned = None
+        self._accumulator = None
+        self._contrasted = None
+
         # Set 2D camera (the camera will scale to the contents in the scene)
         self.view.camera = scene.PanZoomCamera(aspect=1)
         # flip y-axis to have correct alignment
         self.view.camera.flip = (0, 1, 0)
+        if img_data is not None:
+            self.update(img_data)
         self.view.camera.set_range()
         self.view.camera.zoom(1, (250, 200))
 
-        # set parameters for contrast
-        self.img_data = img_data
-        self._contrast_limits = None
-        self.update_freq = 0
+    @staticmethod
+    def _default_clim(img_data):
+        if img_data is not None and np.issubdtype(img_data.dtype, np.integer):
+            info = np.iinfo(img_data.dtype)
+            return info.min, info.max
+        return 'auto'
 
     @staticmethod
     def run():
@@ -56,16 +134,125 @@ class Viewer:
         ----------
         data: ndarray of the new image to be shown
         """
+        if self.auto_contrast and data.ndim == 2:
+            self._set_clim(auto_contrast(data))
+
+        factor = self._binning_factor(data) if data.ndim == 2 else 1
+        if factor > 1:
+            shape = self._binned_shape(data, factor)
+            self._binned = self._reuse(self._binned, shape, data.dtype)
+            self._accumulator = self._reuse(self._accumulator, shape)
+            data = bin_frame(
+                data, factor, out=self._binned, accumulator=self._accumulator
+            )
+        if factor != self._shown_binning:
+            # binned pixels keep covering the area of the frame pixels
+            self.image.transform = STTransform(scale=(factor, factor))
+            self._shown_binning = factor
+
+        if not self.gpu_contrast and data.ndim == 2:
+            clim = self._contrast_limits
+            if isinstance(clim, str):
+                clim = auto_contrast(data, stride=1, percentiles=(0, 100))
+            self._contrasted = self._reuse(self._contrasted, data.shape, np.uint8)
+            data = apply_contrast(data, clim, self._gamma, out=self._contrasted)
+
         # input new image data
         self.image.set_data(data)
         # update the SceneCanvas object
         self.canvas.update()
 
+    def start_live(self, source, max_fps: float = 30.0, render_fps: float = None):
+        """
+        Show the newest frames of a camera stream until ``stop_live``.
+
+        Frames are copied on a ``LiveView`` worker thread and rendered by a
+        timer of the vispy event loop, frames that arrive faster than they
+        are rendered are skipped, so the acquisition never waits for the
+        display. Run the event loop with ``run``.
+
+        Parameters
+        ----------
+        source
+            Camera stream with a ``read_latest(out, timeout)`` method, e.g.
+            ``FlirCamera`` after ``start_stream()``.
+        max_fps : float
+            Maximum number of frames per second copied for the display.
+        render_fps : float, optional
+            Maximum number of frames per second rendered, defaults to
+            ``max_fps``.
+        """
+        self.stop_live()
+        self._live_view = LiveView(source, max_fps=max_fps)
+        self._live_view.start()
+        self._render_timer = app.Timer(
+            interval=1 / (render_fps or max_fps),
+            connect=self._render_live_frame,
+            start=True,
+        )
+
+    def stop_live(self):
+        """
+        Stop showing the frames of the camera stream
+        """
+        if self._render_timer is not None:
+            self._render_timer.stop()
+            self._render_timer = None
+        if self._live_view is not None:
+            live_view, self._live_view = self._live_view, None
+            live_view.stop()
+
+    def _render_live_frame(self, event=None):
+        frame, _ = self._live_view.take()
+        if frame is not None:
+            self.update(frame)
+
+    @staticmethod
+    def _binned_shape(data, factor):
+        return data.shape[0] // factor, data.shape[1] // factor
+
+    @staticmethod
+    def _reuse(buffer, shape, dtype=np.float32):
+        if buffer is None or buffer.shape != shape or buffer.dtype != dtype:
+            return np.empty(shape, dtype=dtype)
+        return buffer
+
+    def _binning_factor(self, data):
+        if self.binning != 'auto':
+            return self.binning
+        # frame pixels along the width of the canvas at the current zoom
+        shown_pixels = min(self.view.camera.rect.width, data.shape[1])
+        return display_binning(shown_pixels, self.canvas.size[0])
+
+    def _set_clim(self, clim):
+        self._contrast_limits = clim
+        if self.gpu_contrast:
+            self.image.clim = clim
+
     @property
     def contrast_limits(self):
+        """
+        Values shown as the first and last colors of the colormap
+        """
         return self._contrast_limits
 
     @contrast_limits.setter
-    def contrast_limits(self, factor):
-        # TODO: get tuple as argument, use vispy clim
-        pass
+    def contrast_limits(self, clim):
+        # limits set by hand replace the automatic ones
+        self.auto_contrast = False
+        self._set_clim(tuple(clim))
+        self.canvas.update()
+
+    @property
+    def gamma(self):
+        """
+        Gamma correction of the contrast
+        """
+        return self._gamma
+
+    @gamma.setter
+    def gamma(self, value):
+        self._gamma = value
+        if self.gpu_contrast:
+            self.image.gamma = value
+        self.canvas.update()
@@ -1,6 +1,10 @@
 from abc import ABCMeta, abstractmethod
 from typing import Tuple
 
+import numpy as np
+
+from copylot.hardware.cameras.frame_buffer import FrameMetadata
+
 
 class AbstractCamera(metaclass=ABCMeta):
     """AbstractCamera
@@ -29,6 +33,53 @@ class AbstractCamera(metaclass=ABCMeta):
         """Method to capture a single image from the camera."""
         raise NotImplementedError()
 
+    @abstractmethod
+    def start_sequence(self, n_buffers: int = 16) -> None:
+        """Start a continuous acquisition on a background thread
+
+        Frames are copied into a pool of ``n_buffers`` preallocated frames
+        until ``stop_sequence`` is called, read them with ``get_frame``.
+
+        Parameters
+        ----------
+        n_buffers : int
+            Number of frames that can wait to be read before the oldest
+            ones are dropped.
+
+        """
+        raise NotImplementedError()
+
+    @abstractmethod
+    def get_frame(
+        self, timeout: float = None, out: np.ndarray = None
+    ) -> Tuple[np.ndarray, FrameMetadata]:
+        """Next frame of the sequence, in acquisition order
+
+        Frames dropped because they were not read in time show up as gaps
+        in ``FrameMetadata.frame_index``.
+
+        Parameters
+        ----------
+        timeout : float
+            Maximum time to wait for a frame in seconds, wait forever if None.
+        out : np.ndarray, optional
+            Caller-owned destination buffer with the shape and dtype of the
+            frames, the frame is copied into it instead of a new array.
+
+        Returns
+        -------
+        Tuple[np.ndarray, FrameMetadata]
+            The frame, ``out`` if given, and its index, hardware frame
+            counter and timestamp.
+
+        """
+        raise NotImplementedError()
+
+    @abstractmethod
+    def stop_sequence(self) -> None:
+        """Stop the acquisition started by ``start_sequence``"""
+        raise NotImplementedError()
+
     @staticmethod
     @abstractmethod
     def list_available_cameras():
@@ -1,4 +1,5 @@
 from copylot.hardware.cameras.flir.flir_camera import FlirCamera
+from copylot.io.writers import ZarrWriter
 
 if __name__ == '__main__':
     cam = FlirCamera()
@@ -11,7 +12,7 @@ if __name__ == '__main__':
     # list of cameras
     print(cam.list_available_cameras())
 
-    # Return 10 frames and save output arrays as .csv files (this can be changed)
+    # Return 10 frames and save output arrays as OME-TIFF stacks (can be changed to Zarr)
 
     # Option 1: take multiple frames in a single acquisition
     # Can control timeout (wait_time) for grabbing images from the camera buffer
@@ -25,6 +26,16 @@ if __name__ == '__main__':
         snap2 = cam.snap()
         cam.save_image(snap2)
 
+    # Option 3: stream continuously and write every frame to a chunked Zarr store,
+    # frames are written on a background thread while the camera keeps acquiring
+    cam.start_stream()
+    with ZarrWriter('flir_stream.zarr', chunk_frames=16, overwrite=True) as writer:
+        for i in range(100):
+            frame, metadata = cam.read_next(timeout=1)
+            writer.write(frame, metadata)
+    cam.stop_stream()
+    print('Dropped frames', cam.dropped_frames, 'writer blocked', writer.blocked_time)
+
     # open again
     cam.open()
 
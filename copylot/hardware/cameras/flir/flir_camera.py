@@ -1,9 +1,47 @@
 from copylot.hardware.cameras.abstract_camera import AbstractCamera
+from copylot.hardware.cameras.frame_buffer import FrameMetadata
+from copylot.hardware.cameras.streaming import StreamingAcquisition
+from copylot.hardware.telemetry import FrameTelemetry
+from copylot.io.writers import TiffWriter, ZarrWriter
 from copylot import logger
-import PySpin
-import numpy as np
-import os.path
-from skimage.io import imsave, imread
+import time
+
+
+# GenICam nodes of the camera, resolved once per camera
+NODE_NAMES = (
+    'ExposureAuto',
+    'ExposureTime',
+    'GainAuto',
+    'Gain',
+    'AcquisitionFrameRate',
+    'AdcBitDepth',
+    'Width',
+    'Height',
+    'BinningHorizontal',
+    'BinningVertical',
+    'SensorShutterMode',
+)
+
+# nodes whose limits change when a node is written
+LIMIT_DEPENDENCIES = {
+    'BinningHorizontal': ('Width',),
+    'BinningVertical': ('Height', 'ExposureTime', 'AcquisitionFrameRate'),
+    'Height': ('ExposureTime', 'AcquisitionFrameRate'),
+    'AdcBitDepth': ('ExposureTime', 'AcquisitionFrameRate'),
+    'SensorShutterMode': ('ExposureTime', 'AcquisitionFrameRate'),
+    'ExposureTime': ('AcquisitionFrameRate',),
+}
+
+# order in which apply_settings writes the settings, a setting may change the
+# limits of the settings after it
+SETTINGS_ORDER = (
+    'shutter_mode',
+    'bitdepth',
+    'binning',
+    'image_size',
+    'exposure',
+    'gain',
+)
 
 
 class FlirCameraException(Exception):
@@ -13,14 +51,38 @@ class FlirCameraException(Exception):
 class FlirCamera(AbstractCamera):
     """
     Flir Camera BFS-U3-63S4M-C adapter.
+
+    The frame IDs, timestamps and backlog of the acquired frames are
+    recorded in ``telemetry``, which is named after the serial number of the
+    camera when it is opened, e.g. 'flir20270803'. The handles of the GenICam nodes are resolved
+    once when the camera is opened, and their limits are cached until a
+    node they depend on is written.
+
+    Parameters
+    ----------
+    backend
+        Module providing the Spinnaker ``System``, node functions and
+        constants, defaults to ``PySpin``. Pass a simulated backend to run
+        the camera without the Spinnaker SDK.
     """
 
-    def __init__(self):
+    def __init__(self, backend=None):
+        if backend is None:
+            import PySpin as backend
+        self._pyspin = backend
         self.system = None
         self.cam_list = None
         self._cam = None
         self._device_id = None
         self._nodemap_tldevice = None
+        self._stream = None
+        self._pending_images = ()
+        self._first_frame_id = None
+        self._nb_saved_stacks = 0
+        self._nodes = None
+        self._limits = {}
+        # named after the camera in open()
+        self.telemetry = None
 
     @property
     def cam(self):
@@ -40,6 +102,9 @@ class FlirCamera(AbstractCamera):
             Camera pointer object connected to this instance.
         """
         self._cam = val
+        # the nodes and limits of the previous camera
+        self._nodes = None
+        self._limits = {}
 
     @property
     def nodemap_tldevice(self):
@@ -89,24 +154,28 @@ class FlirCamera(AbstractCamera):
             Index of camera assigned to CameraPtr.
         """
         if self.system is None:
-            self.system = PySpin.System.GetInstance()
+            self.system = self._pyspin.System.GetInstance()
             self.cam_list = self.system.GetCameras()
         self.cam = self.cam_list[index]
         self.nodemap_tldevice = self.cam.GetTLDeviceNodeMap()
 
         # assign serial number
         serial_no = ''
-        node_serial_no = PySpin.CStringPtr(
+        node_serial_no = self._pyspin.CStringPtr(
             self.nodemap_tldevice.GetNode('DeviceSerialNumber')
         )
-        if PySpin.IsReadable(node_serial_no):
+        if self._pyspin.IsReadable(node_serial_no):
             serial_no = node_serial_no.GetValue()
         else:
             logger.error('Node serial number is not readable')
         self._device_id = serial_no
+        # one telemetry per camera, e.g. for synchronized acquisitions
+        self.telemetry = FrameTelemetry(f"flir{serial_no or index}")
 
         # initialize camera
         self.initialize()
+        # resolve the node handles once, the camera must be initialized
+        self.nodes
 
     def initialize(self):
         """
@@ -115,7 +184,7 @@ class FlirCamera(AbstractCamera):
         try:
             if not self.cam.IsInitialized():
                 self.cam.Init()
-        except PySpin.SpinnakerException as ex:
+        except self._pyspin.SpinnakerException as ex:
             logger.error('Error running camera initialization: %s' % ex)
 
     def close(self):
@@ -124,6 +193,8 @@ class FlirCamera(AbstractCamera):
         Call close() once finished using the current camera instance
         Call open() to image again with the same instance
         """
+        self.stop_stream()
+
         # Deinitialize camera
         self.cam.DeInit()
 
@@ -148,41 +219,40 @@ class FlirCamera(AbstractCamera):
 
     def save_image(self, all_arrays, image_format='tiff'):
         """
-        Save individual image arrays to disk in a specific format
+        Save image arrays to disk as a single stack in a specific format.
+        Returns the path of the saved stack.
 
         Parameters
         ----------
         all_arrays : Numpy ndarray
             Intensity array list or single array of the image(s) returned by return_image()
         image_format : string
-            File format to save the image: 'csv', 'png', 'tiff'
-        """
-        if type(all_arrays) is list:
-            n = len(all_arrays)
+            File format to save the images: 'tiff' for OME-TIFF, 'zarr'
+        """
+        if type(all_arrays) is not list:
+            all_arrays = [all_arrays]
+
+        # a timestamp and a per-instance counter keep filenames unique without probing the disk,
+        # the writers fail rather than overwrite a stack saved under the same name
+        self._nb_saved_stacks += 1
+        name = 'Acquisition-%s-%s-%d' % (
+            self.device_id,
+            time.strftime('%Y%m%d-%H%M%S'),
+            self._nb_saved_stacks,
+        )
+        if image_format == 'tiff':
+            writer = TiffWriter(name + '.ome.tif', nb_frames=len(all_arrays))
+        elif image_format == 'zarr':
+            writer = ZarrWriter(name + '.zarr')
         else:
-            n = 1
-        add = 0
-        # assign unique filename to each array
-        for i in range(n):
-            filename = 'Acquisition-%s-%d.%s' % (self.device_id, i + add, image_format)
-            if i == 0:
-                while os.path.isfile('./' + filename):
-                    add += 1
-                    filename = 'Acquisition-%s-%d.%s' % (
-                        self.device_id,
-                        i + add,
-                        image_format,
-                    )
-
-            # get from list of arrays if n > 1
-            if n > 1:
-                to_save = all_arrays[i]
-            else:
-                to_save = all_arrays
+            raise FlirCameraException('Unsupported image format: %s' % image_format)
 
-            imsave(filename, to_save)
+        with writer:
+            for array in all_arrays:
+                writer.write(array)
 
-            logger.info('Saved at %s' % filename)
+        logger.info('Saved %d images at %s', len(all_arrays), writer.path)
+        return writer.path
 
     def return_image(self, processor, processing_type, wait_time):
         """
@@ -206,9 +276,7 @@ class FlirCamera(AbstractCamera):
             )
             return None
         else:
-            width = image_result.GetWidth()
-            height = image_result.GetHeight()
-            logger.info(f"Image width, height: {width} {height}")
+            self.telemetry.record(*self._frame_metadata(image_result))
 
             # Optional color processing. Ex processing_type = PySpin.PixelFormat_Mono8
             if processor is not None:
@@ -241,21 +309,60 @@ class FlirCamera(AbstractCamera):
         processing_type : string
             PySpin.PixelFormat color processor.
         """
+        if not self._set_acquisition_mode(mode):
+            return None
+
+        #  Start acquisition
+        self.telemetry.reset()
+        self._first_frame_id = None
+        self.cam.BeginAcquisition()
+
+        processor = self._create_processor(processing)
+
+        # List to store multiple arrays
+        all_arrays = []
+        for i in range(n_images):
+            try:
+                a = self.return_image(processor, processing_type, wait_time)
+                all_arrays.append(a)
+            except self._pyspin.SpinnakerException as ex:
+                logger.error('Error on image %i acquisition: %s' % (i, ex))
+                return None
+
+        #  End acquisition
+        self.cam.EndAcquisition()
+
+        if n_images == 1:
+            return all_arrays[0]  # return the array itself
+        else:
+            return all_arrays  # return a list of arrays
+
+    def _set_acquisition_mode(self, mode):
+        """
+        Set the acquisition mode node, returns False if the node is not accessible
+
+        Parameters
+        ----------
+        mode : string
+            Acquisition mode: 'Continuous' or 'SingleFrame'.
+        """
         # Retrieve nodemap
         nodemap = self.cam.GetNodeMap()
 
         # Cast node entries to CEnumerationPtr
-        node_acmod = PySpin.CEnumerationPtr(nodemap.GetNode('AcquisitionMode'))
-        if not PySpin.IsReadable(node_acmod) or not PySpin.IsWritable(node_acmod):
+        node_acmod = self._pyspin.CEnumerationPtr(nodemap.GetNode('AcquisitionMode'))
+        if not self._pyspin.IsReadable(node_acmod) or not self._pyspin.IsWritable(
+            node_acmod
+        ):
             logger.error('Unable to set acquisition mode')
-            return None
+            return False
 
         # Retrieve entry node from enumeration node with each mode
         node_acmod_con = node_acmod.GetEntryByName(mode)
 
-        if not PySpin.IsReadable(node_acmod_con):
+        if not self._pyspin.IsReadable(node_acmod_con):
             logger.error('Unable to set acquisition mode to ' + mode)
-            return None
+            return False
 
         # Retrieve integer value from entry node
         acmod_con = node_acmod_con.GetValue()
@@ -263,36 +370,194 @@ class FlirCamera(AbstractCamera):
         # Set integer value from entry node as new value of enumeration node
         node_acmod.SetIntValue(acmod_con)
         logger.info('Acquisition mode set to ' + mode)
+        return True
 
-        #  Start acquisition
+    def _create_processor(self, processing):
+        """
+        Create ImageProcessor instance for post-processing images, None if no processing
+        """
+        if not processing:
+            return None
+        processor = self._pyspin.ImageProcessor()
+        # Set default image processor color processing method
+        processor.SetColorProcessing(
+            self._pyspin.SPINNAKER_COLOR_PROCESSING_ALGORITHM_HQ_LINEAR
+        )
+        return processor
+
+    @property
+    def is_streaming(self):
+        """
+        Return True while a streaming session started by start_stream() is running
+        """
+        return self._stream is not None and self._stream.is_running
+
+    @property
+    def frame_count(self):
+        """
+        Return the number of frames acquired by the current streaming session
+        """
+        return 0 if self._stream is None else self._stream.frame_count
+
+    @property
+    def dropped_frames(self):
+        """
+        Return the number of frames overwritten before read_next() returned them
+        """
+        return 0 if self._stream is None else self._stream.dropped_frames
+
+    def start_stream(
+        self, nb_buffers=16, wait_time=1000, processing=False, processing_type=None
+    ):
+        """
+        Begin a continuous acquisition that runs on a background thread until
+        stop_stream() is called. Frames are copied into a preallocated pool of
+        nb_buffers frames, read them with read_latest() or read_next().
+
+        Parameters
+        ----------
+        nb_buffers : int
+            Number of frames in the buffer pool.
+        wait_time : int
+            Timeout to grab the next image in the camera buffer in milliseconds.
+        processing : bool
+            True for color processing and converting image array format.
+        processing_type : string
+            PySpin.PixelFormat color processor.
+        """
+        if self.is_streaming:
+            raise FlirCameraException('Streaming session is already running')
+
+        if not self._set_acquisition_mode('Continuous'):
+            raise FlirCameraException('Unable to set continuous acquisition mode')
+
+        processor = self._create_processor(processing)
+        self._first_frame_id = None
+        self._stream = StreamingAcquisition(
+            lambda: self._grab_stream_frame(processor, processing_type, wait_time),
+            nb_buffers=nb_buffers,
+            on_stop=self._end_stream_acquisition,
+            telemetry=self.telemetry,
+        )
         self.cam.BeginAcquisition()
+        self._stream.start()
 
-        processor = None
-        # Create ImageProcessor instance for post-processing images
-        if processing:
-            processor = PySpin.ImageProcessor()
-            # Set default image processor color processing method
-            processor.SetColorProcessing(
-                PySpin.SPINNAKER_COLOR_PROCESSING_ALGORITHM_HQ_LINEAR
-            )
+    def read_latest(self, out=None, timeout=None):
+        """
+        Return the newest frame of the streaming session and its FrameMetadata
 
-        # List to store multiple arrays
-        all_arrays = []
-        for i in range(n_images):
-            try:
-                a = self.return_image(processor, processing_type, wait_time)
-                all_arrays.append(a)
-            except PySpin.SpinnakerException as ex:
-                logger.error('Error on image %i acquisition: %s' % (i, ex))
+        Parameters
+        ----------
+        out : Numpy ndarray
+            Optional destination array the frame is copied to.
+        timeout : float
+            Maximum time to wait for a frame in seconds, wait forever if None.
+        """
+        if self._stream is None:
+            raise FlirCameraException('No streaming session, call start_stream()')
+        return self._stream.read_latest(out, timeout)
+
+    def read_next(self, out=None, timeout=None):
+        """
+        Return the next frame of the streaming session in acquisition order and its FrameMetadata
+
+        Parameters
+        ----------
+        out : Numpy ndarray
+            Optional destination array the frame is copied to.
+        timeout : float
+            Maximum time to wait for a frame in seconds, wait forever if None.
+        """
+        if self._stream is None:
+            raise FlirCameraException('No streaming session, call start_stream()')
+        return self._stream.read_next(out, timeout)
+
+    def stop_stream(self):
+        """
+        Stop the streaming session started by start_stream()
+        """
+        if self._stream is not None:
+            self._stream.stop()
+
+    def start_sequence(self, n_buffers=16):
+        """
+        Start a continuous acquisition without processing, see start_stream()
+
+        Parameters
+        ----------
+        n_buffers : int
+            Number of frames in the buffer pool.
+        """
+        self.start_stream(nb_buffers=n_buffers)
+
+    def get_frame(self, timeout=None, out=None):
+        """
+        Return the next frame of the sequence in acquisition order and its FrameMetadata
+
+        Parameters
+        ----------
+        timeout : float
+            Maximum time to wait for a frame in seconds, wait forever if None.
+        out : Numpy ndarray
+            Optional destination array the frame is copied to.
+        """
+        return self.read_next(out=out, timeout=timeout)
+
+    def stop_sequence(self):
+        """
+        Stop the acquisition started by start_sequence()
+        """
+        self.stop_stream()
+
+    def _grab_stream_frame(self, processor, processing_type, wait_time):
+        """
+        Grab the next image on the streaming thread, returns None on timeout or incomplete images
+        """
+        # the previous array has been copied to the buffer pool by now
+        self._release_pending_images()
+        try:
+            image_result = self.cam.GetNextImage(wait_time)
+        except self._pyspin.SpinnakerException as ex:
+            if ex.errorcode == self._pyspin.SPINNAKER_ERR_TIMEOUT:
                 return None
+            raise
 
-        #  End acquisition
-        self.cam.EndAcquisition()
+        if image_result.IsIncomplete():
+            logger.warning(
+                'Image incomplete with image status %d ...'
+                % image_result.GetImageStatus()
+            )
+            image_result.Release()
+            return None
 
-        if n_images == 1:
-            return all_arrays[0]  # return the array itself
+        if processor is not None:
+            image_converted = processor.Convert(image_result, processing_type)
         else:
-            return all_arrays  # return a list of arrays
+            image_converted = image_result
+        self._pending_images = (image_result, image_converted)
+        return image_converted.GetNDArray(), self._frame_metadata(image_result)
+
+    def _frame_metadata(self, image_result):
+        """
+        FrameMetadata of an image, the frame indices count from the first image of the acquisition
+        """
+        frame_id = image_result.GetFrameID()
+        if self._first_frame_id is None:
+            self._first_frame_id = frame_id
+        return FrameMetadata(
+            frame_index=frame_id - self._first_frame_id,
+            framestamp=frame_id,
+            timestamp=image_result.GetTimeStamp() * 1e-9,
+        )
+
+    def _release_pending_images(self):
+        if self._pending_images:
+            self._pending_images[0].Release()
+            self._pending_images = ()
+
+    def _end_stream_acquisition(self):
+        self._release_pending_images()
+        self.cam.EndAcquisition()
 
     def snap(
         self,
@@ -306,6 +571,7 @@ class FlirCamera(AbstractCamera):
         Take and return image ndarray of n_images at a time for a single camera.
         Returns ndarray of shape (width, height, 1)
         Repeatedly calling snap() with begin and end acquisition repeatedly.
+        While a streaming session is running, snap() returns the newest streamed frame instead.
 
         Parameters
         ----------
@@ -320,29 +586,95 @@ class FlirCamera(AbstractCamera):
         processing_type : string
             PySpin.PixelFormat color processor.
         """
+        if self.is_streaming and n_images == 1:
+            return self.read_latest(timeout=wait_time / 1000)[0]
+
         # Call method to acquire images
         try:
             result_array = self.acquire_images(
                 mode, n_images, wait_time, processing, processing_type
             )
-        except PySpin.SpinnakerException as ex:
+        except self._pyspin.SpinnakerException as ex:
             logger.error('Error beginning image acquisition: %s' % ex)
             return None
         return result_array
 
+    @property
+    def nodes(self):
+        """
+        Return the handles of the GenICam nodes of NODE_NAMES by name, resolved once per camera
+        """
+        if self._nodes is None:
+            self._nodes = {name: getattr(self.cam, name) for name in NODE_NAMES}
+        return self._nodes
+
+    def node_limits(self, name):
+        """
+        Return the cached (minimum, maximum) of a node
+
+        Parameters
+        ----------
+        name : string
+            Node name in NODE_NAMES.
+        """
+        limits = self._limits.get(name)
+        if limits is None:
+            node = self.nodes[name]
+            limits = self._limits[name] = (node.GetMin(), node.GetMax())
+        return limits
+
+    def _write_node(self, name, value):
+        """
+        Write a node and forget the cached limits that depend on it
+        """
+        self.nodes[name].SetValue(value)
+        for dependent in LIMIT_DEPENDENCIES.get(name, ()):
+            self._limits.pop(dependent, None)
+
+    def apply_settings(self, settings):
+        """
+        Validate and write a whole configuration, e.g. to switch imaging presets
+
+        The settings are written in SETTINGS_ORDER, so that every setting is
+        checked against the limits left by the settings before it, e.g. the
+        image size against the limits of the new binning.
+
+        Parameters
+        ----------
+        settings : dict
+            Values of any of 'shutter_mode', 'bitdepth', 'binning',
+            'image_size', 'exposure' and 'gain', with the units of the
+            corresponding properties.
+
+        Raises
+        ------
+        FlirCameraException
+            For unknown settings, before anything is written, or for a value
+            out of bounds, in which case the settings before it are applied.
+        """
+        unknown = set(settings) - set(SETTINGS_ORDER)
+        if unknown:
+            raise FlirCameraException(f'Unknown settings: {sorted(unknown)}')
+
+        for name in SETTINGS_ORDER:
+            if name in settings and not getattr(self, f'_set_{name}')(settings[name]):
+                raise FlirCameraException(
+                    f'Invalid {name} {settings[name]!r}, the settings before it are applied'
+                )
+
     @property
     def exposure_limits(self):
         """
         Returns the minimum and maximum exposure in microseconds (type: float)
         """
-        return self.cam.ExposureTime.GetMin(), self.cam.ExposureTime.GetMax()
+        return self.node_limits('ExposureTime')
 
     @property
     def exposure(self):
         """
         Returns the most recent exposure setting in microseconds (type: float)
         """
-        return self.cam.ExposureTime.GetValue()
+        return self.nodes['ExposureTime'].GetValue()
 
     @exposure.setter
     def exposure(self, exp):
@@ -354,33 +686,40 @@ class FlirCamera(AbstractCamera):
         exp: float
             Exposure in microseconds.
         """
-        if self.cam.ExposureAuto.GetAccessMode() != PySpin.RW:
+        if not self._set_exposure(exp):
+            logger.error('Input exposure is out of bounds. Cannot change settings')
+
+    def _set_exposure(self, exp):
+        nodes = self.nodes
+        if nodes['ExposureAuto'].GetAccessMode() != self._pyspin.RW:
             logger.error('Unable to disable automatic exposure. Aborting...')
 
         # Disable automatic exposure
-        self.cam.ExposureAuto.SetValue(PySpin.ExposureAuto_Off)
-        if self.cam.ExposureTime.GetAccessMode() != PySpin.RW:
+        nodes['ExposureAuto'].SetValue(self._pyspin.ExposureAuto_Off)
+        if nodes['ExposureTime'].GetAccessMode() != self._pyspin.RW:
             logger.error('Unable to set exposure time')
 
         # ensure exposure is within bounds
-        if self.exposure_limits[0] <= exp <= self.exposure_limits[1]:
-            self.cam.ExposureTime.SetValue(exp)
-        else:
-            logger.error('Input exposure is out of bounds. Cannot change settings')
+        min_exposure, max_exposure = self.exposure_limits
+        if not min_exposure <= exp <= max_exposure:
+            return False
+        self._write_node('ExposureTime', exp)
+        return True
 
     @property
     def gain_limits(self):
         """
         Returns the minimum and maximum gain in dB, normalized to range [0,1] (type: float)
         """
-        return self.cam.Gain.GetMin() / 18.0, self.cam.Gain.GetMax() / 18.0
+        min_gain, max_gain = self.node_limits('Gain')
+        return min_gain / 18.0, max_gain / 18.0
 
     @property
     def gain(self):
         """
         Returns the most recent gain setting in dB (type: float)
         """
-        return self.cam.Gain.GetValue() / 18.0
+        return self.nodes['Gain'].GetValue() / 18.0
 
     @gain.setter
     def gain(self, g):
@@ -392,35 +731,39 @@ class FlirCamera(AbstractCamera):
         g: float
             Gain in dB within range [0.0,1.0].
         """
-        g = g * 18.0
+        if not self._set_gain(g):
+            logger.error('Input gain is out of bounds. Cannot change settings')
 
-        if self.cam.GainAuto.GetAccessMode() != PySpin.RW:
+    def _set_gain(self, g):
+        nodes = self.nodes
+        if nodes['GainAuto'].GetAccessMode() != self._pyspin.RW:
             logger.error('Unable to disable automatic gain')
 
         # Disable automatic gain
-        self.cam.GainAuto.SetValue(PySpin.GainAuto_Off)
-        if self.cam.Gain.GetAccessMode() != PySpin.RW:
+        nodes['GainAuto'].SetValue(self._pyspin.GainAuto_Off)
+        if nodes['Gain'].GetAccessMode() != self._pyspin.RW:
             logger.error('Unable to set gain')
 
-        # ensure gain is within bounds
-        if self.gain_limits[0] <= g <= self.gain_limits[1]:
-            self.cam.Gain.SetValue(g)
-        else:
-            logger.error('Input gain is out of bounds. Cannot change settings')
+        # ensure gain is within bounds, the limits are normalized as well
+        min_gain, max_gain = self.gain_limits
+        if not min_gain <= g <= max_gain:
+            return False
+        self._write_node('Gain', g * 18.0)
+        return True
 
     @property
     def framerate(self):
         """
         Returns the most recent frame rate setting in Hz (type: float)
         """
-        return self.cam.AcquisitionFrameRate.GetValue()
+        return self.nodes['AcquisitionFrameRate'].GetValue()
 
     @property
     def bitdepth(self):
         """
         Return the bit depth of the current camera
         """
-        return self.cam.AdcBitDepth.GetValue()
+        return self.nodes['AdcBitDepth'].GetValue()
 
     @bitdepth.setter
     def bitdepth(self, bit):
@@ -432,22 +775,19 @@ class FlirCamera(AbstractCamera):
         bit : int
             Bit depth to set according to the convention above.
         """
-        if not PySpin.IsWritable(self.cam.AdcBitDepth()):
+        self._set_bitdepth(bit)
+
+    def _set_bitdepth(self, bit):
+        if not self._pyspin.IsWritable(self.nodes['AdcBitDepth']):
             logger.error('Bit depth node is not writable. Try unplugging the camera.')
-        self.cam.AdcBitDepth.SetValue(bit)
+        self._write_node('AdcBitDepth', bit)
+        return True
 
     def image_nodes(self):
         """
         Get the image size nodes for the current camera
         """
-        nodemap = self.cam.GetNodeMap()
-        node_width = PySpin.CIntegerPtr(nodemap.GetNode('Width'))
-        node_height = PySpin.CIntegerPtr(nodemap.GetNode('Height'))
-        if not PySpin.IsReadable(node_width) and PySpin.IsWritable(node_width):
-            logger.error('Width node is not accessible')
-        if not PySpin.IsReadable(node_height) and PySpin.IsWritable(node_height):
-            logger.error('Height node is not accessible')
-        return node_width, node_height
+        return self.nodes['Width'], self.nodes['Height']
 
     @property
     def image_size(self):
@@ -467,34 +807,30 @@ class FlirCamera(AbstractCamera):
         size : tuple
             Tuple for image dimensions in pixels (width : int, height : int).
         """
-        node_width, node_height = self.image_nodes()
+        if not self._set_image_size(size):
+            logger.error('Input image size is out of bounds. Cannot change settings.')
 
+    def _set_image_size(self, size):
         # ensure input is within bounds
         minw, maxw, minh, maxh = self.image_size_limits
-        if minw <= size[0] <= maxw and minh <= size[1] <= maxh:
-            node_width.SetValue(size[0])
-            node_height.SetValue(size[1])
-        else:
-            logger.error('Input image size is out of bounds. Cannot change settings.')
+        if not (minw <= size[0] <= maxw and minh <= size[1] <= maxh):
+            return False
+        self._write_node('Width', size[0])
+        self._write_node('Height', size[1])
+        return True
 
     @property
     def image_size_limits(self):
         """
         Return a tuple of the image size limits.
         """
-        node_width, node_height = self.image_nodes()
-        return (
-            node_width.GetMin(),
-            node_width.GetMax(),
-            node_height.GetMin(),
-            node_height.GetMax(),
-        )
+        return (*self.node_limits('Width'), *self.node_limits('Height'))
 
     @property
     def binning(self):
         return (
-            self.cam.BinningHorizontal.GetValue(),
-            self.cam.BinningVertical.GetValue(),
+            self.nodes['BinningHorizontal'].GetValue(),
+            self.nodes['BinningVertical'].GetValue(),
         )
 
     @binning.setter
@@ -507,23 +843,24 @@ class FlirCamera(AbstractCamera):
         val : tuple
             Binning input (x : int, y : int)
         """
-        xmin = self.cam.BinningHorizontal.GetMin()
-        xmax = self.cam.BinningHorizontal.GetMax()
-        ymin = self.cam.BinningVertical.GetMin()
-        ymax = self.cam.BinningVertical.GetMax()
-
-        if xmin <= val[0] <= xmax and ymin <= val[1] <= ymax:
-            self.cam.BinningHorizontal.SetValue(val[0])
-            self.cam.BinningVertical.SetValue(val[1])
-        else:
+        if not self._set_binning(val):
             logger.error('Input binning is out of bounds. Cannot change settings.')
 
+    def _set_binning(self, val):
+        xmin, xmax = self.node_limits('BinningHorizontal')
+        ymin, ymax = self.node_limits('BinningVertical')
+        if not (xmin <= val[0] <= xmax and ymin <= val[1] <= ymax):
+            return False
+        self._write_node('BinningHorizontal', val[0])
+        self._write_node('BinningVertical', val[1])
+        return True
+
     @property
     def shutter_mode(self):
         """
         Return the shutter mode (type: int) of the current camera. 1 = global, 2 = rolling.
         """
-        return self.cam.SensorShutterMode.GetValue()
+        return self.nodes['SensorShutterMode'].GetValue()
 
     @shutter_mode.setter
     def shutter_mode(self, mode='global'):
@@ -535,14 +872,15 @@ class FlirCamera(AbstractCamera):
         mode : string
             Shutter mode keyword ('global' or 'rolling')
         """
-        if mode == 'global':
-            if not self.cam.SensorShutterMode.GetValue() == 1:
-                self.cam.SensorShutterMode.SetValue(1)
-        elif mode == 'rolling':
-            if not self.cam.SensorShutterMode.GetValue() == 2:
-                self.cam.SensorShutterMode.SetValue(2)
-        else:
+        if not self._set_shutter_mode(mode):
             logger.error(
-                'Mode input: ', mode, ' is not valid. Enter global or rolling mode'
+                'Mode input: %s is not valid. Enter global or rolling mode', mode
             )
-        pass
+
+    def _set_shutter_mode(self, mode):
+        values = {'global': 1, 'rolling': 2}
+        if mode not in values:
+            return False
+        if self.nodes['SensorShutterMode'].GetValue() != values[mode]:
+            self._write_node('SensorShutterMode', values[mode])
+        return True
@@ -0,0 +1,151 @@
+import numpy as np
+import pytest
+
+from copylot.hardware import telemetry
+from copylot.hardware.cameras.flir.flir_camera import FlirCamera, FlirCameraException
+from copylot.hardware.simulated import simulated_backend
+from copylot.io.writers import StreamWriterException
+
+
+@pytest.fixture
+def camera():
+    backend = simulated_backend('flir_camera', realtime=False)
+    camera = FlirCamera(backend=backend)
+    camera.open()
+    return camera
+
+
+def test_apply_settings_in_dependency_order(camera):
+    camera.apply_settings(
+        {
+            'gain': 0.5,
+            'exposure': 5000.0,
+            'image_size': (1024, 512),
+            'binning': (2, 2),
+            'bitdepth': 2,
+            'shutter_mode': 'rolling',
+        }
+    )
+
+    assert camera.cam.writes == [
+        ('SensorShutterMode', 2),
+        ('AdcBitDepth', 2),
+        ('BinningHorizontal', 2),
+        ('BinningVertical', 2),
+        ('Width', 1024),
+        ('Height', 512),
+        ('ExposureAuto', 'Off'),
+        ('ExposureTime', 5000.0),
+        ('GainAuto', 'Off'),
+        ('Gain', 9.0),
+    ]
+
+
+def test_limits_are_cached_until_a_dependency_is_written(camera):
+    width = camera.cam.Width
+
+    assert camera.image_size_limits == (8, 3072, 8, 2048)
+    assert camera.image_size_limits == (8, 3072, 8, 2048)
+    assert width.limit_reads == 2
+    assert camera.exposure_limits == (10.0, 1e6)
+
+    camera.binning = (2, 2)
+    assert camera.image_size_limits == (8, 1536, 8, 1024)
+    assert width.limit_reads == 4
+
+    # checked against the limits of the new binning
+    camera.image_size = (2048, 1024)
+    assert camera.image_size == (3072, 2048)
+    camera.image_size = (1536, 512)
+    assert camera.image_size == (1536, 512)
+    # the exposure limit follows the height
+    assert camera.exposure_limits == (10.0, 250000.0)
+
+
+def test_unknown_settings_are_rejected_before_writing(camera):
+    with pytest.raises(FlirCameraException):
+        camera.apply_settings({'exposure': 5000.0, 'gain_db': 3.0})
+
+    assert camera.cam.writes == []
+
+
+def test_out_of_bounds_setting_keeps_the_settings_before_it(camera):
+    with pytest.raises(FlirCameraException):
+        camera.apply_settings({'binning': (2, 2), 'image_size': (3072, 2048)})
+
+    assert camera.binning == (2, 2)
+    assert camera.image_size == (3072, 2048)
+    assert ('Width', 3072) not in camera.cam.writes
+
+
+def test_gain_is_normalized(camera):
+    assert camera.gain_limits == (0.0, 1.0)
+
+    camera.gain = 0.25
+    assert camera.cam.Gain.value == 4.5
+    assert camera.gain == 0.25
+
+    # 2 dB is within the limits of the node but not a normalized gain
+    camera.gain = 2.0
+    assert camera.cam.Gain.value == 4.5
+    with pytest.raises(FlirCameraException):
+        camera.apply_settings({'gain': 2.0})
+
+
+def test_snap_frame_indices_start_at_each_acquisition(camera):
+    for _ in range(3):
+        frames = camera.snap(n_images=2)
+        assert [int(frame[0, 0]) for frame in frames] == [
+            camera.cam.next_frame_id - 2,
+            camera.cam.next_frame_id - 1,
+        ]
+        records = camera.telemetry.snapshot()
+        assert list(records['frame_index']) == [0, 1]
+        assert camera.telemetry.dropped_frames == 0
+
+
+def test_telemetry_is_named_after_the_camera():
+    backend = simulated_backend(
+        'flir_camera', serial_numbers=('20270803', '20270804'), realtime=False
+    )
+    cameras = [FlirCamera(backend=backend), FlirCamera(backend=backend)]
+    cameras[0].open(0)
+    cameras[1].open(1)
+
+    assert telemetry.registry['flir20270803'] is cameras[0].telemetry
+    assert telemetry.registry['flir20270804'] is cameras[1].telemetry
+
+
+def test_sequence_on_the_simulated_camera():
+    backend = simulated_backend('flir_camera', sensor_shape=(16, 24))
+    camera = FlirCamera(backend=backend)
+    camera.open()
+    camera.nodes['AcquisitionFrameRate'].SetValue(60.0)
+    camera.exposure = 100.0
+
+    camera.start_sequence(n_buffers=8)
+    try:
+        frames = [camera.get_frame(timeout=1) for _ in range(3)]
+    finally:
+        camera.stop_sequence()
+    camera.close()
+
+    assert [metadata.frame_index for _, metadata in frames] == [0, 1, 2]
+    assert frames[0][0].shape == (16, 24)
+
+
+def test_saved_stack_is_not_overwritten(camera, tmp_path, monkeypatch, mocker):
+    tifffile = pytest.importorskip('tifffile')
+    monkeypatch.chdir(tmp_path)
+    mocker.patch('time.strftime', return_value='20261018-120000')
+    frame = camera.snap()
+    path = camera.save_image(frame)
+
+    # another instance of the camera saving in the same second
+    other = FlirCamera(backend=camera._pyspin)
+    other.open()
+    with pytest.raises(StreamWriterException):
+        other.save_image(frame + 1)
+
+    with tifffile.TiffFile(path) as tiff:
+        np.testing.assert_array_equal(tiff.asarray(), frame)
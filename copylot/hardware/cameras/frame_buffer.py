@@ -0,0 +1,134 @@
+from typing import NamedTuple, Optional, Tuple
+
+import numpy as np
+
+
+class FrameMetadata(NamedTuple):
+    """Metadata attached to every frame handed out by a camera stream.
+
+    Parameters
+    ----------
+    frame_index : int
+        Index of the frame since the start of the acquisition, gaps mean dropped frames.
+    framestamp : int
+        Frame counter reported by the camera hardware.
+    timestamp : float
+        Hardware timestamp of the frame in seconds.
+    """
+
+    frame_index: int
+    framestamp: int = 0
+    timestamp: float = 0.0
+
+
+class FrameRingBuffer:
+    """
+    Preallocated pool of frames that is reused in a circular manner.
+
+    Frames are copied into the next free slot instead of allocating a new
+    array for every frame. ``push`` returns a view on the slot it wrote to,
+    this view stays valid until the buffer wraps around, i.e. for the next
+    ``nb_frames - 1`` pushes.
+
+    Parameters
+    ----------
+    nb_frames : int
+        Number of frames in the pool.
+    shape : Tuple[int, int]
+        Shape of a single frame.
+    dtype
+        Data type of the frames.
+
+    """
+
+    def __init__(self, nb_frames: int, shape: Tuple[int, int], dtype=np.uint16):
+        if nb_frames < 1:
+            raise ValueError("A ring buffer needs at least one frame.")
+        self._frames = np.empty((nb_frames, *shape), dtype=dtype)
+        self._metadata = [None] * nb_frames
+        self._count = 0
+
+    def __len__(self):
+        return len(self._frames)
+
+    @property
+    def frame_shape(self) -> Tuple[int, ...]:
+        """Shape of a single frame"""
+        return self._frames.shape[1:]
+
+    @property
+    def dtype(self):
+        """Data type of the frames"""
+        return self._frames.dtype
+
+    @property
+    def count(self) -> int:
+        """Number of frames pushed since creation"""
+        return self._count
+
+    def next_slot(self) -> np.ndarray:
+        """Return the slot that the next frame will be written to.
+
+        Producers that can write directly into memory (e.g. by passing
+        it as destination buffer to the SDK) fill this slot and then call
+        ``commit`` to avoid an additional copy.
+        """
+        return self._frames[self._count % len(self._frames)]
+
+    def commit(self, metadata: FrameMetadata) -> np.ndarray:
+        """Mark the slot returned by ``next_slot`` as filled.
+
+        Parameters
+        ----------
+        metadata : FrameMetadata
+
+        Returns
+        -------
+        np.ndarray
+            View on the committed slot.
+        """
+        index = self._count % len(self._frames)
+        self._metadata[index] = metadata
+        self._count += 1
+        return self._frames[index]
+
+    def push(self, frame: np.ndarray, metadata: FrameMetadata) -> np.ndarray:
+        """Copy a frame into the next slot.
+
+        Parameters
+        ----------
+        frame : np.ndarray
+        metadata : FrameMetadata
+
+        Returns
+        -------
+        np.ndarray
+            View on the slot the frame was copied to.
+        """
+        np.copyto(self.next_slot(), frame)
+        return self.commit(metadata)
+
+    def get(self, frame_count: int) -> Tuple[np.ndarray, FrameMetadata]:
+        """Return the frame pushed as ``frame_count``-th frame and its metadata.
+
+        Parameters
+        ----------
+        frame_count : int
+            Position of the frame in push order, starting at 0.
+
+        Raises
+        ------
+        IndexError
+            If the frame was not pushed yet or was already overwritten.
+        """
+        if not self._count - len(self._frames) <= frame_count < self._count:
+            raise IndexError(f"Frame {frame_count} is not in the ring buffer.")
+        index = frame_count % len(self._frames)
+        return self._frames[index], self._metadata[index]
+
+    def latest(self) -> Tuple[Optional[np.ndarray], Optional[FrameMetadata]]:
+        """Return the newest frame and its metadata, (None, None) if empty"""
+        if self._count == 0:
+            return None, None
+        index = (self._count - 1) % len(self._frames)
+        return self._frames[index], self._metadata[index]
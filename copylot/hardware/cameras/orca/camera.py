@@ -1,6 +1,31 @@
+from contextlib import contextmanager
+from typing import Tuple
+
+import numpy as np
+
 from copylot import logger
 from copylot.hardware.cameras.abstract_camera import AbstractCamera
-from copylot.hardware.cameras.orca.dcam import Dcamapi, Dcam
+from copylot.hardware.cameras.frame_buffer import FrameMetadata, FrameRingBuffer
+from copylot.hardware.cameras.streaming import StreamingAcquisition
+from copylot.hardware.telemetry import FrameTelemetry
+
+# DCAM values of the shutter modes, the AREA and PROGRESSIVE sensor modes
+SENSOR_MODES = {'rolling': 1, 'lightsheet': 12}
+BINNINGS = (1, 2, 4)
+SUBARRAY_MODE_ON = 2
+
+# properties written by the settings, in the order they are applied when the
+# camera is opened, the subarray size is in sensor pixels
+SETTINGS_ORDER = (
+    'SENSORMODE',
+    'BITSPERCHANNEL',
+    'BINNING',
+    'SUBARRAYHSIZE',
+    'SUBARRAYVSIZE',
+    'SUBARRAYMODE',
+    'EXPOSURETIME',
+    'CONTRASTGAIN',
+)
 
 
 class OrcaCameraException(Exception):
@@ -11,14 +36,47 @@ class OrcaCamera(AbstractCamera):
     """
     Hamamatsu Orca Flash 4 Camera adapter.
 
+    DCAM is only opened while the camera streams. The settings are written
+    to the streaming camera, or to a camera opened for the call otherwise,
+    and they are applied again whenever the camera is opened.
+
     Parameters
     ----------
     camera_index : int
+    nb_buffer_frames : int
+        Number of frames DCAM buffers (and the stream ring buffer holds)
+        before the oldest frame is overwritten.
+    backend
+        Module-like object providing the ``Dcamapi`` and ``Dcam`` classes,
+        defaults to ``copylot.hardware.cameras.orca.dcam``. Pass a fake
+        backend to run the camera without the DCAM SDK.
+
+    Attributes
+    ----------
+    telemetry : FrameTelemetry
+        Frame indices, timestamps and DCAM buffer backlog of the last stream.
 
     """
 
-    def __init__(self, camera_index: int = 0):
+    def __init__(self, camera_index: int = 0, nb_buffer_frames: int = 64, backend=None):
+        if backend is None:
+            from copylot.hardware.cameras.orca import dcam as backend
+
         self._camera_index = camera_index
+        self._backend = backend
+        self.nb_buffer_frames = nb_buffer_frames
+        self._dropped_frames = 0
+        self._sequence = None
+        # camera of the running stream, and the settings written by name
+        self._dcam = None
+        self._settings = {}
+        self.telemetry = FrameTelemetry(f"orca{camera_index}")
+
+    @property
+    def dropped_frames(self) -> int:
+        """Number of frames overwritten in the DCAM buffer before they were read
+        during the last stream"""
+        return self._dropped_frames
 
     def run(self, nb_frame: int = 100000):
         """
@@ -31,49 +89,462 @@ class OrcaCamera(AbstractCamera):
             Number of frames to be acquired, default chosen just a big enough number.
 
         """
-        if Dcamapi.init():
-            dcam = Dcam(self._camera_index)
-            if dcam.dev_open():
-                nb_buffer_frames = 3
-                if dcam.buf_alloc(nb_buffer_frames):
-                    if dcam.cap_start():
-                        timeout_milisec = 20
-
-                        for _ in range(nb_frame):
-                            if dcam.wait_capevent_frameready(timeout_milisec):
-                                data = (  # noqa: F841
-                                    dcam.buf_getlastframedata()
-                                )  # Data is here
-                                print(data.shape, type(data))
-                            else:
-                                dcamerr = dcam.lasterr()
-                                if dcamerr.is_timeout():
-                                    logger.error("===: timeout")
-                                else:
-                                    logger.error(
-                                        f"dcam.wait_event() fails with error {dcamerr}"
-                                    )
-                                    break
-
-                        dcam.cap_stop()
-                    else:
-                        raise OrcaCameraException(
-                            f"dcam.cap_start() fails with error {dcam.lasterr()}"
-                        )
+        for data, metadata in self.stream(nb_frame):
+            logger.debug(
+                "frame %d: %s, %s", metadata.frame_index, data.shape, data.dtype
+            )
 
-                    dcam.buf_release()  # release buffer
-                else:
-                    raise OrcaCameraException(
-                        f"dcam.buf_alloc({nb_buffer_frames}) fails with error {dcam.lasterr()}"
-                    )
-                dcam.dev_close()
-            else:
+    def stream(
+        self,
+        nb_frames: int,
+        timeout_millisec: int = 1000,
+        copy: bool = True,
+        yield_timeouts: bool = False,
+        max_timeouts: int = 10,
+    ):
+        """
+        Generator that acquires ``nb_frames`` frames in sequence mode.
+
+        No memory is allocated per frame. With ``copy=True`` each frame is
+        copied once from the locked DCAM buffer into a preallocated ring
+        buffer and a view on the ring slot is yielded, it stays valid for the
+        next ``nb_buffer_frames - 1`` frames. With ``copy=False`` the yielded
+        array is a view on DCAM's own buffer, which the camera overwrites
+        once it wraps around, so consumers must keep up with acquisition.
+
+        Frames that DCAM overwrote before they could be read are counted in
+        ``dropped_frames`` and show up as gaps in ``FrameMetadata.frame_index``.
+
+        Parameters
+        ----------
+        nb_frames : int
+            Number of frames to yield.
+        timeout_millisec : int
+            Timeout of a single wait for the frame ready event.
+        copy : bool
+            Copy frames into the ring buffer instead of yielding DCAM views.
+        yield_timeouts : bool
+            Yield None when no frame arrived before the timeout, so that the
+            consumer can stop waiting.
+        max_timeouts : int
+            Number of consecutive timeouts after which the stream fails, e.g.
+            after a lost trigger. Ignored with ``yield_timeouts``, where the
+            consumer decides when to stop waiting.
+
+        Yields
+        ------
+        Tuple[np.ndarray, FrameMetadata] or None
+            None when no frame arrived before the timeout, only with
+            ``yield_timeouts``.
+
+        Raises
+        ------
+        OrcaCameraException
+            After ``max_timeouts`` consecutive timeouts without
+            ``yield_timeouts``, the camera is released first.
+
+        """
+        dcam = self._open_device()
+        self._dcam = dcam
+        try:
+            if not dcam.buf_alloc(self.nb_buffer_frames):
                 raise OrcaCameraException(
-                    f"dcam.dev_open() fails with error {dcam.lasterr()}"
+                    f"dcam.buf_alloc({self.nb_buffer_frames}) fails with error {dcam.lasterr()}"
                 )
-        else:
+            try:
+                if not dcam.cap_start():
+                    raise OrcaCameraException(
+                        f"dcam.cap_start() fails with error {dcam.lasterr()}"
+                    )
+                try:
+                    yield from self._stream_frames(
+                        dcam,
+                        nb_frames,
+                        timeout_millisec,
+                        copy,
+                        None if yield_timeouts else max_timeouts,
+                    )
+                finally:
+                    dcam.cap_stop()
+            finally:
+                dcam.buf_release()
+        finally:
+            self._dcam = None
+            dcam.dev_close()
+            self._backend.Dcamapi.uninit()
+
+    def snap(self, timeout_millisec: int = 1000) -> np.ndarray:
+        """
+        Acquire a single frame, or return the newest frame of the sequence
+        while one is running.
+
+        Parameters
+        ----------
+        timeout_millisec : int
+            Timeout of the wait for the frame.
+
+        Returns
+        -------
+        np.ndarray
+
+        """
+        if self._sequence is not None and self._sequence.is_running:
+            return self._sequence.read_latest(timeout=timeout_millisec / 1000)[0]
+
+        frames = self.stream(1, timeout_millisec, copy=False)
+        try:
+            data, _ = next(frames)
+            # the view on the DCAM buffer is released with the stream
+            return data.copy()
+        finally:
+            frames.close()
+
+    def start_sequence(self, n_buffers: int = 16, timeout_millisec: int = 100):
+        """
+        Start a continuous acquisition on a background thread.
+
+        Frames are copied from the DCAM buffer into a pool of ``n_buffers``
+        frames until ``stop_sequence``, read them with ``get_frame``.
+
+        Parameters
+        ----------
+        n_buffers : int
+            Number of frames that can wait to be read before the oldest ones
+            are dropped.
+        timeout_millisec : int
+            Timeout of a single wait for the frame ready event, the
+            acquisition thread checks whether to stop in between.
+
+        """
+        if self._sequence is not None and self._sequence.is_running:
+            raise OrcaCameraException("Sequence is already running.")
+
+        frames = self.stream(
+            float('inf'), timeout_millisec, copy=False, yield_timeouts=True
+        )
+        # the stream is advanced and closed on the acquisition thread
+        self._sequence = StreamingAcquisition(
+            lambda: next(frames),
+            nb_buffers=n_buffers,
+            on_stop=frames.close,
+        )
+        self._sequence.start()
+
+    def get_frame(
+        self, timeout: float = None, out: np.ndarray = None
+    ) -> Tuple[np.ndarray, FrameMetadata]:
+        """
+        Next frame of the sequence in acquisition order.
+
+        Parameters
+        ----------
+        timeout : float
+            Maximum time to wait for a frame in seconds, wait forever if None.
+        out : np.ndarray, optional
+            Destination buffer, a new array is allocated if None.
+
+        Returns
+        -------
+        Tuple[np.ndarray, FrameMetadata]
+
+        """
+        if self._sequence is None:
+            raise OrcaCameraException("No sequence, call start_sequence().")
+        return self._sequence.read_next(out, timeout)
+
+    def stop_sequence(self):
+        """Stop the acquisition started by ``start_sequence``"""
+        if self._sequence is not None:
+            self._sequence.stop()
+
+    def _open_device(self):
+        """Initialize DCAM-API, open the camera and apply the settings"""
+        if not self._backend.Dcamapi.init():
             raise OrcaCameraException(
-                f"Dcamapi.init() fails with error {Dcamapi.lasterr()}"
+                f"Dcamapi.init() fails with error {self._backend.Dcamapi.lasterr()}"
             )
 
-        Dcamapi.uninit()
+        dcam = self._backend.Dcam(self._camera_index)
+        if not dcam.dev_open():
+            err = dcam.lasterr()
+            self._backend.Dcamapi.uninit()
+            raise OrcaCameraException(f"dcam.dev_open() fails with error {err}")
+        try:
+            for name in SETTINGS_ORDER:
+                if name in self._settings:
+                    self._write_property(dcam, name, self._settings[name])
+        except OrcaCameraException:
+            dcam.dev_close()
+            self._backend.Dcamapi.uninit()
+            raise
+        return dcam
+
+    @contextmanager
+    def _device(self):
+        """The camera of the running stream, else the camera opened for the block"""
+        if self._dcam is not None:
+            yield self._dcam
+            return
+        dcam = self._open_device()
+        try:
+            yield dcam
+        finally:
+            dcam.dev_close()
+            self._backend.Dcamapi.uninit()
+
+    def _read_property(self, dcam, name):
+        value = dcam.prop_getvalue(self._backend.DCAM_IDPROP[name])
+        if value is False:
+            raise OrcaCameraException(
+                f"dcam.prop_getvalue({name}) fails with error {dcam.lasterr()}"
+            )
+        return value
+
+    def _write_property(self, dcam, name, value):
+        if not dcam.prop_setvalue(self._backend.DCAM_IDPROP[name], value):
+            raise OrcaCameraException(
+                f"dcam.prop_setvalue({name}, {value}) fails with error {dcam.lasterr()}"
+            )
+
+    def _property_limits(self, dcam, name):
+        attributes = dcam.prop_getattr(self._backend.DCAM_IDPROP[name])
+        if attributes is False:
+            raise OrcaCameraException(
+                f"dcam.prop_getattr({name}) fails with error {dcam.lasterr()}"
+            )
+        return attributes.valuemin, attributes.valuemax
+
+    def _write_settings(self, **values):
+        """Write properties and keep them to apply them whenever the camera is opened"""
+        with self._device() as dcam:
+            for name, value in values.items():
+                self._write_property(dcam, name, value)
+                self._settings[name] = value
+
+    @AbstractCamera.device_id.setter
+    def device_id(self, serial_number):
+        self._device_id = serial_number
+
+    @staticmethod
+    def list_available_cameras(backend=None):
+        """
+        Indices of the cameras DCAM finds, call it while no camera streams.
+
+        Parameters
+        ----------
+        backend
+            DCAM backend, defaults to ``copylot.hardware.cameras.orca.dcam``.
+
+        Returns
+        -------
+        List[int]
+
+        """
+        if backend is None:
+            from copylot.hardware.cameras.orca import dcam as backend
+
+        if not backend.Dcamapi.init():
+            raise OrcaCameraException(
+                f"Dcamapi.init() fails with error {backend.Dcamapi.lasterr()}"
+            )
+        try:
+            return list(range(backend.Dcamapi.get_devicecount()))
+        finally:
+            backend.Dcamapi.uninit()
+
+    @property
+    def exposure(self) -> float:
+        """Exposure time in seconds"""
+        with self._device() as dcam:
+            return self._read_property(dcam, 'EXPOSURETIME')
+
+    @exposure.setter
+    def exposure(self, value: float):
+        self._write_settings(EXPOSURETIME=value)
+
+    @property
+    def exposure_limits(self) -> Tuple[float, float]:
+        """Minimum and maximum exposure times in seconds"""
+        with self._device() as dcam:
+            return self._property_limits(dcam, 'EXPOSURETIME')
+
+    @property
+    def bitdepth(self) -> int:
+        """Number of bits per pixel, 12 or 16"""
+        with self._device() as dcam:
+            return int(self._read_property(dcam, 'BITSPERCHANNEL'))
+
+    @bitdepth.setter
+    def bitdepth(self, value: int):
+        self._write_settings(BITSPERCHANNEL=value)
+
+    @property
+    def binning(self) -> Tuple[int, int]:
+        """Horizontal and vertical binning, they are equal"""
+        with self._device() as dcam:
+            binning = int(self._read_property(dcam, 'BINNING'))
+        return binning, binning
+
+    @binning.setter
+    def binning(self, value: Tuple[int, int]):
+        horizontal, vertical = value
+        if horizontal != vertical or horizontal not in BINNINGS:
+            raise OrcaCameraException(
+                f"Binning {value} is not one of {[(b, b) for b in BINNINGS]}."
+            )
+        self._write_settings(BINNING=horizontal)
+
+    @property
+    def image_size(self) -> Tuple[int, int]:
+        """Width and height of the frames in binned pixels"""
+        with self._device() as dcam:
+            return (
+                int(self._read_property(dcam, 'IMAGE_WIDTH')),
+                int(self._read_property(dcam, 'IMAGE_HEIGHT')),
+            )
+
+    @image_size.setter
+    def image_size(self, value: Tuple[int, int]):
+        width, height = value
+        with self._device() as dcam:
+            binning = int(self._read_property(dcam, 'BINNING'))
+        # the subarray starts at the first sensor pixel
+        self._write_settings(
+            SUBARRAYHSIZE=width * binning,
+            SUBARRAYVSIZE=height * binning,
+            SUBARRAYMODE=SUBARRAY_MODE_ON,
+        )
+
+    @property
+    def image_size_limits(self) -> Tuple[int, int, int, int]:
+        """Minimum and maximum width and height of the frames in binned pixels"""
+        with self._device() as dcam:
+            binning = int(self._read_property(dcam, 'BINNING'))
+            limits = self._property_limits(dcam, 'SUBARRAYHSIZE')
+            limits += self._property_limits(dcam, 'SUBARRAYVSIZE')
+        return tuple(int(limit // binning) for limit in limits)
+
+    @property
+    def gain(self) -> float:
+        """Contrast gain, normalized to [0, 1]"""
+        with self._device() as dcam:
+            minimum, maximum = self._property_limits(dcam, 'CONTRASTGAIN')
+            value = self._read_property(dcam, 'CONTRASTGAIN')
+        return (value - minimum) / (maximum - minimum)
+
+    @gain.setter
+    def gain(self, value: float):
+        if not 0 <= value <= 1:
+            raise OrcaCameraException(f"Gain {value} is not within [0, 1].")
+        with self._device() as dcam:
+            minimum, maximum = self._property_limits(dcam, 'CONTRASTGAIN')
+        self._write_settings(CONTRASTGAIN=round(minimum + value * (maximum - minimum)))
+
+    @property
+    def gain_limits(self) -> Tuple[float, float]:
+        """Normalized gain limits"""
+        return 0.0, 1.0
+
+    @property
+    def shutter_mode(self) -> str:
+        """'rolling', or 'lightsheet' for the lightsheet readout mode"""
+        with self._device() as dcam:
+            value = int(self._read_property(dcam, 'SENSORMODE'))
+        modes = {value: mode for mode, value in SENSOR_MODES.items()}
+        return modes.get(value, str(value))
+
+    @shutter_mode.setter
+    def shutter_mode(self, mode: str):
+        if mode not in SENSOR_MODES:
+            raise OrcaCameraException(
+                f"Shutter mode {mode!r} is not one of {sorted(SENSOR_MODES)}."
+            )
+        self._write_settings(SENSORMODE=SENSOR_MODES[mode])
+
+    def _stream_frames(self, dcam, nb_frames, timeout_millisec, copy, max_timeouts):
+        """Drain the DCAM buffer frame by frame, oldest first, timeouts yield
+        None when ``max_timeouts`` is None"""
+        ring_buffer = None
+        nb_buffer_frames = self.nb_buffer_frames
+        self._dropped_frames = 0
+        self.telemetry.reset()
+        nb_read = 0  # number of frames transferred by DCAM that were handled
+        nb_yielded = 0
+        nb_timeouts = 0
+
+        while nb_yielded < nb_frames:
+            transfer_info = self._wait_transfer_info(dcam, timeout_millisec)
+            if transfer_info is None:
+                if max_timeouts is None:
+                    yield None
+                    continue
+                nb_timeouts += 1
+                if nb_timeouts >= max_timeouts:
+                    raise OrcaCameraException(
+                        f"No frame received in {nb_timeouts} waits of "
+                        f"{timeout_millisec} ms."
+                    )
+                continue
+            nb_timeouts = 0
+
+            nb_new = transfer_info.nFrameCount - nb_read
+            if nb_new > nb_buffer_frames:
+                nb_lost = nb_new - nb_buffer_frames
+                self._dropped_frames += nb_lost
+                logger.warning("%d frames were dropped", nb_lost)
+                nb_read += nb_lost
+                nb_new = nb_buffer_frames
+
+            for age in range(nb_new - 1, -1, -1):
+                buffer_index = (
+                    transfer_info.nNewestFrameIndex - age
+                ) % nb_buffer_frames
+                data, metadata = self._lock_frame(dcam, buffer_index, nb_read)
+                nb_read += 1
+                # the newer frames are waiting in the DCAM buffer
+                self.telemetry.record(*metadata, queue_depth=age)
+
+                if copy:
+                    if ring_buffer is None:
+                        ring_buffer = FrameRingBuffer(
+                            nb_buffer_frames, data.shape, data.dtype
+                        )
+                    data = ring_buffer.push(data, metadata)
+
+                yield data, metadata
+                nb_yielded += 1
+                if nb_yielded == nb_frames:
+                    return
+
+    @staticmethod
+    def _wait_transfer_info(dcam, timeout_millisec):
+        """Wait for the next frame ready event, returns None on timeout"""
+        if not dcam.wait_capevent_frameready(timeout_millisec):
+            dcamerr = dcam.lasterr()
+            if dcamerr.is_timeout():
+                logger.debug("dcam.wait_capevent_frameready() timeout")
+                return None
+            raise OrcaCameraException(f"dcam.wait_event() fails with error {dcamerr}")
+
+        transfer_info = dcam.cap_transferinfo()
+        if transfer_info is False:
+            raise OrcaCameraException(
+                f"dcam.cap_transferinfo() fails with error {dcam.lasterr()}"
+            )
+        return transfer_info
+
+    @staticmethod
+    def _lock_frame(dcam, buffer_index, frame_index):
+        """Return a view on a frame of the DCAM buffer and its metadata"""
+        locked = dcam.buf_lockframe(buffer_index)
+        if locked is False:
+            raise OrcaCameraException(
+                f"dcam.buf_lockframe({buffer_index}) fails with error {dcam.lasterr()}"
+            )
+        frame, data = locked
+        metadata = FrameMetadata(
+            frame_index=frame_index,
+            framestamp=frame.framestamp,
+            timestamp=frame.timestamp.sec + frame.timestamp.microsec * 1e-6,
+        )
+        return data, metadata
@@ -56,6 +56,27 @@ def dcammisc_alloc_ndarray(frame: DCAMBUF_FRAME):
     return False
 
 
+def dcammisc_ndarray_view(frame: DCAMBUF_FRAME):
+    """
+    Wrap the image memory referenced by DCAMBUF_FRAME.buf in a NumPy ndarray without copying.
+    The returned array is only valid while DCAM keeps the locked frame in its buffer.
+
+    """
+
+    if frame.type == DCAM_PIXELTYPE.MONO16:
+        ctype = c_uint16
+    elif frame.type == DCAM_PIXELTYPE.MONO8:
+        ctype = c_uint8
+    else:
+        return False
+
+    # rows may be padded, so wrap the full row stride and crop to the image width
+    pixels_per_row = frame.rowbytes // sizeof(ctype)
+    buf = cast(frame.buf, POINTER(ctype))
+    npBuf = np.ctypeslib.as_array(buf, shape=(frame.height, pixels_per_row))
+    return npBuf[:, : frame.width]
+
+
 # ==== declare Dcamapi class ====
 
 
@@ -482,12 +503,13 @@ class Dcam:
         cOption = c_int32(0)
         return self.__result(dcambuf_release(self.__hdcam, cOption))
 
-    def buf_getframe(self, iFrame):
+    def buf_getframe(self, iFrame, npBuf=None):
         """
         Return DCAMBUF_FRAME instance with image data specified by iFrame.
 
         Arg:
             arg1(int): Index of target frame
+            arg2(ndarray): Optional C-contiguous destination buffer. A new one is allocated when None.
 
         Returns:
             (aFrame, npBuf): aFrame is DCAMBUF_FRAME, npBuf is NumPy buffer
@@ -496,9 +518,10 @@ class Dcam:
         if not self.is_opened():
             return self.__result(DCAMERR.INVALIDHANDLE)  # instance is not opened yet.
 
-        npBuf = dcammisc_alloc_ndarray(self.__bufframe)
-        if npBuf is False:
-            return self.__result(DCAMERR.INVALIDPIXELTYPE)
+        if npBuf is None:
+            npBuf = dcammisc_alloc_ndarray(self.__bufframe)
+            if npBuf is False:
+                return self.__result(DCAMERR.INVALIDPIXELTYPE)
 
         aFrame = DCAMBUF_FRAME()
         aFrame.iFrame = iFrame
@@ -515,6 +538,34 @@ class Dcam:
 
         return (aFrame, npBuf)
 
+    def buf_lockframe(self, iFrame):
+        """
+        Lock the frame specified by iFrame in DCAM internal buffer and return a view on it.
+        No image data is copied, the view is overwritten once DCAM reuses the buffer frame.
+
+        Arg:
+            arg1(int): Index of target frame
+
+        Returns:
+            (aFrame, npView): aFrame is DCAMBUF_FRAME, npView is NumPy view on DCAM buffer
+            False:  error happens.  lasterr() returns the DCAMERR value
+        """
+        if not self.is_opened():
+            return self.__result(DCAMERR.INVALIDHANDLE)  # instance is not opened yet.
+
+        aFrame = DCAMBUF_FRAME()
+        aFrame.iFrame = iFrame
+
+        ret = self.__result(dcambuf_lockframe(self.__hdcam, byref(aFrame)))
+        if ret is False:
+            return False
+
+        npView = dcammisc_ndarray_view(aFrame)
+        if npView is False:
+            return self.__result(DCAMERR.INVALIDPIXELTYPE)
+
+        return (aFrame, npView)
+
     def buf_getframedata(self, iFrame):
         """
         Return NumPy buffer of image data specified by iFrame.
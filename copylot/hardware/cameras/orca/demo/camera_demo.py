@@ -1,5 +1,9 @@
 from copylot.hardware.cameras.orca.camera import OrcaCamera
 
 if __name__ == '__main__':
-    camera = OrcaCamera()
-    camera.run(100)
+    camera = OrcaCamera(nb_buffer_frames=64)
+
+    for data, metadata in camera.stream(100):
+        print(metadata.frame_index, metadata.timestamp, data.shape)
+
+    print("dropped frames:", camera.dropped_frames)
@@ -0,0 +1,202 @@
+import time
+
+import numpy as np
+import pytest
+
+from copylot.hardware.cameras.orca.camera import OrcaCamera, OrcaCameraException
+from copylot.hardware.simulated.dcam import simulated_dcam_backend
+
+
+@pytest.fixture
+def fake_backend():
+    '''
+    Simulated DCAM backend transferring a frame per event, frame k is filled
+    with the value k and exposed until k + 0.5 s
+    '''
+    return simulated_dcam_backend(
+        shape=(4, 6), exposure_time=0.5, readout_time=1.0, realtime=False
+    )
+
+
+@pytest.mark.parametrize('copy', [True, False])
+def test_stream_frames_in_order(fake_backend, copy):
+    camera = OrcaCamera(nb_buffer_frames=4, backend=fake_backend)
+
+    frames = [
+        (int(data[0, 0]), metadata) for data, metadata in camera.stream(10, copy=copy)
+    ]
+
+    assert [value for value, _ in frames] == list(range(10))
+    assert [metadata.frame_index for _, metadata in frames] == list(range(10))
+    assert frames[3][1].timestamp == pytest.approx(3.5)
+    assert camera.dropped_frames == 0
+    assert not fake_backend.Dcamapi.initialized
+
+
+def test_stream_reuses_ring_buffer(fake_backend):
+    camera = OrcaCamera(nb_buffer_frames=3, backend=fake_backend)
+
+    addresses = {
+        data.__array_interface__['data'][0] for data, _ in camera.stream(9, copy=True)
+    }
+
+    assert len(addresses) == 3
+
+
+def test_stream_counts_dropped_frames(fake_backend):
+    fake_backend.Dcam.frames_per_event = 6
+    camera = OrcaCamera(nb_buffer_frames=4, backend=fake_backend)
+
+    frames = [metadata.frame_index for _, metadata in camera.stream(8)]
+
+    # 2 frames are overwritten in the 4-frame buffer at every event
+    assert frames == [2, 3, 4, 5, 8, 9, 10, 11]
+    assert camera.dropped_frames == 4
+    assert camera.telemetry.dropped_frames == 4
+    # the 4 frames of an event are read oldest first
+    records = camera.telemetry.snapshot()
+    assert list(records['queue_depth']) == [3, 2, 1, 0, 3, 2, 1, 0]
+    # frames delivered per second, the camera runs at 1 fps
+    assert camera.telemetry.stats().frame_rate == pytest.approx(7 / 9)
+
+
+def test_stream_releases_camera_on_error(fake_backend):
+    fake_backend.Dcam.cap_start = lambda self: False
+    camera = OrcaCamera(backend=fake_backend)
+
+    with pytest.raises(OrcaCameraException):
+        next(camera.stream(1))
+    assert not fake_backend.Dcamapi.initialized
+
+
+def test_stream_fails_after_consecutive_timeouts(fake_backend):
+    # the first frame is ready after 10 s
+    fake_backend.Dcam.exposure_time = 5
+    fake_backend.Dcam.readout_time = 5
+    fake_backend.Dcam.realtime = True
+    camera = OrcaCamera(backend=fake_backend)
+
+    with pytest.raises(OrcaCameraException):
+        next(camera.stream(1, timeout_millisec=10, max_timeouts=3))
+    assert not fake_backend.Dcamapi.initialized
+
+    timeouts = camera.stream(1, timeout_millisec=10, yield_timeouts=True)
+    assert [next(timeouts) for _ in range(5)] == [None] * 5
+    timeouts.close()
+    assert not fake_backend.Dcamapi.initialized
+
+
+def test_stream_at_camera_frame_rate():
+    backend = simulated_dcam_backend(
+        shape=(4, 6), exposure_time=0.002, readout_time=0.005
+    )
+    camera = OrcaCamera(nb_buffer_frames=8, backend=backend)
+
+    start = time.perf_counter()
+    frames = [metadata for _, metadata in camera.stream(20)]
+    duration = time.perf_counter() - start
+
+    # 19 frame periods after the first exposure and readout
+    assert duration >= 19 * 0.005 + 0.007
+    assert [metadata.frame_index for metadata in frames] == list(range(20))
+    assert np.diff([metadata.timestamp for metadata in frames]) == pytest.approx(0.005)
+    assert camera.dropped_frames == 0
+
+
+def test_sequence_reads_frames_into_caller_buffer():
+    backend = simulated_dcam_backend(
+        shape=(4, 6), exposure_time=0.001, readout_time=0.002
+    )
+    camera = OrcaCamera(nb_buffer_frames=8, backend=backend)
+    out = np.empty((4, 6), dtype=np.uint16)
+
+    camera.start_sequence(n_buffers=16)
+    frames = []
+    for _ in range(5):
+        frame, metadata = camera.get_frame(timeout=1, out=out)
+        assert frame is out
+        frames.append((int(frame[0, 0]), metadata.frame_index))
+    camera.stop_sequence()
+
+    assert frames == [(index, index) for index in range(5)]
+    # the DCAM buffer is released on the acquisition thread
+    assert not backend.Dcamapi.initialized
+
+
+def test_sequence_stops_without_frames():
+    # the first frame is ready after 10 s
+    backend = simulated_dcam_backend(shape=(4, 6), exposure_time=5, readout_time=5)
+    camera = OrcaCamera(backend=backend)
+
+    camera.start_sequence(timeout_millisec=10)
+    with pytest.raises(TimeoutError):
+        camera.get_frame(timeout=0.05)
+    start = time.perf_counter()
+    camera.stop_sequence()
+
+    assert time.perf_counter() - start < 0.5
+    assert not backend.Dcamapi.initialized
+
+
+def test_settings_are_applied_whenever_the_camera_opens():
+    backend = simulated_dcam_backend(shape=(64, 96), realtime=False)
+    camera = OrcaCamera(backend=backend)
+
+    camera.binning = (2, 2)
+    camera.image_size = (16, 8)
+    camera.exposure = 0.02
+    camera.gain = 0.5
+    camera.shutter_mode = 'lightsheet'
+
+    # every call opened the camera, whose properties start from the defaults
+    assert camera.binning == (2, 2)
+    assert camera.image_size == (16, 8)
+    assert camera.image_size_limits == (2, 48, 2, 32)
+    assert camera.exposure == 0.02
+    assert camera.gain == 0.5
+    assert camera.shutter_mode == 'lightsheet'
+    assert camera.snap().shape == (8, 16)
+    assert not backend.Dcamapi.initialized
+
+
+def test_settings_are_written_to_the_streaming_camera():
+    backend = simulated_dcam_backend(shape=(4, 6), realtime=False)
+    camera = OrcaCamera(backend=backend)
+
+    frames = camera.stream(3)
+    next(frames)
+    camera.exposure = 0.5
+    # the subarray cannot change during the capture
+    with pytest.raises(OrcaCameraException):
+        camera.binning = (2, 2)
+    _, metadata = next(frames)
+    frames.close()
+
+    # frame 1 is exposed from 0.5 to 1 s
+    assert metadata.timestamp == pytest.approx(1.0)
+    assert camera.binning == (1, 1)
+    assert camera.exposure == 0.5
+
+
+def test_invalid_settings_are_rejected():
+    camera = OrcaCamera(backend=simulated_dcam_backend(realtime=False))
+
+    with pytest.raises(OrcaCameraException):
+        camera.binning = (2, 4)
+    with pytest.raises(OrcaCameraException):
+        camera.exposure = 20.0
+    with pytest.raises(OrcaCameraException):
+        camera.shutter_mode = 'global'
+
+    assert camera.exposure_limits == (38.96e-6, 10.0)
+    assert camera.exposure == 0.01
+
+
+def test_snap_and_available_cameras():
+    backend = simulated_dcam_backend(shape=(4, 6), realtime=False)
+    camera = OrcaCamera(backend=backend)
+
+    assert OrcaCamera.list_available_cameras(backend) == [0]
+    assert camera.snap()[0, 0] == 0
+    assert camera.snap().shape == (4, 6)
+    assert not backend.Dcamapi.initialized
@@ -0,0 +1,223 @@
+import threading
+import time
+from typing import Callable, Optional, Tuple
+
+import numpy as np
+
+from copylot import logger
+from copylot.hardware.cameras.frame_buffer import FrameMetadata, FrameRingBuffer
+from copylot.hardware.telemetry import FrameTelemetry
+
+
+class StreamingAcquisitionException(Exception):
+    pass
+
+
+class StreamingAcquisition:
+    """
+    Continuous acquisition on a background thread.
+
+    A producer thread calls ``grab_frame`` in a loop and copies every frame
+    into a preallocated ``FrameRingBuffer``, so acquisition is never blocked
+    by slow consumers and no memory is allocated per frame. Consumers either
+    read the newest frame (``read_latest``, e.g. for live view) or every
+    frame in acquisition order (``read_next``, e.g. for saving).
+
+    One ring slot is kept free for the producer, so at most ``nb_buffers - 1``
+    frames can be pending before ``read_next`` starts dropping frames.
+
+    Parameters
+    ----------
+    grab_frame : Callable[[], Optional[Tuple[np.ndarray, FrameMetadata]]]
+        Returns the next frame and its metadata, or None on timeout.
+        The returned array only needs to stay valid until the next call.
+    nb_buffers : int
+        Number of frames in the ring buffer.
+    on_stop : Callable[[], None], optional
+        Called on the acquisition thread after the last grab.
+    telemetry : FrameTelemetry, optional
+        Records every frame with the number of frames ``read_next`` has not
+        returned yet, reset on start.
+
+    """
+
+    def __init__(
+        self,
+        grab_frame: Callable[[], Optional[Tuple[np.ndarray, FrameMetadata]]],
+        nb_buffers: int = 16,
+        on_stop: Callable[[], None] = None,
+        telemetry: FrameTelemetry = None,
+    ):
+        if nb_buffers < 2:
+            raise ValueError("Streaming needs at least two buffers.")
+        self._grab_frame = grab_frame
+        self._on_stop = on_stop
+        self.telemetry = telemetry
+        self.nb_buffers = nb_buffers
+
+        self._ring_buffer = None
+        self._condition = threading.Condition()
+        self._stop_event = threading.Event()
+        self._thread = None
+        self._error = None
+        self._next_read = 0
+        self._dropped_frames = 0
+
+    @property
+    def is_running(self) -> bool:
+        """True while the acquisition thread is alive"""
+        return self._thread is not None and self._thread.is_alive()
+
+    @property
+    def frame_count(self) -> int:
+        """Number of frames acquired since start"""
+        return 0 if self._ring_buffer is None else self._ring_buffer.count
+
+    @property
+    def dropped_frames(self) -> int:
+        """Number of frames overwritten before ``read_next`` could return them"""
+        return self._dropped_frames
+
+    def start(self):
+        """Start the acquisition thread"""
+        if self.is_running:
+            raise StreamingAcquisitionException("Acquisition is already running.")
+
+        self._ring_buffer = None
+        self._error = None
+        self._next_read = 0
+        self._dropped_frames = 0
+        if self.telemetry is not None:
+            self.telemetry.reset()
+        self._stop_event.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="copylot-streaming", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self, timeout: float = None):
+        """Stop the acquisition thread and wait until it returns
+
+        Parameters
+        ----------
+        timeout : float
+            Maximum time to wait for the thread in seconds.
+        """
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+        with self._condition:
+            self._condition.notify_all()
+        self._raise_error()
+
+    def read_latest(
+        self, out: np.ndarray = None, timeout: float = None
+    ) -> Tuple[np.ndarray, FrameMetadata]:
+        """
+        Copy the newest frame, waits until the first frame arrives.
+
+        Parameters
+        ----------
+        out : np.ndarray, optional
+            Destination buffer, a new array is allocated if None.
+        timeout : float
+            Maximum time to wait for a frame in seconds, wait forever if None.
+
+        Returns
+        -------
+        Tuple[np.ndarray, FrameMetadata]
+        """
+        with self._condition:
+            self._wait_for(lambda: self.frame_count > 0, timeout)
+            frame, metadata = self._ring_buffer.latest()
+            self._next_read = self._ring_buffer.count
+            return self._copy(frame, out), metadata
+
+    def read_next(
+        self, out: np.ndarray = None, timeout: float = None
+    ) -> Tuple[np.ndarray, FrameMetadata]:
+        """
+        Copy the oldest frame not read yet, so that frames are returned in
+        acquisition order. Frames that were overwritten in the meantime are
+        skipped and counted in ``dropped_frames``.
+
+        Parameters
+        ----------
+        out : np.ndarray, optional
+            Destination buffer, a new array is allocated if None.
+        timeout : float
+            Maximum time to wait for a frame in seconds, wait forever if None.
+
+        Returns
+        -------
+        Tuple[np.ndarray, FrameMetadata]
+        """
+        with self._condition:
+            self._wait_for(lambda: self.frame_count > self._next_read, timeout)
+
+            # the slot the producer is writing to is not readable
+            oldest_valid = self._ring_buffer.count - (self.nb_buffers - 1)
+            if self._next_read < oldest_valid:
+                self._dropped_frames += oldest_valid - self._next_read
+                self._next_read = oldest_valid
+
+            frame, metadata = self._ring_buffer.get(self._next_read)
+            self._next_read += 1
+            return self._copy(frame, out), metadata
+
+    def _wait_for(self, predicate, timeout):
+        """Wait on the condition, raises if the acquisition stopped or timed out"""
+        deadline = None if timeout is None else time.perf_counter() + timeout
+        while not predicate():
+            self._raise_error()
+            if not self.is_running:
+                raise StreamingAcquisitionException("Acquisition is not running.")
+            remaining = None if deadline is None else deadline - time.perf_counter()
+            if remaining is not None and remaining <= 0:
+                raise TimeoutError("No frame received before timeout.")
+            self._condition.wait(remaining)
+
+    def _raise_error(self):
+        if self._error is not None:
+            raise StreamingAcquisitionException(
+                "Acquisition thread failed."
+            ) from self._error
+
+    @staticmethod
+    def _copy(frame, out):
+        if out is None:
+            return frame.copy()
+        np.copyto(out, frame)
+        return out
+
+    def _run(self):
+        try:
+            while not self._stop_event.is_set():
+                result = self._grab_frame()
+                if result is None:
+                    continue
+                data, metadata = result
+
+                if self._ring_buffer is None:
+                    self._ring_buffer = FrameRingBuffer(
+                        self.nb_buffers, data.shape, data.dtype
+                    )
+                # the next slot is never readable, so it is filled without the lock
+                np.copyto(self._ring_buffer.next_slot(), data)
+                with self._condition:
+                    self._ring_buffer.commit(metadata)
+                    self._condition.notify_all()
+                if self.telemetry is not None:
+                    self.telemetry.record(
+                        *metadata,
+                        queue_depth=self._ring_buffer.count - self._next_read,
+                    )
+        except Exception as e:
+            logger.error("Streaming acquisition stopped with error: %s", e)
+            self._error = e
+        finally:
+            if self._on_stop is not None:
+                self._on_stop()
+            with self._condition:
+                self._condition.notify_all()
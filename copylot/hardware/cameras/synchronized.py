@@ -0,0 +1,387 @@
+import threading
+import time
+from typing import Dict, Iterable, Mapping, NamedTuple
+
+import numpy as np
+
+from copylot import logger
+from copylot.hardware.cameras.frame_buffer import FrameMetadata, FrameRingBuffer
+
+
+class SynchronizedAcquisitionException(Exception):
+    pass
+
+
+class FrameSet(NamedTuple):
+    """Frames of every camera taken at the same trigger.
+
+    Parameters
+    ----------
+    index : int
+        Index of the set since the start of the acquisition.
+    frames : Dict[str, np.ndarray]
+        Frame of every camera, by camera name.
+    metadata : Dict[str, FrameMetadata]
+        Metadata of every frame, by camera name.
+    skew : float
+        Time between the arrival of the first and the last frame of the set
+        on the host in seconds.
+    """
+
+    index: int
+    frames: Dict[str, np.ndarray]
+    metadata: Dict[str, FrameMetadata]
+    skew: float
+
+
+class SkewReport(NamedTuple):
+    """Synchronization of the cameras since the start of the acquisition.
+
+    Parameters
+    ----------
+    nb_sets : int
+        Number of frame sets returned.
+    mean_skew : float
+        Mean skew of the sets in seconds.
+    max_skew : float
+        Largest skew of a set in seconds.
+    unmatched_frames : Dict[str, int]
+        Frames of every camera skipped because other cameras had no frame
+        of the same trigger, e.g. after a dropped frame.
+    dropped_frames : Dict[str, int]
+        Frames of every camera overwritten before they could be matched.
+    """
+
+    nb_sets: int
+    mean_skew: float
+    max_skew: float
+    unmatched_frames: Dict[str, int]
+    dropped_frames: Dict[str, int]
+
+
+class _CameraCapture:
+    """Ring buffer, arrival times and read position of a camera"""
+
+    def __init__(self, name, source):
+        self.name = name
+        self.source = source
+        self.ring_buffer = None
+        self.arrivals = None
+        self.next_read = 0
+        self.first_timestamp = None
+        self.unmatched_frames = 0
+        self.dropped_frames = 0
+        self.thread = None
+
+    @property
+    def count(self):
+        return 0 if self.ring_buffer is None else self.ring_buffer.count
+
+
+class SynchronizedAcquisition:
+    """
+    Acquire from several cameras in lockstep.
+
+    Every camera is read by its own capture thread, which copies the frames
+    into a preallocated ring buffer of the camera, so the cameras are read
+    in parallel and throughput scales with the number of cameras as long as
+    there are cores to run the threads. ``read_next_set`` pairs the frames
+    of the cameras that belong to the same trigger, either by their frame
+    index, for cameras started by the same trigger, or by their timestamp
+    since the first frame of the camera. Frames without a match in every
+    camera are skipped and counted in ``skew_report``.
+
+    One ring slot of every camera is kept free for its capture thread, so at
+    most ``nb_buffers - 1`` frames of a camera can be pending before frames
+    are dropped.
+
+    Parameters
+    ----------
+    cameras : Mapping[str, object]
+        Frame source of every camera by name. A source is either a camera
+        after ``start_sequence()``, read with ``get_frame(timeout, out)``,
+        a ``StreamingAcquisition``, read with ``read_next(out, timeout)``,
+        or an iterable of frames and metadata, e.g. ``OrcaCamera.stream(n)``.
+    match : str
+        'frame_index' or 'timestamp'.
+    tolerance : float
+        Largest difference of the frame indices, or of the timestamps in
+        seconds, of frames of the same trigger.
+    nb_buffers : int
+        Number of frames in the ring buffer of every camera.
+    timeout : float
+        Maximum time a capture thread waits for a frame of ``read_next``
+        before it checks whether the acquisition was stopped.
+
+    """
+
+    def __init__(
+        self,
+        cameras: Mapping[str, object],
+        match: str = 'frame_index',
+        tolerance: float = 0,
+        nb_buffers: int = 16,
+        timeout: float = 0.1,
+    ):
+        if match not in ('frame_index', 'timestamp'):
+            raise ValueError(f"Unknown match {match!r}, use frame_index or timestamp.")
+        if nb_buffers < 2:
+            raise ValueError("Synchronized acquisition needs at least two buffers.")
+        if not cameras:
+            raise ValueError("Synchronized acquisition needs at least one camera.")
+        self.match = match
+        self.tolerance = tolerance
+        self.nb_buffers = nb_buffers
+        self.timeout = timeout
+
+        self._cameras = [
+            _CameraCapture(name, source) for name, source in cameras.items()
+        ]
+        self._condition = threading.Condition()
+        self._stop_event = threading.Event()
+        self._error = None
+        self._set_count = 0
+        self._skews = []
+
+    @property
+    def camera_names(self):
+        """Names of the cameras, in the order they were given"""
+        return [camera.name for camera in self._cameras]
+
+    @property
+    def is_running(self) -> bool:
+        """True while the capture thread of every camera is alive"""
+        return all(
+            camera.thread is not None and camera.thread.is_alive()
+            for camera in self._cameras
+        )
+
+    @property
+    def set_count(self) -> int:
+        """Number of frame sets returned since start"""
+        return self._set_count
+
+    def start(self):
+        """Start a capture thread per camera"""
+        if any(camera.thread is not None for camera in self._cameras):
+            raise SynchronizedAcquisitionException("Acquisition is already running.")
+
+        self._error = None
+        self._set_count = 0
+        self._skews = []
+        self._stop_event.clear()
+        self._cameras = [
+            _CameraCapture(camera.name, camera.source) for camera in self._cameras
+        ]
+        for camera in self._cameras:
+            camera.thread = threading.Thread(
+                target=self._capture,
+                args=(camera,),
+                name=f"copylot-capture-{camera.name}",
+                daemon=True,
+            )
+        for camera in self._cameras:
+            camera.thread.start()
+
+    def stop(self, timeout: float = None):
+        """Stop the capture threads and wait until they return
+
+        Parameters
+        ----------
+        timeout : float
+            Maximum time to wait for every thread in seconds.
+        """
+        self._stop_event.set()
+        for camera in self._cameras:
+            if camera.thread is not None:
+                camera.thread.join(timeout)
+                camera.thread = None
+        with self._condition:
+            self._condition.notify_all()
+        self._raise_error()
+
+    def read_next_set(self, timeout: float = None) -> FrameSet:
+        """
+        Next set of frames of the same trigger.
+
+        The frames are views on the ring buffers of the cameras, a frame
+        stays valid until its camera captured ``nb_buffers - 1`` more frames.
+        Copy them, e.g. with ``StreamWriter.write``, to keep them longer.
+
+        Parameters
+        ----------
+        timeout : float
+            Maximum time to wait for a set in seconds, wait forever if None.
+
+        Returns
+        -------
+        FrameSet
+        """
+        deadline = None if timeout is None else time.perf_counter() + timeout
+        with self._condition:
+            while True:
+                self._wait_for_frames(deadline)
+                keys = {camera.name: self._key(camera) for camera in self._cameras}
+                newest = max(keys.values())
+                behind = [
+                    camera
+                    for camera in self._cameras
+                    if keys[camera.name] < newest - self.tolerance
+                ]
+                if not behind:
+                    return self._take_set()
+                for camera in behind:
+                    camera.next_read += 1
+                    camera.unmatched_frames += 1
+
+    def frame_sets(self, nb_sets: int, timeout: float = None) -> Iterable[FrameSet]:
+        """
+        Generator of the next ``nb_sets`` frame sets.
+
+        Parameters
+        ----------
+        nb_sets : int
+        timeout : float
+            Maximum time to wait for each set in seconds.
+
+        Yields
+        ------
+        FrameSet
+        """
+        for _ in range(nb_sets):
+            yield self.read_next_set(timeout)
+
+    def write_sets(self, writers: Mapping[str, object], nb_sets: int, timeout=None):
+        """
+        Write the frames of the next ``nb_sets`` sets, one writer per camera.
+
+        Parameters
+        ----------
+        writers : Mapping[str, StreamWriter]
+            Writer of every camera by name, cameras without a writer are
+            only synchronized.
+        nb_sets : int
+        timeout : float
+            Maximum time to wait for each set in seconds.
+        """
+        for frame_set in self.frame_sets(nb_sets, timeout):
+            for name, writer in writers.items():
+                writer.write(frame_set.frames[name], frame_set.metadata[name])
+
+    def skew_report(self) -> SkewReport:
+        """Skew of the frame sets and frames skipped since start"""
+        skews = np.array(self._skews)
+        return SkewReport(
+            nb_sets=len(skews),
+            mean_skew=float(skews.mean()) if len(skews) else 0.0,
+            max_skew=float(skews.max()) if len(skews) else 0.0,
+            unmatched_frames={
+                camera.name: camera.unmatched_frames for camera in self._cameras
+            },
+            dropped_frames={
+                camera.name: camera.dropped_frames for camera in self._cameras
+            },
+        )
+
+    def _key(self, camera):
+        _, metadata = camera.ring_buffer.get(camera.next_read)
+        if self.match == 'frame_index':
+            return metadata.frame_index
+        if camera.first_timestamp is None:
+            camera.first_timestamp = metadata.timestamp
+        return metadata.timestamp - camera.first_timestamp
+
+    def _take_set(self):
+        frames, metadata, arrivals = {}, {}, []
+        for camera in self._cameras:
+            frames[camera.name], metadata[camera.name] = camera.ring_buffer.get(
+                camera.next_read
+            )
+            arrivals.append(camera.arrivals[camera.next_read % self.nb_buffers])
+            camera.next_read += 1
+        skew = max(arrivals) - min(arrivals)
+        self._skews.append(skew)
+        frame_set = FrameSet(self._set_count, frames, metadata, skew)
+        self._set_count += 1
+        return frame_set
+
+    def _wait_for_frames(self, deadline):
+        """Wait until every camera has an unread frame, skipping overwritten ones"""
+        while True:
+            self._raise_error()
+            waiting = [
+                camera for camera in self._cameras if camera.count <= camera.next_read
+            ]
+            if not waiting:
+                break
+            # a camera whose capture ended, e.g. at the end of its stream,
+            # never completes another set
+            if self._stop_event.is_set() or not all(
+                camera.thread is not None and camera.thread.is_alive()
+                for camera in waiting
+            ):
+                raise SynchronizedAcquisitionException("Acquisition is not running.")
+            remaining = None if deadline is None else deadline - time.perf_counter()
+            if remaining is not None and remaining <= 0:
+                raise TimeoutError("No frame set received before timeout.")
+            self._condition.wait(remaining)
+
+        for camera in self._cameras:
+            # the slot the capture thread is writing to is not readable
+            oldest_valid = camera.count - (self.nb_buffers - 1)
+            if camera.next_read < oldest_valid:
+                camera.dropped_frames += oldest_valid - camera.next_read
+                camera.next_read = oldest_valid
+
+    def _raise_error(self):
+        if self._error is not None:
+            raise SynchronizedAcquisitionException(
+                "Capture thread failed."
+            ) from self._error
+
+    def _frames(self, camera):
+        """Frames of a source, the array is only read before the next one"""
+        source = camera.source
+        if hasattr(source, 'get_frame'):
+            read = source.get_frame
+        elif hasattr(source, 'read_next'):
+            read = source.read_next
+        else:
+            yield from source
+            return
+        while not self._stop_event.is_set():
+            # frames are read into the ring buffer of the camera directly
+            out = None if camera.ring_buffer is None else camera.ring_buffer.next_slot()
+            try:
+                yield read(out=out, timeout=self.timeout)
+            except TimeoutError:
+                continue
+
+    def _capture(self, camera):
+        frames = self._frames(camera)
+        try:
+            for data, metadata in frames:
+                if self._stop_event.is_set():
+                    break
+                arrival = time.perf_counter()
+                if camera.ring_buffer is None:
+                    camera.ring_buffer = FrameRingBuffer(
+                        self.nb_buffers, data.shape, data.dtype
+                    )
+                    camera.arrivals = np.zeros(self.nb_buffers)
+                # the next slot is never readable, so it is filled without the lock
+                slot = camera.ring_buffer.next_slot()
+                if data is not slot:
+                    np.copyto(slot, data)
+                with self._condition:
+                    camera.arrivals[camera.count % self.nb_buffers] = arrival
+                    camera.ring_buffer.commit(metadata)
+                    self._condition.notify_all()
+        except Exception as e:
+            logger.error("Capture of %s stopped with error: %s", camera.name, e)
+            self._error = e
+        finally:
+            # stops the acquisition of generator sources, e.g. OrcaCamera.stream
+            frames.close()
+            with self._condition:
+                self._condition.notify_all()
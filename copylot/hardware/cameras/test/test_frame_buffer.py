@@ -0,0 +1,40 @@
+import numpy as np
+import pytest
+
+from copylot.hardware.cameras.frame_buffer import FrameMetadata, FrameRingBuffer
+
+
+def test_push_wraps_around():
+    ring_buffer = FrameRingBuffer(3, (2, 2), np.uint16)
+
+    views = [
+        ring_buffer.push(np.full((2, 2), i, np.uint16), FrameMetadata(frame_index=i))
+        for i in range(4)
+    ]
+
+    # the fourth frame overwrote the first slot
+    assert views[0] is not views[3]
+    assert np.shares_memory(views[0], views[3])
+    assert views[0][0, 0] == 3
+    assert ring_buffer.count == 4
+
+    frame, metadata = ring_buffer.latest()
+    assert frame[0, 0] == 3
+    assert metadata.frame_index == 3
+
+
+def test_next_slot_and_commit():
+    ring_buffer = FrameRingBuffer(2, (2, 2), np.uint8)
+    assert ring_buffer.latest() == (None, None)
+
+    slot = ring_buffer.next_slot()
+    slot[:] = 7
+    view = ring_buffer.commit(FrameMetadata(frame_index=0))
+
+    assert np.shares_memory(slot, view)
+    assert ring_buffer.latest()[0][1, 1] == 7
+
+
+def test_empty_ring_buffer_raises():
+    with pytest.raises(ValueError):
+        FrameRingBuffer(0, (2, 2))
@@ -0,0 +1,129 @@
+import threading
+import time
+
+import numpy as np
+import pytest
+
+from copylot.hardware.cameras.frame_buffer import FrameMetadata
+from copylot.hardware.cameras.streaming import (
+    StreamingAcquisition,
+    StreamingAcquisitionException,
+)
+from copylot.hardware.telemetry import FrameTelemetry
+
+
+class FakeGrabber:
+    '''
+    Returns 2x3 frames filled with their frame index, a single array is
+    reused for every frame like a camera SDK buffer.
+    '''
+
+    def __init__(self, nb_frames=None, period=0.0):
+        self.nb_frames = nb_frames
+        self.period = period
+        self.count = 0
+        self.stopped = False
+        self._buffer = np.zeros((2, 3), dtype=np.uint16)
+
+    def __call__(self):
+        time.sleep(self.period)
+        if self.nb_frames is not None and self.count >= self.nb_frames:
+            return None
+        self._buffer[:] = self.count
+        metadata = FrameMetadata(frame_index=self.count)
+        self.count += 1
+        return self._buffer, metadata
+
+    def on_stop(self):
+        self.stopped = True
+
+
+def wait_for_frames(stream, nb_frames, timeout=2.0):
+    deadline = time.perf_counter() + timeout
+    while stream.frame_count < nb_frames:
+        assert time.perf_counter() < deadline
+        time.sleep(0.001)
+
+
+def test_read_latest_returns_newest_frame():
+    grabber = FakeGrabber(nb_frames=10)
+    stream = StreamingAcquisition(grabber, nb_buffers=4, on_stop=grabber.on_stop)
+    stream.start()
+    wait_for_frames(stream, 10)
+
+    out = np.empty((2, 3), dtype=np.uint16)
+    frame, metadata = stream.read_latest(out=out, timeout=1)
+    stream.stop()
+
+    assert frame is out
+    assert metadata.frame_index == 9
+    assert np.all(frame == 9)
+    assert grabber.stopped
+    assert not stream.is_running
+
+
+def test_read_next_returns_frames_in_order():
+    grabber = FakeGrabber(nb_frames=20, period=0.001)
+    stream = StreamingAcquisition(grabber, nb_buffers=32)
+    stream.start()
+
+    frames = [stream.read_next(timeout=1) for _ in range(20)]
+    stream.stop()
+
+    assert [metadata.frame_index for _, metadata in frames] == list(range(20))
+    assert [int(frame[0, 0]) for frame, _ in frames] == list(range(20))
+    assert stream.dropped_frames == 0
+
+
+def test_read_next_counts_dropped_frames():
+    grabber = FakeGrabber(nb_frames=10)
+    stream = StreamingAcquisition(grabber, nb_buffers=4)
+    stream.start()
+    wait_for_frames(stream, 10)
+
+    frame, metadata = stream.read_next(timeout=1)
+    stream.stop()
+
+    # one slot is reserved for the producer, so only 3 frames are readable
+    assert metadata.frame_index == 7
+    assert np.all(frame == 7)
+    assert stream.dropped_frames == 7
+
+
+def test_read_timeout():
+    stream = StreamingAcquisition(FakeGrabber(nb_frames=0, period=0.001))
+    stream.start()
+
+    with pytest.raises(TimeoutError):
+        stream.read_latest(timeout=0.05)
+    stream.stop()
+
+
+def test_error_on_acquisition_thread_is_raised():
+    event = threading.Event()
+
+    def grab_frame():
+        event.set()
+        raise RuntimeError('camera disconnected')
+
+    stream = StreamingAcquisition(grab_frame)
+    stream.start()
+    event.wait(1)
+
+    with pytest.raises(StreamingAcquisitionException):
+        stream.read_next(timeout=1)
+    with pytest.raises(StreamingAcquisitionException):
+        stream.stop()
+
+
+def test_telemetry_records_the_backlog():
+    grabber = FakeGrabber(nb_frames=5)
+    frames = FrameTelemetry('test_stream')
+    stream = StreamingAcquisition(grabber, nb_buffers=8, telemetry=frames)
+    stream.start()
+    wait_for_frames(stream, 5)
+    stream.stop()
+
+    # nothing was read while the frames arrived
+    assert list(frames.snapshot()['queue_depth']) == [1, 2, 3, 4, 5]
+    assert frames.dropped_frames == 0
@@ -0,0 +1,161 @@
+import time
+
+import numpy as np
+import pytest
+
+from copylot.hardware.cameras.frame_buffer import FrameMetadata
+from copylot.hardware.cameras.orca.camera import OrcaCamera
+from copylot.hardware.cameras.streaming import StreamingAcquisition
+from copylot.hardware.cameras.synchronized import (
+    SynchronizedAcquisition,
+    SynchronizedAcquisitionException,
+)
+from copylot.hardware.simulated.dcam import simulated_dcam_backend
+
+
+def triggered_frames(nb_frames, missed=(), offset=0.0, period=0.001):
+    '''
+    Yields 2x2 frames filled with the trigger index, like a camera on an
+    external trigger with a period of ``period`` that misses some triggers.
+    The hardware clock of every camera starts at ``offset``.
+    '''
+    buffer = np.zeros((2, 2), dtype=np.uint16)
+    for trigger in range(nb_frames):
+        time.sleep(period)
+        if trigger in missed:
+            continue
+        buffer[:] = trigger
+        yield buffer, FrameMetadata(
+            frame_index=trigger, timestamp=offset + trigger * 0.01
+        )
+
+
+class TriggeredGrabber:
+    '''Grab function of a StreamingAcquisition, returns None after the last frame'''
+
+    def __init__(self, nb_frames, missed=()):
+        self._frames = triggered_frames(nb_frames, missed)
+
+    def __call__(self):
+        return next(self._frames, None)
+
+
+class RecordingWriter:
+    def __init__(self):
+        self.frames = []
+
+    def write(self, frame, metadata=None):
+        self.frames.append((frame.copy(), metadata))
+
+
+def test_sets_are_matched_by_frame_index():
+    left = StreamingAcquisition(TriggeredGrabber(20, missed={3}), nb_buffers=32)
+    right = StreamingAcquisition(TriggeredGrabber(20, missed={7, 8}), nb_buffers=32)
+    left.start()
+    right.start()
+    acquisition = SynchronizedAcquisition({'left': left, 'right': right}, nb_buffers=32)
+    acquisition.start()
+    frame_sets = list(acquisition.frame_sets(17, timeout=2))
+    acquisition.stop()
+    left.stop()
+    right.stop()
+
+    expected = [i for i in range(20) if i not in {3, 7, 8}]
+    assert [frame_set.index for frame_set in frame_sets] == list(range(17))
+    for frame_set, trigger in zip(frame_sets, expected):
+        for name in ('left', 'right'):
+            assert frame_set.metadata[name].frame_index == trigger
+            assert np.all(frame_set.frames[name] == trigger)
+
+    report = acquisition.skew_report()
+    assert report.nb_sets == 17
+    assert report.unmatched_frames == {'left': 2, 'right': 1}
+    assert report.dropped_frames == {'left': 0, 'right': 0}
+    assert 0 <= report.mean_skew <= report.max_skew
+
+
+def test_sets_are_matched_by_timestamp():
+    acquisition = SynchronizedAcquisition(
+        {
+            'orca': triggered_frames(10, missed={0}, offset=100.0),
+            'flir': triggered_frames(10, missed={5}, offset=3.0),
+        },
+        match='timestamp',
+        tolerance=0.002,
+    )
+    acquisition.start()
+    frame_sets = list(acquisition.frame_sets(8, timeout=2))
+    acquisition.stop()
+
+    # timestamps count from the first frame of each camera, so the flir
+    # frame of trigger 0 is matched with the orca frame of trigger 1
+    orca = [frame_set.metadata['orca'].frame_index for frame_set in frame_sets]
+    flir = [frame_set.metadata['flir'].frame_index for frame_set in frame_sets]
+    assert orca == [1, 2, 3, 4, 5, 7, 8, 9]
+    assert flir == [0, 1, 2, 3, 4, 6, 7, 8]
+
+
+def test_cameras_are_read_with_get_frame():
+    cameras = {
+        f"orca{index}": OrcaCamera(
+            camera_index=index,
+            backend=simulated_dcam_backend(
+                shape=(4, 6), exposure_time=0.001, readout_time=0.002
+            ),
+        )
+        for index in range(2)
+    }
+    for camera in cameras.values():
+        camera.start_sequence()
+    acquisition = SynchronizedAcquisition(cameras)
+    acquisition.start()
+    frame_sets = list(acquisition.frame_sets(5, timeout=2))
+    acquisition.stop()
+    for camera in cameras.values():
+        camera.stop_sequence()
+
+    for index, frame_set in enumerate(frame_sets):
+        for frame in frame_set.frames.values():
+            assert np.all(frame == index)
+
+
+def test_write_sets():
+    writers = {'left': RecordingWriter(), 'right': RecordingWriter()}
+    acquisition = SynchronizedAcquisition(
+        {'left': triggered_frames(5), 'right': triggered_frames(5)}
+    )
+    acquisition.start()
+    acquisition.write_sets(writers, nb_sets=5, timeout=2)
+    acquisition.stop()
+
+    for writer in writers.values():
+        assert [metadata.frame_index for _, metadata in writer.frames] == list(range(5))
+        assert [int(frame[0, 0]) for frame, _ in writer.frames] == list(range(5))
+
+
+def test_ended_camera_stops_the_sets():
+    acquisition = SynchronizedAcquisition(
+        {'left': triggered_frames(2), 'right': triggered_frames(5)}
+    )
+    acquisition.start()
+    assert len(list(acquisition.frame_sets(2, timeout=2))) == 2
+
+    with pytest.raises(SynchronizedAcquisitionException):
+        acquisition.read_next_set(timeout=2)
+    acquisition.stop()
+
+
+def test_capture_error_is_raised():
+    def failing_frames():
+        yield from triggered_frames(1)
+        raise RuntimeError("camera unplugged")
+
+    acquisition = SynchronizedAcquisition(
+        {'left': failing_frames(), 'right': triggered_frames(5)}
+    )
+    acquisition.start()
+
+    with pytest.raises(SynchronizedAcquisitionException):
+        list(acquisition.frame_sets(5, timeout=2))
+    with pytest.raises(SynchronizedAcquisitionException):
+        acquisition.stop()
@@ -39,3 +39,6 @@ if __name__ == "__main__":
     daq_card.acquire_stacks(
         channels=['488', '561'], view=3, scan_option="Stage", interleave=False
     )
+
+    # release the ao and do tasks kept committed between acquisitions
+    daq_card.close()
@@ -22,8 +22,8 @@ def constant_voltage_single_channel_demo():
     # Keep the desired voltages on for desired time in seconds, (5 seconds for our demo)
     time.sleep(50)
 
-    # Clean the ao channels
-    live_nidaq.zero()
+    # Clean the ao channels and release the task
+    live_nidaq.close()
 
 
 if __name__ == '__main__':
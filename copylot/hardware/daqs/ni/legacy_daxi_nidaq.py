@@ -1,9 +1,17 @@
 """making ao channel to send a sequence of signals"""
+import itertools
 import nidaqmx
 import nidaqmx.system
-import numpy as np
+import threading
 import time
 
+import numpy as np
+
+from copylot import logger
+from copylot.hardware.daqs.ni import waveforms
+from copylot.hardware.daqs.ni.task_pool import TaskPool
+from copylot.hardware.telemetry import FrameTelemetry
+
 
 def set_dio_state(ch, value):
     """set a DIO channel,
@@ -64,6 +72,16 @@ class NIDaq:
         Voltage to apply on galvo beta to adjust light sheet angle
     laser_power
         Percentage value in [0, 100], for laser analog control
+    backend
+        Module-like object providing the ``Task`` class, defaults to ``nidaqmx``.
+        Pass a simulated backend to run acquisitions without a DAQ.
+    task_pool : TaskPool, optional
+        Pool of committed tasks shared with other instances, e.g. by a GUI
+        that creates an instance for every change of parameters. The pool
+        is not closed by ``close``, its owner closes it.
+
+    The ao and do tasks are kept committed and reused between calls,
+    call ``close`` or use the instance as context manager to release them.
 
     """
 
@@ -97,6 +115,8 @@ class NIDaq:
     ch_dio7 = "cDAQ1DIO/port0/line7"  # idle
 
     NB_DUMMY_TTLS = 2  # the number of dummy TTLs from the Flash4 camera
+    # unit: second, how often stop_now is checked while waiting for a stack
+    STOP_CHECK_INTERVAL = 0.5
 
     # constants
     MAX_VOL = 10  # unit: v, maximum voltage of the ao channels
@@ -138,7 +158,12 @@ class NIDaq:
         o1_pifoc: int = 0,  # unit: um, to apply on O1 PIFOC, [-400, 400] um.
         light_sheet_angle: float = -2.2,  # unit: v, to apply on galvo beta to adjust light sheet angle
         laser_power=100,  # unit: percentage [0, 100], for laser analog control
+        backend=None,  # module providing Task, defaults to nidaqmx
+        task_pool=None,  # pool of committed tasks shared between instances
     ):
+        self._backend = nidaqmx if backend is None else backend
+        self._owns_task_pool = task_pool is None
+        self._task_pool = TaskPool(self._backend) if task_pool is None else task_pool
         self.stop_now = False
 
         self.exposure = exposure
@@ -162,8 +187,25 @@ class NIDaq:
         self.o1_pifoc = o1_pifoc
         self.light_sheet_angle = light_sheet_angle
         self.laser_power_percent = laser_power
-        print("number of slices:", self.nb_slices)
-        print("current sampling_rate is:", self.sampling_rate)
+        # stack index and value of the stack counter at the end of every stack
+        self.telemetry = FrameTelemetry('nidaq')
+        logger.debug(
+            "number of slices: %d, sampling rate: %s",
+            self.nb_slices,
+            self.sampling_rate,
+        )
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def close(self):
+        """Release the ao and do tasks kept committed between calls, unless
+        the task pool is shared"""
+        if self._owns_task_pool:
+            self._task_pool.close()
 
     @property
     def nb_slices(self):
@@ -175,8 +217,37 @@ class NIDaq:
         """Sampling rate"""
         return self.num_samples / self.exposure
 
+    @property
+    def nb_on_samples(self):
+        """Number of samples per exposure while the whole chip is exposed"""
+        return round((self.exposure - self.readout_time) * self.sampling_rate)
+
+    @property
+    def _stripe_range(self):
+        """Min and max voltages of the galvo gamma for stripe reduction"""
+        return (
+            -self.stripe_reduction_range + self.stripe_reduction_offset,
+            self.stripe_reduction_range + self.stripe_reduction_offset,
+        )
+
+    def _get_view_levels(self, view: str):
+        """Return the scan galvo offset, switching galvo and O3 voltages of a view"""
+        if view == "view1":
+            offset = self.offset_view1
+            galvo1, galvo2 = self.view1_galvo1, self.view1_galvo2
+            o3 = self.o3_view1
+        elif view == "view2":
+            offset = self.offset_view2
+            galvo1, galvo2 = self.view2_galvo1, self.view2_galvo2
+            o3 = self.o3_view2
+        else:
+            raise ValueError("View not supported")
+        # convert the offset from um to v
+        offset = self._offset_distance_to_voltage(offset)
+        return offset, galvo1, galvo2, o3 / self.CONVERT_RATIO_PIFOC_O3
+
     def _get_ao_data(self, view: str, scan_option: str = "Stage"):
-        """Generate the ndarray for an ao channel
+        """Generate the ndarray for the ao channels
 
         Parameters
         ----------
@@ -185,70 +256,35 @@ class NIDaq:
 
         Returns
         -------
-        TODO: write the return type and description
+        np.ndarray
+            Read-only waveforms of the 8 ao channels, shape (8, num_samples)
 
         """
-        # AO3. for stripe reduction
-        stripe_min = -self.stripe_reduction_range + self.stripe_reduction_offset
-        stripe_max = self.stripe_reduction_range + self.stripe_reduction_offset
-        nb_on_sample = round((self.exposure - self.readout_time) * self.sampling_rate)
-        nb_off_sample = round(self.readout_time * self.sampling_rate)
-        data_ao3 = list(np.linspace(stripe_min, stripe_max, nb_on_sample))
-        data_ao3.extend([stripe_min] * nb_off_sample)
-
-        # AO4, for fixed light sheet angle
-        data_ao4 = [self.light_sheet_angle] * self.num_samples
-
-        # AO7, for laser analog control
-        data_ao7 = [
-            self.laser_power_percent / 100 * self.MAX_LASER_ANALOG
-        ] * self.num_samples
-
-        # AO1, AO2 and AO6, for view switching and light sheet stabilization
-        if view == "view1":
-            offset = self._offset_distance_to_voltage(
-                self.offset_view1
-            )  # convert the offset from um to v
-            data_ao1 = [self.view1_galvo1] * self.num_samples
-            data_ao2 = [self.view1_galvo2] * self.num_samples
-            data_ao6 = [self.o3_view1 / self.CONVERT_RATIO_PIFOC_O3] * self.num_samples
-        elif view == "view2":
-            offset = self._offset_distance_to_voltage(
-                self.offset_view2
-            )  # convert the offset from um to v
-            data_ao1 = [self.view2_galvo1] * self.num_samples
-            data_ao2 = [self.view2_galvo2] * self.num_samples
-            data_ao6 = [self.o3_view2 / self.CONVERT_RATIO_PIFOC_O3] * self.num_samples
+        if scan_option != "Stage":
+            raise ValueError("Scanning mode not supported")
 
-        # AO0 and AO5 depends in scanning option
-        if scan_option == "Stage":
-            # AO0, stablize light sheet during stage scanning
-            min_range = -self.scan_step / 2 / self.CONVERT_RATIO_SCAN_GALVO
-            max_range = self.scan_step / 2 / self.CONVERT_RATIO_SCAN_GALVO
-            # v change scan for stablizing galvo
-            data_ao0_on = list(
-                np.linspace(max_range + offset, min_range + offset, self.num_samples)
-            )
-            data_ao0_off = list(
-                np.linspace(
-                    data_ao0_on[nb_on_sample], max_range + offset, nb_off_sample
-                )
-            )
-            data_ao0 = data_ao0_on[:nb_on_sample] + data_ao0_off
-
-            # AO5, for fixed O1 position
-            data_ao5 = [self.o1_pifoc / self.CONVERT_RATIO_PIFOC_O1] * self.num_samples
-
-        return [
-            data_ao0,
-            data_ao1,
-            data_ao2,
-            data_ao3,
-            data_ao4,
-            data_ao5,
-            data_ao6,
-            data_ao7,
-        ]
+        offset, galvo1, galvo2, o3 = self._get_view_levels(view)
+        stripe_min, stripe_max = self._stripe_range
+        laser_power = self.laser_power_percent / 100 * self.MAX_LASER_ANALOG
+        levels = (
+            offset,  # AO0, ramp to stablize light sheet during stage scanning
+            galvo1,  # AO1 and AO2, for view switching and light sheet stabilization
+            galvo2,
+            stripe_min,  # AO3, ramp for stripe reduction
+            self.light_sheet_angle,  # AO4, for fixed light sheet angle
+            self.o1_pifoc / self.CONVERT_RATIO_PIFOC_O1,  # AO5, for fixed O1 position
+            o3,  # AO6, for O3 focus control
+            laser_power,  # AO7, for laser analog control
+        )
+        return waveforms.stage_scan_ao_waveforms(
+            self.num_samples,
+            self.nb_on_samples,
+            offset,
+            self.scan_step / 2 / self.CONVERT_RATIO_SCAN_GALVO,
+            levels,
+            stripe_min,
+            stripe_max,
+        )
 
     def _get_do_data(self, nb_channels, interleave=False, current_ch=0):
         """Method to get digital output data.
@@ -261,47 +297,43 @@ class NIDaq:
 
         Returns
         -------
-        list
+        np.ndarray
+            Read-only waveform of shape (num_samples,) for a single channel,
+            shape (nb_channels, nb_samples) otherwise
 
         """
-        nb_on_sample = round((self.exposure - self.readout_time) * self.sampling_rate)
-        data_on = [True] * nb_on_sample + [False] * (self.num_samples - nb_on_sample)
-        data_off = [False] * self.num_samples
-
+        data = waveforms.exposure_do_waveforms(
+            self.num_samples,
+            self.nb_on_samples,
+            nb_channels,
+            interleave and nb_channels > 1,
+            current_ch,
+        )
         if nb_channels == 1:
-            return data_on
-        else:
-            data = []
-            # only generate data once if interleaved channel acquisition
-            if interleave:
-                for i in range(nb_channels):
-                    data.append(
-                        data_off * i + data_on + data_off * (nb_channels - i - 1)
-                    )
-            # generate data for each channel for sequential channel acquisition
-            else:
-                for ch in range(nb_channels):
-                    if ch == current_ch:
-                        data.append(data_on)
-                    else:
-                        data.append(data_off)
-            return data
+            return data[0]
+        return data
 
     def _crate_ao_task_for_acquisition(self):
         """create ao task for acquisition, include all the needed ao channels"""
-        task_ao = nidaqmx.Task("ao0")
-        task_ao.ao_channels.add_ao_voltage_chan(self.ch_ao0)
-        task_ao.ao_channels.add_ao_voltage_chan(self.ch_ao1)
-        task_ao.ao_channels.add_ao_voltage_chan(self.ch_ao2)
-        task_ao.ao_channels.add_ao_voltage_chan(self.ch_ao3)
-        task_ao.ao_channels.add_ao_voltage_chan(self.ch_ao4)
-        task_ao.ao_channels.add_ao_voltage_chan(self.ch_ao5)
-        task_ao.ao_channels.add_ao_voltage_chan(self.ch_ao6)
-        task_ao.ao_channels.add_ao_voltage_chan(self.ch_ao7)
+        task_ao = self._task_pool.ao_task(
+            [
+                self.ch_ao0,
+                self.ch_ao1,
+                self.ch_ao2,
+                self.ch_ao3,
+                self.ch_ao4,
+                self.ch_ao5,
+                self.ch_ao6,
+                self.ch_ao7,
+            ],
+            hardware_timed=True,
+        )
+        # the task is reused, the galvo scan configures a start trigger
+        task_ao.triggers.start_trigger.disable_start_trig()
         return task_ao
 
     def _crate_do_task_for_acquisition(self, channels):
-        """Create ao task for acquisition, include all the needed ao channels
+        """Create do task for acquisition, include all the needed do channels
 
         Parameters
         ----------
@@ -312,23 +344,22 @@ class NIDaq:
         nidaqmx.Task
 
         """
-        task_do = nidaqmx.Task("do0")  # for laser control
-
         # select channel
+        lines = []
         for ch in channels:
             if ch == '405':
-                task_do.do_channels.add_do_chan(self.ch_dio0)
+                lines.append(self.ch_dio0)
             elif ch == '488':
-                task_do.do_channels.add_do_chan(self.ch_dio1)
+                lines.append(self.ch_dio1)
             elif ch == '561':
-                task_do.do_channels.add_do_chan(self.ch_dio2)
+                lines.append(self.ch_dio2)
             elif ch == '639':
-                task_do.do_channels.add_do_chan(self.ch_dio3)
+                lines.append(self.ch_dio3)
             elif ch == 'bf':
-                task_do.do_channels.add_do_chan(self.ch_dio4)
+                lines.append(self.ch_dio4)
             else:
                 raise ValueError("Channel not supported")
-        return task_do
+        return self._task_pool.do_task(lines, hardware_timed=True)  # for laser control
 
     def acquire_stacks(
         self,
@@ -350,17 +381,13 @@ class NIDaq:
         interleave : bool
 
         """
-        # If using interleave mode
-        # for multichannel acquistion, make sure each channel has the same number of slices
-        if interleave:
-            if len(channels) > 1 and self.nb_slices % len(channels) != 0:
-                nb_slices = self.nb_slices - self.nb_slices % len(channels)
-                self.scan_range = nb_slices * self.scan_step
+        self._adjust_scan_range_for_interleave(len(channels), interleave)
+        self.telemetry.reset()
 
         # use different acquisition methods for each scanning option
         if scan_option == 'Stage':
             fn_acquire = self._acquire_stacks
-        elif scan_option == 'O1' or 'Galvo':
+        elif scan_option in ('O1', 'Galvo'):
             # set the initial states of the AO devices before acquisition
             self.set_initial_states(scan_option, view)
             fn_acquire = self._acquire_stacks_galvo
@@ -371,40 +398,36 @@ class NIDaq:
         task_ao = self._crate_ao_task_for_acquisition()
         task_do = self._crate_do_task_for_acquisition(channels)
 
-        # select view
-        nr_channels = len(channels)
+        fn_acquire(
+            task_ao,
+            task_do,
+            len(channels),
+            self._get_views(view),
+            scan_option,
+            interleave,
+        )
+
+        # the ao and do tasks stay committed for the next acquisition
+        task_ao.stop()
+        task_do.stop()
+
+    def _adjust_scan_range_for_interleave(self, nr_channels, interleave):
+        """For multichannel interleaved acquisition, make sure each channel
+        has the same number of slices"""
+        if interleave and nr_channels > 1 and self.nb_slices % nr_channels != 0:
+            nb_slices = self.nb_slices - self.nb_slices % nr_channels
+            self.scan_range = nb_slices * self.scan_step
+
+    @staticmethod
+    def _get_views(view):
+        """Return the views to acquire, view=3 for both views"""
         if view == 1:
-            # if scan_option == 'Interleave_denoising':
-            #     fn_acquire(task_ao, task_do, nr_channels, ['view1'], scan_option, interleave, low_power, high_power)
-            # else:
-            fn_acquire(
-                task_ao, task_do, nr_channels, ['view1'], scan_option, interleave
-            )
+            return ['view1']
         elif view == 2:
-            # if scan_option == 'Interleave_denoising':
-            #     fn_acquire(task_ao, task_do, nr_channels, ['view2'], scan_option, interleave, low_power, high_power)
-            # else:
-            fn_acquire(
-                task_ao, task_do, nr_channels, ['view2'], scan_option, interleave
-            )
+            return ['view2']
         elif view == 3:
-            # if scan_option == 'Interleave_denoising':
-            #     fn_acquire(task_ao, task_do, nr_channels, ['view1', 'view2'], scan_option, interleave,
-            #                low_power, high_power)
-            # else:
-            fn_acquire(
-                task_ao,
-                task_do,
-                nr_channels,
-                ['view1', 'view2'],
-                scan_option,
-                interleave,
-            )
-        else:
-            raise ValueError("View not supported")
-
-        task_ao.close()
-        task_do.close()
+            return ['view1', 'view2']
+        raise ValueError("View not supported")
 
     def _acquire_stacks(
         self, task_ao, task_do, nr_channels, views, scan_option, interleave
@@ -431,28 +454,11 @@ class NIDaq:
             nr_channels, interleave
         )  # get the digital output data depending on the channels
 
-        # set up the counter for count the slices for a zstack
-        task_ctr_loop = nidaqmx.Task("counter0")
-        ctr_loop = task_ctr_loop.ci_channels.add_ci_count_edges_chan(
-            self.ch_ctr1, edge=nidaqmx.constants.Edge.RISING
-        )
-        ctr_loop.ci_count_edges_term = self.PFI0
+        # set up the counter that completes once the outputs of a zstack are generated
+        task_ctr_loop, stack_done = self._set_up_stack_counter()
 
         # set up the counter to retrigger the ao and do channels
-        task_ctr_retrig = nidaqmx.Task("counter1")
-        task_ctr_retrig.co_channels.add_co_pulse_chan_freq(
-            self.ch_ctr0,
-            idle_state=nidaqmx.constants.Level.LOW,
-            freq=self.sampling_rate,
-        )
-        task_ctr_retrig.timing.cfg_implicit_timing(
-            sample_mode=nidaqmx.constants.AcquisitionType.FINITE,
-            samps_per_chan=self.num_samples,
-        )
-        task_ctr_retrig.triggers.start_trigger.cfg_dig_edge_start_trig(
-            trigger_source=self.PFI0, trigger_edge=nidaqmx.constants.Slope.RISING
-        )
-        task_ctr_retrig.triggers.start_trigger.retriggerable = True
+        task_ctr_retrig = self._set_up_retriggerable_counter(self.ch_ctr0)
 
         # set up ao channel
         task_ao.timing.cfg_samp_clk_timing(
@@ -473,7 +479,7 @@ class NIDaq:
             for v in range(len(data_ao)):  # change view
                 task_ao.write(data_ao[v])
                 task_ao.start()
-                print("number of slices to acquire:", self.nb_slices)
+                logger.debug("number of slices to acquire: %d", self.nb_slices)
                 for ch in range(nr_channels):
                     # regenerate do date for non-interleaved multichannel acquisition
                     if not interleave and nr_channels > 1:
@@ -484,29 +490,183 @@ class NIDaq:
                     task_do.write(data_do)
                     task_do.start()
 
-                    task_ctr_loop.start()
-                    counts = 0
-                    while (
-                        counts < self.nb_slices + 1
-                    ):  # Flash4.0 outputs 1 more pulse than asked
-                        counts = task_ctr_loop.read()
-                        time.sleep(0.005)  # wait time during loop
-                    task_ctr_loop.stop()
-                    print("counts: ", counts)
-                    # print("counts: ", counts)
-                    time.sleep(
-                        self.exposure + 0.1
-                    )  # add time to allow ao and do output for the last frame
+                    self._wait_for_stack(task_ctr_loop, stack_done)
                     task_do.stop()
-                    print("one stack done!")
+                    logger.debug("one stack done")
                 task_ao.stop()
 
         # task_ctr_retrig.stop()
         task_ctr_retrig.close()
         task_ctr_loop.close()
 
+    def compile_timepoint(self, nr_channels, views, interleave=True, nb_timepoints=1):
+        """Concatenate the ao and do outputs of all the stacks of time points
+
+        The stacks are in the order of ``_acquire_stacks``: for every view,
+        one stack per channel, each lasting nb_slices + 1 camera frames.
+
+        Parameters
+        ----------
+        nr_channels : int
+        views : List[str]
+        interleave : bool
+        nb_timepoints : int
+            Number of consecutive time points in the buffers.
+
+        Returns
+        -------
+        Tuple[np.ndarray, np.ndarray]
+            The ao waveforms of shape (8, n) and the do waveforms of shape
+            (n,) for a single channel, (nr_channels, n) otherwise
+        """
+        stacks_ao, stacks_do = [], []
+        for view in views:
+            data_ao = self._get_ao_data(view)
+            for ch in range(nr_channels):
+                stacks_ao.append(data_ao)
+                stacks_do.append(self._get_do_data(nr_channels, interleave, ch))
+        return (
+            waveforms.playback_waveforms(
+                stacks_ao, self.nb_stack_samples, nb_timepoints
+            ),
+            waveforms.playback_waveforms(
+                stacks_do, self.nb_stack_samples, nb_timepoints
+            ),
+        )
+
+    def acquire_stacks_hardware_timed(
+        self, channels, view, interleave=True, timepoints_per_block=1
+    ):
+        """Acquire all the time points of a stage scan without restarting tasks
+
+        The outputs of ``timepoints_per_block`` time points, all views and
+        channels, are compiled into one block that is streamed with
+        regeneration disabled. The DAQ buffer holds two blocks: Python
+        writes the next block each time one was transferred to the device,
+        so the whole time-lapse follows the camera triggers with no gap
+        between stacks. The camera has to send nb_slices + 1 triggers per
+        stack, back to back.
+
+        Parameters
+        ----------
+        channels : List[str]
+            ['405'], ['488'], ['561'], ['639'], ['bf'] or any combination of them
+        view : int
+            view=1 first view only, view=2 second view only, view=3 both views
+        interleave : bool
+        timepoints_per_block : int
+            Number of time points written to the DAQ at once.
+
+        """
+        self._adjust_scan_range_for_interleave(len(channels), interleave)
+        self.telemetry.reset()
+        views = self._get_views(view)
+        task_ao = self._crate_ao_task_for_acquisition()
+        task_do = self._crate_do_task_for_acquisition(channels)
+
+        timepoints_per_block = min(timepoints_per_block, self.nb_timepoints)
+        data_ao, data_do = self.compile_timepoint(
+            len(channels), views, interleave, timepoints_per_block
+        )
+        block_samples = data_ao.shape[-1]
+        total_samples = self.nb_timepoints * block_samples // timepoints_per_block
+        blocks = self._playback_blocks(data_ao, data_do, total_samples)
+
+        # set up the counter that completes once all the outputs are generated
+        task_ctr_loop, acquisition_done = self._set_up_stack_counter(total_samples)
+        task_ctr_retrig = self._set_up_retriggerable_counter(self.ch_ctr0)
+
+        block_transferred = threading.Semaphore(0)
+
+        def on_transferred(task_handle, event_type, nb_samples, callback_data):
+            # block index and number of samples transferred to the device so far
+            self.telemetry.record(
+                self.telemetry.frame_count,
+                (self.telemetry.frame_count + 1) * nb_samples,
+            )
+            block_transferred.release()
+            return 0
+
+        self._set_up_playback(task_ao, total_samples, 2 * block_samples)
+        self._set_up_playback(task_do, total_samples, 2 * block_samples)
+        task_ao.register_every_n_samples_transferred_from_buffer_event(
+            block_samples, on_transferred
+        )
+
+        try:
+            # fill the buffer, then refill one block ahead of the hardware
+            for block_ao, block_do in itertools.islice(blocks, 2):
+                task_ao.write(block_ao)
+                task_do.write(block_do)
+            task_ao.start()
+            task_do.start()
+            acquisition_done.clear()
+            task_ctr_loop.start()
+            task_ctr_retrig.start()
+
+            for block_ao, block_do in blocks:
+                if not self._wait_until(block_transferred.acquire):
+                    break
+                task_ao.write(block_ao)
+                task_do.write(block_do)
+            self._wait_until(acquisition_done.wait)
+        finally:
+            task_ctr_retrig.close()
+            task_ctr_loop.close()
+            self._reset_playback(task_ao)
+            self._reset_playback(task_do)
+            task_ao.register_every_n_samples_transferred_from_buffer_event(
+                block_samples, None
+            )
+
+    @staticmethod
+    def _playback_blocks(data_ao, data_do, total_samples):
+        """Yield the ao and do blocks to write, the last one may be truncated"""
+        block_samples = data_ao.shape[-1]
+        for start in range(0, total_samples, block_samples):
+            nb_samples = min(block_samples, total_samples - start)
+            if nb_samples == block_samples:
+                yield data_ao, data_do
+            else:
+                yield (
+                    np.ascontiguousarray(data_ao[..., :nb_samples]),
+                    np.ascontiguousarray(data_do[..., :nb_samples]),
+                )
+
+    def _set_up_playback(self, task, nb_samples, buffer_size):
+        """Clock an output task with the retriggered counter, without regeneration
+
+        Parameters
+        ----------
+        task : nidaqmx.Task
+        nb_samples : int
+            Number of samples generated per channel.
+        buffer_size : int
+            Number of samples per channel of the output buffer.
+
+        """
+        task.timing.cfg_samp_clk_timing(
+            rate=self.sampling_rate,
+            source=self.ch_ctr0_internal_output,
+            sample_mode=nidaqmx.constants.AcquisitionType.FINITE,
+            samps_per_chan=nb_samples,
+        )
+        task.out_stream.regen_mode = (
+            nidaqmx.constants.RegenerationMode.DONT_ALLOW_REGENERATION
+        )
+        task.out_stream.output_buf_size = min(buffer_size, nb_samples)
+
+    @staticmethod
+    def _reset_playback(task):
+        """Stop an output task and restore the defaults expected by acquire_stacks"""
+        task.stop()
+        task.out_stream.regen_mode = (
+            nidaqmx.constants.RegenerationMode.ALLOW_REGENERATION
+        )
+        del task.out_stream.output_buf_size
+
     def _get_ao_data_galvo(self, view: str, scan_option="O1"):
-        """Generate the ndarray for an ao channel
+        """Generate the ndarray for the ao channels
 
         Parameters
         ----------
@@ -515,53 +675,45 @@ class NIDaq:
 
         Returns
         -------
-        TODO: fill the correct return type and description
+        np.ndarray
+            Read-only waveforms of the ao channels 0 to 6, one sample per slice
 
         """
-        nb_samples = self.NB_DUMMY_TTLS + self.nb_slices
-        # AO3. not stripe reduction in this mode
-        data_ao3 = [self.stripe_reduction_offset] * nb_samples
-
-        # AO4, for fixed light sheet angle
-        data_ao4 = [self.light_sheet_angle] * nb_samples
-
-        # AO1 and AO2, for view switching and light sheet stabilization
-        if view == "view1":
-            offset = self._offset_distance_to_voltage(
-                self.offset_view1
-            )  # convert the offset from um to v
-            data_ao1 = [self.view1_galvo1] * nb_samples
-            data_ao2 = [self.view1_galvo2] * nb_samples
-            data_ao6 = [self.o3_view2 / self.CONVERT_RATIO_PIFOC_O3] * nb_samples
-        elif view == "view2":
-            offset = self._offset_distance_to_voltage(
-                self.offset_view2
-            )  # convert the offset from um to v
-            data_ao1 = [self.view2_galvo1] * nb_samples
-            data_ao2 = [self.view2_galvo2] * nb_samples
-            data_ao6 = [self.o3_view2 / self.CONVERT_RATIO_PIFOC_O3] * nb_samples
+        offset, galvo1, galvo2, _ = self._get_view_levels(view)
+        o1 = self.o1_pifoc / self.CONVERT_RATIO_PIFOC_O1
+        levels = (
+            offset,  # AO0, for fixed scan galvo position
+            galvo1,  # AO1 and AO2, for view switching and light sheet stabilization
+            galvo2,
+            self.stripe_reduction_offset,  # AO3, not stripe reduction in this mode
+            self.light_sheet_angle,  # AO4, for fixed light sheet angle
+            o1,  # AO5, for fixed O1 position
+            self.o3_view2 / self.CONVERT_RATIO_PIFOC_O3,  # AO6
+        )
 
         # AO0 and AO5 depends in scanning option
         if scan_option == "O1":
-            # AO0, for fixed scan galvo position
-            data_ao0 = [offset] * nb_samples
-            # AO5, for O1  scanning
-            min_range = (
+            # AO5, for O1 scanning
+            scan_channel = 5
+            scan_start = (
                 self.o1_pifoc - self.scan_range / 2
             ) / self.CONVERT_RATIO_PIFOC_O1
             step = self.scan_step / self.CONVERT_RATIO_PIFOC_O1
-            data_ao5 = [x * step + min_range for x in range(nb_samples)]
         elif scan_option == "Galvo":
-            # for fixed O1 position
-            data_ao5 = [self.o1_pifoc / self.CONVERT_RATIO_PIFOC_O1] * nb_samples
-            # for scan galvo ramp
-            min_range = offset - self.scan_range / 2 / self.CONVERT_RATIO_SCAN_GALVO
+            # AO0, for scan galvo ramp
+            scan_channel = 0
+            scan_start = offset - self.scan_range / 2 / self.CONVERT_RATIO_SCAN_GALVO
             step = self.scan_step / self.CONVERT_RATIO_SCAN_GALVO
-            data_ao0 = [x * step + min_range for x in range(nb_samples)]
+        else:
+            raise ValueError("Scanning mode not supported")
 
-        return [data_ao0, data_ao1, data_ao2, data_ao3, data_ao4, data_ao5, data_ao6]
+        return waveforms.galvo_scan_ao_waveforms(
+            self.NB_DUMMY_TTLS + self.nb_slices, scan_channel, scan_start, step, levels
+        )
 
-    def _acquire_stacks_galvo(self, task_ao, task_do, channels, views, scan_option):
+    def _acquire_stacks_galvo(
+        self, task_ao, task_do, channels, views, scan_option, interleave=True
+    ):
         """Set up the workflow to acquire multiple stacks
         todo, support multichannel imaging
 
@@ -572,6 +724,8 @@ class NIDaq:
         channels
         views
         scan_option
+        interleave
+            Not supported yet
 
         """
         data_ao = [
@@ -582,28 +736,11 @@ class NIDaq:
             channels
         )  # get the digital output data depending on the channels
 
-        # set up the counter for loop through a zstack
-        task_ctr_loop = nidaqmx.Task("counter0")
-        ctr_loop = task_ctr_loop.ci_channels.add_ci_count_edges_chan(
-            self.ch_ctr1, edge=nidaqmx.constants.Edge.RISING
-        )
-        ctr_loop.ci_count_edges_term = self.PFI0
-
-        # set up the counter to retrigger the do channels
-        task_ctr_retrig = nidaqmx.Task("counter1")
-        task_ctr_retrig.co_channels.add_co_pulse_chan_freq(
-            self.ch_ctr0,
-            idle_state=nidaqmx.constants.Level.LOW,
-            freq=self.sampling_rate,
-        )
-        task_ctr_retrig.timing.cfg_implicit_timing(
-            sample_mode=nidaqmx.constants.AcquisitionType.FINITE,
-            samps_per_chan=self.num_samples,
-        )
-        task_ctr_retrig.triggers.start_trigger.cfg_dig_edge_start_trig(
-            trigger_source=self.PFI0, trigger_edge=nidaqmx.constants.Slope.RISING
-        )
-        task_ctr_retrig.triggers.start_trigger.retriggerable = True
+        # set up the counter that completes once the outputs of a zstack are generated
+        task_ctr_loop, stack_done = self._set_up_stack_counter()
+
+        # set up the counter to retrigger the ao and do channels
+        task_ctr_retrig = self._set_up_retriggerable_counter(self.ch_ctr0)
 
         # set up ao channel
         nb_samples = self.NB_DUMMY_TTLS + self.nb_slices
@@ -636,21 +773,9 @@ class NIDaq:
                     task_do.write(data_do)
                     task_do.start()
 
-                    task_ctr_loop.start()
-                    counts = 0
-                    while (
-                        counts < self.nb_slices + 1
-                    ):  # Flash4.0 outputs 1 more pulse than asked
-                        counts = task_ctr_loop.read()
-                        time.sleep(0.005)  # wait time during loop
-                    task_ctr_loop.stop()
-                    print("counts: ", counts)
-                    # print("counts: ", counts)
-                    time.sleep(
-                        self.exposure + 0.1
-                    )  # add time to allow ao and do output for the last frame
+                    self._wait_for_stack(task_ctr_loop, stack_done)
                     task_do.stop()
-                    print("one stack done!")
+                    logger.debug("one stack done")
                 task_ao.stop()
 
         # task_ctr_retrig.stop()
@@ -687,28 +812,11 @@ class NIDaq:
             nr_channels, interleave
         )  # get the digital output data depending on the channels
 
-        # set up the counter for loop through a zstack
-        task_ctr_loop = nidaqmx.Task("counter0")
-        ctr_loop = task_ctr_loop.ci_channels.add_ci_count_edges_chan(
-            self.ch_ctr1, edge=nidaqmx.constants.Edge.RISING
-        )
-        ctr_loop.ci_count_edges_term = self.PFI0
+        # set up the counter that completes once the outputs of a zstack are generated
+        task_ctr_loop, stack_done = self._set_up_stack_counter()
 
         # set up the counter to retrigger the ao and do channels
-        task_ctr_retrig = nidaqmx.Task("counter1")
-        task_ctr_retrig.co_channels.add_co_pulse_chan_freq(
-            self.ch_ctr0,
-            idle_state=nidaqmx.constants.Level.LOW,
-            freq=self.sampling_rate,
-        )
-        task_ctr_retrig.timing.cfg_implicit_timing(
-            sample_mode=nidaqmx.constants.AcquisitionType.FINITE,
-            samps_per_chan=self.num_samples,
-        )
-        task_ctr_retrig.triggers.start_trigger.cfg_dig_edge_start_trig(
-            trigger_source=self.PFI0, trigger_edge=nidaqmx.constants.Slope.RISING
-        )
-        task_ctr_retrig.triggers.start_trigger.retriggerable = True
+        task_ctr_retrig = self._set_up_retriggerable_counter(self.ch_ctr0)
 
         # set up ao channel
         task_ao.timing.cfg_samp_clk_timing(
@@ -729,7 +837,7 @@ class NIDaq:
             for v in range(len(data_ao)):  # change view
                 task_ao.write(data_ao[v])
                 task_ao.start()
-                print("number of slices to acquire:", self.nb_slices)
+                logger.debug("number of slices to acquire: %d", self.nb_slices)
                 for ch in range(nr_channels):
                     # regenerate do date for non-interleaved multichannel acquisition
                     if not interleave and nr_channels > 1:
@@ -740,21 +848,9 @@ class NIDaq:
                     task_do.write(data_do)
                     task_do.start()
 
-                    task_ctr_loop.start()
-                    counts = 0
-                    while (
-                        counts < self.nb_slices + 1
-                    ):  # Flash4.0 outputs 1 more pulse than asked
-                        counts = task_ctr_loop.read()
-                        time.sleep(0.005)  # wait time during loop
-                    task_ctr_loop.stop()
-                    print("counts: ", counts)
-                    # print("counts: ", counts)
-                    time.sleep(
-                        self.exposure + 0.1
-                    )  # add time to allow ao and do output for the last frame
+                    self._wait_for_stack(task_ctr_loop, stack_done)
                     task_do.stop()
-                    print("one stack done!")
+                    logger.debug("one stack done")
                 task_ao.stop()
 
         # task_ctr_retrig.stop()
@@ -779,15 +875,16 @@ class NIDaq:
 
         """
         data = [scan_galvo, galvo1, galvo2, angle_galvo, o1, o3, laser_power]
-        with nidaqmx.Task() as task:
-            task.ao_channels.add_ao_voltage_chan(self.ch_ao0)
-            task.ao_channels.add_ao_voltage_chan(self.ch_ao1)
-            task.ao_channels.add_ao_voltage_chan(self.ch_ao2)
-            task.ao_channels.add_ao_voltage_chan(self.ch_ao4)
-            task.ao_channels.add_ao_voltage_chan(self.ch_ao5)
-            task.ao_channels.add_ao_voltage_chan(self.ch_ao6)
-            task.ao_channels.add_ao_voltage_chan(self.ch_ao7)
-            task.write(data, auto_start=True)
+        channels = [
+            self.ch_ao0,
+            self.ch_ao1,
+            self.ch_ao2,
+            self.ch_ao4,
+            self.ch_ao5,
+            self.ch_ao6,
+            self.ch_ao7,
+        ]
+        self._task_pool.write_ao(channels, data)
 
     def select_view(self, view):
         """Select one view in live mode
@@ -894,25 +991,17 @@ class NIDaq:
         t
 
         """
-        nb_on_sample = round((self.exposure - self.readout_time) * self.sampling_rate)
-        # nb_off_sample = round(self.readout_time * self.sampling_rate)
-        data_do = [True] * nb_on_sample + [False] * (self.num_samples - nb_on_sample)
+        data_do = self._get_do_data(1)
 
-        task_do = nidaqmx.Task()
-        task_do.do_channels.add_do_chan(ch)
-
-        task_ao = nidaqmx.Task("ao0")
-        task_ao.ao_channels.add_ao_voltage_chan(self.ch_ao3)
+        task_do = self._task_pool.do_task([ch], hardware_timed=True)
+        task_ao = self._task_pool.ao_task([self.ch_ao3], hardware_timed=True)
         # for stripe reduction
-        stripe_min = -self.stripe_reduction_range + self.stripe_reduction_offset
-        stripe_max = self.stripe_reduction_range + self.stripe_reduction_offset
-        nb_on_sample = round((self.exposure - self.readout_time) * self.sampling_rate)
-        nb_off_sample = round(self.readout_time * self.sampling_rate)
-        data_ao3 = list(np.linspace(stripe_min, stripe_max, nb_on_sample))
-        data_ao3.extend([stripe_min] * nb_off_sample)
+        data_ao3 = waveforms.stripe_reduction_waveform(
+            self.num_samples, self.nb_on_samples, *self._stripe_range
+        )
 
         self._retriggable_task(task_do, data_do, task_ao, data_ao3, t)
-        set_dio_state(ch, False)
+        self._task_pool.write_do([ch], [False])
 
     def select_channel(self, ch, t=None):
         """Select one channel in live mode
@@ -936,6 +1025,93 @@ class NIDaq:
         else:
             raise ValueError("Channel not supported!")
 
+    @property
+    def nb_stack_samples(self):
+        """Number of output samples generated for a zstack"""
+        # Flash4.0 outputs 1 more pulse than asked
+        return (self.nb_slices + 1) * self.num_samples
+
+    def _set_up_stack_counter(self, nb_samples=None):
+        """Set up a counter task that is done once the ao and do outputs of
+        the last frame of a zstack are generated
+
+        It counts the ticks of the retriggered sample clock, which ticks
+        num_samples times per camera trigger, so it completes right after the
+        last output sample instead of polling the number of camera triggers.
+
+        Parameters
+        ----------
+        nb_samples : int, optional
+            Number of output samples to count, defaults to one zstack.
+
+        Returns
+        -------
+        Tuple[nidaqmx.Task, threading.Event]
+            The counter task and an event set by its done event
+
+        """
+        task_ctr = self._backend.Task("counter0")
+        ctr = task_ctr.ci_channels.add_ci_count_edges_chan(
+            self.ch_ctr1, edge=nidaqmx.constants.Edge.RISING
+        )
+        ctr.ci_count_edges_term = self.ch_ctr0_internal_output
+        task_ctr.timing.cfg_samp_clk_timing(
+            rate=self.sampling_rate,
+            source=self.ch_ctr0_internal_output,
+            sample_mode=nidaqmx.constants.AcquisitionType.FINITE,
+            samps_per_chan=self.nb_stack_samples if nb_samples is None else nb_samples,
+        )
+
+        stack_done = threading.Event()
+
+        def on_done(task_handle, status, callback_data):
+            stack_done.set()
+            return 0
+
+        task_ctr.register_done_event(on_done)
+        return task_ctr, stack_done
+
+    def _wait_for_stack(self, task_ctr, stack_done):
+        """Start the stack counter and block until its done event,
+        returns early if stop_now is set
+
+        Parameters
+        ----------
+        task_ctr : nidaqmx.Task
+        stack_done : threading.Event
+
+        """
+        stack_done.clear()
+        task_ctr.start()
+        if self._wait_until(stack_done.wait):
+            # output samples counted, fewer than nb_stack_samples if triggers were missed
+            counts = task_ctr.read(
+                number_of_samples_per_channel=nidaqmx.constants.READ_ALL_AVAILABLE
+            )
+            self.telemetry.record(
+                self.telemetry.frame_count, counts[-1] if counts else 0
+            )
+        task_ctr.stop()
+
+    def _wait_until(self, wait):
+        """Block until a wait call succeeds, returns False if stop_now was set before
+
+        Parameters
+        ----------
+        wait : Callable[[float], bool]
+            E.g. ``threading.Event.wait``, called with timeout=STOP_CHECK_INTERVAL.
+
+        Returns
+        -------
+        bool
+
+        """
+        while not wait(timeout=self.STOP_CHECK_INTERVAL):
+            if self.stop_now:
+                logger.info("stack aborted")
+                return False
+        return True
+
     def _set_up_retriggerable_counter(self, counter):
         """Set up a retriggerable counter task
 
@@ -948,7 +1124,7 @@ class NIDaq:
         nidaqmx.Task
 
         """
-        task_ctr = nidaqmx.Task()
+        task_ctr = self._backend.Task()
         task_ctr.co_channels.add_co_pulse_chan_freq(
             counter, idle_state=nidaqmx.constants.Level.LOW, freq=self.sampling_rate
         )
@@ -1004,5 +1180,3 @@ class NIDaq:
         task_ao.stop()
         task_ctr.stop()
         task_ctr.close()
-        task_do.close()
-        task_ao.close()
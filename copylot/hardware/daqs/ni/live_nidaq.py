@@ -1,13 +1,36 @@
-import nidaqmx
+from copylot.hardware.daqs.ni.task_pool import TaskPool
 
 
 class LiveNIDaq:
-    def __init__(self):
+    """
+    Sets constant voltages on analog output channels in live mode.
+
+    The voltages of all channels are written at once by a single committed
+    task that is reused across calls, call ``close`` to release it.
+
+    Parameters
+    ----------
+    backend
+        Module-like object providing the ``Task`` class, defaults to ``nidaqmx``.
+
+    """
+
+    def __init__(self, backend=None):
         self._active_ao_channels = set()
         self._active_do_channels = set()
+        self._ao_voltages = {}
+        self._task_pool = TaskPool(backend)
 
     def __del__(self):
-        self.zero()
+        # nothing to zero if close() was called or no voltage was ever set
+        if len(self._task_pool):
+            self.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
 
     @property
     def active_ao_channels(self):
@@ -26,9 +49,15 @@ class LiveNIDaq:
 
     def zero(self):
         for channel in self.active_ao_channels:
-            with nidaqmx.Task() as task:
-                task.ao_channels.add_ao_voltage_chan(channel)
-                task.write([0.0], auto_start=True)
+            self._ao_voltages[channel] = 0.0
+        self._write_ao_voltages()
+
+    def close(self):
+        """Set the active analog channels to zero and release the tasks"""
+        try:
+            self.zero()
+        finally:
+            self._task_pool.close()
 
     def set_constant_ao_voltage(self, channel: str, voltage: float):
         """
@@ -39,10 +68,17 @@ class LiveNIDaq:
         voltage : float
         """
         if channel in self.active_ao_channels:
-            with nidaqmx.Task() as task:
-                task.ao_channels.add_ao_voltage_chan(channel)
-                task.write([voltage], auto_start=True)
+            self._ao_voltages[channel] = voltage
+            self._write_ao_voltages()
         else:
             raise ValueError(
                 "Constant voltage can not be set to an inactive analog channel."
             )
+
+    def _write_ao_voltages(self):
+        """Write the voltages of all channels that were set in one call"""
+        if self._ao_voltages:
+            channels = sorted(self._ao_voltages)
+            self._task_pool.write_ao(
+                channels, [self._ao_voltages[ch] for ch in channels]
+            )
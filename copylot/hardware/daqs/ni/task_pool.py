@@ -0,0 +1,142 @@
+from typing import Sequence
+
+import nidaqmx
+from nidaqmx.constants import TaskMode
+
+from copylot import logger
+
+
+class TaskPool:
+    """
+    Keeps one committed nidaqmx task per group of channels and reuses it.
+
+    Creating, verifying and reserving a task takes milliseconds, so tasks
+    are created on first use, committed (``TaskMode.TASK_COMMIT``) and kept
+    until ``close``. All channels of a group are written in a single
+    ``write`` call. A physical channel can only be reserved by one task, so
+    getting a group that overlaps committed groups unreserves the
+    overlapping tasks. They stay cached and are committed again the next
+    time they are used, which is much cheaper than creating them again.
+
+    On-demand tasks and hardware-timed tasks are cached separately, as an
+    on-demand write to a task with a sample clock would only fill its buffer.
+    Hardware-timed tasks are handed out without timing, callers configure it.
+
+    Parameters
+    ----------
+    backend
+        Module-like object providing the ``Task`` class, defaults to ``nidaqmx``.
+
+    """
+
+    def __init__(self, backend=None):
+        self._backend = nidaqmx if backend is None else backend
+        self._tasks = {}
+        self._committed = set()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def __len__(self):
+        return len(self._tasks)
+
+    def ao_task(self, channels: Sequence[str], hardware_timed: bool = False):
+        """Return the committed task of a group of analog output channels
+
+        Parameters
+        ----------
+        channels : Sequence[str]
+            Physical channels, in the order of the data written to the task.
+        hardware_timed : bool
+            Task used with a sample clock.
+        """
+        return self._get_task('ao', channels, hardware_timed)
+
+    def do_task(self, channels: Sequence[str], hardware_timed: bool = False):
+        """Return the committed task of a group of digital output lines
+
+        Parameters
+        ----------
+        channels : Sequence[str]
+            Physical lines, in the order of the data written to the task.
+        hardware_timed : bool
+            Task used with a sample clock.
+        """
+        return self._get_task('do', channels, hardware_timed)
+
+    def write_ao(self, channels: Sequence[str], values: Sequence[float]):
+        """Set constant voltages on analog output channels in one write
+
+        Parameters
+        ----------
+        channels : Sequence[str]
+        values : Sequence[float]
+            One voltage per channel.
+        """
+        self.ao_task(channels).write(list(values), auto_start=True)
+
+    def write_do(self, channels: Sequence[str], values: Sequence[bool]):
+        """Set digital output lines in one write
+
+        Parameters
+        ----------
+        channels : Sequence[str]
+        values : Sequence[bool]
+            One state per line.
+        """
+        self.do_task(channels).write(list(values), auto_start=True)
+
+    def release(self, channels: Sequence[str]):
+        """Close the cached tasks using any of the channels"""
+        channels = set(channels)
+        for key in [key for key in self._tasks if channels.intersection(key[1])]:
+            self._close_task(key)
+
+    def close(self):
+        """Close all cached tasks"""
+        for key in list(self._tasks):
+            self._close_task(key)
+
+    def _get_task(self, kind, channels, hardware_timed):
+        key = (kind, tuple(channels), hardware_timed)
+        task = self._tasks.get(key)
+        if task is None:
+            task = self._create_task(kind, channels)
+            self._tasks[key] = task
+        if key not in self._committed:
+            self._unreserve(channels)
+            task.control(TaskMode.TASK_COMMIT)
+            self._committed.add(key)
+            logger.debug("Committed %s task for %s", kind, ', '.join(channels))
+        return task
+
+    def _create_task(self, kind, channels):
+        task = self._backend.Task()
+        try:
+            for channel in channels:
+                if kind == 'ao':
+                    task.ao_channels.add_ao_voltage_chan(channel)
+                else:
+                    task.do_channels.add_do_chan(channel)
+        except Exception:
+            task.close()
+            raise
+        return task
+
+    def _unreserve(self, channels):
+        """Unreserve the committed tasks using any of the channels, they stay cached"""
+        channels = set(channels)
+        for key in [key for key in self._committed if channels.intersection(key[1])]:
+            self._tasks[key].control(TaskMode.TASK_UNRESERVE)
+            self._committed.discard(key)
+
+    def _close_task(self, key):
+        task = self._tasks.pop(key)
+        self._committed.discard(key)
+        try:
+            task.close()
+        except Exception as e:
+            logger.error("Failed to close task for %s: %s", ', '.join(key[1]), e)
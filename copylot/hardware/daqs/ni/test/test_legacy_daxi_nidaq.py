@@ -0,0 +1,146 @@
+import threading
+import time
+
+import numpy as np
+import pytest
+
+from copylot.hardware.daqs.ni.legacy_daxi_nidaq import NIDaq
+from copylot.hardware.simulated.daq import SimulatedDAQ
+
+
+@pytest.fixture
+def daq():
+    # stacks of 6 camera frames, the last output is generated 10 ms after the last trigger
+    return NIDaq(
+        exposure=0.01,
+        nb_timepoints=2,
+        scan_step=1,
+        scan_range=5,
+        backend=SimulatedDAQ(frame_period=0.01),
+    )
+
+
+def test_acquire_stacks_waits_for_the_last_output(daq):
+    daq.acquire_stacks(['488', '561'], view=3, interleave=False)
+
+    # 2 timepoints x 2 views x 2 channels, every stack ends on the done event
+    # of the counter of its 6 frames instead of a fixed wait
+    backend = daq._backend
+    task_ao, task_do = [task for task in backend.tasks if task.committed]
+    counter = next(task for task in backend.tasks if task.name == 'counter0')
+    assert counter.timing.samps_per_chan == 6 * daq.num_samples
+    assert counter.done_events == 8
+    assert len(task_ao.written) == 4
+    assert len(task_do.written) == 8
+    np.testing.assert_array_equal(task_do.written[1], daq._get_do_data(2, current_ch=1))
+
+    # the stack counter value is recorded at the end of every stack
+    stacks = daq.telemetry.snapshot()
+    assert list(stacks['frame_index']) == list(range(8))
+    assert (stacks['framestamp'] >= 6).all()
+    assert daq.telemetry.stats().frame_rate == pytest.approx(1 / 0.06, rel=0.2)
+
+    # only the ao and do tasks are kept between acquisitions
+    assert backend.open_tasks == [task_ao, task_do]
+    daq.acquire_stacks(['488', '561'], view=1, interleave=False)
+    assert backend.open_tasks == [task_ao, task_do]
+    daq.close()
+    assert not backend.open_tasks
+
+
+def test_live_mode_reuses_tasks(daq, mocker):
+    mocker.patch('builtins.print')
+
+    for _ in range(3):
+        daq.select_view(1)
+        daq.select_channel('488', t=0)
+    daq.set_initial_states('Galvo', view=2)
+    daq.acquire_stacks(['488'], view=1)
+    daq.select_view(2)
+
+    # the on-demand and hardware-timed ao and do groups are only created once
+    # even though their channels overlap, counters are created per call
+    outputs = [
+        task for task in daq._backend.tasks if task.ao_channels or task.do_channels
+    ]
+    assert len(outputs) == 5
+    daq.close()
+    assert not daq._backend.open_tasks
+
+
+def test_shared_task_pool_is_kept(daq):
+    shared = NIDaq(
+        exposure=0.01,
+        nb_timepoints=1,
+        scan_step=1,
+        scan_range=5,
+        backend=daq._backend,
+        task_pool=daq._task_pool,
+    )
+    shared.select_view(1)
+    shared.close()
+
+    (task,) = daq._backend.open_tasks
+    daq.select_view(2)
+    assert daq._backend.open_tasks == [task]
+    daq.close()
+    assert task.closed
+
+
+def test_stop_now_aborts_the_stack(daq):
+    daq._backend.frame_period = 10
+    daq.STOP_CHECK_INTERVAL = 0.01
+    daq.nb_timepoints = 1
+    threading.Timer(0.05, setattr, (daq, 'stop_now', True)).start()
+
+    start = time.perf_counter()
+    daq.acquire_stacks(['488'], view=1)
+
+    assert time.perf_counter() - start < 1
+
+
+def test_hardware_timed_playback_refills_ahead(daq):
+    daq.nb_timepoints = 5
+    daq.acquire_stacks_hardware_timed(
+        ['488', '561'], view=1, interleave=False, timepoints_per_block=2
+    )
+
+    # 5 timepoints x 2 channels in blocks of 2 timepoints
+    task_ao, task_do = [task for task in daq._backend.tasks if task.committed]
+    block_samples = 2 * 2 * daq.nb_stack_samples
+    assert task_ao.timing.samps_per_chan == 5 * block_samples // 2
+    assert [data.shape for data in task_ao.written] == [
+        (8, block_samples),
+        (8, block_samples),
+        (8, block_samples // 2),
+    ]
+    # the buffer is filled with two blocks, then every block is written while
+    # the previous one is still waiting to be generated, so there is no gap
+    for task in (task_ao, task_do):
+        assert task.buffered_at_write == [0, block_samples, block_samples]
+    counter = next(task for task in daq._backend.tasks if task.name == 'counter0')
+    assert counter.done_events == 1
+    np.testing.assert_array_equal(
+        task_do.written[0][:, daq.nb_stack_samples : 2 * daq.nb_stack_samples],
+        np.tile(daq._get_do_data(2, current_ch=1), daq.nb_slices + 1),
+    )
+
+    # the pooled tasks regenerate again for acquire_stacks
+    assert task_ao.out_stream.output_buf_size is None
+    daq.acquire_stacks(['488', '561'], view=1, interleave=False)
+    daq.close()
+    assert not daq._backend.open_tasks
+
+
+def test_stop_now_aborts_the_playback(daq):
+    daq._backend.frame_period = 10
+    daq.STOP_CHECK_INTERVAL = 0.01
+    daq.nb_timepoints = 3
+    threading.Timer(0.05, setattr, (daq, 'stop_now', True)).start()
+
+    start = time.perf_counter()
+    daq.acquire_stacks_hardware_timed(['488'], view=3)
+
+    assert time.perf_counter() - start < 1
+    task_ao = next(task for task in daq._backend.tasks if task.committed)
+    assert len(task_ao.written) == 2
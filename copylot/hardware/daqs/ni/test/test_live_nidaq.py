@@ -0,0 +1,29 @@
+import pytest
+
+from copylot.hardware.daqs.ni.live_nidaq import LiveNIDaq
+from copylot.hardware.simulated.daq import SimulatedDAQ
+
+
+def test_voltages_are_written_by_a_single_task():
+    backend = SimulatedDAQ()
+    live_nidaq = LiveNIDaq(backend)
+    live_nidaq.add_active_ao_channel("ao0")
+    live_nidaq.add_active_ao_channel("ao1")
+
+    live_nidaq.zero()
+    for voltage in (0.1, 0.2, 0.3):
+        live_nidaq.set_constant_ao_voltage("ao1", voltage)
+
+    (task,) = backend.tasks
+    assert [channel.name for channel in task.ao_channels] == ["ao0", "ao1"]
+    assert [list(data) for data in task.written][-1] == [0.0, 0.3]
+
+    live_nidaq.close()
+    assert list(task.written[-1]) == [0.0, 0.0]
+    assert not backend.open_tasks
+
+
+def test_inactive_channel_raises():
+    with LiveNIDaq(SimulatedDAQ()) as live_nidaq:
+        with pytest.raises(ValueError):
+            live_nidaq.set_constant_ao_voltage("ao0", 1.0)
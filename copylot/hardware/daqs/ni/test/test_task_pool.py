@@ -0,0 +1,63 @@
+import pytest
+
+from copylot.hardware.daqs.ni.task_pool import TaskPool
+from copylot.hardware.simulated.daq import SimulatedDAQ
+
+
+@pytest.fixture
+def backend():
+    return SimulatedDAQ()
+
+
+def test_tasks_are_committed_and_reused(backend):
+    pool = TaskPool(backend)
+
+    pool.write_ao(['ao0', 'ao1'], [1.0, 2.0])
+    pool.write_ao(['ao0', 'ao1'], [3.0, 4.0])
+
+    (task,) = backend.tasks
+    assert task.committed
+    assert [list(data) for data in task.written] == [[1.0, 2.0], [3.0, 4.0]]
+    assert pool.ao_task(['ao0', 'ao1']) is task
+
+
+def test_overlapping_groups_are_unreserved_and_kept(backend):
+    pool = TaskPool(backend)
+    group_task = pool.ao_task(['ao0', 'ao1'])
+    other_task = pool.ao_task(['ao2'])
+
+    single_task = pool.ao_task(['ao1'])
+    timed_task = pool.ao_task(['ao1'], hardware_timed=True)
+
+    assert not any(task.closed for task in backend.tasks)
+    assert len(pool) == 4
+    # only the last group using ao1 holds it
+    assert other_task.committed and timed_task.committed
+    assert not group_task.committed and not single_task.committed
+    assert backend.reserved == {'ao1': timed_task, 'ao2': other_task}
+
+    # the unreserved task is committed again instead of created again
+    assert pool.ao_task(['ao0', 'ao1']) is group_task
+    assert group_task.committed and not timed_task.committed
+    assert len(backend.tasks) == 4
+
+
+def test_release_closes_overlapping_tasks(backend):
+    pool = TaskPool(backend)
+    group_task = pool.ao_task(['ao0', 'ao1'])
+    other_task = pool.ao_task(['ao2'])
+
+    pool.release(['ao1'])
+
+    assert group_task.closed and not other_task.closed
+    assert len(pool) == 1
+
+
+def test_close_releases_all_tasks(backend):
+    with TaskPool(backend) as pool:
+        pool.write_do(['line0', 'line1'], [True, False])
+        pool.write_ao(['ao0'], [0.5])
+
+    assert len(pool) == 0
+    assert not backend.open_tasks
+    assert not backend.reserved
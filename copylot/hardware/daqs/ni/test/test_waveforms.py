@@ -0,0 +1,104 @@
+import numpy as np
+import pytest
+
+from copylot.hardware.daqs.ni import waveforms
+from copylot.hardware.daqs.ni.legacy_daxi_nidaq import NIDaq
+
+
+@pytest.fixture
+def daq():
+    # 20 samples per exposure, 18 of them while the whole chip is exposed
+    return NIDaq(exposure=0.1, nb_timepoints=1, scan_step=1, scan_range=10)
+
+
+def test_stage_scan_ao_data(daq):
+    data = daq._get_ao_data('view2')
+
+    assert data.shape == (8, 20)
+    assert data.dtype == np.float64
+    assert data.flags.c_contiguous
+
+    offset = daq._offset_distance_to_voltage(daq.offset_view2)
+    half_range = daq.scan_step / 2 / daq.CONVERT_RATIO_SCAN_GALVO
+    ramp = np.linspace(offset + half_range, offset - half_range, 20)
+    np.testing.assert_allclose(data[0, :18], ramp[:18])
+    np.testing.assert_allclose(data[0, 18:], [ramp[18], offset + half_range])
+
+    stripe_min, stripe_max = daq._stripe_range
+    np.testing.assert_allclose(data[3, :18], np.linspace(stripe_min, stripe_max, 18))
+    np.testing.assert_allclose(data[3, 18:], stripe_min)
+
+    np.testing.assert_allclose(data[1], daq.view2_galvo1)
+    np.testing.assert_allclose(data[6], daq.o3_view2 / daq.CONVERT_RATIO_PIFOC_O3)
+    np.testing.assert_allclose(data[7], daq.MAX_LASER_ANALOG)
+
+
+def test_galvo_scan_ao_data(daq):
+    data = daq._get_ao_data_galvo('view1', scan_option='O1')
+
+    nb_samples = daq.NB_DUMMY_TTLS + daq.nb_slices
+    step = daq.scan_step / daq.CONVERT_RATIO_PIFOC_O1
+    start = (daq.o1_pifoc - daq.scan_range / 2) / daq.CONVERT_RATIO_PIFOC_O1
+    assert data.shape == (7, nb_samples)
+    np.testing.assert_allclose(data[5], [x * step + start for x in range(nb_samples)])
+    np.testing.assert_allclose(
+        data[0], daq._offset_distance_to_voltage(daq.offset_view1)
+    )
+
+
+@pytest.mark.parametrize(
+    'interleave, expected',
+    [
+        (True, [[1, 1, 0, 0, 0, 0], [0, 0, 0, 1, 1, 0]]),
+        (False, [[0, 0, 0], [1, 1, 0]]),
+    ],
+)
+def test_exposure_do_waveforms(interleave, expected):
+    data = waveforms.exposure_do_waveforms(3, 2, 2, interleave, current_ch=1)
+
+    assert data.dtype == bool
+    np.testing.assert_array_equal(data, np.array(expected, dtype=bool))
+
+
+def test_waveforms_are_cached_and_read_only(daq):
+    data = daq._get_ao_data('view1')
+
+    assert daq._get_ao_data('view1') is data
+    assert daq._get_ao_data('view2') is not data
+    with pytest.raises(ValueError):
+        data[0, 0] = 0
+
+    daq.exposure = 0.2
+    assert daq._get_ao_data('view1') is not data
+
+
+def test_unsupported_options_raise(daq):
+    with pytest.raises(ValueError):
+        daq._get_ao_data('view3')
+    with pytest.raises(ValueError):
+        daq._get_ao_data_galvo('view1', scan_option='Stage')
+
+
+def test_playback_waveforms_concatenate_stacks():
+    patterns = [np.array([[1, 2]]), np.array([[3, 4, 5]])]
+    data = waveforms.playback_waveforms(patterns, nb_samples=5, nb_repeats=2)
+
+    period = [1, 2, 1, 2, 1, 3, 4, 5, 3, 4]
+    np.testing.assert_array_equal(data, [period * 2])
+
+
+def test_compile_timepoint_matches_acquire_stacks(daq):
+    data_ao, data_do = daq.compile_timepoint(2, ['view1', 'view2'], interleave=True)
+
+    nb_samples = daq.nb_stack_samples
+    assert data_ao.shape == (8, 4 * nb_samples)
+    assert data_do.shape == (2, 4 * nb_samples)
+    np.testing.assert_array_equal(
+        data_ao[:, 3 * nb_samples : 4 * nb_samples],
+        np.tile(daq._get_ao_data('view2'), daq.nb_slices + 1),
+    )
+    # the interleaved channels restart with the first channel for every stack
+    np.testing.assert_array_equal(
+        data_do[:, nb_samples : nb_samples + 2 * daq.num_samples],
+        daq._get_do_data(2, interleave=True),
+    )
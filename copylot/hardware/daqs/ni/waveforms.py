@@ -0,0 +1,222 @@
+"""Vectorized waveform generation for the NI DAQ acquisitions.
+
+Every function returns a single contiguous ``(n_channels, n_samples)``
+ndarray that can be passed as is to ``nidaqmx.Task.write``. Waveforms only
+depend on their arguments, so they are cached and keyed by them: the same
+array is returned for every time point, view and channel that uses the same
+parameters. Cached arrays are read-only, copy them before modifying.
+
+``playback_waveforms`` concatenates them into the buffer of a whole time
+point, that is streamed without regeneration during hardware-timed playback.
+"""
+from functools import lru_cache
+from typing import Sequence, Tuple
+
+import numpy as np
+
+
+def _read_only(array: np.ndarray) -> np.ndarray:
+    array.flags.writeable = False
+    return array
+
+
+def _constant_waveforms(levels: Tuple[float, ...], nb_samples: int) -> np.ndarray:
+    """Return a (len(levels), nb_samples) array with one constant level per channel"""
+    data = np.empty((len(levels), nb_samples), dtype=np.float64)
+    data[:] = np.asarray(levels, dtype=np.float64)[:, np.newaxis]
+    return data
+
+
+@lru_cache(maxsize=64)
+def stripe_reduction_waveform(
+    nb_samples: int, nb_on_samples: int, stripe_min: float, stripe_max: float
+) -> np.ndarray:
+    """Ramp of the gamma galvo during the exposure, back to the start during readout
+
+    Parameters
+    ----------
+    nb_samples : int
+        Number of samples per camera exposure.
+    nb_on_samples : int
+        Number of samples while the whole chip is exposed.
+    stripe_min : float
+        unit: v
+    stripe_max : float
+        unit: v
+
+    Returns
+    -------
+    np.ndarray
+        Waveform of shape (nb_samples,)
+    """
+    data = np.full(nb_samples, stripe_min, dtype=np.float64)
+    data[:nb_on_samples] = np.linspace(stripe_min, stripe_max, nb_on_samples)
+    return _read_only(data)
+
+
+@lru_cache(maxsize=64)
+def stage_scan_ao_waveforms(
+    nb_samples: int,
+    nb_on_samples: int,
+    scan_offset: float,
+    scan_half_range: float,
+    levels: Tuple[float, ...],
+    stripe_min: float,
+    stripe_max: float,
+) -> np.ndarray:
+    """AO waveforms of one camera exposure during stage scanning
+
+    Channel 0 compensates the stage motion with the scan galvo during the
+    exposure and flies back during readout, channel 3 reduces stripes,
+    all other channels hold a constant level.
+
+    Parameters
+    ----------
+    nb_samples : int
+        Number of samples per camera exposure.
+    nb_on_samples : int
+        Number of samples while the whole chip is exposed.
+    scan_offset : float
+        Center position of the scan galvo, unit: v
+    scan_half_range : float
+        Half of the scan galvo range compensating one scan step, unit: v
+    levels : Tuple[float, ...]
+        Constant level of each of the 8 AO channels, unit: v.
+        The levels of channels 0 and 3 are ignored.
+    stripe_min : float
+        unit: v
+    stripe_max : float
+        unit: v
+
+    Returns
+    -------
+    np.ndarray
+        Waveforms of shape (8, nb_samples)
+    """
+    data = _constant_waveforms(levels, nb_samples)
+
+    # AO0, stabilize light sheet during stage scanning
+    scan_start = scan_offset + scan_half_range
+    ramp = np.linspace(scan_start, scan_offset - scan_half_range, nb_samples)
+    data[0, :nb_on_samples] = ramp[:nb_on_samples]
+    data[0, nb_on_samples:] = np.linspace(
+        ramp[nb_on_samples], scan_start, nb_samples - nb_on_samples
+    )
+
+    # AO3, stripe reduction
+    data[3] = stripe_reduction_waveform(
+        nb_samples, nb_on_samples, stripe_min, stripe_max
+    )
+    return _read_only(data)
+
+
+@lru_cache(maxsize=64)
+def galvo_scan_ao_waveforms(
+    nb_samples: int,
+    scan_channel: int,
+    scan_start: float,
+    scan_step: float,
+    levels: Tuple[float, ...],
+) -> np.ndarray:
+    """AO waveforms of one stack scanned with the galvo or O1, one sample per slice
+
+    Parameters
+    ----------
+    nb_samples : int
+        Number of slices, including the dummy triggers.
+    scan_channel : int
+        Index of the scanned channel, it ramps by ``scan_step`` every slice.
+    scan_start : float
+        Level of the scanned channel for the first slice, unit: v
+    scan_step : float
+        unit: v
+    levels : Tuple[float, ...]
+        Constant level of each channel, the level of the scanned channel is ignored.
+
+    Returns
+    -------
+    np.ndarray
+        Waveforms of shape (len(levels), nb_samples)
+    """
+    data = _constant_waveforms(levels, nb_samples)
+    data[scan_channel] = np.arange(nb_samples) * scan_step + scan_start
+    return _read_only(data)
+
+
+@lru_cache(maxsize=64)
+def exposure_do_waveforms(
+    nb_samples: int,
+    nb_on_samples: int,
+    nb_channels: int,
+    interleave: bool = False,
+    current_ch: int = 0,
+) -> np.ndarray:
+    """DO waveforms switching the lasers on while the whole chip is exposed
+
+    Parameters
+    ----------
+    nb_samples : int
+        Number of samples per camera exposure.
+    nb_on_samples : int
+        Number of samples while the whole chip is exposed.
+    nb_channels : int
+        Number of laser channels.
+    interleave : bool
+        Switch channels every exposure instead of only turning on ``current_ch``.
+    current_ch : int
+        Channel that is on for sequential channel acquisition.
+
+    Returns
+    -------
+    np.ndarray
+        Boolean waveforms of shape (nb_channels, nb_channels * nb_samples) if
+        interleaved, (nb_channels, nb_samples) otherwise.
+    """
+    data_on = np.zeros(nb_samples, dtype=bool)
+    data_on[:nb_on_samples] = True
+
+    if interleave:
+        # channel i is on during the i-th of nb_channels exposures
+        data = np.kron(np.eye(nb_channels, dtype=bool), data_on)
+    else:
+        data = np.zeros((nb_channels, nb_samples), dtype=bool)
+        data[current_ch] = data_on
+    return _read_only(data)
+
+
+def playback_waveforms(
+    patterns: Sequence[np.ndarray], nb_samples: int, nb_repeats: int = 1
+) -> np.ndarray:
+    """Concatenate the waveforms of consecutive stacks into one playback buffer
+
+    Every pattern is repeated, as a regenerated buffer would be, and
+    truncated to ``nb_samples``. The sequence of stacks is then repeated
+    ``nb_repeats`` times, e.g. for a block of time points.
+
+    Parameters
+    ----------
+    patterns : Sequence[np.ndarray]
+        Waveforms of shape (n_channels, pattern_length) or (pattern_length,),
+        one per stack, with the same number of channels and dtype.
+    nb_samples : int
+        Number of samples of every stack.
+    nb_repeats : int
+        Number of times the sequence of stacks is played.
+
+    Returns
+    -------
+    np.ndarray
+        Waveforms of shape (n_channels, nb_repeats * len(patterns) * nb_samples)
+    """
+    period = len(patterns) * nb_samples
+    data = np.empty(
+        patterns[0].shape[:-1] + (nb_repeats * period,), dtype=patterns[0].dtype
+    )
+    for i, pattern in enumerate(patterns):
+        nb_periods = -(-nb_samples // pattern.shape[-1])
+        data[..., i * nb_samples : (i + 1) * nb_samples] = np.tile(pattern, nb_periods)[
+            ..., :nb_samples
+        ]
+    for i in range(1, nb_repeats):
+        data[..., i * period : (i + 1) * period] = data[..., :period]
+    return data
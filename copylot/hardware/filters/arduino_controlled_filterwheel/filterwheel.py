@@ -10,13 +10,18 @@ class ArduinoControlledFilterwheel:
     Parameters
     ----------
     com_port : str
+    backend
+        Module-like object providing the ``Serial`` class, defaults to
+        ``serial``. Pass a simulated backend to run the filter wheel without
+        the Arduino.
 
     """
 
-    def __init__(self, com_port: str = None):
+    def __init__(self, com_port: str = None, backend=None):
         self.com_port = com_port if com_port else "COM8"
 
-        self.serial_connection = serial.Serial()
+        backend = serial if backend is None else backend
+        self.serial_connection = backend.Serial()
         self.serial_connection.port = self.com_port
         self.serial_connection.baudrate = 1000000
         self.serial_connection.stopbits = serial.STOPBITS_ONE
@@ -0,0 +1,129 @@
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from typing import List, Optional, Sequence
+
+from copylot import logger
+
+
+class VortranIOThread:
+    """
+    Serial transport of a Vortran laser running on a dedicated thread.
+
+    ``submit`` queues a batch of command lines and returns a future. The
+    thread writes all the lines of a batch at once, and of every batch
+    queued in the meantime, so the laser processes them back to back
+    instead of waiting for a round trip per command. Replies are matched
+    to commands by their ``<cmd>=`` prefix, other lines (echo, prompts,
+    stale replies) are discarded.
+
+    Parameters
+    ----------
+    address : serial.Serial
+        Open serial port of the laser.
+    timeout : float
+        Time to wait for the replies of a batch in seconds.
+
+    """
+
+    def __init__(self, address, timeout: float = 1):
+        self.address = address
+        self.timeout = timeout
+        self._requests = queue.Queue()
+        self._thread = threading.Thread(
+            target=self._run, name="copylot-vortran-io", daemon=True
+        )
+        self._thread.start()
+
+    def submit(self, commands: Sequence[str], lines: Sequence[str]) -> Future:
+        """
+        Queue command lines for writing
+
+        Parameters
+        ----------
+        commands : Sequence[str]
+            Command of every line, e.g. '?LP' or 'LP', the prefix of its reply.
+        lines : Sequence[str]
+            Lines to write, terminated by a carriage return.
+
+        Returns
+        -------
+        Future
+            Resolves to the list of the parsed reply of every command,
+            None for commands without a reply before the timeout.
+        """
+        if not self._thread.is_alive():
+            raise RuntimeError("The IO thread of the laser is closed.")
+        future = Future()
+        self._requests.put((list(commands), list(lines), future))
+        return future
+
+    def close(self):
+        """Write the queued commands and stop the thread"""
+        if self._thread.is_alive():
+            self._requests.put(None)
+            self._thread.join()
+
+    def _run(self):
+        closing = False
+        while not closing:
+            batch = [self._requests.get()]
+            # pipeline the requests queued by other threads in the meantime
+            while batch[-1] is not None:
+                try:
+                    batch.append(self._requests.get_nowait())
+                except queue.Empty:
+                    break
+            if batch[-1] is None:
+                closing = True
+                batch.pop()
+            batch = [
+                request
+                for request in batch
+                if request[2].set_running_or_notify_cancel()
+            ]
+            if batch:
+                self._process(batch)
+
+    def _process(self, batch):
+        try:
+            commands = [cmd for request in batch for cmd in request[0]]
+            replies = self._exchange(
+                commands, ''.join(line for request in batch for line in request[1])
+            )
+        except Exception as e:
+            for _, _, future in batch:
+                future.set_exception(e)
+            return
+
+        start = 0
+        for request_commands, _, future in batch:
+            future.set_result(replies[start : start + len(request_commands)])
+            start += len(request_commands)
+
+    def _exchange(self, commands: List[str], message: str) -> List[Optional[List[str]]]:
+        """Write the message and read lines until every command got its reply"""
+        # replies that arrived after a previous timeout would be mismatched
+        self.address.reset_input_buffer()
+        data = message.encode('utf-8')
+        logger.debug("Write to laser -> %r", data)
+        self.address.write(data)
+
+        replies = [None] * len(commands)
+        pending = list(range(len(commands)))
+        deadline = time.perf_counter() + self.timeout
+        while pending and time.perf_counter() < deadline:
+            msg = self.address.readline().decode()
+            if len(msg) <= 1 or not msg.endswith(('\n', '\r')):
+                continue
+            for index in pending:
+                prefix = commands[index] + '='
+                if msg.startswith(prefix):
+                    replies[index] = msg[len(prefix) :].rstrip('\r\n').split(', ')
+                    pending.remove(index)
+                    logger.debug("msg_out > %s", msg)
+                    break
+        if pending:
+            logger.debug("No reply to %s", [commands[index] for index in pending])
+        return replies
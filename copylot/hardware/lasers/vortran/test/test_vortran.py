@@ -1,9 +1,23 @@
+import threading
+
 import pytest
 from unittest import mock
 
 import serial
 
 from copylot.hardware.lasers.vortran.vortran import VortranLaser
+from copylot.hardware.simulated.serial import SimulatedSerial
+from copylot.hardware.simulated.vortran import SimulatedVortranLaser
+
+
+@pytest.fixture(autouse=True)
+def port_cache(mocker, tmp_path):
+    '''
+    Keep the port cache of get_lasers out of the home directory
+    '''
+    path = tmp_path / 'vortran_lasers.json'
+    mocker.patch.object(VortranLaser, 'PORT_CACHE', path)
+    return path
 
 
 @pytest.fixture
@@ -158,3 +172,119 @@ def test_set_get_power(create_laser):
     laser = create_laser(['LP=50\r\n', '?LP=50\r\n'])
     laser.laser_power = 50
     assert laser.laser_power == 50
+
+
+def test_responses_are_matched_by_prefix(create_laser):
+    # replies out of order, with an echo and an unrelated line in between
+    laser = create_laser(
+        ['?FD=STANDBY\r\n', '?LP\r\n', 'PROMPT\r\n', '?FC=0\r\n', '?LP=2.5\r\n']
+    )
+    assert laser.query_many(['?LP', '?FC', '?FD']) == [['2.5'], ['0'], ['STANDBY']]
+    laser.address.write.assert_called_with(b'?LP\r?FC\r?FD\r')
+
+
+@pytest.fixture
+def simulated_laser(mocker):
+    # fast link, so that the latency dominates the transfer time of the replies
+    device = SimulatedVortranLaser(
+        baudrate=1_000_000, link_latency=0.005, processing_time=0.001
+    )
+    mocker.patch("serial.Serial", return_value=device)
+    laser = VortranLaser(port='SIM')
+    yield laser
+    laser.disconnect()
+
+
+def test_query_many_pipelines_the_queries(simulated_laser):
+    simulated_laser.toggle_emission = 1
+    simulated_laser.laser_power = 20
+    port = simulated_laser.address
+    nb_writes = len(port.written)
+
+    power, fault_code, fault_description = simulated_laser.query_many(
+        ['?LP', '?FC', '?FD']
+    )
+
+    assert (power, fault_code, fault_description) == (
+        ['20.0'],
+        ['0'],
+        ['LASER EMISSION ACTIVE'],
+    )
+    # a single write, so a single round trip of the link instead of three
+    assert port.written[nb_writes:] == [b'?LP\r?FC\r?FD\r']
+
+
+def test_concurrent_queries_share_the_io_thread(simulated_laser):
+    futures = [simulated_laser.query_many_async(['?LE', '?LP']) for _ in range(5)]
+    assert [future.result(timeout=1) for future in futures] == [[['0'], ['0.0']]] * 5
+    assert simulated_laser.status == (0, 'STANDBY')
+
+
+class SilentPort(SimulatedSerial):
+    def respond(self, line):
+        return []
+
+
+@pytest.fixture
+def simulated_ports(mocker):
+    '''
+    Ten ports, lasers on two of them, the other ones never reply
+    '''
+    serial_numbers = {'COM3': '1001', 'COM7': '1002'}
+    ports = [f'COM{index}' for index in range(10)]
+    mocker.patch(
+        "serial.tools.list_ports.comports",
+        return_value=[mock.MagicMock(device=port) for port in ports],
+    )
+
+    def open_port(port, **kwargs):
+        if port in serial_numbers:
+            return SimulatedVortranLaser(serial_numbers[port], port=port, **kwargs)
+        return SilentPort(port=port, **kwargs)
+
+    return mocker.patch("serial.Serial", side_effect=open_port), serial_numbers
+
+
+def test_get_lasers_probes_the_ports_concurrently(simulated_ports, port_cache):
+    mock_serial, serial_numbers = simulated_ports
+    # every probe waits until all the ports are open, probing them one
+    # after the other breaks the barrier
+    all_open = threading.Barrier(10, timeout=5)
+    open_port = mock_serial.side_effect
+
+    def open_together(port, **kwargs):
+        device = open_port(port, **kwargs)
+        all_open.wait()
+        return device
+
+    mock_serial.side_effect = open_together
+
+    lasers = VortranLaser.get_lasers(timeout=0.2)
+
+    assert not all_open.broken
+    assert lasers == list(serial_numbers.items())
+    assert mock_serial.call_count == 10
+    assert port_cache.exists()
+
+
+def test_get_lasers_validates_the_cached_ports(simulated_ports, mocker):
+    mock_serial, serial_numbers = simulated_ports
+    VortranLaser.get_lasers(timeout=0.2)
+    mock_serial.reset_mock()
+    probe = mocker.spy(VortranLaser, '_probe_port')
+
+    lasers = VortranLaser.get_lasers(timeout=0.2)
+
+    assert lasers == list(serial_numbers.items())
+    # only the cached ports are probed, not the silent ones
+    assert sorted(call.args[0] for call in probe.call_args_list) == ['COM3', 'COM7']
+    assert sorted(call.kwargs['port'] for call in mock_serial.call_args_list) == [
+        'COM3',
+        'COM7',
+    ]
+
+    # a laser moved to another port, all ports are scanned again
+    serial_numbers['COM5'] = serial_numbers.pop('COM7')
+    mock_serial.reset_mock()
+    assert VortranLaser.get_lasers(timeout=0.2) == [('COM3', '1001'), ('COM5', '1002')]
+    assert mock_serial.call_count == 2 + 10
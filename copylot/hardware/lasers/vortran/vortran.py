@@ -7,12 +7,15 @@ For more details regarding operation,
 refer to the manuals in https://www.vortranlaser.com/
 
 """
+import json
 import serial
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
 from copylot import logger
 from copylot.hardware.lasers.abstract_laser import AbstractLaser
+from copylot.hardware.lasers.vortran.io_thread import VortranIOThread
 from serial.tools import list_ports
-import time
-from typing import Tuple
+from typing import Dict, List, Sequence, Tuple
 
 
 class VortranLaser(AbstractLaser):
@@ -46,8 +49,12 @@ class VortranLaser(AbstractLaser):
         '?RP',
     ]
     VOLTRAN_CMDS = GLOBAL_CMD + GLOBAL_QUERY + LASER_CMD + LASER_QUERY
+    # port -> serial number of the lasers found by get_lasers
+    PORT_CACHE = Path.home() / ".coPylot" / "vortran_lasers.json"
 
-    def __init__(self, serial_number=None, port=None, baudrate=19200, timeout=1):
+    def __init__(
+        self, serial_number=None, port=None, baudrate=19200, timeout=1, backend=None
+    ):
         """
         Wrapper for vortran stradus lasers.
         establishes a connection through COM port
@@ -63,12 +70,17 @@ class VortranLaser(AbstractLaser):
            baudrate for serial communication
         timeout : int
             timeout for write/read in seconds
+        backend
+            Module-like object providing the ``Serial`` class, defaults to
+            ``serial``. Pass a simulated backend to run without the laser.
         """
         # Serial Communication
         self.port: str = port
         self.baudrate: int = baudrate
         self.address = None
         self.timeout: int = timeout
+        self._io_thread = None
+        self._backend = serial if backend is None else backend
 
         # Laser Specs
         self.serial_number: str = None
@@ -118,7 +130,7 @@ class VortranLaser(AbstractLaser):
         for port in ports:
             self.port = port
             try:
-                self.address = serial.Serial(
+                self.address = self._backend.Serial(
                     port=self.port,
                     baudrate=self.baudrate,
                     bytesize=serial.EIGHTBITS,
@@ -126,10 +138,12 @@ class VortranLaser(AbstractLaser):
                     stopbits=serial.STOPBITS_ONE,
                     timeout=self.timeout,
                 )
+                self._io_thread = VortranIOThread(self.address, self.timeout)
                 self._identify_laser()
             except RuntimeError:
                 logger.debug(
-                    f"A runtime error occurred while attempting to connect to port {self.port}"
+                    "A runtime error occurred while attempting to connect to port %s",
+                    self.port,
                 )
                 self.disconnect()
                 continue
@@ -139,7 +153,9 @@ class VortranLaser(AbstractLaser):
             # in which case we first check that the laser matches it
             if self._in_serial_num is None or self._in_serial_num == self.serial_number:
                 logger.info(
-                    f"Connected to Vortran laser {self.serial_number} on serial port {self.port}"
+                    "Connected to Vortran laser %s on serial port %s",
+                    self.serial_number,
+                    self.port,
                 )
                 laser_found = True
                 break
@@ -155,6 +171,9 @@ class VortranLaser(AbstractLaser):
 
     def disconnect(self):
         """Disconnects the device"""
+        if self._io_thread is not None:
+            self._io_thread.close()
+            self._io_thread = None
         if self.is_connected:
             self.address.close()
         self.address = None
@@ -162,7 +181,7 @@ class VortranLaser(AbstractLaser):
     @property
     def is_connected(self):
         """Check if device is connected to COM Port and return True/False"""
-        logger.debug(f'{self.port} is open')
+        logger.debug('%s is open', self.port)
         self._is_connected = self.address is not None and self.address.is_open
         return self._is_connected
 
@@ -184,58 +203,72 @@ class VortranLaser(AbstractLaser):
         -------
         a list with the parsed response from the device to the given command
         """
+        return self._write_cmds([cmd], [value])[0]
+
+    def _write_cmds(self, cmds, values) -> List[List[str]]:
+        """
+        Writes several commands in one round trip and waits for their responses
+
+        Parameters
+        ----------
+        cmds : Sequence[str]
+            vortran Stadus commands
+        values : Sequence
+            value to be set with each command, None for queries
+
+        Returns
+        -------
+        a list with the parsed response to each command, ['0'] if there was none
+        """
         try:
-            if cmd in VortranLaser.VOLTRAN_CMDS:
-                if value is not None:
-                    cmd_LF = cmd + '=' + str(value) + '\r'
-                else:
-                    cmd_LF = cmd + '\r'
-                logger.debug(
-                    f"Write to laser <{self.serial_number}> -> cmd:<{cmd_LF.encode('utf-8')}>"
-                )
-                self.address.write(cmd_LF.encode('utf-8'))
-                msg_out = self._read_cmd(cmd)
-                return msg_out
-            else:
-                raise ValueError(f"Command '{cmd}' not found")
+            responses = self._submit_cmds(cmds, values).result()
         except Exception as e:
             raise RuntimeError(f"Error sending command: {str(e)}")
+        return [['0'] if values is None else values for values in responses]
+
+    def _submit_cmds(self, cmds, values) -> Future:
+        lines = []
+        for cmd, value in zip(cmds, values):
+            if cmd not in VortranLaser.VOLTRAN_CMDS:
+                raise ValueError(f"Command '{cmd}' not found")
+            if value is not None:
+                lines.append(cmd + '=' + str(value) + '\r')
+            else:
+                lines.append(cmd + '\r')
+        if self._io_thread is None:
+            raise RuntimeError(f"Laser on port {self.port} is not connected")
+        return self._io_thread.submit(cmds, lines)
 
-    def _read_cmd(self, cmd):
+    def query_many(self, queries: Sequence[str]) -> List[List[str]]:
         """
-        Reads the data from the serial port and parses the data in response
-        to a sent command
+        Send several queries in one round trip, e.g. ['?LP', '?FC', '?FD']
 
         Parameters
         ----------
-        cmd : (str)
-            the command written
+        queries : Sequence[str]
+            vortran Stradus queries
+
         Returns
         -------
-            the decoded and parsed response to the command
+        a list with the parsed response to each query
         """
-        # All replies to commands are in upper case.
-        try:
-            elapsed_time = 0
-            values = None
-            start_time = time.perf_counter()
-            while elapsed_time < self.timeout:
-                msg = self.address.readline().decode()
-                elapsed_time = time.perf_counter() - start_time
-                if len(msg) > 1:
-                    if msg.endswith('\n') or msg.endswith('\r'):
-                        if msg[: len(cmd) + 1] == (cmd + '='):
-                            values = msg[len(cmd) + 1 : -2].split(', ')
-                            logger.debug(f"msg_out > {msg}")
-                            break
-            logger.debug(f"Parsed values: {values}")
-            if values is None:
-                values = ['0']
-                # TODO: maybe raise warning?
-                # raise Warning
-            return values
-        except RuntimeWarning:
-            logger.info("Error: No response from laser")
+        return self._write_cmds(queries, [None] * len(queries))
+
+    def query_many_async(self, queries: Sequence[str]) -> Future:
+        """
+        Send several queries in one round trip without waiting for the responses
+
+        Parameters
+        ----------
+        queries : Sequence[str]
+            vortran Stradus queries
+
+        Returns
+        -------
+        a Future resolving to the parsed response to each query,
+        None for queries without response
+        """
+        return self._submit_cmds(queries, [None] * len(queries))
 
     def _identify_laser(self):
         """
@@ -249,7 +282,7 @@ class VortranLaser(AbstractLaser):
         self.wavelength = int(laser_param[2][:-2])  # [mW]
         self._max_power = float(laser_param[3][:-2])
         self.laser_shape = laser_param[4]
-        logger.debug(f'Laser param: {laser_param}')
+        logger.debug('Laser param: %s', laser_param)
 
     # TODO: implement table 9.3.4 from  PDF
     @property
@@ -374,8 +407,8 @@ class VortranLaser(AbstractLaser):
             pass
         if power > self._max_power:
             power = self._max_power
-            logger.info(f'Maximum power is: {self._max_power}')
-        logger.info(f'Setting power: {power}')
+            logger.info('Maximum power is: %s', self._max_power)
+        logger.info('Setting power: %s', power)
         self._curr_power = float(self._write_cmd('LP', power)[0])
 
     @property
@@ -392,7 +425,7 @@ class VortranLaser(AbstractLaser):
         """
         Pulse Power configuration
         """
-        logger.info(f'Setting Power:{power}')
+        logger.info('Setting Power:%s', power)
         self._pulse_power = float(self._write_cmd('PP', str(power))[0])
 
     @property
@@ -428,27 +461,109 @@ class VortranLaser(AbstractLaser):
         Request the laser's status and return a tuple with the fault code and description
 
         """
-        fault_code = self._write_cmd('?FC')
-        fault_description = self._write_cmd('?FD')
+        fault_code, fault_description = self.query_many(['?FC', '?FD'])
         self._status = (int(fault_code[0]), str(fault_description[0]))
         return self._status
 
     @staticmethod
-    def get_lasers():
-        com_ports = list_ports.comports()
-        lasers = []
-        for port in com_ports:
+    def _probe_port(port, baudrate=19200, timeout=0.2):
+        """
+        Return the serial number of the laser on a port, None if there is none
+
+        Only sends the identification query ``?LI``, with a short timeout.
+        """
+        address = None
+        try:
+            address = serial.Serial(
+                port=port,
+                baudrate=baudrate,
+                bytesize=serial.EIGHTBITS,
+                parity=serial.PARITY_NONE,
+                stopbits=serial.STOPBITS_ONE,
+                timeout=timeout,
+            )
+            io_thread = VortranIOThread(address, timeout)
             try:
-                laser = VortranLaser(port=port.device)
-                if laser.serial_number is not None:
-                    lasers.append((laser.port, laser.serial_number))
-                    logger.info(f"Found: {laser.port}:{laser.serial_number}")
-                    laser.disconnect()
-                else:
-                    continue
-            except (RuntimeWarning, RuntimeError):
-                logger.debug(f'No laser found in {port}')
+                reply = io_thread.submit(['?LI'], ['?LI\r']).result()[0]
+            finally:
+                io_thread.close()
+        except (serial.SerialException, OSError, RuntimeError, ValueError) as e:
+            logger.debug('Probing %s failed: %s', port, e)
+            return None
+        finally:
+            if address is not None:
+                address.close()
+        return None if reply is None else reply[0]
+
+    @staticmethod
+    def _load_port_cache(cache_path) -> Dict[str, str]:
+        try:
+            with open(cache_path) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    @staticmethod
+    def _save_port_cache(cache_path, lasers):
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(cache_path, 'w') as f:
+                json.dump(dict(lasers), f, indent=2)
+        except OSError as e:
+            logger.warning('Could not save the laser ports to %s: %s', cache_path, e)
+
+    @staticmethod
+    def get_lasers(
+        timeout: float = 0.2, use_cache: bool = True, max_workers: int = 16
+    ) -> List[Tuple[str, str]]:
+        """
+        Find the lasers connected to the COM ports
+
+        The ports are probed concurrently with the ``?LI`` query. The
+        port -> serial number mapping is saved to ``PORT_CACHE``: on the next
+        call, only the cached ports are probed and, if they still hold the
+        same lasers, the other ports are not scanned.
 
+        Parameters
+        ----------
+        timeout : float
+            Time to wait for the reply of each port in seconds.
+        use_cache : bool
+            Trust the cached ports if they are validated, otherwise scan all ports.
+        max_workers : int
+            Maximum number of ports probed at the same time.
+
+        Returns
+        -------
+        a list of (port, serial number) tuples
+        """
+        ports = [port.device for port in list_ports.comports()]
+        cache_path = Path(VortranLaser.PORT_CACHE)
+
+        def probe(port_list):
+            if not port_list:
+                return []
+            with ThreadPoolExecutor(min(max_workers, len(port_list))) as executor:
+                serial_numbers = executor.map(
+                    lambda port: VortranLaser._probe_port(port, timeout=timeout),
+                    port_list,
+                )
+                return list(zip(port_list, serial_numbers))
+
+        lasers = None
+        if use_cache:
+            cache = VortranLaser._load_port_cache(cache_path)
+            cached = probe([port for port in ports if port in cache])
+            if cached and all(cache[port] == number for port, number in cached):
+                lasers = cached
+                logger.debug('Validated the cached laser ports %s', cache)
+
+        if lasers is None:
+            lasers = [(port, number) for port, number in probe(ports) if number]
+            VortranLaser._save_port_cache(cache_path, lasers)
+
+        for port, serial_number in lasers:
+            logger.info("Found: %s:%s", port, serial_number)
         if len(lasers) == 0:
             logger.info("No lasers found...")
             raise Exception
@@ -6,21 +6,34 @@ Optotune Tip-tilt mirror controller MR-E-2 python wrapper
 For more details regarding operation, refer to the manuals in https://www.optotune.com/fast-steering-mirrors
 
 """
+import numpy as np
+
 from copylot import logger
 from copylot.hardware.mirrors.optotune import optoMDC
 
+# the vector index of the pattern memory commands is a 16-bit byte offset
+MAX_PATTERN_LENGTH = 2**16 // 4
+
 
 class OptoMirror:
-    def __init__(self, com_port: str = None):
+    def __init__(self, com_port: str = None, backend=None):
         """
         Wrapper for Optotune mirror controller MR-E-2.
         establishes a connection through COM port
 
+        Parameters
+        ----------
+        com_port : str
+        backend
+            Module-like object providing the ``Serial`` class, defaults to
+            ``serial``. Pass a simulated backend to run without the controller.
+
         """
         self.mirror = optoMDC.connect(
             com_port
             if com_port is not None
-            else optoMDC.tools.list_comports.get_mre2_port()
+            else optoMDC.tools.list_comports.get_mre2_port(),
+            backend=backend,
         )
 
         self.channel_x = self.mirror.Mirror.Channel_0
@@ -47,8 +60,13 @@ class OptoMirror:
             Returning value is the current normalized angular value of the mirror
             value = theta/tan(50degree)
             50 degree is the maximum optical deflection angle for each direction.
+            Both positions are read in a single command.
         """
-        return self.position_x, self.position_y
+        return tuple(
+            self.mirror.get_many(
+                [self.channel_x.StaticInput.xy, self.channel_y.StaticInput.xy]
+            )
+        )
 
     @property
     def position_x(self):
@@ -77,7 +95,7 @@ class OptoMirror:
             nearest edge of the unit circle
         """
         self.channel_x.StaticInput.SetXY(value)
-        logger.info(f"position_x set to: {value}")
+        logger.debug("position_x set to: %s", value)
 
     @property
     def position_y(self):
@@ -106,4 +124,117 @@ class OptoMirror:
 
         """
         self.channel_y.StaticInput.SetXY(value)
-        logger.info(f"position_y set to: {value}")
+        logger.debug("position_y set to: %s", value)
+
+    def upload_trajectory(
+        self,
+        trajectory: np.ndarray,
+        sample_rate: float,
+        cycles: int = -1,
+        external_trigger: bool = True,
+    ):
+        """
+        Uploads a trajectory to the vector pattern memory of the controller
+        and sets up its playback, see start_trajectory.
+
+        The samples of both axes are uploaded back to back, x then y, in
+        pipelined segments, and played back by the vector pattern unit of
+        each channel at the sample rate, without any serial communication.
+
+        Parameters
+        ----------
+        trajectory : np.ndarray
+            (n_samples, 2) array of the normalized x and y angular values of
+            each sample, in [-1, 1], see position_x.
+        sample_rate : float
+            Playback rate in samples per second.
+        cycles : int
+            Number of times the trajectory is played, -1 to loop until
+            stop_trajectory.
+        external_trigger : bool
+            Whether the playback waits for the trigger input of the
+            controller once started.
+
+        Raises
+        ------
+        ValueError
+            The trajectory is not a (n_samples, 2) array of values in [-1, 1]
+            or does not fit in the pattern memory.
+        RuntimeError
+            The controller did not acknowledge every segment of the upload.
+        """
+        trajectory = np.asarray(trajectory, dtype=np.float32)
+        if trajectory.ndim != 2 or trajectory.shape[1] != 2 or len(trajectory) == 0:
+            raise ValueError(
+                f"The trajectory must be a (n_samples, 2) array, not {trajectory.shape}."
+            )
+        if 2 * len(trajectory) > MAX_PATTERN_LENGTH:
+            raise ValueError(
+                f"The trajectory has {len(trajectory)} samples, "
+                f"the pattern memory fits {MAX_PATTERN_LENGTH // 2} per axis."
+            )
+        if not np.all(np.abs(trajectory) <= 1):
+            raise ValueError("The trajectory values must be in [-1, 1].")
+
+        n_samples = len(trajectory)
+        pattern = np.concatenate([trajectory[:, 0], trajectory[:, 1]])
+        if not self.mirror.VectorPatternMemory.SetPattern(0, pattern):
+            raise RuntimeError(
+                "The mirror controller did not acknowledge the trajectory."
+            )
+
+        for i, channel in enumerate((self.channel_x, self.channel_y)):
+            unit = channel.VectorPatternUnit
+            # one set-multiple command per channel
+            self.mirror.set_value(
+                [
+                    unit.unit,
+                    unit.start,
+                    unit.end,
+                    unit.frequency_speed,
+                    unit.cycles,
+                    unit.external_trigger,
+                ],
+                [
+                    optoMDC.Units.XY,
+                    i * n_samples,
+                    (i + 1) * n_samples,
+                    float(sample_rate),
+                    cycles,
+                    external_trigger,
+                ],
+            )
+            unit.SetAsInput()
+        logger.info(
+            "trajectory of %d samples at %s Hz uploaded", n_samples, sample_rate
+        )
+
+    def start_trajectory(self):
+        """
+        Starts the playback of the uploaded trajectory on both axes at once.
+        With an external trigger, the playback then waits for the trigger.
+        """
+        self.mirror.set_value(
+            [
+                self.channel_x.VectorPatternUnit.run,
+                self.channel_y.VectorPatternUnit.run,
+            ],
+            [True, True],
+        )
+        logger.info("trajectory started")
+
+    def stop_trajectory(self):
+        """
+        Stops the playback of the trajectory and returns the mirror to the
+        static position inputs, see position_x and position_y.
+        """
+        self.mirror.set_value(
+            [
+                self.channel_x.VectorPatternUnit.run,
+                self.channel_y.VectorPatternUnit.run,
+            ],
+            [False, False],
+        )
+        self.channel_x.StaticInput.SetAsInput()
+        self.channel_y.StaticInput.SetAsInput()
+        logger.info("trajectory stopped")
@@ -2,5 +2,12 @@
 # import os
 #
 # sys.path.extend([os.path.dirname(__file__)])
-from .mre2 import MRE2Board as connect
 from .tools.definitions import *
+
+
+def __getattr__(name):
+    # the board and its register tables are imported on first use, e.g. by optoMDC.connect(port)
+    if name == 'connect':
+        from .mre2 import MRE2Board
+        return MRE2Board
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
@@ -55,6 +55,8 @@ class MRE2Board(_Board):
         Determines whether or not Board will be set in simple-mode after initialization.
     board_reset: bool, optional = False
         Determines whether or not to reset the Board during initialization.
+    backend: optional
+        Module-like object providing the Serial class, defaults to serial. A simulated backend runs without the board.
 
     Raises
     ------
@@ -93,7 +95,7 @@ class MRE2Board(_Board):
     """
     def __init__(self, port: str = None, baudrate: int = 115200, comm_lock: bool = True,
                  timeout: float = 2, verbose: bool = False, boot_in_simple: bool = False,
-                 board_reset: bool = False, inter_byte_timeout: float = 0.2):
+                 board_reset: bool = False, inter_byte_timeout: float = 0.2, backend=None):
         if port is None:
             try:
                 port = get_mre2_port()
@@ -102,8 +104,9 @@ class MRE2Board(_Board):
 
         _Board.__init__(self, port=port, baudrate=baudrate, comm_lock=comm_lock,
                         timeout=timeout, verbose=verbose, simple=boot_in_simple,
-                        board_reset=board_reset, inter_byte_timeout=inter_byte_timeout)
+                        board_reset=board_reset, inter_byte_timeout=inter_byte_timeout, backend=backend)
 
+        self.register_catalog = Registers._catalog
         # board-level systems
         self.VectorPatternMemory = Registers.VectorPatternMemory(board=self)
         self.TemperatureManager = Registers.TemperatureManager(board=self)
@@ -1,2 +1,9 @@
 from .tools.definitions import *
-from .registers import generic_registers as Registers
+
+
+def __getattr__(name):
+    # the register tables are imported on first use, they pull in the whole package
+    if name == 'Registers':
+        from .registers import generic_registers
+        return generic_registers
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
@@ -1,14 +1,17 @@
+import logging
 import numpy as np
 import time
 import struct
 import inspect
 from .tools.parsing_tools import encode, encode_vector
-from .tools.command_tools import issue_command, process_simple_response, process_response, get_cmd_reg_val
+from .tools.command_tools import issue_command, issue_commands, process_simple_response, process_response, get_cmd_reg_val
 from .tools.systems_registers_tools import process_registers
-from .tools.definitions import (CMD_DELAY, ENDIAN, Units, Waveforms,
+from .tools.definitions import (CMD_DELAY, CHUNK_SIZE, MULTIPLE_CNT, ENDIAN, Units, Waveforms,
                                 CommandID, SimpleResponses, ESCAPE_BYTE,
                                 FRAME_BOUNDARY, ESCAPE_MASK)
 
+logger = logging.getLogger(__name__)
+
 
 # Kummenberg Commands
 class Command:
@@ -46,6 +49,9 @@ class Command:
 
     """
 
+    # resolves the register ids of get_many and set_many, set by the boards
+    register_catalog = None
+
     def __init__(self, board=None):
         pass
 
@@ -525,6 +531,110 @@ class Command:
                 print('Last Message Sent : {}'.format(self.Connection.last_sent))
             return parsed_response[2]
 
+    def _register_record(self, register: dict or int):
+        """Register record of a record or of a register id, see register_catalog"""
+        if isinstance(register, dict):
+            return register
+        if self.register_catalog is None:
+            raise KeyError('Register id {} cannot be resolved without a register catalog'.format(hex(register)))
+        return self.register_catalog.find(register)[3]
+
+    def _issue_multiple(self, command_id: int, records: list, values: list or None, cmd_delay):
+        """Pipelines the multiple commands of the chunks of records, returns the parsed response of each chunk"""
+        chunks = [slice(start, start + MULTIPLE_CNT) for start in range(0, len(records), MULTIPLE_CNT)]
+        commands = []
+        for chunk in chunks:
+            cmd_reg_val = get_cmd_reg_val(command=command_id, register=records[chunk],
+                                          value=None if values is None else values[chunk])
+            if cmd_reg_val == (None, None, None):
+                raise ValueError('Invalid values {} for registers {}'.format(
+                    values[chunk], [hex(record['id']) for record in records[chunk]]))
+            commands.append(encode(*cmd_reg_val))
+        responses = issue_commands(self, commands, cmd_delay=cmd_delay)
+
+        parsed_responses = []
+        for chunk, response in zip(chunks, responses):
+            parsed_response = process_response(CommandID.SET_MULTIPLE if values is not None else CommandID.GET_MULTIPLE,
+                                               records[chunk], None if values is None else values[chunk], response,
+                                               self.verbose)
+            if response == b'' or parsed_response[4]:
+                # timeout or error flag was true
+                logger.warning('Registers Not Acknowledged : %s', [hex(record['id']) for record in records[chunk]])
+                parsed_responses.append(None)
+            else:
+                parsed_responses.append(parsed_response[2])
+        return parsed_responses
+
+    def get_many(self, registers: list, cmd_delay: float = None):
+        r"""
+        Gets the values of many registers, in as few round trips as the firmware allows.
+
+        The registers are packed in get multiple commands of up to MULTIPLE_CNT registers, and the commands are
+        pipelined, see issue_commands.
+
+        Parameters
+        ----------
+        registers : list of dicts or ints
+            Register dictionaries, or register ids resolved with register_catalog.
+        cmd_delay : float
+            Additional time in seconds to wait for each response.
+
+        Returns
+        -------
+        list
+            Value of each register, None for the registers the firmware did not answer.
+
+        Examples
+        --------
+        >>> channel = board.Mirror.Channel_0
+        >>> board.get_many([channel.StaticInput.xy, channel.OFPID.kp, 0x5102])
+        [0.25, 0.1, -0.5]
+
+        """
+        records = [self._register_record(register) for register in registers]
+        values = []
+        for start, response_data in zip(range(0, len(records), MULTIPLE_CNT),
+                                        self._issue_multiple(CommandID.GET_VALUE, records, None, cmd_delay)):
+            nb_registers = len(records[start:start + MULTIPLE_CNT])
+            values.extend([None] * nb_registers if response_data is None else response_data)
+        return values
+
+    def set_many(self, values, cmd_delay: float = None):
+        r"""
+        Sets many registers, in as few round trips as the firmware allows.
+
+        The registers are packed in set multiple commands of up to MULTIPLE_CNT registers, so that the request fits
+        in MAX_PAYLOAD_SIZE, and the commands are pipelined, see issue_commands.
+
+        Parameters
+        ----------
+        values : dict or iterable of pairs
+            {register id: value}, or (register dictionary or id, value) pairs.
+        cmd_delay : float
+            Additional time in seconds to wait for each response.
+
+        Returns
+        -------
+        bool
+            Whether every register was acknowledged by the firmware.
+
+        Raises
+        ------
+        ValueError
+            A value is not valid for its register, no command was sent.
+
+        Examples
+        --------
+        >>> channel = board.Mirror.Channel_0
+        >>> board.set_many([(channel.StaticInput.xy, 0.25), (channel.OFPID.kp, 0.1)])
+        True
+
+        """
+        pairs = list(values.items()) if isinstance(values, dict) else list(values)
+        records = [self._register_record(register) for register, _ in pairs]
+        responses = self._issue_multiple(CommandID.SET_VALUE, records, [value for _, value in pairs], cmd_delay)
+        return all(response is not None for response in responses)
+
     def set_vector(self, register: dict or int, index: int, vector, cmd_delay=None):
         r"""
         Sets the given register vector to desired value.
@@ -582,6 +692,56 @@ class Command:
             print('Last Message Sent : {}'.format(self.Connection.last_sent))
         return parsed_response[2]
 
+    def set_vector_segments(self, register: dict or int, index: int, vector, chunk_size: int = CHUNK_SIZE,
+                            cmd_delay=None):
+        r"""
+        Sets a vector longer than a command payload, one segment of chunk_size elements per command.
+
+        The segment commands are pipelined, see issue_commands, so the round trip latency is paid once per
+        MAX_COMMANDS_IN_FLIGHT segments instead of once per segment. A full pattern memory takes about 1600
+        segments, at most MAX_COMMANDS_IN_FLIGHT of them are sent before their responses are read, so that the
+        receive buffer of the board is not overrun.
+
+        Parameters
+        ----------
+        register : dict or int
+            Register dictionary corresponding to desired registers, see set_vector.
+        index : int
+            The location to store the first element of the vector.
+        vector : list or np.ndarray
+            The values, their type is dependent on the register being addressed.
+        chunk_size : int
+            Number of elements per segment, the payload of a segment must fit in MAX_PAYLOAD_SIZE.
+        cmd_delay : float
+            Additional time in seconds to wait for each response.
+
+        Returns
+        -------
+        bool
+            Whether every segment was acknowledged by the firmware.
+
+        Examples
+        --------
+        >>> register = board.VectorPatternMemory.vector
+        >>> board.set_vector_segments(register, 0, np.linspace(-0.5, 0.5, 1000))
+        True
+
+        """
+        starts = range(0, len(vector), chunk_size)
+        commands = [encode_vector(register=register, index=index + start, vector=vector[start:start + chunk_size])
+                    for start in starts]
+        responses = issue_commands(self, commands, cmd_delay=cmd_delay)
+        acknowledged = True
+        for start, response in zip(starts, responses):
+            parsed_response = process_response(command_id_sent=CommandID.SET_VECTOR,
+                                               register=register, value=vector[start:start + chunk_size],
+                                               response=response, verbose=self.verbose)
+            if response == b'' or parsed_response[4]:
+                # timeout or error flag was true
+                logger.warning('Segment Not Acknowledged : [index=%d]', index + start)
+                acknowledged = False
+        return acknowledged
+
     def get_vector(self, register: dict or int, index: int, count: int):
         r"""
         Gets the given register vector.
@@ -1,12 +1,62 @@
+import logging
 import serial
 from .registers import generic_registers as registers
-from .tools.definitions import UnitType, CommandID, FRAME_BOUNDARY, SimpleResponses, CMD_DELAY
+from .tools.definitions import UnitType, CommandID, FRAME_BOUNDARY, SimpleResponses, CMD_DELAY, commandName
 from .commands import Command
 from .tools.command_tools import issue_command
 import time
 from warnings import warn
 from sys import exit
 
+logger = logging.getLogger(__name__)
+
+
+class CommandLatency:
+    r"""
+    Round trip time statistics of the commands issued over a connection, per command.
+
+    The latency of a command is the time from writing it to receiving its whole response. Pipelined commands are all
+    written at once, so their latencies include the responses to the commands before them.
+
+    Examples
+    --------
+    >>> board.Connection.latency.summary()
+    {'GET_VALUE': {'count': 120, 'mean': 0.00041, 'min': 0.00035, 'max': 0.0011, 'last': 0.0004}}
+
+    """
+
+    def __init__(self):
+        self._statistics = {}
+
+    def record(self, command_bytes: bytes, seconds: float):
+        """Record the latency of a command, identified by its command id or as SIMPLE for simple-mode commands"""
+        if len(command_bytes) > 2 and command_bytes[0] == FRAME_BOUNDARY:
+            name = commandName.get(command_bytes[2], hex(command_bytes[2]))
+        else:
+            name = 'SIMPLE'
+        statistics = self._statistics.get(name)
+        if statistics is None:
+            self._statistics[name] = [1, seconds, seconds, seconds, seconds]
+        else:
+            statistics[0] += 1
+            statistics[1] += seconds
+            statistics[2] = min(statistics[2], seconds)
+            statistics[3] = max(statistics[3], seconds)
+            statistics[4] = seconds
+
+    def summary(self):
+        r"""
+        Returns
+        -------
+        dict
+            Number of commands, mean, min, max and last latencies in seconds, per command name.
+        """
+        return {name: {'count': count, 'mean': total / count, 'min': minimum, 'max': maximum, 'last': last}
+                for name, (count, total, minimum, maximum, last) in self._statistics.items()}
+
+    def reset(self):
+        self._statistics.clear()
+
 
 class Connection:
     r"""
@@ -41,6 +91,8 @@ class Connection:
             bytes that were received until then.
     verbose : bool
         Verbose serial output for debugging/etc. If true, output generated even without parse_error/failures.
+    backend
+        Module-like object providing the Serial class, defaults to serial. A simulated backend runs without the board.
 
     Raises
     ------
@@ -62,7 +114,8 @@ class Connection:
     """
 
     def __init__(self, port: str or None, baudrate: int, inter_byte_timeout: float,
-                 comm_lock: bool, timeout: float, verbose: bool):
+                 comm_lock: bool, timeout: float, verbose: bool, backend=None):
+        self._backend            = serial if backend is None else backend
         self._port               = port
         self._baudrate           = baudrate
         self._inter_byte_timeout = inter_byte_timeout
@@ -72,6 +125,8 @@ class Connection:
         self._settings           = None
         self.verbose             = verbose
         self.last_sent           = None
+        self.latency             = CommandLatency()
+        self._received           = bytearray()
 
         if port is not None:
             # make connection to input
@@ -194,6 +249,76 @@ class Connection:
 
         return data
 
+    def _pop_frame(self):
+        """Remove the first complete frame from the received bytes, the bytes before it are dropped"""
+        start = self._received.find(FRAME_BOUNDARY)
+        while start != -1:
+            end = self._received.find(FRAME_BOUNDARY, start + 1)
+            if end == -1:
+                del self._received[:start]
+                return None
+            if end > start + 1:
+                frame = bytes(self._received[start:end + 1])
+                del self._received[:end + 1]
+                return frame
+            # two frame boundaries in a row, the second one opens the frame
+            start = end
+        self._received.clear()
+        return None
+
+    def receive_frame(self, timeout: float = None):
+        r"""
+        Receive one pro-mode frame, returning as soon as its closing frame boundary arrives.
+
+        Bytes received after the frame are kept for the next call, so the responses of pipelined commands are read
+        back to back.
+
+        Parameters
+        ----------
+        timeout : float, optional
+            Time in seconds to wait for a complete frame. Defaults to the timeout of the connection, None waits
+            forever. The deadline is checked between reads, each read blocks at most the port timeout.
+
+        Returns
+        -------
+        bytes
+            The frame, including the frame boundaries, or b'' if no complete frame arrived before the deadline.
+        """
+        if self._port is None:
+            return self.receive()
+        if timeout is None:
+            timeout = self._timeout
+        deadline = None if timeout is None else time.perf_counter() + timeout
+        frame = self._pop_frame()
+        while frame is None:
+            if deadline is not None and time.perf_counter() >= deadline:
+                break
+            # blocks until at least one byte arrives, then takes whatever else is waiting
+            data = self._serial_conn.read(max(1, self._serial_conn.in_waiting))
+            if data:
+                self._received += data
+                frame = self._pop_frame()
+        if frame is None:
+            frame = b''
+        if self.verbose:
+            logger.debug('Received: %s', frame.hex())
+        return frame
+
+    def discard_input(self):
+        r"""
+        Drop the bytes received so far, e.g. responses that arrived after a timeout.
+
+        Returns
+        -------
+        bytes
+            The bytes dropped.
+        """
+        junk = bytes(self._received)
+        self._received.clear()
+        if self._port is not None and self._serial_conn.in_waiting:
+            junk += self._read(self._serial_conn)
+        return junk
+
     def connect(self):
         r"""
         Establish serial connection over port. Will reattempt up to 3 times.
@@ -218,7 +343,7 @@ class Connection:
                 try:
                     # connect
                     attempts += 1
-                    self._serial_conn = serial.Serial(port=self._port, baudrate=self._baudrate, timeout=self._timeout,
+                    self._serial_conn = self._backend.Serial(port=self._port, baudrate=self._baudrate, timeout=self._timeout,
                                                       interCharTimeout=self._inter_byte_timeout)
                     self._settings = self._serial_conn.getSettingsDict()
                     if self.verbose:
@@ -274,7 +399,7 @@ class Board(Command):
 
     Parameters
     ----------
-    port, baudrate, comm_lock, timeout, verbose
+    port, baudrate, comm_lock, timeout, verbose, backend
         Extended from Connection class
     simple: bool, optional
         Determines whether or not Board will be set in simple-mode after initialization.
@@ -319,7 +444,7 @@ class Board(Command):
     """
     def __init__(self, port: str or None = None, baudrate: int = 115200, comm_lock: bool = True,
                  timeout: float = None, verbose: bool = False, simple: bool = False,
-                 board_reset: bool = False, inter_byte_timeout: float = 0.2):
+                 board_reset: bool = False, inter_byte_timeout: float = 0.2, backend=None):
         self.verbose = verbose
         self.simulated = port is None
         if self.simulated:
@@ -336,8 +461,10 @@ class Board(Command):
         # default channels
         self.channel = [self.ProxyBoard.Channel_0]
 
+        self.register_catalog = registers._catalog
+
         # default connection and Kummenberg commands
-        self.Connection = Connection(port, baudrate, inter_byte_timeout, comm_lock, timeout, verbose)
+        self.Connection = Connection(port, baudrate, inter_byte_timeout, comm_lock, timeout, verbose, backend)
         self.Commands = Command()
         Command.__init__(self)
         self._simple = self.IsSimpleMode()
@@ -579,6 +706,60 @@ class Channel:
         self._control_mode = control_mode
         return response
 
+    def _register_record(self, name: str):
+        """Register record of a 'System.register' name of this channel, e.g. 'StaticInput.xy'"""
+        system_name, _, register_name = name.partition('.')
+        record = getattr(getattr(self, system_name), register_name, None)
+        if not isinstance(record, dict) or 'id' not in record:
+            raise KeyError('{} is not a register of channel {}'.format(name, self._channel))
+        return record
+
+    def get_many(self, names: list, cmd_delay: float = None):
+        r"""
+        Gets many registers of this channel, in as few round trips as the firmware allows, see Board.get_many.
+
+        Parameters
+        ----------
+        names : list of str
+            'System.register' names, e.g. 'StaticInput.xy'.
+        cmd_delay : float
+            Additional time in seconds to wait for each response.
+
+        Returns
+        -----
+        dict
+            {name: value}, None for the registers the firmware did not answer.
+
+        Examples
+        --------
+        >>> board.Mirror.Channel_0.get_many(['StaticInput.xy', 'OFPID.kp'])
+        {'StaticInput.xy': 0.25, 'OFPID.kp': 0.1}
+
+        """
+        names = list(names)
+        values = self._board.get_many([self._register_record(name) for name in names], cmd_delay=cmd_delay)
+        return dict(zip(names, values))
+
+    def set_many(self, values: dict, cmd_delay: float = None):
+        r"""
+        Sets many registers of this channel, in as few round trips as the firmware allows, see Board.set_many.
+
+        Parameters
+        ----------
+        values : dict
+            {'System.register': value}, e.g. {'StaticInput.xy': 0.25}.
+        cmd_delay : float
+            Additional time in seconds to wait for each response.
+
+        Returns
+        -----
+        bool
+            Whether every register was acknowledged by the firmware.
+
+        """
+        return self._board.set_many([(self._register_record(name), value) for name, value in values.items()],
+                                    cmd_delay=cmd_delay)
+
     def initialize_channel(self):
         self.__init__(self._board, self._channel)
 
@@ -197,7 +197,7 @@ registers table 1:
         if self._board is not None:
             if isinstance(register_name_or_id, int):
                 register_list = get_registers(self.__class__, self._channel)
-                register_name_or_id = [item[0] for item in register_list if
+                register_name_or_id = [item[0] for item in register_list.items() if
                                        item[1]['id'] & 0x000f == register_name_or_id][0]
             response = self._board.set_value(self.__dict__[register_name_or_id], value)
             if isinstance(value, list):
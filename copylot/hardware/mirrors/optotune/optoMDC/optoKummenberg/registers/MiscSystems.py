@@ -463,9 +463,8 @@ System ID: 0x26
 
 
     def SetPattern(self, index, vector):
-        for i in range(0, len(vector), CHUNK_SIZE):
-            aux = vector[i:i + CHUNK_SIZE]
-            self.SetPatternSegment(i + index, aux)
+        # the segments are pipelined, a pattern of thousands of samples is a single round trip
+        return self._board.set_vector_segments(self.vector, index, vector, chunk_size=CHUNK_SIZE)
 
     def GetPattern(self, index, count):
         vec = []
@@ -475,7 +474,7 @@ System ID: 0x26
         iters = count // CHUNK_SIZE
         remainder = count % CHUNK_SIZE
         for i in range(iters):
-            aux = self.GetPatternSegment(i * CHUNK_SIZE, CHUNK_SIZE)
+            aux = self.GetPatternSegment(index + i * CHUNK_SIZE, CHUNK_SIZE)
             vec.extend(aux)
         if remainder:
             aux = self.GetPatternSegment(index + count - remainder, remainder)
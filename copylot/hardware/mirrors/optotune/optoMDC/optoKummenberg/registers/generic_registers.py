@@ -50,9 +50,8 @@ For a complete list of Systems, call one of the helper methods from registers mo
 
 """
 # other
-import inspect
-import sys
 from ..tools.definitions import CHANNEL_CNT
+from ..tools.register_catalog import RegisterCatalog
 from ..tools.systems_registers_tools import get_registers
 # input stage
 from .InputStage import *
@@ -68,26 +67,13 @@ from .OutputStage import *
 from .MiscSystems import *
 
 
+# register records of the systems of this module, built on first use
+_catalog = RegisterCatalog(__name__, CHANNEL_CNT)
+
+
 def help():
     print(__doc__)
 
 
 def systems():
-    all_systems = inspect.getmembers(sys.modules[__name__], inspect.isclass)
-    all_systems = list(zip(*all_systems))[1]
-    sys_dict = {}
-    for system in all_systems:
-        try:
-            for i in range(CHANNEL_CNT):
-                sys_obj = system(channel=i)
-                sys_id = sys_obj.sys_id
-                reg_dict = dict(sys_obj.register_list)
-                sys_dict.update({sys_id: {'name': sys_obj.name, 'registers': reg_dict}})
-        except TypeError:
-            # not a system
-            pass
-        except AttributeError:
-            # abstract system, do not add to list
-            pass
-    return sys_dict
-    # return [system for system in all_systems if system()._is_a_system]
+    return _catalog.systems()
@@ -2,9 +2,8 @@ import struct
 import time
 import serial
 from ..tools.parsing_tools import parse_error, encode, decode
-from ..tools.definitions import (CMD_DELAY, ENDIAN, FRAME_BOUNDARY,
-                                 SimpleResponses, commandID, commandName,
-                                 WaveformShape, UnitType)
+from ..tools.definitions import (ENDIAN, SimpleResponses, commandID, commandName,
+                                 WaveformShape, UnitType, MAX_COMMANDS_IN_FLIGHT)
 from ..tools.systems_registers_tools import process_registers
 import numpy as np
 
@@ -14,6 +13,8 @@ def issue_command(board, command_bytes, cmd_delay: float = None):
     Issues given command_bytes over _board connection. Will attempt 3 times.
 
     This method unlocks the comm_lock, sends the desired data, receives a response, then reapplies the lock.
+    The response is read as soon as it arrives: until the closing frame boundary in pro mode, until the end of the
+    line in simple mode.
 
     Parameters
     ----------
@@ -21,6 +22,9 @@ def issue_command(board, command_bytes, cmd_delay: float = None):
         The board to issue a command over.
     command_bytes : bytes or int or str
         The byte array to send over the connection.
+    cmd_delay : float, optional
+        Additional time in seconds to wait for the response, on top of the connection timeout, for commands the
+        firmware takes long to process.
 
     Returns
     -------
@@ -34,39 +38,16 @@ def issue_command(board, command_bytes, cmd_delay: float = None):
     See Also
     --------
     Command bytes must be properly encoded, see registers encode function.
+    issue_commands : pipelines several pro-mode commands.
 
     """
     board.Connection._comm_lock = False
     number_of_attempts = 0
     response = b''
 
-    if cmd_delay is None:
-        cmd_delay = CMD_DELAY
-
     while response == b'' and number_of_attempts < 3:
         try:
-            # clear output buffer
-            temp = board.Connection.verbose
-            board.Connection.verbose = False
-            junk = board.Connection.receive()
-            board.Connection.verbose = temp
-            if junk != b'':
-                response = junk
-                break
-            if board.Connection.verbose and junk != b'':
-                print('Output Buffer Cleared. [data={}]'.format(junk))
-
-            # call and respond
-            board.Connection.send(command_bytes)
-            time.sleep(cmd_delay)
-            if not hasattr(board, '_simple'):
-                reponse = board.Connection.receive()
-            else:
-                if board._simple:
-                    response = board.Connection.receive(terminator='\n')
-                elif not board._simple:
-                    response = board.Connection.receive(terminator=bytes([FRAME_BOUNDARY]))
-            board.Connection._serial_conn.flush()
+            response = _exchange(board, [command_bytes], cmd_delay)[0]
             number_of_attempts += 1
             break
 
@@ -94,6 +75,78 @@ def issue_command(board, command_bytes, cmd_delay: float = None):
     return response
 
 
+def issue_commands(board, commands, cmd_delay: float = None, window: int = MAX_COMMANDS_IN_FLIGHT):
+    r"""
+    Pipelines pro-mode commands: writes up to window commands at once, then reads their responses in order.
+
+    The firmware processes the commands while the previous responses travel back, so the round trip latency is paid
+    once per window instead of once per command. The board has no flow control, so at most window commands are
+    sent ahead of the responses read, which bounds the bytes waiting in its receive buffer. The next commands are
+    written each time half of the window was answered.
+
+    Parameters
+    ----------
+    board : Board
+        The board to issue the commands over.
+    commands : list of bytes
+        Encoded pro-mode commands, see encode.
+    cmd_delay : float, optional
+        Additional time in seconds to wait for each response, on top of the connection timeout.
+    window : int, optional
+        Maximum number of commands without a response read, see MAX_COMMANDS_IN_FLIGHT.
+
+    Returns
+    -------
+    list of bytes
+        Firmware response of each command, b'' for the responses missing at the deadline.
+
+    Examples
+    --------
+    >>> responses = issue_commands(board, [encode(0x11, 0x5000), encode(0x11, 0x5001)])
+    """
+    board.Connection._comm_lock = False
+    try:
+        return _exchange(board, list(commands), cmd_delay, window)
+    finally:
+        board.Connection._comm_lock = True
+
+
+def _exchange(board, commands, cmd_delay=None, window=MAX_COMMANDS_IN_FLIGHT):
+    """Send commands at most window ahead of their responses and read one response per command"""
+    connection = board.Connection
+    # responses that arrived after a previous timeout would be mismatched
+    junk = connection.discard_input()
+    if connection.verbose and junk != b'':
+        print('Output Buffer Cleared. [data={}]'.format(junk))
+
+    sent = [0.0] * len(commands)
+
+    def send(start, stop):
+        connection.send(b''.join(commands[start:stop]))
+        sent[start:stop] = [time.perf_counter()] * (stop - start)
+        return stop
+
+    nb_sent = send(0, min(window, len(commands)))
+    timeout = connection._timeout
+    if cmd_delay and timeout is not None:
+        timeout += cmd_delay
+
+    simple = getattr(board, '_simple', False)
+    responses = []
+    for index, command_bytes in enumerate(commands):
+        if simple:
+            response = connection.receive(terminator=b'\n')
+        else:
+            response = connection.receive_frame(timeout)
+        if response:
+            connection.latency.record(command_bytes, time.perf_counter() - sent[index])
+        responses.append(response)
+        # refill the window once half of it was answered
+        if nb_sent < len(commands) and nb_sent - (index + 1) <= window // 2:
+            nb_sent = send(nb_sent, min(index + 1 + window, len(commands)))
+    return responses
+
+
 def attempt_reconnect(board):
     r"""
     Will attempt to reconnect to board. Will attempt 3 times.
@@ -9,6 +9,10 @@ MAX_CHANNEL_CNT = 8
 SIGNAL_FLOW_STAGE_CNT = 5
 CMD_DELAY = 0.001
 CHUNK_SIZE = 10
+# pro-mode commands sent ahead of their responses, about 1 kB of frames in the receive buffer of the board
+MAX_COMMANDS_IN_FLIGHT = 16
+# registers per multiple command, a set multiple command of 8 registers fills MAX_PAYLOAD_SIZE
+MULTIPLE_CNT = 8
 ESCAPE_BYTE = 0x7D
 FRAME_BOUNDARY = 0x7E
 ESCAPE_MASK = 1 << 5
@@ -0,0 +1,320 @@
+r"""
+Table-driven framing codec of the Kummenberg serial protocol.
+
+Frames follow the format below, every byte between the frame boundaries that equals FRAME_BOUNDARY (0x7e) or
+ESCAPE_BYTE (0x7d) is replaced by ESCAPE_BYTE followed by the byte XOR'd with ESCAPE_MASK (0x20).
+
++----------+---------------------+---------+-----------+------------+---------------+----------+
+| Frame    | Reserved            | Command | Data size | Data       | CRC           | Frame    |
+| Boundary | slave address: 0x00 |         |           | payload    | if applicable | Boundary |
++==========+=====================+=========+===========+============+===============+==========+
+| 1 byte   | 1 byte              | 1 byte  | 1 byte    | 0-50 bytes | 2 bytes       | 1 byte   |
++----------+---------------------+---------+-----------+------------+---------------+----------+
+
+All struct layouts are compiled once, stuffing and de-stuffing run as C level ``bytes`` operations (replace, split,
+translate) instead of Python loops over every byte, and frames without bytes to escape are not copied again.
+``FrameBuffer`` encodes several commands back to back into one preallocated ``bytearray``, and whole sequences of set
+multiple values commands at once with numpy.
+"""
+import logging
+import struct
+from functools import lru_cache
+
+import numpy as np
+
+from ..tools.definitions import ENDIAN, FRAME_BOUNDARY, ESCAPE_BYTE, ESCAPE_MASK, CommandID
+
+logger = logging.getLogger(__name__)
+
+_BOUNDARY = bytes([FRAME_BOUNDARY])
+_ESCAPE = bytes([ESCAPE_BYTE])
+_ESCAPED_BOUNDARY = bytes([ESCAPE_BYTE, FRAME_BOUNDARY ^ ESCAPE_MASK])
+_ESCAPED_ESCAPE = bytes([ESCAPE_BYTE, ESCAPE_BYTE ^ ESCAPE_MASK])
+# XOR of every byte with ESCAPE_MASK, restores the first byte after an escape byte
+_UNMASK_TABLE = bytes(b ^ ESCAPE_MASK for b in range(256))
+
+_HEADER = struct.Struct(ENDIAN + "BBBB")  # frame boundary, slave address, command, data size
+_COMMAND_HEADER = struct.Struct(ENDIAN + "BBB")  # slave address, command, data size
+_CRC = struct.pack(ENDIAN + "H", 0x00)  # the CRC is not used
+_U8 = struct.Struct(ENDIAN + "B")
+_U16 = struct.Struct(ENDIAN + "H")
+_REGISTER_INT = struct.Struct(ENDIAN + "Hi")
+_REGISTER_FLOAT = struct.Struct(ENDIAN + "Hf")
+_VECTOR_GET = struct.Struct(ENDIAN + "HHB")  # register id, vector index, length
+
+HEADER_SIZE = _HEADER.size
+
+
+@lru_cache(maxsize=256)
+def _struct(fmt: str) -> struct.Struct:
+    """Compiled struct of a format, for the layouts depending on the number of registers"""
+    return struct.Struct(ENDIAN + fmt)
+
+
+@lru_cache(maxsize=256)
+def _multiple_layout(nb_registers: int, value_types: tuple) -> struct.Struct:
+    """Compiled struct of a set multiple values payload given the types of the values"""
+    return _struct("H%dH%s" % (nb_registers, _value_format(value_types)))
+
+
+@lru_cache(maxsize=256)
+def _set_multiple_frame_layout(nb_registers: int, value_types: tuple) -> struct.Struct:
+    """Compiled struct of a set multiple values frame, from the opening frame boundary to the CRC"""
+    return _struct("BBBBH%dH%sH" % (nb_registers, _value_format(value_types)))
+
+
+def _value_format(value_types) -> str:
+    """struct format of values, int32 for int and float32 for float, other types are skipped"""
+    return ''.join('f' if issubclass(t, float) else 'i' if issubclass(t, int) else '' for t in value_types)
+
+
+def stuff(body: bytes) -> bytes:
+    """Escape frame boundary and escape bytes of the bytes between the frame boundaries"""
+    if ESCAPE_BYTE in body:
+        body = body.replace(_ESCAPE, _ESCAPED_ESCAPE)
+    if FRAME_BOUNDARY in body:
+        body = body.replace(_BOUNDARY, _ESCAPED_BOUNDARY)
+    return bytes(body)
+
+
+def destuff(body: bytes) -> bytes:
+    """Restore the escaped bytes of the bytes between the frame boundaries"""
+    body = bytes(body)
+    if ESCAPE_BYTE not in body:
+        return body
+    nb_escaped = body.count(_ESCAPED_BOUNDARY) + body.count(_ESCAPED_ESCAPE)
+    if body.count(_ESCAPE) == nb_escaped:
+        # only frame boundary and escape bytes are escaped, as the boards do
+        return body.replace(_ESCAPED_BOUNDARY, _BOUNDARY).replace(_ESCAPED_ESCAPE, _ESCAPE)
+    # the byte following each escape byte was XOR'd with the mask
+    parts = body.split(_ESCAPE)
+    return parts[0] + b''.join(part[:1].translate(_UNMASK_TABLE) + part[1:] for part in parts[1:])
+
+
+def payload(command_id, register_id, data=None):
+    """
+    Unstuffed payload of a command, see ``encode`` for the parameters.
+
+    Returns
+    -------
+    body: bytes
+    size: int
+        Value of the data size byte, it accounts for 4 bytes per value of a set multiple values command.
+    """
+    if isinstance(register_id, list):  # Used for multiple values commands
+        nb_registers = len(register_id)
+        if data is None:  # get values command
+            return _struct("H%dH" % nb_registers).pack(nb_registers, *register_id), 2 + 2 * nb_registers
+        layout = _multiple_layout(nb_registers, tuple(map(type, data)))
+        size = 2 + 2 * nb_registers + 4 * len(data)
+        if layout.size != size:  # values of other types are skipped
+            data = [v for v in data if isinstance(v, (int, float))]
+        return layout.pack(nb_registers, *register_id, *data), size
+
+    if data is not None:
+        if isinstance(data, float):  # Used for set value, when value is float
+            body = _REGISTER_FLOAT.pack(register_id, data)
+        elif isinstance(data, int):  # Used for set value, when value is int
+            body = _REGISTER_INT.pack(register_id, data)
+        elif isinstance(data, list) and len(data) == 2:  # Used for get Vector, vector index and length
+            body = _VECTOR_GET.pack(register_id, data[0], data[1])
+        else:
+            raise ValueError("Cannot encode data {} of type {}".format(data, type(data)))
+    elif command_id in (CommandID.LOAD_CONFIG, CommandID.STORE_CONFIG):
+        body = _U8.pack(register_id)  # Payload contains 1 byte config ID
+    else:
+        body = _U16.pack(register_id)  # Payload contains only registers ID
+    return body, len(body)
+
+
+def frame(command_id, body, size=None) -> bytes:
+    """Stuffed frame of a command given its unstuffed payload, size defaults to the payload length"""
+    body = stuff(_COMMAND_HEADER.pack(0x00, command_id, len(body) if size is None else size) + body + _CRC)
+    return _BOUNDARY + body + _BOUNDARY
+
+
+def encode(command_id, register_id, data=None):
+    r"""
+    Given command_id, register_id and payload, will determine proper bytestring to transmit.
+
+    Parameters
+    ----------
+    command_id
+        Identifier corresponding to command
+    register_id
+        Identifier corresponding to register. See register['id'] field. A list of identifiers for multiple
+        values commands.
+    data
+        Float or int, depending on the type of register. A list of values for a set multiple values command,
+        [vector index, length] for a get vector command.
+
+    Returns
+    -------
+    b_message: bytes
+        Stuffed and escaped bytestring, following the protocol described in the module docstring.
+    """
+    return frame(command_id, *payload(command_id, register_id, data))
+
+
+def decode(data: bytes):
+    r"""
+    Given bytestring, will unpack/destuff values, following stuffing method described in the module docstring.
+
+    Parameters
+    ----------
+    data : bytes
+        Frame received, including the frame boundaries.
+
+    Returns
+    -------
+    result: bytes
+        Destuffed bytestring, without the frame boundaries. None if the frame is invalid.
+    """
+    try:
+        if len(data) < 2 or data[0] != FRAME_BOUNDARY or data[-1] != FRAME_BOUNDARY:
+            logger.warning('Byte De-stuffing Cannot Be Performed. [data=%r]', data)
+            return None
+        body = bytes(data[1:-1])
+    except TypeError:
+        logger.warning('Byte De-stuffing Cannot Be Performed. [data=%r]', data)
+        return None
+
+    if FRAME_BOUNDARY in body:
+        logger.error('Duplicate Frame Returned. System Reboot Required. [data=%r]', data)
+        return None
+    return destuff(body)
+
+
+class FrameBuffer:
+    """
+    Encodes several commands back to back into one preallocated bytearray, to send them in a single write.
+
+    The frames are packed in place, only the frames containing bytes to escape are copied to be stuffed.
+
+    Parameters
+    ----------
+    size : int
+        Capacity in bytes, it grows if needed.
+
+    Examples
+    --------
+    >>> frames = FrameBuffer()
+    >>> frames.append_set_multiple([0x5000, 0x5001], [0.1, 0.2])
+    >>> frames.append(CommandID.GET_MULTIPLE, [0x5000, 0x5001])
+    >>> connection.write(frames.view())
+    """
+
+    def __init__(self, size: int = 1024):
+        self._buffer = bytearray(size)
+        self._length = 0
+        self.nb_frames = 0
+
+    def __len__(self):
+        return self._length
+
+    def clear(self):
+        """Forget the encoded frames, the memory is reused"""
+        self._length = 0
+        self.nb_frames = 0
+
+    def view(self) -> memoryview:
+        """Encoded frames, valid until the buffer is modified"""
+        return memoryview(self._buffer)[:self._length]
+
+    def _reserve(self, nb_bytes):
+        """Make room for a frame before stuffing"""
+        if self._length + nb_bytes > len(self._buffer):
+            self._buffer.extend(bytes(max(nb_bytes, len(self._buffer))))
+
+    def _close_frame(self, end):
+        """Stuff the frame packed up to end, the CRC included, if needed and write the closing frame boundary"""
+        buffer, start = self._buffer, self._length + 1
+        if buffer.find(ESCAPE_BYTE, start, end) != -1 or buffer.find(FRAME_BOUNDARY, start, end) != -1:
+            body = stuff(bytes(buffer[start:end]))
+            buffer[start:end] = body  # the buffer is resized
+            end = start + len(body)
+        buffer[end] = FRAME_BOUNDARY
+        self._length = end + 1
+        self.nb_frames += 1
+
+    def append(self, command_id, register_id, data=None):
+        """Append a command, same parameters as ``encode``"""
+        body, size = payload(command_id, register_id, data)
+        self._reserve(HEADER_SIZE + len(body) + len(_CRC) + 1)
+        start = self._length
+        _HEADER.pack_into(self._buffer, start, FRAME_BOUNDARY, 0x00, command_id, size)
+        end = start + HEADER_SIZE + len(body)
+        self._buffer[start + HEADER_SIZE:end] = body
+        self._buffer[end:end + len(_CRC)] = _CRC
+        self._close_frame(end + len(_CRC))
+
+    def append_set_multiple(self, register_ids, values):
+        """
+        Append a set multiple values command, packing the header, the values and the CRC with a single struct.
+
+        Parameters
+        ----------
+        register_ids : Sequence[int]
+        values : Sequence[float or int]
+            float32 for floats and int32 for ints.
+        """
+        nb_registers = len(register_ids)
+        layout = _set_multiple_frame_layout(nb_registers, tuple(map(type, values)))
+        self._reserve(layout.size + 1)
+        start = self._length
+        layout.pack_into(self._buffer, start, FRAME_BOUNDARY, 0x00, CommandID.SET_MULTIPLE,
+                         2 + 2 * nb_registers + 4 * len(values), nb_registers, *register_ids, *values, 0x00)
+        self._close_frame(start + layout.size)
+
+    def extend_set_multiple(self, register_ids, values, value_type=float):
+        """
+        Append one set multiple values command per row of values, packing all the frames with numpy.
+
+        Parameters
+        ----------
+        register_ids : Sequence[int]
+        values : array_like
+            Values of shape (nb_frames, len(register_ids)).
+        value_type : type
+            float for float32 values, int for int32 values.
+        """
+        frames = _set_multiple_frames(register_ids, values, value_type)
+        raw = frames.view(np.uint8).reshape(len(frames), -1)
+        inner = raw[:, 1:-1]
+        to_stuff = np.flatnonzero(((inner == ESCAPE_BYTE) | (inner == FRAME_BOUNDARY)).any(axis=1))
+        if len(to_stuff):
+            pieces, previous = [], 0
+            for index in to_stuff:
+                pieces.append(raw[previous:index].tobytes())
+                pieces.append(_BOUNDARY + stuff(raw[index, 1:-1].tobytes()) + _BOUNDARY)
+                previous = index + 1
+            pieces.append(raw[previous:].tobytes())
+            data = b''.join(pieces)
+        else:
+            data = raw.tobytes()
+        self._reserve(len(data))
+        self._buffer[self._length:self._length + len(data)] = data
+        self._length += len(data)
+        self.nb_frames += len(frames)
+
+
+def _set_multiple_frames(register_ids, values, value_type=float) -> np.ndarray:
+    """Unstuffed set multiple values frames, one per row of values, as a structured array"""
+    nb_registers = len(register_ids)
+    values = np.asarray(values).reshape(-1, nb_registers)
+    dtype = np.dtype([
+        ('boundary', 'u1'), ('address', 'u1'), ('command', 'u1'), ('size', 'u1'), ('count', ENDIAN + 'u2'),
+        ('registers', ENDIAN + 'u2', (nb_registers,)),
+        ('values', ENDIAN + ('f4' if value_type is float else 'i4'), (nb_registers,)),
+        ('crc', ENDIAN + 'u2'), ('end', 'u1'),
+    ])
+    frames = np.empty(len(values), dtype)
+    frames['boundary'] = frames['end'] = FRAME_BOUNDARY
+    frames['address'] = 0x00
+    frames['command'] = CommandID.SET_MULTIPLE
+    frames['size'] = 2 + 6 * nb_registers
+    frames['count'] = nb_registers
+    frames['registers'] = register_ids
+    frames['values'] = values
+    frames['crc'] = 0x00
+    return frames
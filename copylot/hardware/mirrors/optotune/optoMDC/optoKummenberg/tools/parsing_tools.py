@@ -1,5 +1,8 @@
 import struct
-from ..tools.definitions import ENDIAN, FRAME_BOUNDARY, ESCAPE_BYTE, ESCAPE_MASK, CommandID
+from ..tools.definitions import ENDIAN, CommandID
+from .framing import encode, decode, frame
+
+_VECTOR_HEADER = struct.Struct(ENDIAN + "HHB")  # register id, vector index, length
 
 
 def parse_error_flags(error_flag_data: int):
@@ -100,94 +103,6 @@ def parse_error(error_code: int):
         return code
 
 
-def encode(command_id, register_id, data=None):
-    r"""
-    Given command_id, register_id and payload, will determine proper bytestring to transmit.
-    Uses the following format:
-
-    +----------+---------------------+---------+-----------+------------+---------------+----------+
-    | Frame    | Reserved            | Command | Data size | Data       | CRC           | Frame    |
-    | Boundary | slave address: 0x00 |         |           | payload    | if applicable | Boundary |
-    +==========+=====================+=========+===========+============+===============+==========+
-    | 1 byte   | 1 byte              | 1 byte  | 1 byte    | 0-50 bytes | 2 bytes       | 1 byte   |
-    +----------+---------------------+---------+-----------+------------+---------------+----------+
-
-    Parameters
-    ----------
-    command_id
-        Identifier corresponding to command
-    register_id
-        Identifier corresponding to register. See register['id'] field.
-    data
-        Float or int or bytes, depending on the type of register
-
-    Raises
-    ------
-    none
-
-    Returns
-    -------
-    b_message: bytearray
-        Stuffed and escaped bytestring, following protocol above.
-
-    Notes
-    -----
-    Given a FRAME_BOUNDARY of 0x7e and ESCAPE_BYTE of 0x7d, every appearance of the bytes 0x7e or 0x7d in the data
-    (so in a role other than the delimiter or the escape byte)  is replaced by the sequence 0x7d 0x5e or 0x7d 0x5d,
-    respectively. This follows ESCAPE_MASK = 1 << 5, or 0x20, thus the byte is XOR'd with the mask and prepended by 0x7d
-    """
-    b_header = b''
-    b_message = b''
-    b_delimiter = struct.pack(">B", 0x7E)
-    b_slave_address = struct.pack(">B", 0x00)
-    b_crc = struct.pack(">H", 0x00)
-    b_cocommand_id = struct.pack(">B", command_id)
-    if isinstance(register_id, list):  # Used for multiple values commands
-        b_register_id = struct.pack(">H", len(register_id))
-        for x in register_id:
-            b_register_id += struct.pack(">H", x)
-        if data is None:  # get values command
-            size = 2 + 2 * len(register_id)
-            b_header = b_slave_address + b_cocommand_id + struct.pack(">B", size)
-            b_message = b_delimiter + b_header + b_register_id + b_crc + b_delimiter
-        else:  # set values command
-            size = 2 + 2 * len(register_id) + 4 * len(data)
-            b_header = b_slave_address + b_cocommand_id + struct.pack(">B", size)
-            b_data = b''
-            for v in data:
-                if isinstance(v, float):
-                    b_data += struct.pack(">f", v)
-                elif isinstance(v, int):
-                    b_data += struct.pack(">i", v)
-            b_message = b_delimiter + b_header + b_register_id + b_data + b_crc + b_delimiter
-    else:  # Used for set get value and vector
-        b_register_id = struct.pack(">H", register_id)
-        if data is not None:
-            if isinstance(data, float):  # Used for set value, when value is float
-                b_data = struct.pack(">f", data)
-                b_header = b_slave_address + b_cocommand_id + struct.pack(">B", 0x06)
-            elif isinstance(data, int):  # Used for set value, when value is float
-                b_data = struct.pack(">i", data)
-                b_header = b_slave_address + b_cocommand_id + struct.pack(">B", 0x06)
-            elif isinstance(data, list):  # Used for get Vector
-                if len(data) == 2:
-                    b_data = struct.pack(">H", data[0]) + struct.pack(">B", data[1])  # Pack vector index and length
-                    b_header = b_slave_address + b_cocommand_id + struct.pack(">B", 0x05)
-            b_message = b_delimiter + b_header + b_register_id + b_data + b_crc + b_delimiter
-        else:
-            if command_id == 0x04 or command_id == 0x05:
-                b_header = b_slave_address + b_cocommand_id + struct.pack(">B", 0x01)  # Payload contains 1 byte config ID
-                b_message = b_delimiter + b_header + struct.pack(">B", register_id) + b_crc + b_delimiter
-            else:
-                b_header = b_slave_address + b_cocommand_id + struct.pack(">B", 0x02)  # Payload contains only registers ID
-                b_message = b_delimiter + b_header + b_register_id + b_crc + b_delimiter
-    b_message = b_message.replace(b'}', b'}]')
-    b_message = b_message[1:-1].replace(b'~', b'}^')
-    b_message = b'~' + b_message + b'~'
-
-    return b_message
-
-
 def encode_vector(register, index, vector):
     """
     Encodes the given register vector to bytes.
@@ -213,99 +128,30 @@ def encode_vector(register, index, vector):
     """
     cmd_id = CommandID.SET_VECTOR
     index = index * 4
-    bstr = bytes([])
-
     if type(register) is int:
         # generic packing, vals must already be in correct format for transmission
         vals = struct.pack(ENDIAN + "f" * len(vector), *vector)
-        data = struct.pack(ENDIAN + "HHB", register, index, len(vals)) + vals
+        data = _VECTOR_HEADER.pack(register, index, len(vals)) + vals
     else:
         if register['type'] is int:
             # common, int32 values
             vals = struct.pack(ENDIAN + "i" * len(vector), *vector)
-            data = struct.pack(ENDIAN + "HHB", register['id'], index, len(vals)) + vals
+            data = _VECTOR_HEADER.pack(register['id'], index, len(vals)) + vals
         elif register['type'] is float:
             # common, float32 values
             vals = struct.pack(ENDIAN + "f" * len(vector), *vector)
-            data = struct.pack(ENDIAN + "HHB", register['id'], index, len(vals)) + vals
+            data = _VECTOR_HEADER.pack(register['id'], index, len(vals)) + vals
         elif register['type'] is bytes:
             # less common, generally for eeprom data
             vals = bytes(list(vector))
-            data = struct.pack(ENDIAN + "HHB", register['id'], index // 4, len(vals)) + vals
+            data = _VECTOR_HEADER.pack(register['id'], index // 4, len(vals)) + vals
         elif register['type'] is str:
             # uncommon, char values
             vals = struct.pack(ENDIAN + "c" * len(vector), *vector)
-            data = struct.pack(ENDIAN + "HHB", register['id'], index // 4, len(vals)) + vals
+            data = _VECTOR_HEADER.pack(register['id'], index // 4, len(vals)) + vals
         else:
-            # generic stuffing due to unknown register['type'] value
-            bstr = bytes([0, cmd_id, len(vector)] + list(vector))
-            bstr = bstr + bytes((0, 0))
-
-            def stuff(unstuffed):
-                result = [FRAME_BOUNDARY]
-                for b in unstuffed:
-                    if b in (ESCAPE_BYTE, FRAME_BOUNDARY):
-                        result.append(ESCAPE_BYTE)
-                        result.append(b ^ ESCAPE_MASK)
-                    else:
-                        result.append(b)
-                result.append(FRAME_BOUNDARY)
-                return bytes(result)
-            return stuff(bstr)
+            # generic packing due to unknown register['type'] value, the vector is the payload
+            return frame(cmd_id, bytes(list(vector)))
 
     # build packet frame and stuff bytes
-    bstr = bytes([FRAME_BOUNDARY, 0, cmd_id, len(data)] + list(data) + [0, 0, FRAME_BOUNDARY])
-    bstr = bstr.replace(bytes([ESCAPE_BYTE]), bytes([ESCAPE_BYTE, ESCAPE_BYTE ^ ESCAPE_MASK]))
-    bstr = bstr[1:-1].replace(bytes([FRAME_BOUNDARY]), bytes([ESCAPE_BYTE, FRAME_BOUNDARY ^ ESCAPE_MASK]))
-    bstr = b'~' + bstr + b'~'
-    return bstr
-
-
-def decode(data: bytes):
-    r"""
-    Given bytestring, will unpack/destuff values, following stuffing method described in Notes.
-
-    Parameters
-    ----------
-    command_id
-        Identifier corresponding to command
-    register_id
-        Identifier corresponding to register. See register['id'] field.
-
-    Raises
-    ------
-    none
-
-    Returns
-    -------
-    result: bytearray
-        Destuffed bytestring, following protocol above.
-
-    Notes
-    -----
-    Given a FRAME_BOUNDARY of 0x7e and ESCAPE_BYTE of 0x7d, every appearance of the bytes 0x7e or 0x7d in the data
-    (so in a role other than the delimiter or the escape byte)  is replaced by the sequence 0x7d 0x5e or 0x7d 0x5d,
-    respectively. This follows ESCAPE_MASK = 1 << 5, or 0x20, thus the byte is XOR'd with the mask and prepended by 0x7d
-    """
-    result = []
-    try:
-        if len(data) < 2 or data[0] != FRAME_BOUNDARY or data[-1] != FRAME_BOUNDARY:
-            print('Byte De-stuffing Cannot Be Performed. [data={}]'.format(data))
-            return None
-
-        i = 1
-        while i < (len(data) - 1):
-            if data[i] == ESCAPE_BYTE:
-                result.append(data[i + 1] ^ ESCAPE_MASK)
-                i += 2
-            else:
-                result.append(data[i])
-                i += 1
-    except TypeError or KeyError:
-        print('Byte De-stuffing Cannot Be Performed. [data={}]'.format(data))
-
-    if FRAME_BOUNDARY in data[1:-1]:
-        print("ERROR: Duplicate Frame Returned. System Reboot Required.")
-        return None
-    else:
-        return bytes(result)
+    return frame(cmd_id, data)
@@ -0,0 +1,133 @@
+import importlib
+import inspect
+
+from ..registers.ClassAbstracts import System
+
+
+class RegisterCatalog:
+    r"""
+    Register records of the systems defined in a registers module, built on first use.
+
+    Looking a register up by system, channel and register name, or by register id, is a dictionary access once the
+    catalog is built, instead of instantiating the system and inspecting its attributes on every lookup.
+
+    Parameters
+    ----------
+    module_name : str
+        Name of the registers module, e.g. optoKummenberg.registers.generic_registers. It is imported on first use.
+    channel_count : int
+        Number of channels of the board, the channels of systems() are 0 to channel_count - 1.
+
+    Notes
+    -----
+    The records are shared by every lookup, copy them before modifying them.
+
+    Examples
+    --------
+    >>> catalog = RegisterCatalog('optoMDC.registers.mre2_registers', 2)
+    >>> catalog.register('StaticInput', 'xy', channel=1)
+    {'id': 20738, 'type': <class 'float'>, 'unit': None, 'range': [-1, 1], 'default': 0.0, 'value': 0.0}
+    >>> catalog.find(20738)
+    ('StaticInput', 1, 'xy', {'id': 20738, ...})
+
+    """
+
+    def __init__(self, module_name: str, channel_count: int):
+        self.module_name = module_name
+        self.channel_count = channel_count
+        self._system_classes = None
+        self._registers = {}
+        self._systems = None
+        self._records_by_id = None
+
+    @property
+    def system_classes(self):
+        r"""
+        Returns
+        -------
+        dict
+            System classes by name, in alphabetical order, without the abstract systems of ClassAbstracts.
+        """
+        if self._system_classes is None:
+            module = importlib.import_module(self.module_name)
+            self._system_classes = {
+                name: cls for name, cls in sorted(vars(module).items())
+                if inspect.isclass(cls) and issubclass(cls, System) and cls.__module__ != System.__module__
+            }
+        return self._system_classes
+
+    def registers(self, system, channel: int = 0):
+        r"""
+        Register records of a system.
+
+        Parameters
+        ----------
+        system : str or type
+            System name or class.
+        channel : int
+
+        Returns
+        -------
+        dict
+            Register records by register name.
+        """
+        registers = self._registers.get((system, channel))
+        if registers is None:
+            system_class = self.system_classes[system] if isinstance(system, str) else system
+            try:
+                system_object = system_class(channel=channel)
+            except TypeError:
+                # board-level system
+                system_object = system_class()
+            registers = self._registers[(system, channel)] = dict(system_object.register_list)
+            self._registers[(system_class, channel)] = registers
+        return registers
+
+    def register(self, system, register_name: str, channel: int = 0):
+        """Register record of a system, see registers"""
+        return self.registers(system, channel)[register_name]
+
+    def systems(self):
+        r"""
+        Returns
+        -------
+        dict
+            {sys_id: {'name': system name, 'registers': register records by name}} for every channel of the board,
+            without the board-level systems. Systems sharing an id are listed under the last one in alphabetical order.
+        """
+        if self._systems is None:
+            self._systems = {}
+            self._records_by_id = {}
+            for name, system_class in self.system_classes.items():
+                for channel in range(self.channel_count):
+                    try:
+                        system_object = system_class(channel=channel)
+                    except TypeError:
+                        # board-level systems are not listed
+                        break
+                    registers = self._registers.setdefault((system_class, channel), dict(system_object.register_list))
+                    self._systems[system_object.sys_id] = {'name': name, 'registers': registers}
+                    for register_name, record in registers.items():
+                        if 'id' in record:  # other dict attributes, e.g. the ranges of the units
+                            self._records_by_id[record['id']] = (name, channel, register_name, record)
+        return self._systems
+
+    def find(self, register_id: int):
+        r"""
+        Parameters
+        ----------
+        register_id : int
+
+        Returns
+        -------
+        tuple
+            System name, channel, register name and register record of a register id.
+
+        Raises
+        ------
+        KeyError
+            The register id is not defined for the channels of the board, or is a register of a board-level system.
+        """
+        if self._records_by_id is None:
+            self.systems()
+        return self._records_by_id[register_id]
@@ -1,13 +1,7 @@
-import inspect
-import sys
+import numpy as np
 
-from copylot.hardware.mirrors.optotune.optoMDC.inflect import inflect
-from copylot.hardware.mirrors.optotune.optoMDC.optoKummenberg.registers.ClassAbstracts import System
-
-
-# import inflect
-# from ..registers.ClassAbstracts import System
-# from ...inflect import inflect
+from copylot.hardware.mirrors.optotune.optoMDC.optoKummenberg.tools.definitions import CHANNEL_CNT
+from copylot.hardware.mirrors.optotune.optoMDC.optoKummenberg.tools.register_catalog import RegisterCatalog
 
 
 # # Currently not configured, must pull all classes from registers module
@@ -16,49 +10,44 @@ from copylot.hardware.mirrors.optotune.optoMDC.optoKummenberg.registers.ClassAbs
 #     return [system[0] for system in all_systems if system[1]()._is_a_system]
 
 
+def _generic_catalog():
+    global _catalog
+    if _catalog is None:
+        registers_module = __package__.rpartition('.')[0] + '.registers.generic_registers'
+        _catalog = RegisterCatalog(registers_module, CHANNEL_CNT)
+    return _catalog
+
+
+_catalog = None
+
+
 def list_systems():
     """
-    Inspect generic_registers for all imported and defined Systems.
+    Lists the Systems imported and defined in generic_registers, without instantiating them.
     :return: list of System names
     """
-    all_systems = inspect.getmembers(sys.modules['optoKummenberg.registers.generic_registers'], inspect.isclass)
-    return [system[0] for system in all_systems if hasattr(system[1](0), '_is_a_system')]
+    return list(_generic_catalog().system_classes)
 
 
 def get_register(system_name: str, register_name, channel: int = 0):
     """
-    Given a System name and Register name, will return the associated register_id integer
+    Given a System name and Register name, will return the associated register record, see register_catalog
     :param system_name: str
     :param register_name: str
     :param channel: int
-    :return: int register_id
+    :return: dict register record
     """
-    registers = inspect.getmembers(sys.modules['optoKummenberg.registers.generic_registers'], inspect.isclass)
-    register_system = dict(registers)[system_name](channel)
-    register_list = inspect.getmembers(register_system)
-    register_id = dict(register_list)[register_name]
-    return register_id
+    return _generic_catalog().register(system_name, register_name, channel)
 
 
 def get_registers(system_name: str, channel: int = 0):
     """
-    Returns list of tuples containing registers name and dictionary.
-    :param system_name:
+    Returns dictionary of registers name and record, see register_catalog
+    :param system_name: System name or class
     :param channel:
     :return:
     """
-    if inspect.isclass(system_name):
-        if issubclass(system_name, System):
-            system_object = system_name()
-    else:
-        all_systems = inspect.getmembers(sys.modules['optoKummenberg.registers.generic_registers'], inspect.isclass)
-        system_object = dict(all_systems)[system_name](channel)
-
-    attributes = inspect.getmembers(system_object, lambda a: not (inspect.isroutine(a)))
-    register_list = [item for item in attributes if type(item[1]) is dict
-                     and not (item[0].startswith('__') and item[0].endswith('__'))]
-
-    return dict(register_list)
+    return _generic_catalog().registers(system_name, channel)
 
 
 def process_registers(register_fields: dict, values):
@@ -110,6 +99,8 @@ def process_registers(register_fields: dict, values):
                 pass
             elif not is_valid_value(register_fields[i], values[i]):
                 # invalid value sent!
+                # inflect is large, it is only imported to report errors
+                from copylot.hardware.mirrors.optotune.optoMDC.inflect import inflect
                 invalid_number = inflect.engine().ordinal(i + 1)
                 print('Invalid value for {} given registers'.format(invalid_number))
                 valid_range = register_fields[i]['range']
@@ -192,7 +183,11 @@ def is_valid_value(register_dict, value):
     Validation for requests to set values in the Signal Flow Manager are slightly different.
     The channel you are setting must match the channel in the flow manager.
     For example, it would not make sense to set the Input channel 0 to SPI channel 2, etc.
+
+    A numpy array of values is validated at once, it is valid when all of its values are.
     """
+    if isinstance(value, np.ndarray):
+        return _are_valid_values(register_dict, value)
     # TODO: Add list type for discrete ranges, specifically for SystemID range.
     try:
         value_type = type(value)
@@ -254,4 +249,30 @@ def is_valid_value(register_dict, value):
         return value in (True, False)
 
     if register_type is None:
-        return value_type is None
\ No newline at end of file
+        return value_type is None
+
+
+def _are_valid_values(register_dict, values: np.ndarray):
+    """Vectorized is_valid_value, for a numpy array of values"""
+    try:
+        register_type = register_dict['type']
+        register_range = register_dict['range']
+        is_flow_manager = register_dict['unit'] == 'SystemID'
+    except (KeyError, TypeError):
+        return False
+    if is_flow_manager or values.dtype.kind not in 'biuf':
+        return all(is_valid_value(register_dict, value.item()) for value in values.flat)
+
+    if type(register_range) is dict:
+        register_range = list(register_range.keys())
+    if values.dtype.kind == 'b':
+        return register_type in (int, bool)
+    if register_type is bool:
+        return bool(np.isin(values, (0, 1)).all())
+    if register_type is int and values.dtype.kind == 'f' and not np.all(np.mod(values, 1) == 0):
+        return False
+    if register_type in (int, float):
+        if register_range is None:
+            return True
+        return bool(np.all((register_range[0] <= values) & (values <= register_range[-1])))
+    return False
@@ -51,6 +51,7 @@ For a complete list of registers for a given system, call one of the helper meth
 
 """
 from ..optoKummenberg.registers.generic_registers import *
+from ..optoKummenberg.tools.register_catalog import RegisterCatalog
 from ..tools.definitions import MRE2_CHANNEL_CNT
 
 
@@ -706,21 +707,9 @@ System ID: 0x22
         return self.set_register('proxy_temp_threshold', value)
 
 
+# register records of the systems of this module, built on first use
+_catalog = RegisterCatalog(__name__, MRE2_CHANNEL_CNT)
+
+
 def systems():
-    all_systems = inspect.getmembers(sys.modules[__name__], inspect.isclass)
-    all_systems = list(zip(*all_systems))[1]
-    sys_dict = {}
-    for system in all_systems:
-        try:
-            for i in range(MRE2_CHANNEL_CNT):
-                sys_obj = system(channel=i)
-                sys_id = sys_obj.sys_id
-                reg_dict = dict(sys_obj.register_list)
-                sys_dict.update({sys_id: {'name': sys_obj.name, 'registers': reg_dict}})
-        except TypeError:
-            # not a system
-            pass
-        except AttributeError:
-            # abstract system, do not add to list
-            pass
-    return sys_dict
\ No newline at end of file
+    return _catalog.systems()
@@ -1,2 +0,0 @@
-from .tools.definitions import *
-from .registers import generic_registers as Registers
@@ -1 +1 @@
-from optoKummenberg.tools.command_tools import *
+from ..optoKummenberg.tools.command_tools import *
@@ -1 +1 @@
-from optoKummenberg.tools.parsing_tools import *
+from ..optoKummenberg.tools.parsing_tools import *
@@ -1,25 +1,33 @@
-from optoKummenberg.tools.systems_registers_tools import *
+from ..optoKummenberg.tools.systems_registers_tools import *
 
 
 def list_systems():
     """
-    Inspect generic_registers for all imported and defined Systems.
+    Lists the Systems imported and defined in mre2_registers, without instantiating them.
     :return: list of System names
     """
-    all_systems = inspect.getmembers(sys.modules['optoMDC.registers.xpr4_registers'], inspect.isclass)
-    return [system[0] for system in all_systems if hasattr(system[1](0), '_is_a_system')]
+    from ..registers.mre2_registers import _catalog
+    return list(_catalog.system_classes)
 
 
 def get_register(system_name: str, register_name, channel: int = 0):
     """
-    Given a System name and Register name, will return the associated register_id integer
+    Given a System name and Register name, will return the associated register record, see register_catalog
     :param system_name: str
     :param register_name: str
     :param channel: int
-    :return: int register_id
+    :return: dict register record
     """
-    registers = inspect.getmembers(sys.modules['optoMDC.registers.xpr4_registers'], inspect.isclass)
-    register_system = dict(registers)[system_name](channel)
-    register_list = inspect.getmembers(register_system)
-    register_id = dict(register_list)[register_name]
-    return register_id
\ No newline at end of file
+    from ..registers.mre2_registers import _catalog
+    return _catalog.register(system_name, register_name, channel)
+
+
+def get_registers(system_name: str, channel: int = 0):
+    """
+    Returns dictionary of registers name and record, see register_catalog
+    :param system_name: System name or class
+    :param channel:
+    :return:
+    """
+    from ..registers.mre2_registers import _catalog
+    return _catalog.registers(system_name, channel)
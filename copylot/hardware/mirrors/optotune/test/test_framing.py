@@ -0,0 +1,167 @@
+import logging
+import random
+import struct
+
+import pytest
+
+from copylot.hardware.mirrors.optotune.optoMDC.optoKummenberg.tools import framing
+from copylot.hardware.mirrors.optotune.optoMDC.optoKummenberg.tools.definitions import (
+    CommandID,
+)
+from copylot.hardware.mirrors.optotune.optoMDC.optoKummenberg.tools.parsing_tools import (
+    encode_vector,
+)
+
+# bytes 0x7d and 0x7e are over-represented to exercise the escaping
+SPECIAL_BYTES = [0x7D, 0x7E, 0x5D, 0x5E, 0x00, 0xFF]
+
+
+def random_bytes(rng, max_size=80):
+    return bytes(
+        rng.choice(SPECIAL_BYTES) if rng.random() < 0.3 else rng.randrange(256)
+        for _ in range(rng.randrange(max_size))
+    )
+
+
+def reference_stuff(body):
+    """Byte by byte stuffing of the former codec"""
+    result = []
+    for b in body:
+        if b in (framing.ESCAPE_BYTE, framing.FRAME_BOUNDARY):
+            result += [framing.ESCAPE_BYTE, b ^ framing.ESCAPE_MASK]
+        else:
+            result.append(b)
+    return bytes(result)
+
+
+def reference_destuff(body):
+    """Byte by byte de-stuffing of the former codec"""
+    result, i = [], 0
+    while i < len(body):
+        if body[i] == framing.ESCAPE_BYTE:
+            result.append(body[i + 1] ^ framing.ESCAPE_MASK)
+            i += 2
+        else:
+            result.append(body[i])
+            i += 1
+    return bytes(result)
+
+
+def test_stuff_round_trip():
+    rng = random.Random(0)
+    for _ in range(2000):
+        body = random_bytes(rng)
+        stuffed = framing.stuff(body)
+
+        assert stuffed == reference_stuff(body)
+        assert framing.FRAME_BOUNDARY not in stuffed
+        assert framing.destuff(stuffed) == body
+        assert reference_destuff(stuffed) == body
+
+
+def test_decode_round_trip():
+    rng = random.Random(1)
+    for _ in range(500):
+        command_id = rng.choice(
+            [CommandID.SET_MULTIPLE, CommandID.SET_VECTOR, 0x7D, 0x7E]
+        )
+        register_ids = [rng.randrange(0x10000) for _ in range(rng.randrange(1, 6))]
+        values = [rng.uniform(-1, 1) for _ in register_ids]
+
+        message = framing.encode(command_id, register_ids, values)
+        body = framing.decode(message)
+
+        assert message[0] == message[-1] == framing.FRAME_BOUNDARY
+        layout = ">BBBH%dH%df" % (len(register_ids), len(values))
+        nb_registers, *unpacked = struct.unpack(layout, body[:-2])[3:]
+        assert body[:3] == bytes([0x00, command_id, 2 + 6 * len(register_ids)])
+        assert nb_registers == len(register_ids)
+        assert unpacked[: len(register_ids)] == register_ids
+        assert unpacked[len(register_ids) :] == pytest.approx(values, abs=1e-6)
+
+
+@pytest.mark.parametrize(
+    "command_id, register_id, data, expected",
+    [
+        (CommandID.GET_VALUE, 0x5000, None, b'~\x00\x11\x02P\x00\x00\x00~'),
+        (CommandID.SET_VALUE, 0x7E7D, 1, b'~\x00\x10\x06}^}]\x00\x00\x00\x01\x00\x00~'),
+        (CommandID.SET_VALUE, 0x5000, 0.5, b'~\x00\x10\x06P\x00?\x00\x00\x00\x00\x00~'),
+        (
+            CommandID.GET_VECTOR,
+            0x5000,
+            [3, 4],
+            b'~\x00\x15\x05P\x00\x00\x03\x04\x00\x00~',
+        ),
+        (CommandID.LOAD_CONFIG, 2, None, b'~\x00\x04\x01\x02\x00\x00~'),
+        (
+            CommandID.GET_MULTIPLE,
+            [0x5000, 0x7D00],
+            None,
+            b'~\x00\x13\x06\x00\x02P\x00}]\x00\x00\x00~',
+        ),
+        (
+            CommandID.SET_MULTIPLE,
+            [0x5000],
+            [1],
+            b'~\x00\x12\x08\x00\x01P\x00\x00\x00\x00\x01\x00\x00~',
+        ),
+    ],
+)
+def test_encode_known_frames(command_id, register_id, data, expected):
+    assert framing.encode(command_id, register_id, data) == expected
+
+
+def test_encode_vector_escapes_values():
+    message = encode_vector(0x5000, 0, [struct.unpack('>f', b'~}~}')[0]])
+
+    assert message == b'~\x00\x14\x09P\x00\x00\x00\x04}^}]}^}]\x00\x00~'
+
+
+@pytest.mark.parametrize(
+    "data", [b'', b'~', b'\x00\x11~', b'~\x00~\x11~', '~abc~', None]
+)
+def test_decode_invalid_frames(data, caplog):
+    assert framing.decode(data) is None
+    assert [record.name for record in caplog.records] == [framing.__name__]
+    assert caplog.records[0].levelno >= logging.WARNING
+
+
+def test_frame_buffer_matches_encode():
+    rng = random.Random(2)
+    frames = framing.FrameBuffer(size=16)
+    expected = b''
+    for _ in range(50):
+        register_ids = [rng.randrange(0x10000) for _ in range(rng.randrange(1, 6))]
+        values = [rng.uniform(-1, 1) for _ in register_ids]
+        frames.append_set_multiple(register_ids, values)
+        frames.append(CommandID.GET_MULTIPLE, register_ids)
+        expected += framing.encode(CommandID.SET_MULTIPLE, register_ids, values)
+        expected += framing.encode(CommandID.GET_MULTIPLE, register_ids)
+
+    assert frames.nb_frames == 100
+    assert frames.view() == expected
+
+    frames.clear()
+    frames.append(CommandID.GET_VALUE, 0x5000)
+    assert bytes(frames.view()) == framing.encode(CommandID.GET_VALUE, 0x5000)
+
+
+def test_frame_buffer_extend_matches_encode():
+    rng = random.Random(3)
+    register_ids = [0x5000, 0x5001, 0x6000]
+    values = [[rng.uniform(-1, 1) for _ in register_ids] for _ in range(200)]
+    # a value with bytes to escape in the middle of the batch
+    values[100][1] = struct.unpack('>f', b'~}~}')[0]
+    frames = framing.FrameBuffer(size=64)
+    frames.extend_set_multiple(register_ids, values)
+
+    expected = b''.join(
+        framing.encode(
+            CommandID.SET_MULTIPLE,
+            register_ids,
+            [struct.unpack('>f', struct.pack('>f', v))[0] for v in row],
+        )
+        for row in values
+    )
+    assert frames.nb_frames == 200
+    assert frames.view() == expected
@@ -0,0 +1,67 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+import copylot
+
+REPO_ROOT = os.path.dirname(os.path.dirname(copylot.__file__))
+
+# cumulative import time of copylot.hardware, in us, without the interpreter
+# start-up. Measured at about 6 ms, the budget leaves room for slow machines.
+HARDWARE_IMPORT_BUDGET_US = 100_000
+
+
+def import_times(statement):
+    """Cumulative import time in us by module name, from python -X importtime"""
+    env = dict(os.environ, PYTHONPATH=REPO_ROOT)
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line[len("import time:") :].split("|")
+        if cumulative.strip().isdigit():
+            times[name.strip()] = int(cumulative)
+    return times
+
+
+@pytest.fixture(scope="module")
+def mirror_imports():
+    return import_times("import copylot.hardware.mirrors.optotune.mirror")
+
+
+def test_hardware_import_budget():
+    times = import_times("import copylot.hardware")
+    assert times["copylot.hardware"] < HARDWARE_IMPORT_BUDGET_US
+
+
+def test_mirror_import_is_lazy(mirror_imports):
+    assert "copylot.hardware.mirrors.optotune.mirror" in mirror_imports
+    loaded = [name for name in mirror_imports if "optoMDC" in name]
+    assert not [name for name in loaded if "inflect" in name]
+    assert not [name for name in loaded if ".registers" in name]
+    assert "copylot.hardware.mirrors.optotune.optoMDC.mre2" not in loaded
+
+
+def test_single_optokummenberg_package(mirror_imports):
+    loaded = [name for name in mirror_imports if "optoKummenberg" in name]
+    assert all(
+        name.startswith("copylot.hardware.mirrors.optotune.optoMDC.optoKummenberg")
+        for name in loaded
+    )
+
+
+def test_connect_imports_registers():
+    times = import_times(
+        "from copylot.hardware.mirrors.optotune import optoMDC; optoMDC.connect"
+    )
+    assert "copylot.hardware.mirrors.optotune.optoMDC.mre2" in times
+    assert not [name for name in times if "inflect" in name]
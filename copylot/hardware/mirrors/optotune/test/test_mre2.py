@@ -0,0 +1,230 @@
+import time
+
+import numpy as np
+import pytest
+
+from copylot.hardware.mirrors.optotune.mirror import OptoMirror
+from copylot.hardware.mirrors.optotune.optoMDC.mre2 import MRE2Board
+from copylot.hardware.mirrors.optotune.optoMDC.optoKummenberg.tools import (
+    command_tools,
+)
+from copylot.hardware.mirrors.optotune.optoMDC.optoKummenberg.tools.definitions import (
+    MAX_COMMANDS_IN_FLIGHT,
+    CommandID,
+)
+from copylot.hardware.mirrors.optotune.optoMDC.optoKummenberg.tools.framing import (
+    encode,
+)
+from copylot.hardware.simulated.mre2 import SimulatedMRE2Board
+
+
+@pytest.fixture
+def device(mocker):
+    # USB full speed link, the controller answers within 50 us
+    device = SimulatedMRE2Board(
+        baudrate=12_000_000, link_latency=0.0001, processing_time=0.00005, timeout=0.1
+    )
+    mocker.patch("serial.Serial", return_value=device)
+    return device
+
+
+@pytest.fixture
+def board(device):
+    board = MRE2Board(port='SIM', timeout=0.1)
+    yield board
+    board.disconnect()
+
+
+def test_mirror_positions(device):
+    mirror = OptoMirror(com_port='SIM')
+    mirror.position_x = 0.25
+    mirror.position_y = -0.5
+
+    assert mirror.positions == (0.25, -0.5)
+    assert device.get_register(mirror.channel_x.StaticInput.xy['id']) == 0.25
+
+
+def test_issue_command_reads_response_without_sleeping(board, mocker):
+    sleep = mocker.spy(command_tools.time, 'sleep')
+    board.Connection.latency.reset()
+
+    for i in range(50):
+        board.set_value(0x5002, i / 100)
+
+    sleep.assert_not_called()
+    statistics = board.Connection.latency.summary()['SET_VALUE']
+    assert statistics['count'] == 50
+    assert statistics['min'] <= statistics['mean'] <= statistics['max']
+
+
+def test_issue_commands_pipelines_responses(board, device):
+    device.link_latency = 0.002
+    for i in range(10):
+        board.set_value(0x5000 + i, float(i))
+    commands = [encode(CommandID.GET_VALUE, 0x5000 + i) for i in range(10)]
+
+    sequential = [command_tools.issue_command(board, command) for command in commands]
+    device.io_events.clear()
+    pipelined = command_tools.issue_commands(board, commands)
+
+    assert pipelined == sequential
+    # one round trip instead of ten, the ten frames are written at once
+    first_read = [kind for kind, _ in device.io_events].index('read')
+    assert device.io_events[:first_read] == [('write', 10)]
+    values = [
+        command_tools.process_response(
+            CommandID.GET_VALUE, {'id': 0x5000 + i, 'type': float}, None, response
+        )[2]
+        for i, response in enumerate(pipelined)
+    ]
+    assert values == [[float(i)] for i in range(10)]
+
+
+def test_missing_response_times_out(board, device):
+    device.respond = lambda command: []
+
+    start = time.perf_counter()
+    response = command_tools.issue_command(board, encode(CommandID.GET_VALUE, 0x5000))
+
+    assert response == b''
+    assert time.perf_counter() - start < 0.5
+
+
+def test_late_response_is_discarded(board, device):
+    board.set_value(0x5000, 1.0)
+    board.set_value(0x5001, 2.0)
+    # the response to the first command arrives after the deadline
+    device.processing_time = 0.2
+    assert (
+        command_tools.issue_command(board, encode(CommandID.GET_VALUE, 0x5000)) == b''
+    )
+    device.processing_time = 0.00005
+    time.sleep(0.2)
+
+    assert board.get_value({'id': 0x5001, 'type': float}) == [2.0]
+
+
+def test_pattern_upload_is_pipelined(board, device):
+    device.link_latency = 0.002
+    pattern = np.linspace(-0.5, 0.5, 200)
+
+    device.io_events.clear()
+    assert board.VectorPatternMemory.SetPattern(100, pattern)
+    # 20 segments in two writes, a full window of 16 before the first read
+    assert device.io_events[0] == ('write', MAX_COMMANDS_IN_FLIGHT)
+    writes = [count for kind, count in device.io_events if kind == 'write']
+    assert writes == [MAX_COMMANDS_IN_FLIGHT, 20 - MAX_COMMANDS_IN_FLIGHT]
+
+    np.testing.assert_allclose(device.get_pattern(100, 200), pattern, atol=1e-7)
+    np.testing.assert_allclose(
+        board.VectorPatternMemory.GetPattern(100, 200), pattern, atol=1e-7
+    )
+
+
+def test_pattern_upload_does_not_overrun_the_receive_buffer(board, device):
+    # a controller slower than the link, with a 2 kB receive buffer
+    device.processing_time = 0.0002
+    device.input_buffer_size = 2048
+    pattern = np.linspace(-0.5, 0.5, 5000)
+
+    assert board.VectorPatternMemory.SetPattern(0, pattern)
+
+    # 500 segments, written in a single write they would overflow the buffer
+    assert device.lost_commands == 0
+    assert device.max_input_backlog <= device.input_buffer_size
+    np.testing.assert_allclose(device.get_pattern(0, 5000), pattern, atol=1e-7)
+
+
+def test_mirror_trajectory(device):
+    mirror = OptoMirror(com_port='SIM')
+    t = np.linspace(0, 2 * np.pi, 1000, endpoint=False)
+    trajectory = 0.5 * np.stack([np.cos(t), np.sin(t)], axis=1)
+
+    mirror.upload_trajectory(trajectory, sample_rate=10_000, cycles=3)
+    mirror.start_trajectory()
+
+    np.testing.assert_allclose(device.get_pattern(0, 1000), trajectory[:, 0], atol=1e-7)
+    np.testing.assert_allclose(
+        device.get_pattern(1000, 1000), trajectory[:, 1], atol=1e-7
+    )
+    unit_x = mirror.channel_x.VectorPatternUnit
+    unit_y = mirror.channel_y.VectorPatternUnit
+    assert device.get_register(unit_y.start['id'], '>i') == 1000
+    assert device.get_register(unit_y.end['id'], '>i') == 2000
+    assert device.get_register(unit_x.frequency_speed['id']) == 10_000
+    assert device.get_register(unit_x.cycles['id'], '>i') == 3
+    assert device.get_register(unit_x.external_trigger['id'], '>i') == 1
+    assert device.get_register(unit_x.run['id'], '>i') == 1
+    assert device.get_register(unit_y.run['id'], '>i') == 1
+
+    mirror.stop_trajectory()
+    assert device.get_register(unit_x.run['id'], '>i') == 0
+
+
+@pytest.mark.parametrize(
+    "trajectory",
+    [np.zeros(10), np.zeros((10, 3)), np.full((10, 2), 1.5), np.zeros((10_000, 2))],
+)
+def test_mirror_trajectory_is_validated(device, trajectory):
+    mirror = OptoMirror(com_port='SIM')
+    with pytest.raises(ValueError):
+        mirror.upload_trajectory(trajectory, sample_rate=1000)
+
+
+def test_mirror_positions_single_command(device):
+    mirror = OptoMirror(com_port='SIM')
+    mirror.position_x = 0.25
+    mirror.position_y = -0.5
+    mirror.mirror.Connection.latency.reset()
+
+    assert mirror.positions == (0.25, -0.5)
+    assert mirror.mirror.Connection.latency.summary()['GET_MULTIPLE']['count'] == 1
+
+
+def test_set_many_get_many_chunks(board, device):
+    records = [
+        {'id': 0x5000 + i, 'type': float, 'unit': None, 'range': [-100, 100]}
+        for i in range(30)
+    ]
+    board.Connection.latency.reset()
+
+    assert board.set_many([(record, float(i)) for i, record in enumerate(records)])
+    assert board.get_many(records) == [float(i) for i in range(30)]
+
+    summary = board.Connection.latency.summary()
+    assert summary['SET_MULTIPLE']['count'] == 4
+    assert summary['GET_MULTIPLE']['count'] == 4
+
+
+def test_get_many_register_ids(board, device):
+    channel = board.Mirror.Channel_1
+    board.set_many({channel.StaticInput.xy['id']: 0.5, channel.OFPID.kp['id']: 2.0})
+
+    assert board.get_many([channel.StaticInput.xy['id'], channel.OFPID.kp]) == [
+        0.5,
+        2.0,
+    ]
+    with pytest.raises(KeyError):
+        board.get_many([0xFFFF])
+
+
+def test_channel_set_many(board, device):
+    channel = board.Mirror.Channel_0
+
+    assert channel.set_many({'StaticInput.xy': -0.25, 'OFPID.kp': 0.5})
+    assert device.get_register(channel.StaticInput.xy['id']) == -0.25
+    assert channel.get_many(['StaticInput.xy', 'OFPID.kp']) == {
+        'StaticInput.xy': -0.25,
+        'OFPID.kp': 0.5,
+    }
+    with pytest.raises(KeyError):
+        channel.get_many(['StaticInput.missing'])
+
+
+def test_set_many_invalid_value_sends_nothing(board, device):
+    channel = board.Mirror.Channel_0
+    board.Connection.latency.reset()
+
+    with pytest.raises(ValueError):
+        board.set_many([(channel.StaticInput.xy, 0.1), (channel.StaticInput.xy, 5.0)])
+    assert board.Connection.latency.summary() == {}
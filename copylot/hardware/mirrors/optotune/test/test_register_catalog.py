@@ -0,0 +1,88 @@
+import inspect
+
+import numpy as np
+import pytest
+
+from copylot.hardware.mirrors.optotune.optoMDC.optoKummenberg.registers.ClassAbstracts import (
+    System,
+)
+from copylot.hardware.mirrors.optotune.optoMDC.optoKummenberg.tools import (
+    systems_registers_tools,
+)
+from copylot.hardware.mirrors.optotune.optoMDC.optoKummenberg.tools.register_catalog import (
+    RegisterCatalog,
+)
+from copylot.hardware.mirrors.optotune.optoMDC.registers import mre2_registers
+
+
+@pytest.fixture
+def catalog():
+    return RegisterCatalog(mre2_registers.__name__, 2)
+
+
+def test_system_classes_are_not_instantiated(catalog, mocker):
+    mocker.patch.object(System, '__init__', side_effect=AssertionError)
+
+    assert 'StaticInput' in catalog.system_classes
+    assert 'XYPID' in catalog.system_classes
+    assert 'InputStage' not in catalog.system_classes
+
+
+def test_register_lookup(catalog):
+    record = catalog.register('StaticInput', 'xy', channel=1)
+
+    assert record == mre2_registers.StaticInput(1).xy
+    assert catalog.register(mre2_registers.StaticInput, 'xy', channel=1) is record
+    assert catalog.registers('StaticInput', channel=1)['xy'] is record
+    assert catalog.find(record['id'])[:3] == ('StaticInput', 1, 'xy')
+    assert 'error_flag_register' in catalog.registers('Status')
+
+
+def test_systems_match_reflection(catalog):
+    expected = {}
+    for _, system in inspect.getmembers(mre2_registers, inspect.isclass):
+        try:
+            for channel in range(2):
+                system_object = system(channel=channel)
+                expected[system_object.sys_id] = {
+                    'name': system_object.name,
+                    'registers': dict(system_object.register_list),
+                }
+        except (TypeError, AttributeError):
+            pass
+
+    assert catalog.systems() == expected
+    assert catalog.systems() is catalog.systems()
+
+
+def test_list_systems():
+    assert 'SignalGenerator' in systems_registers_tools.list_systems()
+    assert systems_registers_tools.get_registers('SignalGenerator', 1) == dict(
+        mre2_registers.SignalGenerator(1).register_list
+    )
+
+
+@pytest.mark.parametrize(
+    "system, register_name",
+    [
+        ('StaticInput', 'xy'),
+        ('SignalGenerator', 'cycles'),
+        ('SignalGenerator', 'run'),
+        ('Manager', 'input'),
+    ],
+)
+def test_is_valid_value_of_arrays(catalog, system, register_name):
+    record = catalog.register(system, register_name)
+    rng = np.random.default_rng(0)
+    for values in (
+        rng.uniform(-1, 1, 20),
+        rng.uniform(-2, 2, 20),
+        rng.integers(-2, 100, 20),
+        rng.integers(0, 2, 20).astype(bool),
+        np.array([0.5, np.nan]),
+    ):
+        expected = all(
+            systems_registers_tools.is_valid_value(record, value.item())
+            for value in values
+        )
+        assert systems_registers_tools.is_valid_value(record, values) == expected
@@ -24,13 +24,18 @@ class BartelsUX7:
     ----------
     com : str
     baudrate : int
+    backend
+        Module-like object providing the ``Serial`` class, defaults to
+        ``serial``. Pass a simulated backend to run the pump without the
+        controller.
 
     """
 
-    def __init__(self, com, baudrate):
+    def __init__(self, com, baudrate, backend=None):
         self.stop_now = False
         self.com = com
         self.baudrate = baudrate
+        self._backend = serial if backend is None else backend
 
     def set_pump_speed(self, freq: int, amp: int):
         """
@@ -44,7 +49,7 @@ class BartelsUX7:
             Amplitude.
 
         """
-        ser = serial.Serial(self.com, self.baudrate, timeout=5)
+        ser = self._backend.Serial(self.com, self.baudrate, timeout=5)
         if ser.is_open:
             ser.close()
         ser.open()
@@ -66,7 +71,7 @@ class BartelsUX7:
         duration : float
 
         """
-        ser = serial.Serial(self.com, self.baudrate, timeout=5)
+        ser = self._backend.Serial(self.com, self.baudrate, timeout=5)
         if ser.is_open:
             ser.close()
         ser.open()
@@ -79,7 +84,7 @@ class BartelsUX7:
 
     def read_pump(self):
         """Read out the current status of the pump and print"""
-        ser = serial.Serial(self.com, self.baudrate, timeout=5)
+        ser = self._backend.Serial(self.com, self.baudrate, timeout=5)
         if ser.is_open:
             ser.close()
         ser.open()
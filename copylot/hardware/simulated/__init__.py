@@ -0,0 +1,69 @@
+"""
+Simulated devices with timing models, to run the device drivers without the
+hardware, e.g. to load-test an acquisition on a machine without the vendor
+SDKs. ``simulated_backend`` creates the backend to pass to the driver of a
+device type of the microscope configs.
+"""
+import importlib
+
+# device type of the microscope configs: module and factory of the backend,
+# and whether the backend is a serial device
+SIMULATED_BACKENDS = {
+    'flir_camera': (
+        'copylot.hardware.simulated.spinnaker',
+        'simulated_pyspin_backend',
+        False,
+    ),
+    'orca_camera': ('copylot.hardware.simulated.dcam', 'simulated_dcam_backend', False),
+    'ni_daq': ('copylot.hardware.simulated.daq', 'SimulatedDAQ', False),
+    'asi_stage': ('copylot.hardware.simulated.asi', 'SimulatedASIStage', True),
+    'filterwheel': (
+        'copylot.hardware.simulated.filterwheel',
+        'SimulatedFilterwheel',
+        True,
+    ),
+    'vortran_laser': (
+        'copylot.hardware.simulated.vortran',
+        'SimulatedVortranLaser',
+        True,
+    ),
+    'mirror': ('copylot.hardware.simulated.mre2', 'SimulatedMRE2Board', True),
+    'pump': ('copylot.hardware.simulated.bartels', 'SimulatedBartelsUX7', True),
+}
+
+
+def simulated_backend(device_type: str, **settings):
+    """
+    Simulated backend of a device type, to pass as ``backend`` to its driver.
+
+    The simulation modules are imported on first use, so that importing this
+    package does not require the vendor packages, e.g. ``nidaqmx``.
+
+    Parameters
+    ----------
+    device_type : str
+        Device type of the microscope configs, see ``SIMULATED_BACKENDS``.
+    settings
+        Timing model of the simulated device, e.g. ``exposure_time`` of a
+        camera or ``link_latency`` of a serial device.
+
+    Returns
+    -------
+    Module-like object providing the classes the driver uses.
+
+    Raises
+    ------
+    ValueError
+        There is no simulated backend for the device type.
+
+    """
+    try:
+        module_name, factory_name, is_serial = SIMULATED_BACKENDS[device_type]
+    except KeyError:
+        raise ValueError(f"There is no simulated backend for {device_type!r}.")
+    factory = getattr(importlib.import_module(module_name), factory_name)
+    if is_serial:
+        from copylot.hardware.simulated.serial import SimulatedSerialBackend
+
+        return SimulatedSerialBackend(factory(**settings))
+    return factory(**settings)
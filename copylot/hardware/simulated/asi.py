@@ -0,0 +1,80 @@
+from typing import List
+
+from copylot.hardware.simulated.serial import SimulatedSerial
+
+
+class SimulatedASIStage(SimulatedSerial):
+    """
+    Simulated ASI MS-2000 XY stage controller behind a serial port.
+
+    Positions are in 1/10 um and speeds in mm/s, as on the controller. MOVE
+    and SCAN keep the controller busy, STATUS replies 'B', for the time the
+    stage needs to travel at the current speed. Use it in place of
+    ``serial.Serial``, e.g. by patching ``serial.Serial`` to return it.
+
+    Parameters
+    ----------
+    kwargs
+        Arguments of ``SimulatedSerial``, e.g. the timing model.
+
+    """
+
+    def __init__(self, **kwargs):
+        kwargs.setdefault('baudrate', 9600)
+        super().__init__(**kwargs)
+        self.position = {'X': 0.0, 'Y': 0.0}
+        self.settings = {
+            'SPEED': {'X': 10.0, 'Y': 10.0},
+            'BACKLASH': {'X': 0.04, 'Y': 0.04},
+            'SCANR': {'X': 0.0, 'Y': 0.0},
+            'SCANV': {'X': 0.0, 'Y': 0.0, 'F': 1.0},
+            'SCAN': {'F': 0.0},
+        }
+        self.busy_until = 0.0
+
+    @staticmethod
+    def _parse_arguments(arguments):
+        values = {}
+        for argument in arguments:
+            axis, _, value = argument.partition('=')
+            values[axis.upper()] = float(value)
+        return values
+
+    def _move(self, target):
+        """Start moving to target, in 1/10 um, busy until the slowest axis arrived"""
+        start = max(self.device_time, self.busy_until)
+        duration = max(
+            abs(target[axis] - self.position[axis]) / 1e4 / self.settings['SPEED'][axis]
+            for axis in target
+        )
+        self.position.update(target)
+        self.busy_until = start + duration
+
+    def respond(self, line: str) -> List[str]:
+        command, *arguments = line.split()
+        command = command.upper()
+        if command in ('STATUS', '/'):
+            return ['B\r\n' if self.device_time < self.busy_until else 'N\r\n']
+        if command in ('WHERE', 'W'):
+            axes = [argument.upper() for argument in arguments]
+            positions = ' '.join(f'{self.position[axis]:.1f}' for axis in axes)
+            return [f':A {positions}\r\n']
+
+        try:
+            values = self._parse_arguments(arguments)
+        except ValueError:
+            return [':N-4\r\n']
+        if command in ('MOVE', 'M'):
+            self._move(values)
+        elif command == 'ZERO':
+            self.position = {axis: 0.0 for axis in self.position}
+        elif command == 'SCAN' and not values:
+            # scan the X axis between the SCANR positions, in mm
+            start, stop = self.settings['SCANR']['X'], self.settings['SCANR']['Y']
+            self._move({'X': start * 1e4})
+            self._move({'X': stop * 1e4})
+        elif command in self.settings:
+            self.settings[command].update(values)
+        else:
+            return [':N-1\r\n']
+        return [':A\r\n']
@@ -0,0 +1,48 @@
+from typing import List
+
+from copylot.hardware.simulated.serial import SimulatedSerial
+
+
+class SimulatedBartelsUX7(SimulatedSerial):
+    """
+    Simulated Bartels mp-x controller of a micropump behind a serial port.
+
+    Applies the ``bon``, ``boff``, ``f<frequency>``, ``a<amplitude>`` and
+    ``ms``/``mr``/``mc`` commands without replying, and replies the present
+    settings to an empty line. Use it in place of ``serial.Serial``, e.g. by
+    patching ``serial.Serial`` to return it.
+
+    Parameters
+    ----------
+    kwargs
+        Arguments of ``SimulatedSerial``, e.g. the timing model.
+
+    """
+
+    signals = {'ms': 'SINE', 'mr': 'RECTANGULAR', 'mc': 'SRS'}
+
+    def __init__(self, **kwargs):
+        kwargs.setdefault('baudrate', 9600)
+        super().__init__(**kwargs)
+        self.on = False
+        self.frequency = 100
+        self.amplitude = 100
+        self.signal = 'SINE'
+
+    def respond(self, line: str) -> List[str]:
+        if line == '':
+            state = 'ON' if self.on else 'OFF'
+            return [
+                f'Pump {state}\r\nF={self.frequency}Hz\r\n'
+                f'A={self.amplitude}Vpp\r\nS={self.signal}\r\n'
+            ]
+        if line in ('bon', 'boff'):
+            self.on = line == 'bon'
+        elif line in self.signals:
+            self.signal = self.signals[line]
+        elif line[0] in 'fa' and line[1:].isdigit():
+            if line[0] == 'f':
+                self.frequency = min(max(int(line[1:]), 1), 300)
+            else:
+                self.amplitude = min(max(int(line[1:]), 1), 250)
+        return []
@@ -0,0 +1,316 @@
+import threading
+import time
+from types import SimpleNamespace
+
+import numpy as np
+from nidaqmx.constants import AcquisitionType, RegenerationMode, TaskMode
+
+
+class SimulatedDAQ:
+    """
+    Stand-in for the ``nidaqmx`` module, pass it as ``backend`` to run the
+    NI DAQ adapters without a DAQ.
+
+    Tasks record the configuration and data they receive. Counters model a
+    camera that sends a trigger to PFI0 every ``frame_period`` seconds from
+    the moment a counter task starts, and a retriggerable pulse train that
+    ticks ``samps_per_chan`` times at its frequency after every trigger.
+    Like the driver, committing a task reserves its physical channels and
+    fails if another open task reserved one of them. Output tasks without
+    regeneration transfer samples at their sample clock, writes wait until
+    the buffer has space for the new samples.
+
+    Parameters
+    ----------
+    frame_period : float
+        Time between two camera triggers in seconds.
+
+    """
+
+    def __init__(self, frame_period: float = 0.01):
+        self.frame_period = frame_period
+        self.tasks = []
+        self.reserved = {}
+
+    def Task(self, new_task_name: str = ''):
+        """Create a simulated task, same signature as ``nidaqmx.Task``"""
+        task = SimulatedTask(self, new_task_name)
+        self.tasks.append(task)
+        return task
+
+    @property
+    def open_tasks(self):
+        """Tasks that were not closed"""
+        return [task for task in self.tasks if not task.closed]
+
+    def reserve(self, task, channels):
+        """Reserve physical channels for a task"""
+        for channel in channels:
+            owner = self.reserved.get(channel, task)
+            if owner is not task:
+                raise RuntimeError(f"{channel} is reserved by task {owner.name!r}.")
+        for channel in channels:
+            self.reserved[channel] = task
+
+    def unreserve(self, task):
+        """Release the physical channels reserved by a task"""
+        for channel in [ch for ch, owner in self.reserved.items() if owner is task]:
+            del self.reserved[channel]
+
+    def find_pulse_train(self, terminal: str):
+        """Return the pulse train task whose internal output is ``terminal``"""
+        for task in self.tasks:
+            for channel in task.co_channels:
+                if not task.closed and terminal.endswith(
+                    channel.name.split('_')[-1].capitalize() + 'InternalOutput'
+                ):
+                    return task
+        return None
+
+    def tick_time(self, terminal: str, nb_ticks: int) -> float:
+        """Time after a counter start at which ``terminal`` ticked ``nb_ticks`` times"""
+        pulse_train = self.find_pulse_train(terminal)
+        if pulse_train is None:
+            # camera trigger input
+            return (nb_ticks - 1) * self.frame_period
+        pulses_per_trigger = pulse_train.timing.samps_per_chan
+        frequency = pulse_train.co_channels[0].kwargs['freq']
+        trigger, pulse = divmod(nb_ticks - 1, pulses_per_trigger)
+        return trigger * self.frame_period + (pulse + 1) / frequency
+
+
+class _Channels(list):
+    """Channel collection of a task, ``add_*_chan`` methods append a channel"""
+
+    def __getattr__(self, name):
+        if not name.startswith('add_'):
+            raise AttributeError(name)
+
+        def add_channel(physical_channel, **kwargs):
+            channel = SimpleNamespace(name=physical_channel, kwargs=kwargs)
+            self.append(channel)
+            return channel
+
+        return add_channel
+
+
+class _Timing:
+    def __init__(self):
+        self.rate = None
+        self.source = ''
+        self.sample_mode = AcquisitionType.FINITE
+        self.samps_per_chan = 1000
+
+    def cfg_samp_clk_timing(
+        self,
+        rate,
+        source='',
+        active_edge=None,
+        sample_mode=AcquisitionType.FINITE,
+        samps_per_chan=1000,
+    ):
+        self.rate = rate
+        self.source = source
+        self.sample_mode = sample_mode
+        self.samps_per_chan = samps_per_chan
+
+    def cfg_implicit_timing(
+        self, sample_mode=AcquisitionType.FINITE, samps_per_chan=1000
+    ):
+        self.sample_mode = sample_mode
+        self.samps_per_chan = samps_per_chan
+
+
+class _StartTrigger:
+    def __init__(self):
+        self.source = None
+        self.retriggerable = False
+
+    def cfg_dig_edge_start_trig(self, trigger_source, trigger_edge=None):
+        self.source = trigger_source
+
+    def disable_start_trig(self):
+        self.source = None
+
+
+class _OutStream:
+    def __init__(self):
+        self.regen_mode = RegenerationMode.ALLOW_REGENERATION
+        self._output_buf_size = None
+
+    @property
+    def output_buf_size(self):
+        return self._output_buf_size
+
+    @output_buf_size.setter
+    def output_buf_size(self, value):
+        self._output_buf_size = value
+
+    @output_buf_size.deleter
+    def output_buf_size(self):
+        self._output_buf_size = None
+
+
+class SimulatedTask:
+    """Simulated ``nidaqmx.Task``, created by ``SimulatedDAQ.Task``"""
+
+    def __init__(self, device: SimulatedDAQ, name: str = ''):
+        self.device = device
+        self.name = name
+        self.ao_channels = _Channels()
+        self.do_channels = _Channels()
+        self.ci_channels = _Channels()
+        self.co_channels = _Channels()
+        self.timing = _Timing()
+        self.triggers = SimpleNamespace(start_trigger=_StartTrigger())
+        self.out_stream = _OutStream()
+
+        self.written = []
+        # samples waiting in the buffer when each of the written data arrived
+        self.buffered_at_write = []
+        self.done_events = 0
+        self.running = False
+        self.committed = False
+        self.closed = False
+        self._start_time = None
+        self._done_callback = None
+        self._done = threading.Event()
+        self._timers = []
+        self._transfer_callback = None
+        self._transfer_samples = None
+        self._written_samples = 0
+        self._transferred_samples = 0
+        self._space_available = threading.Condition()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    @property
+    def channel_names(self):
+        return [
+            channel.name
+            for channels in (
+                self.ao_channels,
+                self.do_channels,
+                self.ci_channels,
+                self.co_channels,
+            )
+            for channel in channels
+        ]
+
+    def control(self, action):
+        if action in (TaskMode.TASK_COMMIT, TaskMode.TASK_RESERVE):
+            self.device.reserve(self, self.channel_names)
+            self.committed = action == TaskMode.TASK_COMMIT
+        elif action == TaskMode.TASK_UNRESERVE:
+            self.device.unreserve(self)
+            self.committed = False
+
+    def write(self, data, auto_start=False, timeout=10.0):
+        data = np.asarray(data)
+        nb_samples = data.shape[-1] if data.ndim else 1
+        with self._space_available:
+            if not self._regenerates and not self._space_available.wait_for(
+                lambda: self._written_samples + nb_samples - self._transferred_samples
+                <= self.out_stream.output_buf_size,
+                timeout,
+            ):
+                raise TimeoutError(f"Task {self.name}: no space left in the buffer.")
+            self.buffered_at_write.append(
+                self._written_samples - self._transferred_samples
+            )
+            self._written_samples += nb_samples
+        self.written.append(data)
+        if auto_start:
+            self.start()
+            if self.timing.rate is None:
+                # on-demand writes are done once written
+                self.stop()
+        return nb_samples
+
+    def read(self, number_of_samples_per_channel=None, timeout=10.0):
+        """Number of edges counted since start, as a list with the latest
+        sample if a number of samples is given"""
+        elapsed = time.perf_counter() - self._start_time
+        count = int(elapsed / self.device.frame_period) + 1
+        if number_of_samples_per_channel is None:
+            return count
+        return [count]
+
+    def start(self):
+        self.device.reserve(self, self.channel_names)
+        self.running = True
+        self._done.clear()
+        self._start_time = time.perf_counter()
+        if self.ci_channels and self.timing.sample_mode == AcquisitionType.FINITE:
+            # a finite counter is done once it sampled samps_per_chan edges
+            delay = self.device.tick_time(
+                self.ci_channels[0].ci_count_edges_term, self.timing.samps_per_chan
+            )
+            self._schedule(delay, self._on_done)
+        if not self._regenerates:
+            # samples are transferred to the device as they are generated
+            interval = self._transfer_samples or self.out_stream.output_buf_size // 2
+            for i in range(1, self.timing.samps_per_chan // interval + 1):
+                delay = self.device.tick_time(self.timing.source, i * interval)
+                self._schedule(delay, self._on_transferred, interval)
+
+    @property
+    def _regenerates(self):
+        return self.out_stream.regen_mode == RegenerationMode.ALLOW_REGENERATION
+
+    def _schedule(self, delay, function, *args):
+        timer = threading.Timer(delay, function, args)
+        timer.daemon = True
+        timer.start()
+        self._timers.append(timer)
+
+    def _on_transferred(self, nb_samples):
+        with self._space_available:
+            self._transferred_samples += nb_samples
+            self._space_available.notify_all()
+        if self._transfer_callback is not None:
+            self._transfer_callback(id(self), 0, nb_samples, None)
+
+    def _on_done(self):
+        self.done_events += 1
+        self._done.set()
+        if self._done_callback is not None:
+            self._done_callback(id(self), 0, None)
+
+    def stop(self):
+        for timer in self._timers:
+            timer.cancel()
+        self._timers = []
+        self.running = False
+        # the samples left in the buffer are discarded
+        with self._space_available:
+            self._written_samples = 0
+            self._transferred_samples = 0
+        if not self.committed:
+            # stopping returns uncommitted tasks to the state before start
+            self.device.unreserve(self)
+
+    def close(self):
+        self.stop()
+        self.device.unreserve(self)
+        self.closed = True
+
+    def register_done_event(self, callback_method):
+        self._done_callback = callback_method
+
+    def register_every_n_samples_transferred_from_buffer_event(
+        self, sample_interval, callback_method
+    ):
+        self._transfer_samples = sample_interval
+        self._transfer_callback = callback_method
+
+    def wait_until_done(self, timeout=10.0):
+        if not self._done.wait(timeout):
+            raise TimeoutError(f"Task {self.name} is not done after {timeout} s.")
+
+    def is_task_done(self):
+        return self._done.is_set()
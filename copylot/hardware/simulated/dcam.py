@@ -0,0 +1,302 @@
+import time
+from enum import IntEnum
+from types import SimpleNamespace
+from typing import Tuple
+
+import numpy as np
+
+
+class SimulatedDcamIdprop(IntEnum):
+    """IDs of the properties of the simulated camera, as in ``DCAM_IDPROP``"""
+
+    EXPOSURETIME = 0x001F0110
+    CONTRASTGAIN = 0x00300120
+    SENSORMODE = 0x00400210
+    BINNING = 0x00401110
+    SUBARRAYHSIZE = 0x00402120
+    SUBARRAYVSIZE = 0x00402140
+    SUBARRAYMODE = 0x00402150
+    BITSPERCHANNEL = 0x00420130
+    IMAGE_WIDTH = 0x00420210
+    IMAGE_HEIGHT = 0x00420220
+
+
+class SimulatedDcamErr:
+    """Error code of the simulated DCAM functions"""
+
+    def __init__(self, timeout: bool = False, name: str = None):
+        self._timeout = timeout
+        self._name = name or ('TIMEOUT' if timeout else 'SUCCESS')
+
+    def is_timeout(self) -> bool:
+        return self._timeout
+
+    def __repr__(self):
+        return f'DCAMERR.{self._name}'
+
+
+class SimulatedDcamapi:
+    """Simulated ``Dcamapi``, created by ``simulated_dcam_backend``"""
+
+    initialized = False
+    device_count = 1
+
+    @classmethod
+    def init(cls, *initparams):
+        cls.initialized = True
+        return True
+
+    @classmethod
+    def uninit(cls):
+        cls.initialized = False
+        return True
+
+    @classmethod
+    def lasterr(cls):
+        return SimulatedDcamErr()
+
+    @classmethod
+    def get_devicecount(cls):
+        return cls.device_count if cls.initialized else False
+
+
+class SimulatedDcam:
+    """
+    Simulated ``Dcam`` of a Hamamatsu Orca camera, created by
+    ``simulated_dcam_backend``.
+
+    ``shape`` is the shape of the sensor, the frames are binned and cropped
+    to the subarray of the properties. The properties, with the limits of
+    the Orca Flash 4, start from their defaults every time the camera is
+    opened, and only the exposure time and the contrast gain can be written
+    during a capture. The exposure time property sets ``exposure_time``.
+
+    The camera exposes frame k from ``k * frame_period`` to
+    ``k * frame_period + exposure_time`` after ``cap_start``, and the frame is
+    in the buffer after ``readout_time`` more seconds. Exposure and readout
+    overlap, so ``frame_period`` is the longer of the two. Frames are copied
+    into the circular buffer allocated by ``buf_alloc``, the oldest frames are
+    overwritten once it wraps around, and frame k is filled with the value k
+    modulo 2**16.
+
+    In real time, ``wait_capevent_frameready`` waits until the next frame is
+    in the buffer. Otherwise it transfers ``frames_per_event`` frames at once
+    without waiting, which makes the frame sequence deterministic.
+
+    """
+
+    # 4x4 binned frames of the Orca Flash 4, full frames take 8 MB of buffer each
+    shape: Tuple[int, int] = (512, 512)
+    exposure_time: float = 0.01
+    # full frame readout of the Orca Flash 4 at 100 fps
+    readout_time: float = 0.01
+    realtime: bool = True
+    frames_per_event: int = 1
+
+    # (default, minimum, maximum) of the writable properties, the subarray
+    # defaults to the whole sensor
+    property_limits = {
+        'EXPOSURETIME': (None, 38.96e-6, 10.0),
+        'CONTRASTGAIN': (0, 0, 10),
+        'SENSORMODE': (1, 1, 12),
+        'BINNING': (1, 1, 4),
+        'SUBARRAYHSIZE': (None, 4, None),
+        'SUBARRAYVSIZE': (None, 4, None),
+        'SUBARRAYMODE': (1, 1, 2),
+        'BITSPERCHANNEL': (16, 12, 16),
+    }
+    writable_during_capture = ('EXPOSURETIME', 'CONTRASTGAIN')
+    valid_values = {'SENSORMODE': (1, 12), 'BINNING': (1, 2, 4)}
+
+    def __init__(self, index: int = 0):
+        self.index = index
+        rows, columns = self.shape
+        defaults = {
+            'EXPOSURETIME': self.exposure_time,
+            'SUBARRAYHSIZE': columns,
+            'SUBARRAYVSIZE': rows,
+        }
+        self.properties = {
+            name: defaults.get(name, default)
+            for name, (default, _, _) in self.property_limits.items()
+        }
+        self.buffer = None
+        self.frame_count = 0
+        self.capturing = False
+        self.opened = False
+        self._lasterr = SimulatedDcamErr()
+        self._start_time = None
+        self._framestamps = None
+
+    @property
+    def frame_period(self) -> float:
+        return max(self.exposure_time, self.readout_time)
+
+    def ready_time(self, frame_index: int) -> float:
+        """Time after cap_start at which a frame is in the buffer"""
+        return frame_index * self.frame_period + self.exposure_time + self.readout_time
+
+    def dev_open(self):
+        self.opened = True
+        return True
+
+    def dev_close(self):
+        self.opened = False
+        return True
+
+    def lasterr(self):
+        return self._lasterr
+
+    @property
+    def image_shape(self) -> Tuple[int, int]:
+        """Shape of the frames, binned and cropped to the subarray"""
+        properties = self.properties
+        rows, columns = self.shape
+        if properties['SUBARRAYMODE'] == 2:
+            rows, columns = properties['SUBARRAYVSIZE'], properties['SUBARRAYHSIZE']
+        binning = properties['BINNING']
+        return int(rows // binning), int(columns // binning)
+
+    def _error(self, name: str):
+        self._lasterr = SimulatedDcamErr(name=name)
+        return False
+
+    def _limits(self, name: str) -> Tuple[float, float]:
+        _, minimum, maximum = self.property_limits[name]
+        if name in ('SUBARRAYHSIZE', 'SUBARRAYVSIZE'):
+            rows, columns = self.shape
+            maximum = columns if name == 'SUBARRAYHSIZE' else rows
+        return minimum, maximum
+
+    def prop_getattr(self, idprop: int):
+        name = SimulatedDcamIdprop(idprop).name
+        if name not in self.property_limits:
+            return self._error('NOTWRITABLE')
+        minimum, maximum = self._limits(name)
+        return SimpleNamespace(iProp=idprop, valuemin=minimum, valuemax=maximum)
+
+    def prop_getvalue(self, idprop: int):
+        name = SimulatedDcamIdprop(idprop).name
+        if not self.opened:
+            return self._error('INVALIDHANDLE')
+        if name == 'IMAGE_WIDTH':
+            return float(self.image_shape[1])
+        if name == 'IMAGE_HEIGHT':
+            return float(self.image_shape[0])
+        return float(self.properties[name])
+
+    def prop_setvalue(self, idprop: int, value: float):
+        name = SimulatedDcamIdprop(idprop).name
+        if not self.opened:
+            return self._error('INVALIDHANDLE')
+        if name not in self.property_limits:
+            return self._error('NOTWRITABLE')
+        if self.capturing and name not in self.writable_during_capture:
+            return self._error('BUSY')
+        minimum, maximum = self._limits(name)
+        if not minimum <= value <= maximum:
+            return self._error('OUTOFRANGE')
+        if value not in self.valid_values.get(name, (value,)):
+            return self._error('INVALIDVALUE')
+        self.properties[name] = value
+        if name == 'EXPOSURETIME':
+            self.exposure_time = value
+        return True
+
+    def buf_alloc(self, nb_frames: int):
+        self.buffer = np.zeros((nb_frames, *self.image_shape), dtype=np.uint16)
+        self._framestamps = np.zeros(nb_frames, dtype=np.int64)
+        return True
+
+    def buf_release(self):
+        self.buffer = None
+        return True
+
+    def cap_start(self):
+        self.capturing = True
+        self.frame_count = 0
+        self._start_time = time.perf_counter()
+        return True
+
+    def cap_stop(self):
+        self.capturing = False
+        return True
+
+    def _transfer(self, nb_frames: int):
+        """Copy the next frames in the buffer, only the last buffer length ones survive"""
+        first = max(self.frame_count, self.frame_count + nb_frames - len(self.buffer))
+        for frame_index in range(first, self.frame_count + nb_frames):
+            slot = frame_index % len(self.buffer)
+            self.buffer[slot] = frame_index & 0xFFFF
+            self._framestamps[slot] = frame_index
+        self.frame_count += nb_frames
+
+    def wait_capevent_frameready(self, timeout_millisec: int):
+        if not self.realtime:
+            self._transfer(self.frames_per_event)
+            return True
+
+        wait = (
+            self._start_time + self.ready_time(self.frame_count) - time.perf_counter()
+        )
+        if wait > timeout_millisec / 1000:
+            time.sleep(timeout_millisec / 1000)
+            self._lasterr = SimulatedDcamErr(timeout=True)
+            return False
+        if wait > 0:
+            time.sleep(wait)
+        elapsed = time.perf_counter() - self._start_time
+        nb_ready = (
+            int((elapsed - self.exposure_time - self.readout_time) / self.frame_period)
+            + 1
+        )
+        self._transfer(max(nb_ready - self.frame_count, 1))
+        self._lasterr = SimulatedDcamErr()
+        return True
+
+    def cap_transferinfo(self):
+        return SimpleNamespace(
+            nNewestFrameIndex=(self.frame_count - 1) % len(self.buffer),
+            nFrameCount=self.frame_count,
+        )
+
+    def buf_lockframe(self, index: int):
+        framestamp = int(self._framestamps[index])
+        # the camera clock starts with the capture, timestamps are at the end of the exposure
+        timestamp = framestamp * self.frame_period + self.exposure_time
+        sec = int(timestamp)
+        frame = SimpleNamespace(
+            framestamp=framestamp,
+            timestamp=SimpleNamespace(sec=sec, microsec=round((timestamp - sec) * 1e6)),
+        )
+        return frame, self.buffer[index]
+
+
+def simulated_dcam_backend(**settings) -> SimpleNamespace:
+    """
+    Stand-in for the ``dcam`` module, pass it as ``backend`` to run
+    ``OrcaCamera`` without a camera.
+
+    Parameters
+    ----------
+    settings
+        Class attributes of the simulated ``Dcam``: ``shape``,
+        ``exposure_time``, ``readout_time``, ``realtime`` and
+        ``frames_per_event``.
+
+    Returns
+    -------
+    SimpleNamespace
+        ``Dcamapi`` and ``Dcam`` classes, created for this backend so that
+        their settings and state are not shared with other backends, and the
+        ``DCAM_IDPROP`` property IDs.
+
+    """
+    unknown = set(settings) - set(SimulatedDcam.__annotations__)
+    if unknown:
+        raise ValueError(f"Unknown simulated camera settings: {sorted(unknown)}")
+    return SimpleNamespace(
+        Dcamapi=type('SimulatedDcamapi', (SimulatedDcamapi,), {}),
+        Dcam=type('SimulatedDcam', (SimulatedDcam,), dict(settings)),
+        DCAM_IDPROP=SimulatedDcamIdprop,
+    )
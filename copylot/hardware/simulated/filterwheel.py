@@ -0,0 +1,42 @@
+from typing import List
+
+from copylot.hardware.simulated.serial import SimulatedSerial
+
+
+class SimulatedFilterwheel(SimulatedSerial):
+    """
+    Simulated Arduino controlled filter wheel behind a serial port.
+
+    ``#s<position>`` turns the wheel to one of its 6 positions, the shortest
+    way round, and the command is echoed once the wheel is in position.
+    Other lines are answered with an error line. Use it in place of
+    ``serial.Serial``, e.g. by patching ``serial.Serial`` to return it.
+
+    Parameters
+    ----------
+    move_time : float
+        Time the wheel takes to turn by one position in seconds.
+    kwargs
+        Arguments of ``SimulatedSerial``, e.g. the timing model.
+
+    """
+
+    nb_positions = 6
+
+    def __init__(self, move_time: float = 0.05, **kwargs):
+        kwargs.setdefault('baudrate', 1000000)
+        kwargs.setdefault('terminator', b'\n')
+        super().__init__(**kwargs)
+        self.move_time = move_time
+        self.position = 0
+
+    def respond(self, line: str) -> List[str]:
+        if not line.startswith('#s') or line[2:] not in map(
+            str, range(self.nb_positions)
+        ):
+            return [f'ERROR: {line}\r\n']
+        position = int(line[2:])
+        distance = abs(position - self.position)
+        self.busy(min(distance, self.nb_positions - distance) * self.move_time)
+        self.position = position
+        return [f'{line}\r\n']
@@ -0,0 +1,133 @@
+import struct
+from typing import List, Tuple
+
+from copylot.hardware.mirrors.optotune.optoMDC.optoKummenberg.tools.definitions import (
+    CommandID,
+    FRAME_BOUNDARY,
+)
+from copylot.hardware.mirrors.optotune.optoMDC.optoKummenberg.tools.framing import (
+    decode,
+    frame,
+)
+from copylot.hardware.simulated.serial import SimulatedSerial
+
+# error codes of the firmware, see parsing_tools.parse_error
+COMMAND_UNKNOWN = 0x0002
+COMMAND_LENGTH_MISMATCH = 0x0003
+VECTOR_INDEX_OUT_OF_RANGE = 0x0107
+
+
+class SimulatedMRE2Board(SimulatedSerial):
+    """
+    Simulated Optotune MR-E-2 mirror controller in pro mode behind a serial port.
+
+    Decodes the command frames, keeps every register as its 4 raw bytes and
+    answers with a response frame per command: the register values to get
+    commands and an empty payload to set commands. The vector commands write
+    and read the vector pattern memory. Simple-mode lines, such as
+    the ``Start`` handshake, are ignored as by a board in pro mode. Use it in
+    place of ``serial.Serial``, e.g. by patching ``serial.Serial`` to return
+    it.
+
+    Parameters
+    ----------
+    kwargs
+        Arguments of ``SimulatedSerial``, e.g. the timing model.
+
+    """
+
+    def __init__(self, **kwargs):
+        kwargs.setdefault('baudrate', 115200)
+        kwargs.setdefault('terminator', b'')
+        super().__init__(**kwargs)
+        self.registers = {}
+        # the vector index of the commands is a 16-bit byte offset
+        self.pattern_memory = bytearray(2**16)
+        self._buffer = b''
+
+    def _split_commands(self, data: bytes) -> List[Tuple[bytes, int]]:
+        """Complete frames and simple-mode lines written so far"""
+        self._buffer += data
+        commands = []
+        while self._buffer:
+            if self._buffer[0] == FRAME_BOUNDARY:
+                end = self._buffer.find(FRAME_BOUNDARY, 1)
+                if end == -1:
+                    break
+                if end == 1:
+                    # the second frame boundary opens the frame
+                    self._buffer = self._buffer[1:]
+                    continue
+                command, self._buffer = self._buffer[: end + 1], self._buffer[end + 1 :]
+            else:
+                end = self._buffer.find(b'\n')
+                if end == -1:
+                    break
+                command, self._buffer = self._buffer[: end + 1], self._buffer[end + 1 :]
+            commands.append((command, len(command)))
+        return commands
+
+    def get_register(self, register_id: int, fmt: str = '>f'):
+        """Value of a register, by default decoded as a float"""
+        return struct.unpack(fmt, self.registers.get(register_id, bytes(4)))[0]
+
+    def get_pattern(self, index: int, count: int) -> List[float]:
+        """Samples of the vector pattern memory, index and count in samples"""
+        return list(
+            struct.unpack(
+                '>%df' % count, self.pattern_memory[4 * index : 4 * (index + count)]
+            )
+        )
+
+    @staticmethod
+    def _error(command_id: int, code: int) -> bytes:
+        return frame(command_id | 0x80, struct.pack('>I', code))
+
+    def _respond_multiple(self, command_id: int, payload: bytes) -> bytes:
+        count = struct.unpack('>H', payload[:2])[0]
+        register_ids = struct.unpack('>%dH' % count, payload[2 : 2 + 2 * count])
+        if command_id == CommandID.SET_MULTIPLE:
+            values = payload[2 + 2 * count :]
+            for i, register_id in enumerate(register_ids):
+                self.registers[register_id] = values[4 * i : 4 * i + 4]
+            return frame(command_id, b'')
+        values = b''.join(self.registers.get(i, bytes(4)) for i in register_ids)
+        return frame(command_id, payload[:2] + values)
+
+    def _respond_vector(self, command_id: int, payload: bytes) -> bytes:
+        # register id, byte index and, to get commands, byte count
+        _, index, size = struct.unpack('>HHB', payload[:5])
+        if command_id == CommandID.SET_VECTOR:
+            size = len(payload) - 5
+        if index + size > len(self.pattern_memory):
+            return self._error(command_id, VECTOR_INDEX_OUT_OF_RANGE)
+        if command_id == CommandID.SET_VECTOR:
+            self.pattern_memory[index : index + size] = payload[5:]
+            return frame(command_id, b'')
+        return frame(command_id, bytes(self.pattern_memory[index : index + size]))
+
+    def respond(self, command: bytes) -> List[bytes]:
+        if command[0] != FRAME_BOUNDARY:
+            return []
+        body = decode(command)
+        if body is None or len(body) < 5 or len(body) != body[2] + 5:
+            return [self._error(body[1] if body else 0, COMMAND_LENGTH_MISMATCH)]
+        command_id, payload = body[1], body[3:-2]
+
+        if command_id == CommandID.SET_VALUE:
+            self.registers[struct.unpack('>H', payload[:2])[0]] = payload[2:6]
+            return [frame(command_id, b'')]
+        if command_id == CommandID.GET_VALUE:
+            register_id = struct.unpack('>H', payload[:2])[0]
+            return [frame(command_id, self.registers.get(register_id, bytes(4)))]
+        if command_id in (CommandID.SET_MULTIPLE, CommandID.GET_MULTIPLE):
+            return [self._respond_multiple(command_id, payload)]
+        if command_id in (CommandID.SET_VECTOR, CommandID.GET_VECTOR):
+            return [self._respond_vector(command_id, payload)]
+        if command_id in (
+            CommandID.GET_STATUS,
+            CommandID.GET_FIRMWARE_ID,
+            CommandID.SET_COMM_MODE,
+        ):
+            return [frame(command_id, b'')]
+        return [self._error(command_id, COMMAND_UNKNOWN)]
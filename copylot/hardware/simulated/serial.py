@@ -0,0 +1,261 @@
+import threading
+import time
+from collections import deque
+from typing import List, Tuple, Union
+
+
+class SimulatedSerial:
+    """
+    Stand-in for an open ``serial.Serial`` port of a line based device.
+
+    Subclasses implement ``respond``, which returns the reply lines of a
+    command line and can use ``device_time``, the ``time.perf_counter``
+    time at which the device processes the command. Commands that keep the
+    device busy, e.g. moves replied to once done, call ``busy``. Devices that are not
+    line based override ``_split_commands`` as well. The timing model sends
+    every byte at ``baudrate``, adds ``link_latency`` in each direction
+    (e.g. the USB adapter polling interval), and lets the device process
+    one command at a time for ``processing_time`` seconds. Commands written
+    back to back are processed while the previous replies travel back, as
+    on the hardware. Commands wait in the input buffer of the device until
+    they are processed, and commands that do not fit in it are lost without
+    a reply, like on a device without flow control.
+
+    Parameters
+    ----------
+    port : str
+    baudrate : int
+    timeout : float
+        Maximum time a read waits for the requested bytes in seconds.
+    link_latency : float
+        Latency of the link in each direction in seconds.
+    processing_time : float
+        Time the device takes to process a command in seconds.
+    terminator : bytes
+        End of the command lines.
+    input_buffer_size : int, optional
+        Number of bytes the device buffers before it processes them,
+        unlimited if None.
+
+    Attributes
+    ----------
+    max_input_backlog : int
+        Largest number of bytes that waited in the input buffer at once.
+    lost_commands : int
+        Number of commands that did not fit in the input buffer.
+    io_events : List[Tuple[str, int]]
+        ('write', number of complete commands written) and ('read', number
+        of bytes read) of every write and non-empty read, in order, e.g. to
+        check how many commands were written before the first reply was
+        read.
+
+    """
+
+    def __init__(
+        self,
+        port: str = 'SIM',
+        baudrate: int = 19200,
+        timeout: float = 1,
+        link_latency: float = 0.002,
+        processing_time: float = 0.001,
+        terminator: bytes = b'\r',
+        input_buffer_size: int = None,
+        **kwargs,
+    ):
+        self.port = port
+        self.baudrate = baudrate
+        self.timeout = timeout
+        self.link_latency = link_latency
+        self.processing_time = processing_time
+        self.terminator = terminator
+        self.input_buffer_size = input_buffer_size
+        self.is_open = True
+        self.written = []
+        self.device_time = 0.0
+        self.max_input_backlog = 0
+        self.lost_commands = 0
+        self.io_events = []
+
+        self._partial_line = b''
+        self._device_free = 0.0
+        self._pending = deque()
+        # processing end time and size of the commands in the input buffer
+        self._unprocessed = deque()
+        self._received = bytearray()
+        self._condition = threading.Condition()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def respond(self, line: str) -> List[Union[str, bytes]]:
+        """Reply lines, or bytes, of the device to a command without terminator"""
+        raise NotImplementedError
+
+    def busy(self, duration: float):
+        """Keep the device busy for duration seconds more, e.g. for a move, while it responds to a command"""
+        self._device_free += duration
+
+    def _transmit_time(self, nb_bytes: int) -> float:
+        # 10 bits per byte with a start and a stop bit
+        return nb_bytes * 10 / self.baudrate
+
+    def _split_commands(self, data: bytes) -> List[Tuple[str, int]]:
+        """Complete commands written so far with their size on the wire"""
+        *commands, self._partial_line = (self._partial_line + data).split(
+            self.terminator
+        )
+        return [
+            (command.decode(), len(command) + len(self.terminator))
+            for command in commands
+        ]
+
+    def write(self, data: bytes) -> int:
+        now = time.perf_counter()
+        data = bytes(data)
+        self.written.append(data)
+        commands = self._split_commands(data)
+        self.io_events.append(('write', len(commands)))
+
+        with self._condition:
+            arrival = now + self.link_latency
+            for command, nb_bytes in commands:
+                arrival += self._transmit_time(nb_bytes)
+                if not self._buffer_input(arrival, nb_bytes):
+                    self.lost_commands += 1
+                    continue
+                self._device_free = (
+                    max(arrival, self._device_free) + self.processing_time
+                )
+                self._unprocessed.append((self._device_free, nb_bytes))
+                self.device_time = self._device_free
+                replies = self.respond(command)
+                ready = self._device_free + self.link_latency
+                for reply in replies:
+                    if isinstance(reply, str):
+                        reply = reply.encode()
+                    ready += self._transmit_time(len(reply))
+                    self._pending.append((ready, reply))
+            self._condition.notify_all()
+        return len(data)
+
+    def _buffer_input(self, arrival: float, nb_bytes: int) -> bool:
+        """Whether a command arriving at ``arrival`` fits in the input buffer, with the lock"""
+        while self._unprocessed and self._unprocessed[0][0] <= arrival:
+            self._unprocessed.popleft()
+        backlog = nb_bytes + sum(size for _, size in self._unprocessed)
+        if self.input_buffer_size is not None and backlog > self.input_buffer_size:
+            return False
+        self.max_input_backlog = max(self.max_input_backlog, backlog)
+        return True
+
+    def _collect(self, now: float):
+        """Move the bytes arrived by now to the input buffer, with the lock"""
+        while self._pending and self._pending[0][0] <= now:
+            self._received += self._pending.popleft()[1]
+
+    def _read(self, size: int = None, expected: bytes = None) -> bytes:
+        """
+        Wait for size bytes or the expected sequence, and return the bytes
+        received until then, or the bytes received so far on timeout
+        """
+        deadline = time.perf_counter() + self.timeout
+        with self._condition:
+            while True:
+                now = time.perf_counter()
+                self._collect(now)
+                end = None
+                if expected is not None and expected in self._received:
+                    end = self._received.index(expected) + len(expected)
+                if size is not None and len(self._received) >= size:
+                    end = size if end is None else min(end, size)
+                if end is None and now >= deadline:
+                    end = len(self._received)
+                if end is not None:
+                    data = bytes(self._received[:end])
+                    del self._received[:end]
+                    if data:
+                        self.io_events.append(('read', len(data)))
+                    return data
+                next_bytes = self._pending[0][0] if self._pending else deadline
+                self._condition.wait(min(next_bytes, deadline) - now)
+
+    def read(self, size: int = 1) -> bytes:
+        return self._read(size=size)
+
+    def read_until(self, expected: bytes = b'\n', size: int = None) -> bytes:
+        return self._read(size=size, expected=expected)
+
+    def readline(self) -> bytes:
+        return self._read(expected=b'\n')
+
+    @property
+    def in_waiting(self) -> int:
+        with self._condition:
+            self._collect(time.perf_counter())
+            return len(self._received)
+
+    def inWaiting(self) -> int:
+        return self.in_waiting
+
+    def reset_input_buffer(self):
+        """Discard the bytes received so far"""
+        with self._condition:
+            self._collect(time.perf_counter())
+            self._received.clear()
+
+    @property
+    def name(self) -> str:
+        return self.port
+
+    def open(self):
+        self.is_open = True
+
+    def set_buffer_size(self, rx_size=4096, tx_size=None):
+        pass
+
+    def reset_output_buffer(self):
+        pass
+
+    def flush(self):
+        pass
+
+    def getSettingsDict(self) -> dict:
+        return {'baudrate': self.baudrate, 'timeout': self.timeout}
+
+    def close(self):
+        self.is_open = False
+
+
+class SimulatedSerialBackend:
+    """
+    Stand-in for the ``serial`` module, pass it as ``backend`` to run a
+    serial device driver without the device.
+
+    ``Serial`` returns the simulated device with the port settings of the
+    driver applied, so that the timing model transfers bytes at the baud rate
+    the driver uses.
+
+    Parameters
+    ----------
+    device : SimulatedSerial
+
+    """
+
+    def __init__(self, device: SimulatedSerial):
+        self.device = device
+
+    def Serial(
+        self, port: str = None, baudrate: int = None, timeout: float = None, **kwargs
+    ):
+        """Open the simulated device, same signature as ``serial.Serial``"""
+        if port is not None:
+            self.device.port = port
+        if baudrate is not None:
+            self.device.baudrate = baudrate
+        if timeout is not None:
+            self.device.timeout = timeout
+        self.device.open()
+        return self.device
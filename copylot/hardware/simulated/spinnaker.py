@@ -0,0 +1,292 @@
+import time
+from types import SimpleNamespace
+from typing import Sequence, Tuple
+
+import numpy as np
+
+SPINNAKER_ERR_TIMEOUT = -1011
+
+
+class SimulatedSpinnakerException(Exception):
+    """``SpinnakerException`` of the simulated functions, with an error code"""
+
+    def __init__(self, message: str, errorcode: int = -1001):
+        super().__init__(message)
+        self.errorcode = errorcode
+
+
+class SimulatedNode:
+    """
+    GenICam node of a simulated camera, the maximum can be a function of the
+    camera to make the limits depend on other nodes.
+    """
+
+    def __init__(self, camera, name, value, minimum=None, maximum=None):
+        self.camera = camera
+        self.name = name
+        self.value = value
+        self.minimum = minimum
+        self.maximum = maximum
+        self.limit_reads = 0
+
+    def GetValue(self):
+        return self.value
+
+    def SetValue(self, value):
+        if self.minimum is not None and not (self.GetMin() <= value <= self.GetMax()):
+            raise SimulatedSpinnakerException(f'{self.name} {value} is out of range')
+        self.camera.writes.append((self.name, value))
+        self.value = value
+
+    def GetAccessMode(self):
+        return 'RW'
+
+    def GetMin(self):
+        self.limit_reads += 1
+        return self.minimum
+
+    def GetMax(self):
+        self.limit_reads += 1
+        maximum = self.maximum
+        return maximum(self.camera) if callable(maximum) else maximum
+
+
+class SimulatedEnumerationNode(SimulatedNode):
+    """Enumeration node, e.g. 'AcquisitionMode', whose entries are nodes"""
+
+    def __init__(self, camera, name, entries: Sequence[str]):
+        super().__init__(camera, name, 0)
+        self.entries = {
+            entry: SimulatedNode(camera, entry, value)
+            for value, entry in enumerate(entries)
+        }
+
+    def GetEntryByName(self, name):
+        return self.entries.get(name)
+
+    def SetIntValue(self, value):
+        self.camera.writes.append((self.name, value))
+        self.value = value
+
+
+class SimulatedImage:
+    """Image of a simulated camera, filled with its frame ID modulo 2**16"""
+
+    def __init__(self, frame_id: int, timestamp: float, shape: Tuple[int, int]):
+        self.frame_id = frame_id
+        self.timestamp = timestamp
+        self.shape = shape
+
+    def IsIncomplete(self):
+        return False
+
+    def GetImageStatus(self):
+        return 0
+
+    def GetFrameID(self):
+        return self.frame_id
+
+    def GetTimeStamp(self):
+        return round(self.timestamp * 1e9)
+
+    def GetNDArray(self):
+        return np.full(self.shape, self.frame_id & 0xFFFF, dtype=np.uint16)
+
+    def Release(self):
+        pass
+
+
+class SimulatedImageProcessor:
+    """``ImageProcessor`` that returns the images as they are"""
+
+    def SetColorProcessing(self, algorithm):
+        pass
+
+    def Convert(self, image, pixel_format):
+        return image
+
+
+class SimulatedSpinnakerCamera:
+    """
+    Simulated ``CameraPtr`` of a FLIR Blackfly S camera, created by
+    ``simulated_pyspin_backend``.
+
+    The limits of the image size follow the binning and the exposure limit
+    scales with the frame height, so writing a node changes the limits of
+    the nodes that depend on it like on the camera. Written node values are
+    appended to ``writes``.
+
+    Frame k of an acquisition is in the buffer ``k + 1`` frame periods after
+    ``BeginAcquisition`` in real time, the frame period being the longer of
+    the exposure and one over the frame rate. Otherwise ``GetNextImage``
+    returns the next frame without waiting. Frame IDs keep counting across
+    acquisitions and the timestamps count from the creation of the camera.
+
+    """
+
+    # Blackfly S BFS-U3-63S4M sensor, rows and columns
+    sensor_shape: Tuple[int, int] = (2048, 3072)
+    max_frame_rate: float = 60.0
+    realtime: bool = True
+
+    def __init__(self, serial_number: str):
+        self.writes = []
+        self.initialized = False
+        self.acquiring = False
+        self.next_frame_id = 0
+        self._clock_start = time.perf_counter()
+        self._start_time = None
+        self._frames_in_acquisition = 0
+
+        rows, columns = self.sensor_shape
+        nodes = [
+            SimulatedNode(self, 'ExposureAuto', 'Continuous'),
+            SimulatedNode(
+                self,
+                'ExposureTime',
+                10000.0,
+                10.0,
+                lambda camera: 1e6 * camera.Height.value / rows,
+            ),
+            SimulatedNode(self, 'GainAuto', 'Continuous'),
+            SimulatedNode(self, 'Gain', 0.0, 0.0, 18.0),
+            SimulatedNode(self, 'AcquisitionFrameRate', 30.0, 1.0, self.max_frame_rate),
+            SimulatedNode(self, 'AdcBitDepth', 1, 1, 3),
+            SimulatedNode(
+                self,
+                'Width',
+                columns,
+                8,
+                lambda camera: columns // camera.BinningHorizontal.value,
+            ),
+            SimulatedNode(
+                self,
+                'Height',
+                rows,
+                8,
+                lambda camera: rows // camera.BinningVertical.value,
+            ),
+            SimulatedNode(self, 'BinningHorizontal', 1, 1, 4),
+            SimulatedNode(self, 'BinningVertical', 1, 1, 4),
+            SimulatedNode(self, 'SensorShutterMode', 1, 1, 2),
+        ]
+        for node in nodes:
+            setattr(self, node.name, node)
+        self._tl_nodemap = {
+            'DeviceSerialNumber': SimulatedNode(
+                self, 'DeviceSerialNumber', serial_number
+            )
+        }
+        self._nodemap = {
+            'AcquisitionMode': SimulatedEnumerationNode(
+                self, 'AcquisitionMode', ('Continuous', 'SingleFrame', 'MultiFrame')
+            )
+        }
+
+    @property
+    def frame_period(self) -> float:
+        return max(1 / self.AcquisitionFrameRate.value, self.ExposureTime.value * 1e-6)
+
+    def GetTLDeviceNodeMap(self):
+        return SimpleNamespace(GetNode=self._tl_nodemap.get)
+
+    def GetNodeMap(self):
+        return SimpleNamespace(GetNode=self._nodemap.get)
+
+    def Init(self):
+        self.initialized = True
+
+    def DeInit(self):
+        self.initialized = False
+
+    def IsInitialized(self):
+        return self.initialized
+
+    def BeginAcquisition(self):
+        self.acquiring = True
+        self._start_time = time.perf_counter()
+        self._frames_in_acquisition = 0
+
+    def EndAcquisition(self):
+        self.acquiring = False
+
+    def GetNextImage(self, wait_time: int = 1000):
+        if not self.acquiring:
+            raise SimulatedSpinnakerException('Camera is not acquiring')
+        frame_time = self._start_time - self._clock_start
+        frame_time += (self._frames_in_acquisition + 1) * self.frame_period
+        if self.realtime:
+            wait = self._clock_start + frame_time - time.perf_counter()
+            if wait > wait_time / 1000:
+                time.sleep(wait_time / 1000)
+                raise SimulatedSpinnakerException(
+                    'Failed waiting for the next image', SPINNAKER_ERR_TIMEOUT
+                )
+            if wait > 0:
+                time.sleep(wait)
+        image = SimulatedImage(
+            self.next_frame_id,
+            frame_time,
+            (self.Height.value, self.Width.value),
+        )
+        self.next_frame_id += 1
+        self._frames_in_acquisition += 1
+        return image
+
+
+class SimulatedCameraList(list):
+    """``CameraList`` of the simulated cameras"""
+
+    def GetSize(self):
+        return len(self)
+
+    def Clear(self):
+        pass
+
+
+def simulated_pyspin_backend(
+    serial_numbers: Sequence[str] = ('20270803',), **settings
+) -> SimpleNamespace:
+    """
+    Stand-in for the ``PySpin`` module, pass it as ``backend`` to run
+    ``FlirCamera`` without a camera.
+
+    Parameters
+    ----------
+    serial_numbers : Sequence[str]
+        Serial numbers of the cameras of the system, in index order.
+    settings
+        Class attributes of the simulated cameras: ``sensor_shape``,
+        ``max_frame_rate`` and ``realtime``.
+
+    Returns
+    -------
+    SimpleNamespace
+        The ``System`` of the simulated cameras, and the functions, classes
+        and constants ``FlirCamera`` uses.
+
+    """
+    unknown = set(settings) - set(SimulatedSpinnakerCamera.__annotations__)
+    if unknown:
+        raise ValueError(f"Unknown simulated camera settings: {sorted(unknown)}")
+    camera_type = type(
+        'SimulatedSpinnakerCamera', (SimulatedSpinnakerCamera,), dict(settings)
+    )
+    cameras = SimulatedCameraList(camera_type(str(serial)) for serial in serial_numbers)
+    system = SimpleNamespace(GetCameras=lambda: cameras, ReleaseInstance=lambda: None)
+    return SimpleNamespace(
+        System=SimpleNamespace(GetInstance=lambda: system),
+        SpinnakerException=SimulatedSpinnakerException,
+        SPINNAKER_ERR_TIMEOUT=SPINNAKER_ERR_TIMEOUT,
+        ImageProcessor=SimulatedImageProcessor,
+        SPINNAKER_COLOR_PROCESSING_ALGORITHM_HQ_LINEAR=1,
+        PixelFormat_Mono8='Mono8',
+        PixelFormat_Mono16='Mono16',
+        RW='RW',
+        ExposureAuto_Off='Off',
+        GainAuto_Off='Off',
+        CStringPtr=lambda node: node,
+        CEnumerationPtr=lambda node: node,
+        IsReadable=lambda node: node is not None,
+        IsWritable=lambda node: node is not None,
+    )
@@ -0,0 +1,80 @@
+from typing import List
+
+from copylot.hardware.simulated.serial import SimulatedSerial
+
+
+class SimulatedVortranLaser(SimulatedSerial):
+    """
+    Simulated Vortran Stradus laser behind a serial port.
+
+    Replies to commands with ``<cmd>=<value>`` and to queries with
+    ``?<cmd>=<value>``, echoes the commands while ECHO is on and answers
+    unknown commands with an error line. Use it in place of ``serial.Serial``,
+    e.g. by patching ``serial.Serial`` to return it.
+
+    Parameters
+    ----------
+    serial_number : str
+    wavelength : int
+        unit: nm
+    max_power : float
+        unit: mW
+    echo : bool
+        Echo the command lines, as the laser does after power on.
+    kwargs
+        Arguments of ``SimulatedSerial``, e.g. the timing model.
+
+    """
+
+    def __init__(
+        self,
+        serial_number: str = '100000',
+        wavelength: int = 488,
+        max_power: float = 50.0,
+        echo: bool = True,
+        **kwargs,
+    ):
+        super().__init__(**kwargs)
+        self.serial_number = serial_number
+        self.wavelength = wavelength
+        self.max_power = max_power
+        self.settings = {
+            'ECHO': int(echo),
+            'PROMPT': 0,
+            'C': 0,
+            'DELAY': 1,
+            'EPC': 0,
+            'LC': 0,
+            'LE': 0,
+            'LP': 0.0,
+            'PP': 0.0,
+            'PUL': 0,
+        }
+
+    def _query(self, query: str) -> str:
+        if query == 'LI':
+            return (
+                f"{self.serial_number}, {self.wavelength}nm, {self.wavelength}nm, "
+                f"{self.max_power}mW, CIRC"
+            )
+        if query == 'MAXP':
+            return str(self.max_power)
+        if query == 'FC':
+            return '0'
+        if query == 'FD':
+            return 'LASER EMISSION ACTIVE' if self.settings['LE'] else 'STANDBY'
+        return str(self.settings[query])
+
+    def respond(self, line: str) -> List[str]:
+        replies = [line + '\r\n'] if self.settings['ECHO'] else []
+        command, _, value = line.partition('=')
+        try:
+            if command.startswith('?'):
+                value = self._query(command[1:])
+            else:
+                setting = self.settings[command]
+                self.settings[command] = type(setting)(float(value))
+                value = str(self.settings[command])
+        except (KeyError, ValueError):
+            return replies + [f'ERROR: {line}\r\n']
+        return replies + [f'{command}={value}\r\n']
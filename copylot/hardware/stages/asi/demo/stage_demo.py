@@ -15,9 +15,12 @@ def raster_scan_demo():
     stage = ASIStage()
     stage.zero()
 
-    stage.set_scan_mode(mode=ASIStageScanMode.RASTER)
+    stage.set_up_scan(
+        speed=(1, 10), scanr=(0, 2), scanv=(0, 0, 1), mode=ASIStageScanMode.RASTER
+    )
 
     stage.start_scan()
+    stage.wait_until_idle()
 
     stage.zero()
 
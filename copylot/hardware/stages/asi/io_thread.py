@@ -0,0 +1,117 @@
+import queue
+import threading
+from concurrent.futures import Future
+from typing import List, Sequence
+
+from copylot import logger
+
+
+class ASIStageIOThread:
+    """
+    Serial transport of an ASI stage controller running on a dedicated thread.
+
+    ``submit`` queues messages and returns a future. The thread writes all
+    the messages of a request, and of every request queued in the meantime,
+    in a single write. The controller answers every message with one line,
+    in order, so the replies are read back to back instead of waiting for a
+    round trip per message.
+
+    Parameters
+    ----------
+    serial_connection : serial.Serial
+        Open serial port of the controller.
+
+    """
+
+    def __init__(self, serial_connection):
+        self.serial_connection = serial_connection
+        self._requests = queue.Queue()
+        self._thread = threading.Thread(
+            target=self._run, name="copylot-asi-stage-io", daemon=True
+        )
+        self._thread.start()
+
+    def submit(self, messages: Sequence[str], read_all: bool = False) -> Future:
+        """
+        Queue messages for writing
+
+        Parameters
+        ----------
+        messages : Sequence[str]
+            Messages without the carriage return.
+        read_all : bool
+            Read lines until the read timeout instead of one line per message,
+            for multi-line replies such as INFO.
+
+        Returns
+        -------
+        Future
+            Resolves to the list of reply lines, without line terminators.
+        """
+        if not self._thread.is_alive():
+            raise RuntimeError("The IO thread of the stage is closed.")
+        future = Future()
+        self._requests.put((list(messages), read_all, future))
+        return future
+
+    def close(self):
+        """Write the queued messages and stop the thread"""
+        if self._thread.is_alive():
+            self._requests.put(None)
+            self._thread.join()
+
+    def _run(self):
+        closing = False
+        while not closing:
+            batch = [self._requests.get()]
+            # pipeline the requests queued by other threads in the meantime,
+            # a multi-line reply has to be read on its own
+            while batch[-1] is not None and not batch[-1][1]:
+                try:
+                    batch.append(self._requests.get_nowait())
+                except queue.Empty:
+                    break
+            if batch[-1] is None:
+                closing = True
+                batch.pop()
+            batch = [
+                request
+                for request in batch
+                if request[2].set_running_or_notify_cancel()
+            ]
+            if batch:
+                self._process(batch)
+
+    def _process(self, batch):
+        try:
+            message = ''.join(
+                f"{line}\r" for messages, _, _ in batch for line in messages
+            )
+            # replies that arrived after a previous timeout would be mismatched
+            self.serial_connection.reset_input_buffer()
+            self.serial_connection.write(bytes(message, encoding="ascii"))
+            logger.debug("Sent to stage: %r", message)
+            replies = [
+                self._read_replies(len(messages), read_all)
+                for messages, read_all, _ in batch
+            ]
+        except Exception as e:
+            for _, _, future in batch:
+                future.set_exception(e)
+            return
+
+        for (_, _, future), reply in zip(batch, replies):
+            future.set_result(reply)
+
+    def _read_replies(self, nb_replies: int, read_all: bool) -> List[str]:
+        replies = []
+        while read_all or len(replies) < nb_replies:
+            line = self.serial_connection.readline().decode(encoding="ascii")
+            if not line:
+                if read_all:
+                    break
+                raise TimeoutError(
+                    f"The stage sent {len(replies)} of {nb_replies} replies."
+                )
+            replies.append(line.rstrip('\r\n'))
+        return replies
@@ -1,7 +1,11 @@
 import serial
+import time
+from concurrent.futures import Future
 from enum import IntEnum
+from typing import List, Sequence, Tuple
 
 from copylot import logger
+from copylot.hardware.stages.asi.io_thread import ASIStageIOThread
 
 
 class ASIStageScanMode(IntEnum):
@@ -21,16 +25,25 @@ class ASIStage:
     """
     ASIStage
 
+    Serial communication runs on a background IO thread: ``submit`` returns
+    a future, and several messages submitted together, e.g. the scan setup
+    of ``set_up_scan``, take a single round trip.
+
     Parameters
     ----------
     com_port : str
+    backend
+        Module-like object providing the ``Serial`` class, defaults to
+        ``serial``. Pass a simulated backend to run the stage without the
+        controller.
 
     """
 
-    def __init__(self, com_port: str = None):
+    def __init__(self, com_port: str = None, backend=None):
         self.com_port = com_port if com_port else "COM6"
 
-        self.serial_connection = serial.Serial()
+        backend = serial if backend is None else backend
+        self.serial_connection = backend.Serial()
         self.serial_connection.port = self.com_port
         self.serial_connection.baudrate = 9600
         self.serial_connection.parity = serial.PARITY_NONE
@@ -50,17 +63,58 @@ class ASIStage:
             self.serial_connection.reset_output_buffer()
 
         logger.info(self.serial_connection.name)
+        self._io_thread = ASIStageIOThread(self.serial_connection)
 
     def __del__(self):
-        self.serial_connection.close()
+        self.close()
+
+    def close(self):
+        """Stop the IO thread and close the serial connection."""
+        io_thread = getattr(self, '_io_thread', None)
+        if io_thread is not None:
+            io_thread.close()
+            self._io_thread = None
+        if hasattr(self, 'serial_connection'):
+            self.serial_connection.close()
+
+    def submit(self, messages: Sequence[str]) -> Future:
+        """
+        Send messages in one round trip without waiting for the responses.
+
+        Parameters
+        ----------
+        messages : Sequence[str]
+
+        Returns
+        -------
+        Future
+            Resolves to the list of responses, one per message.
+
+        """
+        return self._io_thread.submit(messages)
 
-    def _send_message(self, message: str):
-        """Send message over serial connection."""
-        self.serial_connection.write(bytes(f"{message}\r", encoding="ascii"))
+    def execute_messages(self, messages: Sequence[str]) -> List[str]:
+        """
+        Sends messages in one round trip, raises if any of them is rejected.
+
+        Parameters
+        ----------
+        messages : Sequence[str]
+
+        Returns
+        -------
+        List[str]
 
-    def _read_response(self) -> str:
-        """Receive and read the response from serial communication."""
-        return self.serial_connection.readline().decode(encoding="ascii")
+        """
+        responses = self.submit(messages).result()
+        errors = [
+            f"{message}: {response}"
+            for message, response in zip(messages, responses)
+            if response.startswith(":N")
+        ]
+        if errors:
+            raise ASIStageException(f"Commands rejected by the stage: {errors}")
+        return responses
 
     def execute_message(self, message: str):
         """
@@ -75,8 +129,7 @@ class ASIStage:
         str
 
         """
-        self._send_message(message)
-        response = self._read_response()
+        response = self.submit([message]).result()[0]
         logger.info(response)
         return response
 
@@ -131,12 +184,12 @@ class ASIStage:
 
     def zero(self):
         """Set current position to zero."""
-        message = "ZERO\r"
+        message = "ZERO"
         self.execute_message(message)
 
     def start_scan(self):
         """Start the stage scan"""
-        message = "SCAN\r"
+        message = "SCAN"
         self.execute_message(message)
 
     def scanr(self, x=0, y=0):
@@ -167,6 +220,82 @@ class ASIStage:
         message = f"SCANV x={x} y={y} f={f}"
         self.execute_message(message)
 
+    def set_up_scan(
+        self,
+        speed: Tuple[float, float] = None,
+        backlash: Tuple[float, float] = None,
+        scanr: Tuple[float, float] = None,
+        scanv: Tuple[float, float, float] = None,
+        mode: ASIStageScanMode = None,
+    ):
+        """Configure a scan in a single round trip.
+
+        Parameters
+        ----------
+        speed : Tuple[float, float]
+            Speed of the x and y axes, unit: mm/s
+        backlash : Tuple[float, float]
+            Backlash of the x and y axes, unit: mm
+        scanr : Tuple[float, float]
+            Start and stop of the scanned axis, unit: mm
+        scanv : Tuple[float, float, float]
+            Start, stop and number of lines of the vertical axis.
+        mode : ASIStageScanMode
+
+        """
+        messages = []
+        if speed is not None:
+            messages.append("SPEED x={} y={}".format(*speed))
+        if backlash is not None:
+            messages.append("BACKLASH x={} y={}".format(*backlash))
+        if scanr is not None:
+            messages.append("SCANR x={} y={}".format(*scanr))
+        if scanv is not None:
+            messages.append("SCANV x={} y={} f={}".format(*scanv))
+        if mode is not None:
+            messages.append(f"SCAN f={int(mode)}")
+        logger.info("set up scan: %s", messages)
+        self.execute_messages(messages)
+
+    def where(self, axes: str = "XY") -> List[float]:
+        """Current position of the axes.
+
+        Parameters
+        ----------
+        axes : str
+            Axis letters, e.g. 'XY'.
+
+        Returns
+        -------
+        List[float]
+            unit: 1/10 um
+
+        """
+        response = self.execute_messages([f"WHERE {' '.join(axes)}"])[0]
+        return [float(value) for value in response.split()[1:]]
+
+    @property
+    def is_busy(self) -> bool:
+        """True while a move or a scan is running."""
+        return self.submit(["STATUS"]).result()[0].strip().endswith("B")
+
+    def wait_until_idle(self, poll_interval: float = 0.05, timeout: float = None):
+        """Block until the stage completed its moves and scans.
+
+        Parameters
+        ----------
+        poll_interval : float
+            Time between two STATUS queries in seconds.
+        timeout : float
+            Maximum time to wait in seconds, wait forever if None.
+
+        """
+        deadline = None if timeout is None else time.perf_counter() + timeout
+        while self.is_busy:
+            if deadline is not None and time.perf_counter() > deadline:
+                raise TimeoutError(f"The stage is still busy after {timeout} s.")
+            time.sleep(poll_interval)
+
     def info(self, axis_letter):
         """Method to fetch various information on stage axes.
 
@@ -177,11 +306,8 @@ class ASIStage:
 
         """
         message = f"INFO {axis_letter}"
-        self._send_message(message)
+        lines = self._io_thread.submit([message], read_all=True).result()
 
         # Read and parse the response in the specific required way
-        lines = self.serial_connection.readlines()[1].split(
-            bytes('\r', encoding="ascii")
-        )
-        response = "\n".join([line.decode() for line in lines])
+        response = "\n".join(lines[1].split('\r'))
         logger.info(response)
@@ -0,0 +1,89 @@
+import pytest
+
+from copylot.hardware.simulated.asi import SimulatedASIStage
+from copylot.hardware.stages.asi import stage as stage_module
+from copylot.hardware.stages.asi.stage import (
+    ASIStage,
+    ASIStageException,
+    ASIStageScanMode,
+)
+
+
+@pytest.fixture
+def controller(mocker):
+    device = SimulatedASIStage(link_latency=0.01, processing_time=0.001)
+    mocker.patch("serial.Serial", return_value=device)
+    return device
+
+
+@pytest.fixture
+def stage(controller):
+    stage = ASIStage(com_port='COM1')
+    yield stage
+    stage.close()
+
+
+def test_set_up_scan_takes_one_round_trip(stage, controller):
+    stage.set_up_scan(
+        speed=(0.5, 10),
+        backlash=(0.04, 0),
+        scanr=(0, 2),
+        scanv=(0, 0, 1),
+        mode=ASIStageScanMode.RASTER,
+    )
+
+    # the 5 messages are written at once, before the first reply is read
+    assert controller.io_events[0] == ('write', 5)
+    assert [kind for kind, _ in controller.io_events].count('write') == 1
+    messages = controller.written[0].decode().split('\r')[:-1]
+    assert messages == [
+        "SPEED x=0.5 y=10",
+        "BACKLASH x=0.04 y=0",
+        "SCANR x=0 y=2",
+        "SCANV x=0 y=0 f=1",
+        "SCAN f=0",
+    ]
+    assert controller.settings['SPEED'] == {'X': 0.5, 'Y': 10}
+
+    controller.io_events.clear()
+    for message in messages:
+        stage.execute_message(message)
+
+    # one round trip per message otherwise
+    writes = [count for kind, count in controller.io_events if kind == 'write']
+    assert writes == [1] * 5
+
+
+def test_rejected_setup_raises(stage):
+    with pytest.raises(ASIStageException, match="SCANV"):
+        stage.execute_messages(["SPEED x=1", "SCANV x=a"])
+
+
+def test_wait_until_idle(stage, controller, mocker):
+    stage.set_up_scan(speed=(10, 10))
+    assert stage.execute_message("MOVE X=20000 Y=10000") == ":A"
+    controller.written.clear()
+    sleep = mocker.spy(stage_module.time, 'sleep')
+
+    stage.wait_until_idle(poll_interval=0.01)
+
+    # polls STATUS while the 2 mm move at 10 mm/s runs, and sleeps in between
+    polls = [data for data in controller.written if data == b'STATUS\r']
+    assert len(polls) == len(controller.written) >= 2
+    assert sleep.call_count == len(polls) - 1
+    sleep.assert_called_with(0.01)
+    # the last poll was processed once the move was done
+    assert controller.device_time >= controller.busy_until
+    assert not stage.is_busy
+    assert stage.where() == [20000, 10000]
+
+
+def test_wait_until_idle_timeout(stage):
+    stage.execute_message("MOVE X=100000")
+    with pytest.raises(TimeoutError):
+        stage.wait_until_idle(poll_interval=0.01, timeout=0.1)
+
+
+def test_concurrent_submits(stage):
+    futures = [stage.submit(["WHERE X"]) for _ in range(10)]
+    assert [future.result(timeout=1) for future in futures] == [[":A 0.0"]] * 10
@@ -0,0 +1,292 @@
+"""
+Per-frame telemetry of the acquisition devices.
+
+Every device that produces frames, or stacks for the DAQ, owns a
+``FrameTelemetry`` that records the frame index, the hardware frame counter
+and timestamp, the host arrival time and the number of frames waiting to be
+read. Records go into a preallocated ring buffer without locks: the
+acquisition thread is the only writer and readers copy a snapshot, so
+recording costs a few microseconds and never waits for the GUI or a metrics
+scraper. ``stats`` aggregates a snapshot into frame rate, jitter and drops,
+``prometheus_text`` exports them in the Prometheus text format.
+"""
+import time
+import weakref
+from typing import Iterable, NamedTuple, Optional
+
+import numpy as np
+
+RECORD_DTYPE = np.dtype(
+    [
+        ('frame_index', np.int64),
+        ('framestamp', np.int64),
+        ('timestamp', np.float64),
+        ('arrival', np.float64),
+        ('queue_depth', np.int32),
+    ]
+)
+
+# telemetry of the devices by name, entries go away with their device
+registry = weakref.WeakValueDictionary()
+
+
+class TelemetryStats(NamedTuple):
+    """Aggregated telemetry of the last frames.
+
+    Parameters
+    ----------
+    frame_count : int
+        Number of frames recorded since the last reset.
+    dropped_frames : int
+        Number of frames missing from the frame indices since the last reset.
+    frame_rate : float
+        Frames per second over the window, from the hardware timestamps if
+        the device provides them, else from the arrival times.
+    jitter : float
+        Standard deviation of the time between two frames in seconds.
+    queue_depth : int
+        Number of frames waiting to be read when the last frame arrived.
+    max_queue_depth : int
+        Largest number of frames waiting to be read over the window.
+    """
+
+    frame_count: int = 0
+    dropped_frames: int = 0
+    frame_rate: float = 0.0
+    jitter: float = 0.0
+    queue_depth: int = 0
+    max_queue_depth: int = 0
+
+
+class FrameTelemetry:
+    """
+    Ring buffer of the telemetry records of a device.
+
+    ``record`` must only be called from a single thread, e.g. the
+    acquisition thread, while any thread can call ``snapshot`` and
+    ``stats``. A record is written before the count is published, and a
+    snapshot discards the records that were overwritten while it was copied.
+
+    Parameters
+    ----------
+    name : str
+        Name of the device, e.g. 'orca0', under which it is registered.
+    capacity : int
+        Number of records kept.
+    clock : Callable[[], float]
+        Host clock of the arrival times.
+
+    """
+
+    def __init__(self, name: str, capacity: int = 4096, clock=time.perf_counter):
+        if capacity < 2:
+            raise ValueError("Telemetry needs a capacity of at least two records.")
+        self.name = name
+        self.clock = clock
+        self._records = np.zeros(capacity, dtype=RECORD_DTYPE)
+        self._count = 0
+        self._dropped_frames = 0
+        # frame indices start at 0, so frames lost before the first one count
+        self._last_index = -1
+        registry[name] = self
+
+    def __len__(self):
+        return len(self._records)
+
+    @property
+    def frame_count(self) -> int:
+        """Number of frames recorded since the last reset"""
+        return self._count
+
+    @property
+    def dropped_frames(self) -> int:
+        """Number of frames missing from the frame indices since the last reset"""
+        return self._dropped_frames
+
+    def reset(self):
+        """Forget the records, e.g. at the start of an acquisition
+
+        Only call it from the recording thread, or while nothing records.
+        """
+        self._count = 0
+        self._dropped_frames = 0
+        self._last_index = -1
+
+    def record(
+        self,
+        frame_index: int,
+        framestamp: int = 0,
+        timestamp: float = 0.0,
+        queue_depth: int = 0,
+        arrival: float = None,
+    ):
+        """
+        Record a frame, e.g. ``telemetry.record(*metadata, queue_depth=n)``.
+
+        Parameters
+        ----------
+        frame_index : int
+            Index of the frame since the start of the acquisition, gaps are
+            counted as dropped frames.
+        framestamp : int
+            Frame counter of the hardware, e.g. a DAQ counter value.
+        timestamp : float
+            Hardware timestamp in seconds, 0 if the device has none.
+        queue_depth : int
+            Number of frames waiting to be read.
+        arrival : float, optional
+            Host time the frame arrived at, defaults to the current time.
+        """
+        if frame_index > self._last_index + 1:
+            self._dropped_frames += frame_index - self._last_index - 1
+        self._last_index = frame_index
+        count = self._count
+        self._records[count % len(self._records)] = (
+            frame_index,
+            framestamp,
+            timestamp,
+            self.clock() if arrival is None else arrival,
+            queue_depth,
+        )
+        self._count = count + 1
+
+    def snapshot(self, nb_records: int = None) -> np.ndarray:
+        """
+        Copy of the last records, oldest first.
+
+        Parameters
+        ----------
+        nb_records : int, optional
+            Maximum number of records, all the readable records if None.
+
+        Returns
+        -------
+        np.ndarray
+            Structured array with the fields of ``RECORD_DTYPE``, at most
+            ``capacity - 1`` records since the writer may be filling the
+            slot of the oldest one.
+        """
+        capacity = len(self._records)
+        count = self._count
+        first = count - min(count, capacity - 1, nb_records or capacity)
+        records = self._records[np.arange(first, count) % capacity]
+        # the writer may have overwritten the oldest records during the copy
+        oldest_valid = self._count - capacity + 1
+        return records[max(oldest_valid - first, 0) :]
+
+    def stats(self, nb_records: int = 100) -> TelemetryStats:
+        """
+        Aggregate the last records.
+
+        Parameters
+        ----------
+        nb_records : int
+            Number of records of the window of the rates.
+
+        Returns
+        -------
+        TelemetryStats
+        """
+        records = self.snapshot(nb_records)
+        if len(records) == 0:
+            return TelemetryStats(self._count, self._dropped_frames)
+
+        frame_rate = jitter = 0.0
+        if len(records) > 1:
+            times = records['timestamp']
+            if not times.any():
+                times = records['arrival']
+            steps = np.diff(records['frame_index'])
+            if times[-1] > times[0] and steps.all():
+                frame_rate = (len(records) - 1) / (times[-1] - times[0])
+                # intervals per frame, so that drops do not count as jitter
+                jitter = float(np.std(np.diff(times) / steps))
+        return TelemetryStats(
+            frame_count=self._count,
+            dropped_frames=self._dropped_frames,
+            frame_rate=frame_rate,
+            jitter=jitter,
+            queue_depth=int(records['queue_depth'][-1]),
+            max_queue_depth=int(records['queue_depth'].max()),
+        )
+
+
+def status_text(telemetries: Optional[Iterable[FrameTelemetry]] = None) -> str:
+    """
+    One line summary of the telemetry, e.g. for a status bar.
+
+    Parameters
+    ----------
+    telemetries : Iterable[FrameTelemetry], optional
+        Defaults to the telemetry of every device in ``registry``.
+
+    Returns
+    -------
+    str
+        E.g. 'orca0: 99.9 fps, jitter 0.1 ms, 0 dropped, queue 1'.
+    """
+    if telemetries is None:
+        telemetries = list(registry.values())
+    summaries = []
+    for telemetry in telemetries:
+        stats = telemetry.stats()
+        summaries.append(
+            f"{telemetry.name}: {stats.frame_rate:.1f} fps, "
+            f"jitter {stats.jitter * 1e3:.1f} ms, "
+            f"{stats.dropped_frames} dropped, queue {stats.queue_depth}"
+        )
+    return ' | '.join(summaries)
+
+
+# name, type and help of the exported metrics, by TelemetryStats field
+PROMETHEUS_METRICS = {
+    'frame_count': ('frames_total', 'counter', "Frames recorded."),
+    'dropped_frames': (
+        'dropped_frames_total',
+        'counter',
+        "Frames missing from the frame indices.",
+    ),
+    'frame_rate': ('frame_rate_hertz', 'gauge', "Frames per second."),
+    'jitter': (
+        'frame_interval_jitter_seconds',
+        'gauge',
+        "Standard deviation of the time between two frames.",
+    ),
+    'queue_depth': ('queue_depth_frames', 'gauge', "Frames waiting to be read."),
+    'max_queue_depth': (
+        'max_queue_depth_frames',
+        'gauge',
+        "Largest number of frames waiting to be read over the window.",
+    ),
+}
+
+
+def prometheus_text(
+    telemetries: Optional[Iterable[FrameTelemetry]] = None, prefix: str = 'copylot'
+) -> str:
+    """
+    Telemetry in the Prometheus text exposition format.
+
+    Parameters
+    ----------
+    telemetries : Iterable[FrameTelemetry], optional
+        Defaults to the telemetry of every device in ``registry``.
+    prefix : str
+        Prefix of the metric names.
+
+    Returns
+    -------
+    str
+        One sample per device and metric, labeled with the device name.
+    """
+    if telemetries is None:
+        telemetries = list(registry.values())
+    stats = [(telemetry.name, telemetry.stats()) for telemetry in telemetries]
+    lines = []
+    for field, (name, metric_type, help_text) in PROMETHEUS_METRICS.items():
+        lines.append(f"# HELP {prefix}_{name} {help_text}")
+        lines.append(f"# TYPE {prefix}_{name} {metric_type}")
+        for device, device_stats in stats:
+            value = getattr(device_stats, field)
+            lines.append(f'{prefix}_{name}{{device="{device}"}} {value:g}')
+    return '\n'.join(lines) + '\n'
@@ -0,0 +1,92 @@
+import threading
+
+import numpy as np
+import pytest
+
+from copylot.hardware import telemetry
+from copylot.hardware.telemetry import FrameTelemetry
+
+
+def test_stats_from_hardware_timestamps():
+    frames = FrameTelemetry('test_camera', capacity=8)
+
+    # 100 fps with a drop after frame 3, arrivals are late by a varying delay
+    for frame_index in [0, 1, 2, 3, 5, 6]:
+        frames.record(
+            frame_index,
+            frame_index + 100,
+            frame_index * 0.01,
+            queue_depth=frame_index % 3,
+            arrival=frame_index * 0.01 + 0.001 * (frame_index % 2),
+        )
+    stats = frames.stats()
+
+    assert stats.frame_count == 6
+    assert stats.dropped_frames == 1
+    assert stats.frame_rate == pytest.approx(5 / 0.06)
+    assert stats.jitter == pytest.approx(0, abs=1e-12)
+    assert stats.queue_depth == 0
+    assert stats.max_queue_depth == 2
+    assert list(frames.snapshot()['framestamp']) == [100, 101, 102, 103, 105, 106]
+
+
+def test_stats_from_arrival_times_without_timestamps():
+    times = iter([0.0, 0.1, 0.3])
+    stacks = FrameTelemetry('test_daq', clock=lambda: next(times))
+    for index in range(3):
+        stacks.record(index)
+
+    stats = stacks.stats()
+    assert stats.frame_rate == pytest.approx(2 / 0.3)
+    assert stats.jitter == pytest.approx(0.05)
+
+
+def test_snapshot_keeps_the_last_records():
+    frames = FrameTelemetry('test_camera', capacity=5)
+    for frame_index in range(10):
+        frames.record(frame_index)
+
+    # the slot of the next record is not readable
+    assert list(frames.snapshot()['frame_index']) == [6, 7, 8, 9]
+    assert list(frames.snapshot(2)['frame_index']) == [8, 9]
+    frames.reset()
+    assert len(frames.snapshot()) == 0
+    assert frames.stats() == telemetry.TelemetryStats()
+
+
+def test_snapshot_while_recording():
+    frames = FrameTelemetry('test_camera', capacity=16)
+    stop = threading.Event()
+
+    def record():
+        frame_index = 0
+        while not stop.is_set():
+            frames.record(frame_index, frame_index)
+            frame_index += 1
+
+    writer = threading.Thread(target=record)
+    writer.start()
+    try:
+        for _ in range(1000):
+            records = frames.snapshot()
+            # never torn: consecutive frames, each with its own framestamp
+            assert np.all(np.diff(records['frame_index']) == 1)
+            np.testing.assert_array_equal(records['frame_index'], records['framestamp'])
+    finally:
+        stop.set()
+        writer.join()
+
+
+def test_prometheus_text():
+    frames = FrameTelemetry('prometheus_camera')
+    for frame_index in (0, 1, 3):
+        frames.record(frame_index, timestamp=frame_index * 0.5, queue_depth=2)
+
+    text = telemetry.prometheus_text([frames])
+
+    assert '# TYPE copylot_frames_total counter\n' in text
+    assert 'copylot_frames_total{device="prometheus_camera"} 3\n' in text
+    assert 'copylot_dropped_frames_total{device="prometheus_camera"} 1\n' in text
+    assert 'copylot_frame_rate_hertz{device="prometheus_camera"} 1.33333\n' in text
+    assert 'copylot_queue_depth_frames{device="prometheus_camera"} 2\n' in text
+    assert 'prometheus_camera: 1.3 fps' in telemetry.status_text()
@@ -0,0 +1,191 @@
+import threading
+
+import numpy as np
+import pytest
+
+from copylot.hardware.cameras.frame_buffer import FrameMetadata
+from copylot.io.writers import StreamWriter, StreamWriterException
+
+
+class MemoryWriter(StreamWriter):
+    '''
+    Keeps written frames in a list, `_write_frame` blocks until `release` is set
+    '''
+
+    def __init__(self, queue_size=4, fail=False):
+        super().__init__('memory', queue_size)
+        self.frames = []
+        self.closed = False
+        self.fail = fail
+        self.release = threading.Event()
+        self.release.set()
+
+    def _open(self, shape, dtype):
+        self.shape = shape
+
+    def _write_frame(self, frame, metadata):
+        self.release.wait()
+        if self.fail:
+            raise IOError('disk full')
+        self.frames.append((frame.copy(), metadata))
+
+    def _close(self):
+        self.closed = True
+
+
+def frame(value):
+    return np.full((2, 3), value, dtype=np.uint16)
+
+
+def test_frames_are_written_in_order():
+    buffer = frame(0)
+    with MemoryWriter(queue_size=2) as writer:
+        for i in range(10):
+            # the caller reuses its buffer right after write()
+            buffer[:] = i
+            writer.write(buffer, FrameMetadata(frame_index=i))
+
+    assert writer.closed
+    assert writer.written_frames == 10
+    assert [int(f[0, 0]) for f, _ in writer.frames] == list(range(10))
+    assert [m.frame_index for _, m in writer.frames] == list(range(10))
+
+
+def test_write_sequence_reuses_a_buffer():
+    class Camera:
+        def __init__(self):
+            self.count = 0
+            self.buffers = set()
+
+        def get_frame(self, timeout=None, out=None):
+            if out is None:
+                out = frame(0)
+            self.buffers.add(id(out))
+            out[:] = self.count
+            self.count += 1
+            return out, FrameMetadata(frame_index=self.count - 1)
+
+    camera = Camera()
+    with MemoryWriter() as writer:
+        writer.write_sequence(camera, 5, timeout=1)
+
+    assert len(camera.buffers) == 1
+    assert [int(f[0, 0]) for f, _ in writer.frames] == list(range(5))
+
+
+def test_full_queue_drops_frames_without_blocking():
+    writer = MemoryWriter(queue_size=2)
+    writer.release.clear()
+
+    results = [writer.write(frame(i), block=False) for i in range(5)]
+    writer.release.set()
+    writer.close()
+
+    # both slots stay in use until the writer thread is released
+    assert results == [True, True, False, False, False]
+    assert writer.dropped_frames == 3
+    assert writer.written_frames == results.count(True)
+    assert writer.max_queue_depth <= 2
+
+
+def test_backpressure_is_reported():
+    writer = MemoryWriter(queue_size=2)
+    writer.release.clear()
+    writer.write(frame(0))
+    writer.write(frame(1))
+    threading.Timer(0.05, writer.release.set).start()
+
+    writer.write(frame(2), timeout=1)
+    writer.close()
+
+    assert writer.blocked_time >= 0.04
+    assert writer.written_frames == 3
+
+
+def test_writer_error_is_raised():
+    writer = MemoryWriter(fail=True)
+    writer.write(frame(0))
+
+    with pytest.raises(StreamWriterException):
+        writer.close()
+    with pytest.raises(StreamWriterException):
+        writer.write(frame(1))
+
+
+def test_zarr_writer_chunks(tmp_path):
+    zarr = pytest.importorskip('zarr')
+    from copylot.io.writers import ZarrWriter
+
+    path = str(tmp_path / 'stack.zarr')
+    with ZarrWriter(path, chunk_frames=4, queue_size=2) as writer:
+        for i in range(10):
+            writer.write(frame(i))
+
+    array = zarr.open_array(path, mode='r')
+    assert array.shape == (10, 2, 3)
+    assert array.chunks == (4, 2, 3)
+    np.testing.assert_array_equal(array[:, 0, 0], np.arange(10))
+
+
+@pytest.mark.parametrize('compression', [None, 'zlib'])
+def test_ome_tiff_writer(tmp_path, compression):
+    tifffile = pytest.importorskip('tifffile')
+    from copylot.io.writers import TiffWriter
+
+    path = str(tmp_path / 'stack.ome.tif')
+    with TiffWriter(
+        path, nb_frames=10, compression=compression, queue_size=2
+    ) as writer:
+        for i in range(10):
+            writer.write(frame(i))
+
+    with tifffile.TiffFile(path) as tiff:
+        assert tiff.is_ome
+        assert tiff.series[0].axes == 'TYX'
+        np.testing.assert_array_equal(tiff.asarray()[:, 0, 0], np.arange(10))
+    assert writer.written_frames == 10
+
+
+@pytest.mark.parametrize('compression', [None, 'zlib'])
+def test_short_tiff_series_is_readable(tmp_path, compression):
+    tifffile = pytest.importorskip('tifffile')
+    from copylot.io.writers import TiffWriter
+
+    path = str(tmp_path / 'stack.ome.tif')
+    with TiffWriter(path, nb_frames=10, compression=compression) as writer:
+        for i in range(1, 5):
+            writer.write(frame(i))
+
+    with tifffile.TiffFile(path) as tiff:
+        stack = tiff.asarray()
+    np.testing.assert_array_equal(stack[:, 0, 0], [1, 2, 3, 4] + [0] * 6)
+    assert writer.written_frames == 4
+    assert writer.padded_frames == 6
+
+
+@pytest.mark.parametrize('writer_type', ['ZarrWriter', 'TiffWriter'])
+def test_existing_stack_is_not_overwritten(tmp_path, writer_type):
+    pytest.importorskip('zarr' if writer_type == 'ZarrWriter' else 'tifffile')
+    from copylot.io import writers
+
+    def first_value(path):
+        if writer_type == 'ZarrWriter':
+            import zarr
+
+            return zarr.open_array(path, mode='r')[0, 0, 0]
+        import tifffile
+
+        return tifffile.imread(path)[0, 0]
+
+    path = str(tmp_path / 'stack')
+    with getattr(writers, writer_type)(path) as writer:
+        writer.write(frame(1))
+
+    with pytest.raises(StreamWriterException):
+        with getattr(writers, writer_type)(path) as writer:
+            writer.write(frame(2))
+    assert first_value(path) == 1
+
+    with getattr(writers, writer_type)(path, overwrite=True) as writer:
+        writer.write(frame(3))
+    assert first_value(path) == 3
@@ -0,0 +1,445 @@
+import queue
+import threading
+import time
+from abc import ABCMeta, abstractmethod
+from typing import Iterable, Optional, Tuple
+
+import numpy as np
+
+from copylot import logger
+from copylot.hardware.cameras.frame_buffer import FrameMetadata
+
+
+class StreamWriterException(Exception):
+    pass
+
+
+class StreamWriter(metaclass=ABCMeta):
+    """
+    Append frames of an acquisition to a single file on a background thread.
+
+    ``write`` copies the frame into one of ``queue_size`` preallocated slots
+    and returns immediately, the writer thread stores the frames in order.
+    When all slots are pending the writer cannot keep up with acquisition:
+    ``write`` then blocks until a slot is free (or drops the frame if
+    ``block=False``) and the time spent waiting is reported as backpressure.
+
+    Subclasses implement ``_open``, ``_write_frame`` and ``_close``, which
+    are only called on the writer thread.
+
+    Parameters
+    ----------
+    path : str
+        Path of the file or store to create.
+    queue_size : int
+        Maximum number of frames waiting to be written.
+    overwrite : bool
+        Replace an existing file or store at ``path``. Otherwise the writer
+        fails with ``StreamWriterException`` instead of truncating it.
+
+    """
+
+    def __init__(self, path: str, queue_size: int = 64, overwrite: bool = False):
+        if queue_size < 1:
+            raise ValueError("A writer needs a queue size of at least one frame.")
+        self.path = path
+        self.queue_size = queue_size
+        self.overwrite = overwrite
+
+        self._slots = None
+        self._free_slots = queue.Queue()
+        self._pending = queue.Queue()
+        self._thread = None
+        self._error = None
+
+        self._frame_count = 0
+        self._written_frames = 0
+        self._dropped_frames = 0
+        self._max_queue_depth = 0
+        self._blocked_time = 0.0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    @property
+    def written_frames(self) -> int:
+        """Number of frames stored on disk"""
+        return self._written_frames
+
+    @property
+    def dropped_frames(self) -> int:
+        """Number of frames dropped because the queue was full"""
+        return self._dropped_frames
+
+    @property
+    def queue_depth(self) -> int:
+        """Number of frames waiting to be written"""
+        return self._pending.qsize()
+
+    @property
+    def max_queue_depth(self) -> int:
+        """Largest number of frames that were waiting to be written at once"""
+        return self._max_queue_depth
+
+    @property
+    def blocked_time(self) -> float:
+        """Total time in seconds ``write`` waited for the writer thread"""
+        return self._blocked_time
+
+    def write(
+        self,
+        frame: np.ndarray,
+        metadata: FrameMetadata = None,
+        block: bool = True,
+        timeout: float = None,
+    ) -> bool:
+        """
+        Queue a frame for writing, the frame is copied so the caller can
+        reuse its buffer right away.
+
+        Parameters
+        ----------
+        frame : np.ndarray
+            2D frame, all frames must have the shape and dtype of the first one.
+        metadata : FrameMetadata, optional
+        block : bool
+            Wait for a free slot if the queue is full, otherwise drop the frame.
+        timeout : float
+            Maximum time to wait for a free slot in seconds, wait forever if None.
+
+        Returns
+        -------
+        bool
+            False if the frame was dropped.
+        """
+        self._raise_error()
+        if self._slots is None:
+            self._start(frame.shape, frame.dtype)
+
+        index = self._acquire_slot(block, timeout)
+        if index is None:
+            self._dropped_frames += 1
+            logger.warning("Writer queue is full, dropped frame %d", self._frame_count)
+            self._frame_count += 1
+            return False
+
+        np.copyto(self._slots[index], frame)
+        if metadata is None:
+            metadata = FrameMetadata(frame_index=self._frame_count)
+        self._frame_count += 1
+        self._pending.put((index, metadata))
+        self._max_queue_depth = max(self._max_queue_depth, self._pending.qsize())
+        return True
+
+    def write_stream(self, frames: Iterable[Tuple[np.ndarray, FrameMetadata]]):
+        """
+        Write every frame of a camera stream, e.g. ``OrcaCamera.stream(n)``.
+
+        Parameters
+        ----------
+        frames : Iterable[Tuple[np.ndarray, FrameMetadata]]
+        """
+        for frame, metadata in frames:
+            self.write(frame, metadata)
+
+    def write_sequence(self, camera, nb_frames: int, timeout: float = None):
+        """
+        Write the next ``nb_frames`` frames of a camera after its
+        ``start_sequence()``, read into a single reused buffer.
+
+        Parameters
+        ----------
+        camera : AbstractCamera
+        nb_frames : int
+        timeout : float
+            Maximum time to wait for each frame in seconds, wait forever if None.
+        """
+        buffer = None
+        for _ in range(nb_frames):
+            buffer, metadata = camera.get_frame(timeout=timeout, out=buffer)
+            self.write(buffer, metadata)
+
+    def close(self):
+        """Write the pending frames and close the file"""
+        if self._thread is not None:
+            self._pending.put(None)
+            self._thread.join()
+            self._thread = None
+            logger.debug(
+                "%s: %d frames written, %d dropped, max queue depth %d, blocked %.3f s",
+                self.path,
+                self._written_frames,
+                self._dropped_frames,
+                self._max_queue_depth,
+                self._blocked_time,
+            )
+        self._raise_error()
+
+    def _start(self, shape, dtype):
+        self._slots = np.empty((self.queue_size, *shape), dtype=dtype)
+        for index in range(self.queue_size):
+            self._free_slots.put(index)
+        self._thread = threading.Thread(
+            target=self._run, args=(shape, dtype), name="copylot-writer", daemon=True
+        )
+        self._thread.start()
+
+    def _acquire_slot(self, block, timeout) -> Optional[int]:
+        try:
+            return self._free_slots.get_nowait()
+        except queue.Empty:
+            if not block:
+                return None
+
+        start = time.perf_counter()
+        try:
+            return self._free_slots.get(timeout=timeout)
+        except queue.Empty:
+            return None
+        finally:
+            self._blocked_time += time.perf_counter() - start
+
+    def _raise_error(self):
+        if self._error is not None:
+            raise StreamWriterException(f"Writing {self.path} failed.") from self._error
+
+    def _run(self, shape, dtype):
+        try:
+            self._open(shape, dtype)
+            try:
+                self._write_frames(self._pending_frames())
+            finally:
+                self._close()
+        except Exception as e:
+            logger.error("Writing %s stopped with error: %s", self.path, e)
+            self._error = e
+            # unblock producers waiting for a free slot
+            for index in range(self.queue_size):
+                self._free_slots.put(index)
+
+    def _pending_frames(self):
+        """Yield queued frames until close(), a slot is reused once the next frame is requested"""
+        while True:
+            item = self._pending.get()
+            if item is None:
+                return
+            index, metadata = item
+            yield self._slots[index], metadata
+            self._written_frames += 1
+            self._free_slots.put(index)
+
+    def _write_frames(self, frames: Iterable[Tuple[np.ndarray, FrameMetadata]]):
+        """Write all frames of the iterator, ends when the writer is closed"""
+        for frame, metadata in frames:
+            self._write_frame(frame, metadata)
+
+    @abstractmethod
+    def _open(self, shape: Tuple[int, ...], dtype):
+        """Create the file for frames of the given shape and dtype"""
+        pass
+
+    @abstractmethod
+    def _write_frame(self, frame: np.ndarray, metadata: FrameMetadata):
+        """Append a frame, the frame buffer is reused once this returns"""
+        pass
+
+    @abstractmethod
+    def _close(self):
+        """Flush buffered frames and close the file"""
+        pass
+
+
+class ZarrWriter(StreamWriter):
+    """
+    Append frames to a chunked Zarr array of shape (T, Y, X).
+
+    Frames are gathered into a chunk of ``chunk_frames`` frames that is
+    appended in one call, so every chunk is compressed and written once.
+
+    Parameters
+    ----------
+    path : str
+        Path of the Zarr store.
+    chunk_frames : int
+        Number of frames per chunk along the time axis.
+    queue_size : int
+        Maximum number of frames waiting to be written.
+    overwrite : bool
+        Replace an existing store at ``path`` instead of failing.
+    array_kwargs
+        Additional arguments for ``zarr.open_array``, e.g. the compressor.
+
+    """
+
+    def __init__(
+        self,
+        path: str,
+        chunk_frames: int = 16,
+        queue_size: int = 64,
+        overwrite: bool = False,
+        **array_kwargs,
+    ):
+        super().__init__(path, queue_size, overwrite)
+        self.chunk_frames = chunk_frames
+        self._array_kwargs = array_kwargs
+        self._array = None
+        self._chunk = None
+        self._chunk_length = 0
+
+    def _open(self, shape, dtype):
+        import zarr
+
+        self._array = zarr.open_array(
+            self.path,
+            mode='w' if self.overwrite else 'w-',
+            shape=(0, *shape),
+            chunks=(self.chunk_frames, *shape),
+            dtype=dtype,
+            **self._array_kwargs,
+        )
+        self._chunk = np.empty((self.chunk_frames, *shape), dtype=dtype)
+        self._chunk_length = 0
+
+    def _write_frame(self, frame, metadata):
+        self._chunk[self._chunk_length] = frame
+        self._chunk_length += 1
+        if self._chunk_length == self.chunk_frames:
+            self._flush()
+
+    def _flush(self):
+        if self._chunk_length:
+            self._array.append(self._chunk[: self._chunk_length], axis=0)
+            self._chunk_length = 0
+
+    def _close(self):
+        self._flush()
+
+
+class TiffWriter(StreamWriter):
+    """
+    Append frames as pages of a single BigTIFF file.
+
+    If ``nb_frames`` is known in advance the frames are written as a single
+    (T, Y, X) series, with OME-XML metadata if the path ends with '.ome.tif'.
+    A writer closed after fewer frames, e.g. when the acquisition is stopped,
+    completes the series with blank frames so that the file stays readable,
+    they are counted in ``padded_frames``.
+    Otherwise uncompressed frames are appended contiguously to a series that
+    grows with every frame, while compressed frames are stored as one page
+    series each.
+
+    Parameters
+    ----------
+    path : str
+        Path of the TIFF file.
+    nb_frames : int, optional
+        Number of frames that will be written, required for OME-TIFF.
+    compression : str, optional
+        Compression of every page, e.g. 'zlib' or 'zstd'.
+    rowsperstrip : int, optional
+        Number of rows per compressed strip, tifffile picks it if None.
+    queue_size : int
+        Maximum number of frames waiting to be written.
+    overwrite : bool
+        Replace an existing file at ``path`` instead of failing.
+
+    """
+
+    def __init__(
+        self,
+        path: str,
+        nb_frames: int = None,
+        compression: str = None,
+        rowsperstrip: int = None,
+        queue_size: int = 64,
+        overwrite: bool = False,
+    ):
+        super().__init__(path, queue_size, overwrite)
+        self.nb_frames = nb_frames
+        self.compression = compression
+        self.rowsperstrip = rowsperstrip
+        self._file = None
+        self._tiff = None
+        self._shape = None
+        self._dtype = None
+        self._padded_frames = 0
+
+    @property
+    def padded_frames(self) -> int:
+        """Number of blank frames that completed a short series on close"""
+        return self._padded_frames
+
+    @property
+    def is_ome(self) -> bool:
+        """True if the file is written as OME-TIFF"""
+        return self.nb_frames is not None and self.path.lower().endswith(
+            ('.ome.tif', '.ome.tiff')
+        )
+
+    def _open(self, shape, dtype):
+        import tifffile
+
+        # 'x' fails if the file exists, without a window between check and open
+        self._file = open(self.path, 'wb' if self.overwrite else 'xb')
+        self._tiff = tifffile.TiffWriter(self._file, bigtiff=True, ome=self.is_ome)
+        self._shape = shape
+        self._dtype = dtype
+
+    def _write_frames(self, frames):
+        if self.nb_frames is None:
+            super()._write_frames(frames)
+            return
+
+        # tifffile pulls the frames from the queue one page at a time
+        self._tiff.write(
+            self._series_frames(frames),
+            shape=(self.nb_frames, *self._shape),
+            dtype=self._dtype,
+            compression=self.compression,
+            rowsperstrip=self.rowsperstrip,
+            photometric='minisblack',
+            maxworkers=1,
+            metadata={'axes': 'TYX'},
+        )
+        # release the last frame and wait for close()
+        for _ in frames:
+            raise StreamWriterException(
+                f"More than {self.nb_frames} frames written to {self.path}"
+            )
+
+    def _series_frames(self, frames):
+        """``nb_frames`` frames of the series, blank frames follow the last
+        frame written before close"""
+        nb_frames = 0
+        for frame, _ in frames:
+            yield frame
+            nb_frames += 1
+            if nb_frames == self.nb_frames:
+                return
+
+        self._padded_frames = self.nb_frames - nb_frames
+        logger.warning(
+            "%s: %d of %d frames written, the series is completed with blank frames",
+            self.path,
+            nb_frames,
+            self.nb_frames,
+        )
+        blank = np.zeros(self._shape, dtype=self._dtype)
+        for _ in range(self._padded_frames):
+            yield blank
+
+    def _write_frame(self, frame, metadata):
+        self._tiff.write(
+            frame,
+            contiguous=self.compression is None,
+            compression=self.compression,
+            rowsperstrip=self.rowsperstrip,
+            photometric='minisblack',
+        )
+
+    def _close(self):
+        self._tiff.close()
+        self._file.close()
@@ -1,3 +1,5 @@
+from typing import List, Tuple
+
 import yaml
 
 
@@ -22,6 +24,72 @@ class MicroscopeConfig:
         """Returns number of devices"""
         return len(self.config_dict['hardware'])
 
+    @property
+    def devices(self) -> List[Tuple[str, dict]]:
+        """Returns (device type, settings) of the devices, in config order"""
+        return [
+            (device_type, settings or {})
+            for device in self.config_dict['hardware']
+            for device_type, settings in device.items()
+        ]
+
+    def device_settings(self, device_type: str, index: int = 0) -> dict:
+        """
+        Settings of a device.
+
+        Parameters
+        ----------
+        device_type : str
+            e.g. 'orca_camera'
+        index : int
+            Index of the device among the devices of its type.
+
+        Returns
+        -------
+        dict
+
+        """
+        matches = [settings for name, settings in self.devices if name == device_type]
+        if index >= len(matches):
+            raise KeyError(f"{self.name} has no {device_type} number {index}.")
+        return matches[index]
+
+    def is_simulated(self, device_type: str, index: int = 0) -> bool:
+        """
+        Whether a device is simulated, set by its 'simulated' setting or by
+        the 'simulated' setting of the whole config, which defaults to False.
+        """
+        return bool(
+            self.device_settings(device_type, index).get(
+                'simulated', self.config_dict.get('simulated', False)
+            )
+        )
+
+    def backend(self, device_type: str, index: int = 0):
+        """
+        Backend to pass to the driver of a device.
+
+        Parameters
+        ----------
+        device_type : str
+            e.g. 'orca_camera'
+        index : int
+            Index of the device among the devices of its type.
+
+        Returns
+        -------
+        The simulated backend of the device, with the timing model of its
+        'simulation' settings, when it is simulated. Otherwise None, the
+        drivers then use the vendor SDK or serial port.
+
+        """
+        if not self.is_simulated(device_type, index):
+            return None
+        from copylot.hardware.simulated import simulated_backend
+
+        simulation = self.device_settings(device_type, index).get('simulation')
+        return simulated_backend(device_type, **(simulation or {}))
+
     @staticmethod
     def read_config(config_path: str):
         """
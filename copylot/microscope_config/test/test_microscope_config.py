@@ -1,5 +1,13 @@
 import pathlib
 
+import pytest
+
+from copylot.hardware.cameras.flir.flir_camera import FlirCamera
+from copylot.hardware.cameras.orca.camera import OrcaCamera
+from copylot.hardware.lasers.vortran.vortran import VortranLaser
+from copylot.hardware.mirrors.optotune.mirror import OptoMirror
+from copylot.hardware.pumps.bartels_ux7.bartels_ux7 import BartelsUX7
+from copylot.hardware.stages.asi.stage import ASIStage
 from copylot.microscope_config.microscope_config import MicroscopeConfig
 
 
@@ -9,3 +17,62 @@ def test_read_config():
 
     assert scope_config.name == "daxi"
     assert scope_config.nb_devices == 14
+
+
+def test_hardware_config_is_not_simulated():
+    config_path = pathlib.Path("copylot/microscope_config/configs/daxi.yaml").resolve()
+    scope_config = MicroscopeConfig.read_config(config_path)
+
+    assert scope_config.devices[0] == (
+        "asi_stage",
+        {"show_gui": False, "com_port": "COM6"},
+    )
+    assert scope_config.device_settings("laser", index=2)["name"] == "yellow-green-561"
+    assert not scope_config.is_simulated("orca_camera")
+    assert scope_config.backend("orca_camera") is None
+    with pytest.raises(KeyError):
+        scope_config.device_settings("laser", index=4)
+
+
+def test_simulated_config_drives_the_drivers():
+    config_path = pathlib.Path(
+        "copylot/microscope_config/configs/simulated.yaml"
+    ).resolve()
+    scope_config = MicroscopeConfig.read_config(config_path)
+
+    stage = ASIStage(com_port="SIM", backend=scope_config.backend("asi_stage"))
+    laser = VortranLaser(port="SIM", backend=scope_config.backend("vortran_laser"))
+    mirror = OptoMirror(com_port="SIM", backend=scope_config.backend("mirror"))
+    pump_backend = scope_config.backend("pump")
+    pump = BartelsUX7("SIM", 9600, backend=pump_backend)
+    camera_backend = scope_config.backend("orca_camera")
+    orca = OrcaCamera(backend=camera_backend)
+    flir = FlirCamera(backend=scope_config.backend("flir_camera"))
+
+    assert stage.serial_connection.name == "SIM"
+    assert laser.wavelength == 488
+    mirror.position_x = 0.25
+    assert mirror.positions[0] == 0.25
+    assert camera_backend.Dcam.shape == [2048, 2048]
+    orca.binning = (4, 4)
+    assert orca.snap().shape == (512, 512)
+    flir.open()
+    assert flir.device_id == "20270803"
+    assert flir.image_size == (3072, 2048)
+    flir.close()
+    assert scope_config.backend("ni_daq").frame_period == 0.01
+    pump.run_pump(0)
+    assert pump_backend.device.written == [b"bon\r", b"boff\r"]
+    assert not pump_backend.device.on
+    stage.close()
+    laser.disconnect()
+
+
+def test_simulated_device_type_without_simulation():
+    scope_config = MicroscopeConfig(
+        {"name": "test", "simulated": True, "hardware": [{"galvo": {"name": "x"}}]}
+    )
+
+    assert scope_config.is_simulated("galvo")
+    with pytest.raises(ValueError):
+        scope_config.backend("galvo")
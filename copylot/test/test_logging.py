@@ -0,0 +1,126 @@
+import json
+import logging
+import threading
+
+import pytest
+
+import copylot
+from copylot import enable_logging, logger
+from copylot._logging import RateLimitFilter, read_binary_log
+
+
+@pytest.fixture
+def debug_log(tmp_path):
+    '''Enable a debug log in tmp_path, returns its path and closes it after the test'''
+    handlers = []
+    level = logger.level
+
+    def enable(**settings):
+        # pytest attaches its log capture, which formats records on the
+        # calling thread, to the logger at the start of the test
+        logger.handlers = [copylot.ch] + handlers
+        logger.propagate = False
+        path = tmp_path / 'copylot.log'
+        handlers.append(enable_logging(str(path), **settings))
+        return path
+
+    yield enable
+    for handler in handlers:
+        logger.removeHandler(handler)
+        handler.close()
+    logger.setLevel(level)
+    logger.propagate = True
+
+
+def test_debug_records_are_not_created_by_default():
+    assert not logger.isEnabledFor(logging.DEBUG)
+
+
+def test_jsonl_log_is_formatted_on_the_listener_thread(debug_log):
+    class Argument:
+        def __str__(self):
+            formatting_threads.append(threading.current_thread())
+            return 'argument'
+
+    formatting_threads = []
+    path = debug_log(output='jsonl')
+    logger.debug("formatted %s", Argument())
+    logger.handlers[-1].close()
+
+    entry = json.loads(path.read_text())
+    assert entry['message'] == 'formatted argument'
+    assert entry['level'] == 'DEBUG'
+    assert entry['function'] == 'test_jsonl_log_is_formatted_on_the_listener_thread'
+    assert formatting_threads and threading.current_thread() not in formatting_threads
+
+
+def test_binary_log(debug_log):
+    path = debug_log(output='binary', queued=False, level=logging.INFO)
+    logger.debug("not logged")
+    logger.info("stack %d of %d", 3, 10)
+    try:
+        raise RuntimeError("no trigger")
+    except RuntimeError:
+        logger.exception("acquisition failed")
+    logger.handlers[-1].flush()
+
+    records = list(read_binary_log(str(path)))
+    assert [record['level'] for record in records] == ['INFO', 'ERROR']
+    assert records[0]['message'] == 'stack 3 of 10'
+    assert records[0]['location'] == 'test_logging.test_binary_log'
+    assert 'RuntimeError: no trigger' in records[1]['message']
+
+
+def test_unknown_output():
+    with pytest.raises(ValueError):
+        enable_logging('log', output='xml')
+
+
+def test_rate_limit_per_module():
+    now = [0.0]
+    rate_limit = RateLimitFilter(rate=2, clock=lambda: now[0])
+
+    def passes(module, level=logging.DEBUG):
+        record = logging.LogRecord('copylot', level, f'{module}.py', 1, 'msg', (), None)
+        return rate_limit.filter(record), record
+
+    # a burst of 2 records per module, warnings always pass
+    assert [passes('camera')[0] for _ in range(4)] == [True, True, False, False]
+    assert passes('stage')[0]
+    assert passes('camera', logging.WARNING)[0]
+
+    now[0] = 0.5
+    passed, record = passes('camera')
+    assert passed
+    assert record.suppressed == 2
+    assert record.getMessage() == 'msg (2 records suppressed)'
+
+
+def test_queued_log_call_only_creates_the_record(debug_log, mocker):
+    debug_log(output='text')
+    handler = logger.handlers[-1]
+    formatter = handler.listener.handlers[0].formatter
+    threads = {'prepare': [], 'getMessage': [], 'format': []}
+
+    def on_thread(name, function):
+        def wrapper(*args):
+            threads[name].append(threading.current_thread())
+            return function(*args)
+
+        return wrapper
+
+    mocker.patch.object(handler, 'prepare', on_thread('prepare', handler.prepare))
+    mocker.patch.object(
+        logging.LogRecord,
+        'getMessage',
+        on_thread('getMessage', logging.LogRecord.getMessage),
+    )
+    mocker.patch.object(formatter, 'format', on_thread('format', formatter.format))
+    logger.debug("frame %d", 1)
+    handler.close()
+
+    assert threads['prepare'] == [threading.current_thread()]
+    # the message is formatted once, on the listener thread
+    assert len(threads['format']) == 1
+    assert threads['getMessage']
+    assert threading.current_thread() not in threads['format'] + threads['getMessage']